@@ -0,0 +1,59 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark the creation, copying and slicing of small Atoms objects with the shared periodic table and with the
+periodic table and the color lookup table reloaded for every Atoms object, as it was done before.
+
+    python benchmarks/benchmark_atoms.py 100 1000
+"""
+
+import numpy as np
+import sys
+import time
+from pyiron.atomistics.structure.atoms import Atoms
+from pyiron.atomistics.structure.periodic_table import ElementColorDictionary, PeriodicTable
+
+
+def clear_cache():
+    PeriodicTable._shared_dataframe_dict.clear()
+    ElementColorDictionary._lut = None
+
+
+def run(n_structures, cached):
+    positions = np.random.random((4, 3))
+    timing = []
+    start = time.time()
+    structure_lst = []
+    for _ in range(n_structures):
+        if not cached:
+            clear_cache()
+        structure_lst.append(Atoms(elements=['Fe', 'Fe', 'Al', 'Al'], positions=positions, cell=np.eye(3)))
+    timing.append(time.time() - start)
+    start = time.time()
+    for structure in structure_lst:
+        if not cached:
+            clear_cache()
+        structure.copy()
+    timing.append(time.time() - start)
+    start = time.time()
+    for structure in structure_lst:
+        if not cached:
+            clear_cache()
+        structure[1:3]
+    timing.append(time.time() - start)
+    return timing
+
+
+def benchmark(n_structures):
+    uncached = run(n_structures, cached=False)
+    cached = run(n_structures, cached=True)
+    print('{:>6d} structures'.format(n_structures))
+    for name, t_uncached, t_cached in zip(['create', 'copy', 'getitem'], uncached, cached):
+        print('    {:<14s} reloaded: {:8.3f} s   shared: {:8.3f} s'.format(name, t_uncached, t_cached))
+
+
+if __name__ == '__main__':
+    for n in [int(arg) for arg in sys.argv[1:]] or [100, 1000]:
+        benchmark(n_structures=n)
@@ -0,0 +1,67 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark parsing synthetic CHGCAR files with the block parser, in double and single precision, and with the line by
+line parser, and the lateral average computed from the chunked HDF5 dataset. The arguments are the grid points per
+axis.
+
+    python benchmarks/benchmark_chgcar.py 100 200
+"""
+
+import numpy as np
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from pyiron.atomistics.structure.atoms import Atoms
+from pyiron.atomistics.volumetric.generic import VolumetricData
+from pyiron.base.generic.hdfio import FileHDFio
+from pyiron.vasp.volumetric_data import VaspVolumetricData
+
+
+def create_chgcar(file_name, n_grid):
+    vd = VolumetricData()
+    vd.atoms = Atoms("Fe2", scaled_positions=[[0, 0, 0], [0.5, 0.5, 0.5]], cell=2.83 * np.eye(3))
+    vd.total_data = np.random.random((n_grid, n_grid, n_grid))
+    vd.write_vasp_volumetric(filename=file_name)
+
+
+def time_function(function, *args, **kwargs):
+    start = time.time()
+    result = function(*args, **kwargs)
+    return time.time() - start, result
+
+
+def benchmark(n_grid, directory):
+    file_name = os.path.join(directory, "CHGCAR_{}".format(n_grid))
+    create_chgcar(file_name, n_grid)
+    vd = VaspVolumetricData()
+    t_old, (_, [data_old]) = time_function(vd._read_vol_data_old, file_name)
+    t_new, _ = time_function(vd.from_file, file_name)
+    if not np.array_equal(vd.total_data, data_old):
+        raise ValueError("The parsers do not agree.")
+    del data_old
+    t_single, _ = time_function(VaspVolumetricData().from_file, file_name, dtype=np.float32)
+    hdf = FileHDFio(file_name=os.path.join(directory, "chgcar_{}.h5".format(n_grid)))
+    t_write, _ = time_function(vd.to_hdf, hdf, group_name="charge_density")
+    vd_hdf = VaspVolumetricData()
+    vd_hdf.from_hdf(hdf, group_name="charge_density")
+    t_average, average = time_function(vd_hdf.get_average_along_axis, ind=2)
+    if not np.allclose(average, vd.get_average_along_axis(ind=2)):
+        raise ValueError("The averages do not agree.")
+    print("{:>4d}^3 grid  line by line: {:7.2f} s   blocks: {:6.2f} s   float32: {:6.2f} s   "
+          "to_hdf: {:6.2f} s   average from hdf: {:6.2f} s".format(n_grid, t_old, t_new, t_single, t_write, t_average))
+
+
+if __name__ == "__main__":
+    directory = tempfile.mkdtemp()
+    try:
+        for n in [int(arg) for arg in sys.argv[1:]] or [100, 200]:
+            benchmark(n_grid=n, directory=directory)
+    finally:
+        shutil.rmtree(directory)
+    print("peak memory: {:.0f} MB".format(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))
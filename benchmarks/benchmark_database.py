@@ -0,0 +1,61 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark the job table queries of the SQLite backend with and without the secondary indexes.
+
+    python benchmarks/benchmark_database.py 10000 100000 1000000
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pyiron.base.database.generic import DatabaseAccess
+from pyiron.base.database.jobtable import job_table, get_job_ids
+
+
+def fill_database(database, n_rows, n_projects=100):
+    now = datetime.now()
+    database.conn.execute(database.simulation_table.insert(), [
+        {'parentid': None, 'masterid': None, 'projectpath': '/benchmark/',
+         'project': 'project_{}/sub_{}/'.format(i % n_projects, i % 7), 'job': 'job_{}'.format(i),
+         'subjob': '/job_{}'.format(i), 'chemicalformula': 'Fe{}'.format(i % 10 + 1), 'status': 'finished',
+         'hamilton': 'Lammps', 'hamversion': '0.1', 'username': 'pyiron', 'computer': 'localhost',
+         'timestart': now, 'timestop': now, 'totalcputime': 1.0} for i in range(n_rows)])
+
+
+def timeit(funct, repeat=5):
+    start = time.time()
+    for _ in range(repeat):
+        funct()
+    return (time.time() - start) / repeat
+
+
+def benchmark(n_rows, directory):
+    result = {}
+    for use_indexes in [False, True]:
+        database = DatabaseAccess('sqlite:///' + os.path.join(directory, 'bench_{}_{}.db'.format(n_rows, use_indexes)),
+                                  'jobs_pyiron', use_indexes=use_indexes)
+        fill_database(database, n_rows)
+        result[use_indexes] = [
+            timeit(lambda: job_table(database, sql_query=None, user=None, project_path='project_1/')),
+            timeit(lambda: get_job_ids(database, sql_query=None, user=None, project_path='project_'), repeat=1),
+            timeit(lambda: database.get_items_dict({'job': 'job_{}'.format(n_rows // 2)})),
+        ]
+        database.conn.close()
+    for label, index in [('job_table(project prefix)', 0), ('get_job_ids(all rows)', 1), ('get_items_dict(job)', 2)]:
+        print('{:>8d} rows {:<26s} regex: {:8.4f} s  indexed: {:8.4f} s'.format(
+            n_rows, label, result[False][index], result[True][index]))
+
+
+if __name__ == '__main__':
+    directory = tempfile.mkdtemp()
+    try:
+        for n in [int(arg) for arg in sys.argv[1:]] or [10000, 100000, 1000000]:
+            benchmark(n_rows=n, directory=directory)
+    finally:
+        shutil.rmtree(directory)
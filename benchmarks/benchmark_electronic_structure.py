@@ -0,0 +1,61 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark loading electronic structures from HDF5 and computing the band gap and the metallicity. The arguments are
+the number of electronic structures, k-points and bands.
+
+    python benchmarks/benchmark_electronic_structure.py 20 500 400
+"""
+
+import numpy as np
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from pyiron.base.generic.hdfio import FileHDFio
+from pyiron.dft.waves.electronic import ElectronicStructure
+
+
+def create_electronic_structure(n_kpoints, n_bands):
+    es_obj = ElectronicStructure()
+    es_obj.kpoint_list = np.random.random((n_kpoints, 3))
+    es_obj.kpoint_weights = np.ones(n_kpoints) / n_kpoints
+    eigenvalues = np.sort(np.random.random((2, n_kpoints, n_bands)) * 20 - 10, axis=-1)
+    es_obj.grand_eigenvalue_matrix = eigenvalues
+    es_obj.grand_occupancy_matrix = (eigenvalues < 0).astype(float)
+    es_obj.efermi = 0.
+    return es_obj
+
+
+def benchmark(n_structures, n_kpoints, n_bands, directory):
+    hdf = FileHDFio(file_name=os.path.join(directory, "electronic_structure.h5"))
+    for i in range(n_structures):
+        create_electronic_structure(n_kpoints, n_bands).to_hdf(hdf, group_name="es_{}".format(i))
+    start = time.time()
+    es_lst = list()
+    for i in range(n_structures):
+        es_obj = ElectronicStructure()
+        es_obj.from_hdf(hdf, group_name="es_{}".format(i))
+        es_lst.append(es_obj)
+    t_load = time.time() - start
+    start = time.time()
+    for es_obj in es_lst:
+        es_obj.get_band_gap()
+        es_obj.is_metal
+    t_analyse = time.time() - start
+    print("{} electronic structures with {} k-points and {} bands   from_hdf: {:6.2f} s   "
+          "band gap and is_metal: {:6.2f} s".format(n_structures, n_kpoints, n_bands, t_load, t_analyse))
+
+
+if __name__ == "__main__":
+    n_structures, n_kpoints, n_bands = [int(arg) for arg in sys.argv[1:4]] or [20, 500, 400]
+    directory = tempfile.mkdtemp()
+    try:
+        benchmark(n_structures=n_structures, n_kpoints=n_kpoints, n_bands=n_bands, directory=directory)
+    finally:
+        shutil.rmtree(directory)
+    print("peak memory: {:.0f} MB".format(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))
@@ -0,0 +1,62 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark collecting the final forces of the child jobs of a phonon like master job - by inspecting every child job
+and reading the full force trajectory as before and with ParallelMaster.gather(), serial and with a pool of worker
+processes. The project is created in the current directory, which has to be part of the pyiron project paths. The
+arguments are the number of child jobs, the number of atoms, the number of ionic steps per child and the number of
+worker processes.
+
+    python benchmarks/benchmark_gather.py 200 1000 20 4
+"""
+
+import numpy as np
+import os
+import sys
+import time
+from pyiron.project import Project
+
+
+def create_project(path, n_children, n_atoms, n_steps):
+    project = Project(path)
+    master = project.create_job("Murnaghan", "master")
+    master.save()
+    for i in range(n_children):
+        job = project.create_job(project.job_type.ScriptJob, "child_{}".format(i))
+        job.master_id = master.job_id
+        job.save()
+        with job.project_hdf5.open("output/generic") as h5:
+            h5["forces"] = np.random.random((n_steps, n_atoms, 3))
+    return project, master
+
+
+def gather_inspect(master):
+    return np.array([master.project_hdf5.inspect(job_id)["output/generic/forces"][-1]
+                     for job_id in master.child_ids])
+
+
+def benchmark(master, workers):
+    start = time.time()
+    forces_inspect = gather_inspect(master)
+    t_inspect = time.time() - start
+    start = time.time()
+    forces_serial = master.gather("output/generic/forces")
+    t_serial = time.time() - start
+    start = time.time()
+    forces_parallel = master.gather("output/generic/forces", workers=workers)
+    t_parallel = time.time() - start
+    if not (np.array_equal(forces_inspect, forces_serial) and np.array_equal(forces_inspect, forces_parallel)):
+        raise ValueError("The gathered forces do not agree.")
+    print("{} children {}: inspect {:.2f} s   gather {:.2f} s   gather with {} workers {:.2f} s".format(
+        len(forces_serial), forces_serial.shape[1:], t_inspect, t_serial, workers, t_parallel))
+
+
+if __name__ == '__main__':
+    n_children, n_atoms, n_steps, workers = [int(arg) for arg in sys.argv[1:5]] or [200, 1000, 20, 4]
+    project, master = create_project(os.path.abspath('benchmark_gather'), n_children, n_atoms, n_steps)
+    try:
+        benchmark(master, workers)
+    finally:
+        project.remove(enable=True, enforce=True)
@@ -0,0 +1,49 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark building, modifying and writing a GenericParameters input with many keys. The arguments are the number of
+keys and the number of times the input file is written.
+
+    python benchmarks/benchmark_generic_parameters.py 2000 10
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pyiron.base.generic.parameters import GenericParameters
+
+
+def benchmark(n_keys, n_writes, directory):
+    gp = GenericParameters(table_name="benchmark")
+    start = time.time()
+    for i in range(n_keys):
+        gp.set(**{"key_{}".format(i): i})
+    t_set = time.time() - start
+    start = time.time()
+    for i in range(n_keys):
+        gp.modify(**{"key_{}".format(i): 2 * i})
+        if gp.get("key_{}".format(i)) != 2 * i:
+            raise ValueError("The modified value does not agree.")
+    t_modify = time.time() - start
+    start = time.time()
+    for _ in range(n_writes):
+        gp.write_file(file_name="input", cwd=directory)
+    t_write = time.time() - start
+    start = time.time()
+    gp.remove_keys(["key_{}".format(i) for i in range(0, n_keys, 2)])
+    t_remove = time.time() - start
+    print("{:>6d} keys: set {:6.2f} s, modify+get {:6.2f} s, {} writes {:6.2f} s, remove half {:6.2f} s".format(
+        n_keys, t_set, t_modify, n_writes, t_write, t_remove))
+
+
+if __name__ == "__main__":
+    n_keys, n_writes = [int(arg) for arg in sys.argv[1:3]] or [2000, 10]
+    directory = tempfile.mkdtemp()
+    try:
+        benchmark(n_keys=n_keys, n_writes=n_writes, directory=directory)
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,63 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark reading the output of many job HDF5 files with and without the cache of open HDF5 file handles.
+
+    python benchmarks/benchmark_hdf5_cache.py 100 1000 10000
+"""
+
+import numpy as np
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pyiron.base.generic.hdfio import FileHDFio, hdf5_file_cache
+
+
+def create_job_files(directory, n_jobs):
+    hdf_lst = []
+    for i in range(n_jobs):
+        hdf = FileHDFio(file_name=os.path.join(directory, 'job_{}.h5'.format(i)), h5_path='/job_{}'.format(i))
+        with hdf.open('output/generic') as hdf_generic:
+            hdf_generic['energy_tot'] = np.random.rand(10)
+            hdf_generic['positions'] = np.random.rand(10, 8, 3)
+            hdf_generic['steps'] = np.arange(10)
+        hdf['status'] = 'finished'
+        hdf_lst.append(hdf)
+    return hdf_lst
+
+
+def read_job_files(hdf_lst):
+    for hdf in hdf_lst:
+        _ = hdf['status']
+        _ = hdf['output/generic/energy_tot']
+        _ = hdf['output/generic/positions']
+
+
+def benchmark(n_jobs, directory):
+    hdf_lst = create_job_files(directory=directory, n_jobs=n_jobs)
+    result = {}
+    for max_open in [0, n_jobs]:
+        hdf5_file_cache.clear()
+        hdf5_file_cache.max_open = max_open
+        start = time.time()
+        read_job_files(hdf_lst)
+        result[max_open] = time.time() - start
+    print('{:>6d} jobs  uncached: {:8.4f} s  cached (first pass): {:8.4f} s'.format(
+        n_jobs, result[0], result[n_jobs]))
+    start = time.time()
+    read_job_files(hdf_lst)
+    print('{:>6d} jobs  cached (second pass): {:8.4f} s'.format(n_jobs, time.time() - start))
+    hdf5_file_cache.clear()
+
+
+if __name__ == '__main__':
+    for n in [int(arg) for arg in sys.argv[1:]] or [100, 1000, 10000]:
+        directory = tempfile.mkdtemp()
+        try:
+            benchmark(n_jobs=n, directory=directory)
+        finally:
+            shutil.rmtree(directory)
@@ -0,0 +1,54 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark the cost of an interactive flush as a function of the number of steps which are already stored, comparing
+the resizable datasets which are extended in place with rewriting the full dataset on every flush.
+
+    python benchmarks/benchmark_interactive_flush.py 100 1000 10000
+"""
+
+import numpy as np
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pyiron.base.generic.hdfio import FileHDFio
+
+
+def flush_rewrite(hdf, key, data):
+    if key in hdf.list_nodes():
+        data = np.array(hdf[key].tolist() + data.tolist())
+    hdf[key] = data
+
+
+def flush_extend(hdf, key, data):
+    hdf.extend(key, data)
+
+
+def benchmark(n_steps, directory, flush_frequency=10, n_atoms=100):
+    result = {}
+    for label, flush in [('rewrite', flush_rewrite), ('extend', flush_extend)]:
+        hdf = FileHDFio(file_name=os.path.join(directory, 'flush_{}_{}.h5'.format(label, n_steps)), h5_path='/job')
+        start = time.time()
+        for _ in range(n_steps // flush_frequency):
+            flush(hdf, 'positions', np.random.rand(flush_frequency, n_atoms, 3))
+            flush(hdf, 'energy_tot', np.random.rand(flush_frequency))
+        total = time.time() - start
+        start = time.time()
+        flush(hdf, 'positions', np.random.rand(flush_frequency, n_atoms, 3))
+        result[label] = (total, time.time() - start)
+    print('{:>7d} steps  total rewrite: {:8.3f} s  extend: {:8.3f} s   last flush rewrite: {:8.4f} s  '
+          'extend: {:8.4f} s'.format(n_steps, result['rewrite'][0], result['extend'][0],
+                                     result['rewrite'][1], result['extend'][1]))
+
+
+if __name__ == '__main__':
+    directory = tempfile.mkdtemp()
+    try:
+        for n in [int(arg) for arg in sys.argv[1:]] or [100, 1000, 10000]:
+            benchmark(n_steps=n, directory=directory)
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,89 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark the delay between the last child job of a master finishing and the waiting process noticing it, once by
+polling the database every interval_in_s seconds and once using the job notification channel with the same interval
+as fallback. The child jobs are finished by a separate process at random times.
+
+    python benchmarks/benchmark_job_notification.py 10 100
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import multiprocessing
+import time
+from datetime import datetime
+from pyiron.base.database.generic import DatabaseAccess
+from pyiron.base.job.jobstatus import JobStatus
+from pyiron.base.job.notification import job_notification
+
+
+def create_children(database, n_children):
+    now = datetime.now()
+    return database.add_items([
+        {'parentid': None, 'masterid': 1, 'projectpath': '/benchmark/', 'project': 'master_hdf5/',
+         'job': 'child_{}'.format(i), 'subjob': '/child_{}'.format(i), 'chemicalformula': 'Fe', 'status': 'running',
+         'hamilton': 'ExampleJob', 'hamversion': '0.1', 'username': 'pyiron', 'computer': 'localhost',
+         'timestart': now} for i in range(n_children)])
+
+
+def finish_children(connection_string, notification_path, job_ids, duration, finish_time):
+    database = DatabaseAccess(connection_string, 'jobs_pyiron')
+    job_notification.path = notification_path
+    for job_id in job_ids:
+        time.sleep(random.uniform(0, 2 * duration / len(job_ids)))
+        JobStatus(db=database, job_id=job_id).finished = True
+    finish_time.value = time.time()
+    database.conn.close()
+
+
+def count_running(database, job_ids):
+    return len([item for item in database.get_items_by_ids(job_ids, columns=['status'])
+                if item['status'] != 'finished'])
+
+
+def wait(connection_string, database, job_ids, interval_in_s, use_notification):
+    database.update_items({'status': 'running'}, job_ids)
+    finish_time = multiprocessing.Value('d', 0.0)
+    process = multiprocessing.Process(target=finish_children,
+                                      args=(connection_string, job_notification.path, job_ids, 1.0, finish_time))
+    process.start()
+    n_queries = 0
+    while True:
+        state = job_notification.get_state()
+        n_queries += 1
+        if count_running(database, job_ids) == 0:
+            break
+        if use_notification:
+            job_notification.wait(timeout=interval_in_s, state=state)
+        else:
+            time.sleep(interval_in_s)
+    delay = time.time() - finish_time.value
+    process.join()
+    return delay, n_queries
+
+
+def benchmark(n_children, directory, interval_in_s=5):
+    connection_string = 'sqlite:///' + os.path.join(directory, 'notify_{}.db'.format(n_children))
+    database = DatabaseAccess(connection_string, 'jobs_pyiron')
+    job_ids = create_children(database, n_children)
+    polling = wait(connection_string, database, job_ids, interval_in_s=interval_in_s, use_notification=False)
+    notification = wait(connection_string, database, job_ids, interval_in_s=interval_in_s, use_notification=True)
+    print('{:>6d} children  polling: {:6.3f} s delay {:>4d} queries   notification: {:6.3f} s delay {:>4d} '
+          'queries'.format(n_children, *(polling + notification)))
+    database.conn.close()
+
+
+if __name__ == '__main__':
+    directory = tempfile.mkdtemp()
+    job_notification.path = os.path.join(directory, 'notify')
+    try:
+        for n in [int(arg) for arg in sys.argv[1:]] or [10, 100]:
+            benchmark(n_children=n, directory=directory)
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,67 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark the number of database queries issued by the status checks of a ParallelMaster with many child jobs, with
+and without the cached job status. In every iteration the master refreshes the status of its children once and then
+evaluates the status flags it uses to decide how to continue, finally all children are set to finished.
+
+    python benchmarks/benchmark_job_status.py 100 1000
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pyiron.base.database.generic import DatabaseAccess
+from pyiron.base.job.jobstatus import JobStatus
+
+
+def create_children(database, n_children):
+    now = datetime.now()
+    job_ids = database.add_items([
+        {'parentid': None, 'masterid': 1, 'projectpath': '/benchmark/', 'project': 'master_hdf5/',
+         'job': 'child_{}'.format(i), 'subjob': '/child_{}'.format(i), 'chemicalformula': 'Fe', 'status': 'running',
+         'hamilton': 'ExampleJob', 'hamversion': '0.1', 'username': 'pyiron', 'computer': 'localhost',
+         'timestart': now} for i in range(n_children)])
+    return job_ids
+
+
+def poll_children(database, job_ids, cache_time, n_iterations=5):
+    status_lst = [JobStatus(db=database, job_id=job_id, cache_time=cache_time) for job_id in job_ids]
+    JobStatus.query_count.clear()
+    start = time.time()
+    for _ in range(n_iterations):
+        for status in status_lst:
+            status.refresh_status()
+            if status.aborted:
+                status.created = True
+            elif not status.finished and (status.running or status.submitted or status.collect):
+                pass
+    for status in status_lst:
+        status.finished = True
+    return time.time() - start, JobStatus.query_count['read'] + JobStatus.query_count['write']
+
+
+def benchmark(n_children, directory):
+    database = DatabaseAccess('sqlite:///' + os.path.join(directory, 'status_{}.db'.format(n_children)), 'jobs_pyiron')
+    job_ids = create_children(database, n_children)
+    result = {}
+    for cache_time in [0, 60]:
+        database.update_items({'status': 'running'}, job_ids)
+        result[cache_time] = poll_children(database, job_ids, cache_time=cache_time)
+    print('{:>6d} children  uncached: {:8.3f} s {:>7d} queries   cached: {:8.3f} s {:>7d} queries'.format(
+        n_children, *(result[0] + result[60])))
+    database.conn.close()
+
+
+if __name__ == '__main__':
+    directory = tempfile.mkdtemp()
+    try:
+        for n in [int(arg) for arg in sys.argv[1:]] or [100, 1000]:
+            benchmark(n_children=n, directory=directory)
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,111 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark collecting a LAMMPS dump file with the chunked reader against parsing the whole file with one pandas call per
+snapshot, measuring the run time and the peak memory. The synthetic dump files contain a triclinic cell with the given
+number of atoms and 100 snapshots.
+
+    python benchmarks/benchmark_lammps_dump.py 1000 10000 100000
+"""
+
+import numpy as np
+import os
+import pandas as pd
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from io import StringIO
+from pyiron.atomistics.structure.atoms import Atoms
+from pyiron.base.generic.hdfio import FileHDFio
+from pyiron.lammps.base import LammpsBase, to_amat
+from pyiron.lammps.structure import UnfoldingPrism
+
+
+class DumpCollector(object):
+    """
+    Minimal stand-in for a LAMMPS job, providing the attributes used by LammpsBase.collect_dump_file()
+    """
+    def __init__(self, structure, hdf):
+        self.structure = structure
+        self.project_hdf5 = hdf
+
+    @staticmethod
+    def job_file_name(file_name, cwd=None):
+        return os.path.join(cwd, file_name)
+
+    collect_dump_file = LammpsBase.collect_dump_file
+    _write_dump_output = LammpsBase._write_dump_output
+
+
+def collect_dump_file_pandas(file_name, structure, hdf):
+    with open(file_name, 'r') as ff:
+        dump = ff.readlines()
+    rotation_lammps2orig = np.linalg.inv(UnfoldingPrism(structure.cell, digits=15).R)
+    output = {}
+    output['time'] = np.array([int(dump[nn + 1]) for nn, ll in enumerate(dump) if ll.startswith('ITEM: TIMESTEP')])
+    natoms = np.array([int(dump[nn + 1]) for nn, ll in enumerate(dump) if ll.startswith('ITEM: NUMBER OF ATOMS')])
+    cells = np.array([to_amat(np.array(' '.join(dump[nn + 1:nn + 4]).split(), dtype=float))
+                      for nn, ll in enumerate(dump) if ll.startswith('ITEM: BOX BOUNDS')])
+    output['cells'] = cells
+    l_start = np.where([ll.startswith('ITEM: ATOMS') for ll in dump])[0]
+    content = [pd.read_csv(StringIO('\n'.join(dump[llst:llen]).replace('ITEM: ATOMS ', '')), delim_whitespace=True)
+               for llst, llen in zip(l_start, l_start + natoms + 1)]
+    forces = np.array([np.stack((cc['fx'], cc['fy'], cc['fz']), axis=-1) for cc in content])
+    output['forces'] = np.einsum('ijk,kl->ijl', forces, rotation_lammps2orig)
+    unwrapped_positions = np.array([np.stack((cc['xsu'], cc['ysu'], cc['zsu']), axis=-1) for cc in content])
+    positions = unwrapped_positions - np.floor(unwrapped_positions)
+    unwrapped_positions = np.einsum('ikj,ilk->ilj', cells, unwrapped_positions)
+    output['unwrapped_positions'] = np.einsum('ijk,kl->ijl', unwrapped_positions, rotation_lammps2orig)
+    positions = np.einsum('ikj,ilk->ilj', cells, positions)
+    output['positions'] = np.einsum('ijk,kl->ijl', positions, rotation_lammps2orig)
+    with hdf.open("output/generic") as hdf_output:
+        for k, v in output.items():
+            hdf_output[k] = v
+
+
+def create_dump(file_name, n_atoms, n_steps=100):
+    with open(file_name, 'w') as f:
+        for step in range(n_steps):
+            f.write('ITEM: TIMESTEP\n{}\nITEM: NUMBER OF ATOMS\n{}\n'.format(step * 100, n_atoms))
+            f.write('ITEM: BOX BOUNDS xy xz yz pp pp pp\n0.0 20.5 0.5\n0.0 20.0 0.0\n0.0 20.0 0.0\n')
+            f.write('ITEM: ATOMS id type xsu ysu zsu fx fy fz \n')
+            data = np.hstack([np.arange(1, n_atoms + 1)[:, None], np.ones((n_atoms, 1)),
+                              np.random.rand(n_atoms, 3) * 1.2 - 0.1, np.random.rand(n_atoms, 3) - 0.5])
+            np.savetxt(f, data, fmt='%d %d %20.15g %20.15g %20.15g %20.15g %20.15g %20.15g')
+
+
+def benchmark(n_atoms, directory):
+    file_name = os.path.join(directory, 'dump.out')
+    create_dump(file_name=file_name, n_atoms=n_atoms)
+    structure = Atoms('Al1', scaled_positions=[[0, 0, 0]], cell=[[20, 0, 0], [0.5, 20, 0], [0, 0, 20]])
+    result = {}
+    for label in ['pandas', 'chunked']:
+        hdf = FileHDFio(file_name=os.path.join(directory, 'job_{}.h5'.format(label)), h5_path='/job')
+        tracemalloc.start()
+        start = time.time()
+        if label == 'pandas':
+            collect_dump_file_pandas(file_name=file_name, structure=structure, hdf=hdf)
+        else:
+            DumpCollector(structure=structure, hdf=hdf).collect_dump_file(file_name='dump.out', cwd=directory,
+                                                                          chunk_size=10)
+        result[label] = (time.time() - start, tracemalloc.get_traced_memory()[1] / 1e6, hdf)
+        tracemalloc.stop()
+    for key in ['positions', 'unwrapped_positions', 'forces', 'cells', 'time']:
+        assert np.allclose(result['pandas'][2]['output/generic/' + key], result['chunked'][2]['output/generic/' + key])
+    print('{:>7d} atoms ({:7.1f} MB)  pandas: {:8.3f} s {:8.1f} MB   chunked: {:8.3f} s {:8.1f} MB'.format(
+        n_atoms, os.path.getsize(file_name) / 1e6, *(result['pandas'][:2] + result['chunked'][:2])))
+    for label in result.keys():
+        result[label][2].remove_file()
+
+
+if __name__ == '__main__':
+    directory = tempfile.mkdtemp()
+    try:
+        for n in [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000]:
+            benchmark(n_atoms=n, directory=directory)
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,83 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark the latency of one interactive MD step of a Lennard-Jones crystal - with the lammps library in the same
+process and with the LammpsLibrary MPI bridge, once with one message per value and once with batched requests. Every
+step sets the positions, runs one MD step and reads the thermo output, the cell, the positions and the forces. The
+arguments are the size of the fcc supercell, the number of steps and the number of MPI cores. Requires lammps, mpi4py
+and mpiexec.
+
+    python benchmarks/benchmark_lammps_library.py 10 100 1
+"""
+
+from ctypes import c_double
+import numpy as np
+import shutil
+import sys
+import tempfile
+import time
+from lammps import lammps
+from pyiron.lammps.interactive import LammpsLibrary
+
+THERMO = ['pe', 'etotal', 'step', 'temp', 'vol', 'pxx', 'pyy', 'pzz', 'pxy', 'pxz', 'pyz',
+          'lx', 'ly', 'lz', 'xy', 'xz', 'yz']
+
+
+def setup(lmp, size):
+    for line in ['units lj', 'atom_style atomic', 'atom_modify map array', 'lattice fcc 0.8442',
+                 'region box block 0 {0} 0 {0} 0 {0}'.format(size), 'create_box 1 box', 'create_atoms 1 box',
+                 'mass 1 1.0', 'velocity all create 1.0 87287', 'pair_style lj/cut 2.5', 'pair_coeff 1 1 1.0 1.0 2.5',
+                 'fix 1 all nve', 'thermo_style custom step temp pe etotal pxx pyy pzz pxy pxz pyz vol', 'run 0']:
+        lmp.command(line)
+    return np.array(lmp.gather_atoms('x', 1, 3))
+
+
+def step_native(lmp, positions):
+    lmp.scatter_atoms('x', 1, 3, (len(positions) * c_double).from_buffer(positions))
+    lmp.command('run 1')
+    thermo = [lmp.get_thermo(key) for key in THERMO]
+    return thermo, np.array(lmp.gather_atoms('x', 1, 3)), np.array(lmp.gather_atoms('f', 1, 3))
+
+
+def step_single(lmp, positions):
+    lmp.scatter_atoms('x', 1, 3, positions)
+    lmp.command('run 1')
+    thermo = [lmp.get_thermo(key) for key in THERMO]
+    return thermo, lmp.gather_atoms('x', 1, 3), lmp.gather_atoms('f', 1, 3)
+
+
+def step_batch(lmp, positions):
+    lmp.scatter_atoms('x', 1, 3, positions)
+    lmp.command('run 1')
+    result = lmp.batch([('get_thermo', [key]) for key in THERMO] + [('gather_atoms', ['x', 1, 3]),
+                                                                      ('gather_atoms', ['f', 1, 3])])
+    return result[:-2], result[-2], result[-1]
+
+
+def benchmark(lmp, step, size, n_steps):
+    positions = np.ascontiguousarray(setup(lmp, size), dtype=float)
+    start = time.time()
+    for _ in range(n_steps):
+        thermo, positions, forces = step(lmp, positions)
+        positions = np.ascontiguousarray(positions, dtype=float)
+    return (time.time() - start) / n_steps, len(positions) // 3
+
+
+if __name__ == "__main__":
+    size, n_steps, cores = [int(arg) for arg in sys.argv[1:4]] or [10, 100, 1]
+    directory = tempfile.mkdtemp()
+    try:
+        native = lammps(cmdargs=['-screen', 'none'])
+        t_native, n_atoms = benchmark(native, step_native, size, n_steps)
+        native.close()
+        for name, step in [('bridge, one message per value', step_single), ('bridge, batched', step_batch)]:
+            bridge = LammpsLibrary(cores=cores, working_directory=directory)
+            t_bridge, _ = benchmark(bridge, step, size, n_steps)
+            bridge.close()
+            print("{:>6d} atoms, {}: {:8.2f} ms per step ({:+.2f} ms compared to the library in process)".format(
+                n_atoms, name, 1000 * t_bridge, 1000 * (t_bridge - t_native)))
+        print("{:>6d} atoms, library in process: {:8.2f} ms per step".format(n_atoms, 1000 * t_native))
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,54 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark writing LAMMPS data files of skewed binary fcc supercells with atom_style atomic. The arguments are the
+numbers of atoms.
+
+    python benchmarks/benchmark_lammps_structure.py 10000 100000 1000000
+"""
+
+import numpy as np
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pyiron.atomistics.structure.atoms import CrystalStructure
+from pyiron.lammps.structure import LammpsStructure
+
+
+def create_structure(n_atoms):
+    repeat = max(int(np.round((n_atoms / 4) ** (1 / 3))), 1)
+    structure = CrystalStructure('Al', bravais_basis='fcc', lattice_constants=4.05).repeat(repeat)
+    structure[::3] = 'Ni'
+    cell = structure.cell.copy()
+    cell[1, 0] += 0.1 * cell[0, 0]
+    structure.set_cell(cell, scale_atoms=True)
+    return structure
+
+
+def benchmark(n_atoms, directory):
+    structure = create_structure(n_atoms)
+    lmp_structure = LammpsStructure()
+    lmp_structure.el_eam_lst = ['Al', 'Ni']
+    start = time.time()
+    lmp_structure.structure = structure
+    t_create = time.time() - start
+    start = time.time()
+    lmp_structure.write_file(file_name='structure.inp', cwd=directory)
+    t_write = time.time() - start
+    size = os.path.getsize(os.path.join(directory, 'structure.inp')) / 1024 ** 2
+    print("{:>8d} atoms ({:7.1f} MB): create {:7.2f} s, write {:7.2f} s".format(
+        len(structure), size, t_create, t_write))
+
+
+if __name__ == "__main__":
+    atom_numbers = [int(arg) for arg in sys.argv[1:]] or [10000, 100000, 1000000]
+    directory = tempfile.mkdtemp()
+    try:
+        for n in atom_numbers:
+            benchmark(n_atoms=n, directory=directory)
+    finally:
+        shutil.rmtree(directory)
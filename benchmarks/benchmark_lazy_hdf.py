@@ -0,0 +1,51 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark reading parts of a large trajectory stored in an HDF5 file - by reading the complete array and indexing it
+in memory and by indexing the HDF5DatasetProxy returned in lazy mode, which only reads the selected hyperslab. The
+arguments are the number of steps and the number of atoms.
+
+    python benchmarks/benchmark_lazy_hdf.py 2000 10000
+"""
+
+import numpy as np
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pyiron.base.generic.hdfio import FileHDFio
+
+SELECTIONS = [("last step", -1),
+              ("every 100th step", slice(None, None, 100)),
+              ("10 random steps", np.random.RandomState(0).randint(0, 2000, 10)),
+              ("one atom", (slice(None), 0))]
+
+
+def read(hdf, index):
+    start = time.time()
+    data = hdf["positions"][index]
+    return data, time.time() - start
+
+
+if __name__ == "__main__":
+    n_steps, n_atoms = [int(arg) for arg in sys.argv[1:3]] or [2000, 10000]
+    directory = tempfile.mkdtemp()
+    try:
+        hdf = FileHDFio(file_name=os.path.join(directory, "benchmark.h5"))
+        hdf.put_array("positions", np.random.random((n_steps, n_atoms, 3)))
+        lazy_hdf = hdf.copy()
+        lazy_hdf.lazy = True
+        for name, index in SELECTIONS:
+            if isinstance(index, np.ndarray):
+                index = index % n_steps
+            data, t_full = read(hdf, index)
+            data_lazy, t_lazy = read(lazy_hdf, index)
+            if not np.array_equal(data, data_lazy):
+                raise ValueError("The lazily read data does not agree.")
+            print("{} x {} x 3, {:>16s}: full read {:7.3f} s   lazy read {:7.3f} s".format(
+                n_steps, n_atoms, name, t_full, t_lazy))
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,92 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark the database queries a master job issues to check its child jobs - ParallelMaster.is_finished(),
+GenericMaster.child_names and the child lookup of ParallelMaster.__getitem__() - comparing one query per child with the
+aggregated queries.
+
+    python benchmarks/benchmark_master_children.py 100 1000 2000
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pyiron.base.database.generic import DatabaseAccess
+from pyiron.base.job.core import JobCore
+from pyiron.base.master.generic import GenericMaster
+from pyiron.base.master.parallel import ParallelMaster
+
+
+class Namespace(object):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class MasterStub(object):
+    """
+    Minimal stand-in for a ParallelMaster, providing the attributes used by the child queries
+    """
+    def __init__(self, database, job_id, n_children):
+        self.project = Namespace(db=database)
+        self.status = Namespace(finished=False)
+        self.job_id = job_id
+        self._child_id_func = None
+        self._job_generator = range(n_children)
+
+    child_ids = JobCore.child_ids
+    child_names = GenericMaster.child_names
+    _get_child_items = GenericMaster._get_child_items
+    _get_child_id_and_name_lst = GenericMaster._get_child_id_and_name_lst
+    _get_child_status_count = GenericMaster._get_child_status_count
+    is_finished = ParallelMaster.is_finished
+
+
+def check_children_per_item(master):
+    db = master.project.db
+    child_ids = master.child_ids
+    finished = len(child_ids) >= len(master._job_generator) and set(
+        [db.get_item_by_id(child_id)['status'] for child_id in master.child_ids]) < {'finished', 'aborted'}
+    child_names = dict((child_id, db.get_item_by_id(child_id)['job']) for child_id in master.child_ids)
+    child_name_lst = [db.get_item_by_id(child_id)['job'] for child_id in master.child_ids]
+    return finished, child_names, child_name_lst
+
+
+def check_children_aggregated(master):
+    return master.is_finished(), master.child_names, master._get_child_id_and_name_lst()[1]
+
+
+def benchmark(n_children, directory):
+    database = DatabaseAccess('sqlite:///' + os.path.join(directory, 'master_{}.db'.format(n_children)),
+                              'jobs_pyiron')
+    now = datetime.now()
+    item = {'projectpath': '/benchmark/', 'project': 'master/', 'chemicalformula': 'Fe', 'status': 'finished',
+            'hamilton': 'ExampleJob', 'hamversion': '0.1', 'username': 'pyiron', 'computer': 'localhost',
+            'timestart': now}
+    master_id = database.add_item_dict(dict(item, job='master', subjob='/master', hamilton='ParallelMaster'))
+    database.add_items([dict(item, job='child_{}'.format(i), subjob='/child_{}'.format(i), masterid=master_id)
+                        for i in range(n_children)])
+    master = MasterStub(database=database, job_id=master_id, n_children=n_children)
+    result = {}
+    for label, funct in [('per item', check_children_per_item), ('aggregated', check_children_aggregated)]:
+        database.statistics.reset()
+        start = time.time()
+        result[label] = (funct(master), time.time() - start, database.statistics.queries)
+    assert result['per item'][0] == result['aggregated'][0]
+    print('{:>6d} children  per item: {:8.3f} s {:>6d} queries   aggregated: {:8.3f} s {:>6d} queries'.format(
+        n_children, result['per item'][1], result['per item'][2], result['aggregated'][1],
+        result['aggregated'][2]))
+    database.conn.close()
+
+
+if __name__ == '__main__':
+    directory = tempfile.mkdtemp()
+    try:
+        for n in [int(arg) for arg in sys.argv[1:]] or [100, 1000, 2000]:
+            benchmark(n_children=n, directory=directory)
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,39 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark the periodic neighbor search of Atoms.get_neighbors() for bcc iron supercells with thermal noise, searching
+for a fixed number of neighbors and for all neighbors within a cutoff radius.
+
+    python benchmarks/benchmark_neighbors.py 1000 10000 100000
+"""
+
+import numpy as np
+import sys
+import time
+from pyiron.atomistics.structure.atoms import CrystalStructure
+
+
+def create_structure(n_atoms):
+    n_repeat = max(int(round((n_atoms / 2.) ** (1. / 3.))), 1)
+    structure = CrystalStructure('Fe', bravais_basis='bcc', lattice_constants=[2.83]).repeat(3 * [n_repeat])
+    structure.positions += np.random.normal(scale=0.05, size=structure.positions.shape)
+    return structure
+
+
+def benchmark(n_atoms):
+    structure = create_structure(n_atoms)
+    start = time.time()
+    neighbors = structure.get_neighbors(num_neighbors=14)
+    time_num_neighbors = time.time() - start
+    start = time.time()
+    structure.get_neighbors(cutoff_radius=2.6, num_neighbors=20)
+    time_cutoff = time.time() - start
+    print('{:>7d} atoms  14 neighbors: {:8.3f} s   cutoff: {:8.3f} s   shells: {}'.format(
+        len(structure), time_num_neighbors, time_cutoff, np.max(neighbors.shells)))
+
+
+if __name__ == '__main__':
+    for n in [int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000]:
+        benchmark(n_atoms=n)
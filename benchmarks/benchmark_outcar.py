@@ -0,0 +1,86 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark the single pass OUTCAR parser against calling the individual Outcar.get_*() functions, which each scan the
+whole file. The synthetic OUTCAR files are created by repeating the ionic step of a test OUTCAR file.
+
+    python benchmarks/benchmark_outcar.py 100 1000 10000
+"""
+
+import numpy as np
+import os
+import shutil
+import sys
+import tempfile
+import time
+import warnings
+from pyiron.vasp.outcar import Outcar
+
+TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'static', 'vasp_test_files',
+                        'outcar_samples', 'OUTCAR_1')
+
+
+def create_outcar(file_name, n_steps, template=TEMPLATE):
+    with open(template, 'r') as f:
+        lines = f.readlines()
+    step_start = [i for i, line in enumerate(lines) if 'Iteration' in line][0]
+    step_stop = [i for i, line in enumerate(lines) if 'LOOP+' in line][-1] + 1
+    with open(file_name, 'w') as f:
+        f.writelines(lines[:step_start])
+        for _ in range(n_steps):
+            f.writelines(lines[step_start:step_stop])
+        f.writelines(lines[step_stop:])
+
+
+def parse_with_getters(filename):
+    outcar = Outcar()
+    with open(filename, 'r') as f:
+        lines = f.readlines()
+    n_atoms = outcar.get_number_of_atoms(filename=filename, lines=lines)
+    return {'energies': outcar.get_total_energies(filename=filename, lines=lines),
+            'energies_int': outcar.get_energy_without_entropy(filename=filename, lines=lines),
+            'energies_zero': outcar.get_energy_sigma_0(filename=filename, lines=lines),
+            'scf_energies': outcar.get_all_total_energies(filename=filename, lines=lines),
+            'forces': outcar.get_forces(filename=filename, lines=lines, n_atoms=n_atoms),
+            'positions': outcar.get_positions(filename=filename, lines=lines, n_atoms=n_atoms),
+            'cells': outcar.get_cells(filename=filename, lines=lines),
+            'steps': outcar.get_steps(filename=filename, lines=lines),
+            'temperatures': outcar.get_temperatures(filename=filename, lines=lines),
+            'time': outcar.get_time(filename=filename, lines=lines),
+            'fermi_level': outcar.get_fermi_level(filename=filename, lines=lines),
+            'scf_dipole_moments': outcar.get_dipole_moments(filename=filename, lines=lines),
+            'kin_energy_error': outcar.get_kinetic_energy_error(filename=filename, lines=lines),
+            'stresses': outcar.get_stresses(filename=filename, si_unit=False, lines=lines),
+            'n_elect': outcar.get_nelect(filename=filename, lines=lines),
+            'irreducible_kpoints': outcar.get_irreducible_kpoints(filename=filename, lines=lines),
+            'magnetization': outcar.get_magnetization(filename=filename, lines=lines),
+            'broyden_mixing': outcar.get_broyden_mixing_mesh(filename=filename, lines=lines)}
+
+
+def benchmark(n_steps, directory):
+    file_name = os.path.join(directory, 'OUTCAR_{}'.format(n_steps))
+    create_outcar(file_name=file_name, n_steps=n_steps)
+    start = time.time()
+    parse_dict = parse_with_getters(filename=file_name)
+    time_getters = time.time() - start
+    outcar = Outcar()
+    start = time.time()
+    outcar.from_file(filename=file_name)
+    time_scanner = time.time() - start
+    for key in ['energies', 'forces', 'positions', 'cells', 'stresses']:
+        assert np.array_equal(parse_dict[key], outcar.parse_dict[key])
+    print('{:>7d} ionic steps ({:7.1f} MB)  get_*(): {:8.3f} s  from_file(): {:8.3f} s'.format(
+        n_steps, os.path.getsize(file_name) / 1e6, time_getters, time_scanner))
+    os.remove(file_name)
+
+
+if __name__ == '__main__':
+    warnings.simplefilter('ignore')
+    directory = tempfile.mkdtemp()
+    try:
+        for n in [int(arg) for arg in sys.argv[1:]] or [100, 1000, 10000]:
+            benchmark(n_steps=n, directory=directory)
+    finally:
+        shutil.rmtree(directory)
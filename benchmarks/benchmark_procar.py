@@ -0,0 +1,71 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark parsing synthetic spin polarized PROCAR files with (LORBIT = 11) projections. The arguments are the number
+of k-points, bands and atoms.
+
+    python benchmarks/benchmark_procar.py 50 100 50
+"""
+
+import numpy as np
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from pyiron.vasp.procar import Procar
+
+ORBITALS = ["s", "py", "pz", "px", "dxy", "dyz", "dz2", "dxz", "x2-y2"]
+
+
+def create_procar(file_name, n_kpoints, n_bands, n_atoms, n_spins=2):
+    projections = np.random.random((n_spins, n_kpoints, n_bands, n_atoms, len(ORBITALS))) / 10
+    row_format = " ".join(["{:5d}"] + ["{:6.3f}"] * (len(ORBITALS) + 1)) + "\n"
+    tot_format = " ".join(["tot  "] + ["{:6.3f}"] * (len(ORBITALS) + 1)) + "\n"
+    header = " ".join(["ion  "] + ["{:>6s}".format(o) for o in ORBITALS] + ["   tot"]) + "\n"
+    with open(file_name, "w") as f:
+        f.write("PROCAR lm decomposed\n")
+        for spin in range(n_spins):
+            f.write("# of k-points:  {:>3d}         # of bands: {:>3d}         # of ions: {:>3d}\n\n".format(
+                n_kpoints, n_bands, n_atoms))
+            for k in range(n_kpoints):
+                f.write(" k-point {:>4d} :    {:11.8f}{:11.8f}{:11.8f}     weight = {:.8f}\n\n".format(
+                    k + 1, 0.1 * k, 0.05 * (k % 3 - 1), 0, 1. / n_kpoints))
+                for b in range(n_bands):
+                    f.write("band {:>5d} # energy {:13.8f} # occ. {:11.8f}\n\n".format(
+                        b + 1, -10 + 0.1 * b, max(0., 1. - b / n_bands)))
+                    f.write(header)
+                    for a in range(n_atoms):
+                        values = projections[spin, k, b, a]
+                        f.write(row_format.format(a + 1, *np.append(values, np.sum(values))))
+                    values = np.sum(projections[spin, k, b], axis=0)
+                    f.write(tot_format.format(*np.append(values, np.sum(values))))
+                    f.write("\n")
+                f.write("\n")
+    return np.round(projections, 3)
+
+
+def benchmark(n_kpoints, n_bands, n_atoms, directory):
+    file_name = os.path.join(directory, "PROCAR_{}_{}_{}".format(n_kpoints, n_bands, n_atoms))
+    projections = create_procar(file_name, n_kpoints, n_bands, n_atoms)
+    size = os.path.getsize(file_name) / 1024 ** 2
+    start = time.time()
+    es_obj = Procar().from_file(filename=file_name)
+    t_parse = time.time() - start
+    if not np.allclose(es_obj.grand_dos_matrix, projections):
+        raise ValueError("The parsed projections do not agree.")
+    print("{:>4d} k-points {:>4d} bands {:>4d} atoms ({:7.1f} MB): {:6.2f} s".format(
+        n_kpoints, n_bands, n_atoms, size, t_parse))
+
+
+if __name__ == "__main__":
+    n_kpoints, n_bands, n_atoms = [int(arg) for arg in sys.argv[1:4]] or [50, 100, 50]
+    directory = tempfile.mkdtemp()
+    try:
+        benchmark(n_kpoints=n_kpoints, n_bands=n_bands, n_atoms=n_atoms, directory=directory)
+    finally:
+        shutil.rmtree(directory)
+    print("peak memory: {:.0f} MB".format(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))
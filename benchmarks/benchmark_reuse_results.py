@@ -0,0 +1,48 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark running the same energy volume curve twice with server.reuse_results enabled - the first Murnaghan job
+executes all its child jobs, the second one reuses their output. The project is created in the current directory,
+which has to be part of the pyiron project paths, and pyiron has to be importable by the executable of the
+AtomisticExampleJob. The arguments are the number of volumes and the size of the fcc supercell.
+
+    python benchmarks/benchmark_reuse_results.py 11 2
+"""
+
+import numpy as np
+import os
+import sys
+import time
+from pyiron.project import Project
+
+
+def run_murnaghan(project, job_name, num_points, size):
+    job = project.create_job(project.job_type.AtomisticExampleJob, job_name + "_ref")
+    job.structure = project.create_structure("Fe", "fcc", 3.5).repeat(size)
+    job.server.reuse_results = True
+    murn = project.create_job("Murnaghan", job_name)
+    murn.ref_job = job
+    murn.input["num_points"] = num_points
+    murn.server.reuse_results = True
+    start = time.time()
+    murn.run()
+    run_time = time.time() - start
+    return murn, run_time
+
+
+if __name__ == '__main__':
+    num_points, size = [int(arg) for arg in sys.argv[1:3]] or [11, 2]
+    project = Project(os.path.abspath('benchmark_reuse_results'))
+    try:
+        murn_first, t_first = run_murnaghan(project, "murn_first", num_points, size)
+        murn_second, t_second = run_murnaghan(project, "murn_second", num_points, size)
+        if not np.array_equal(murn_first.gather("output/generic/energy_tot"),
+                              murn_second.gather("output/generic/energy_tot")):
+            raise ValueError("The reused energies do not agree.")
+        for name, murn, run_time in [("first", murn_first, t_first), ("second", murn_second, t_second)]:
+            print("{} Murnaghan with {} volumes: {:.2f} s   {}".format(
+                name, num_points, run_time, murn.get_reuse_statistics()))
+    finally:
+        project.remove(enable=True, enforce=True)
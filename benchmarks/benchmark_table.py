@@ -0,0 +1,64 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark PyironTable.create_table() for a project of copies of the VASP test job - serial, with a pool of worker
+processes, repeated with the cached results and after adding a new column. The project is created in the current
+directory, which has to be part of the pyiron project paths. The arguments are the number of jobs followed by the number
+of worker processes.
+
+    python benchmarks/benchmark_table.py 100 4
+"""
+
+import os
+import sys
+import time
+from pyiron.project import Project
+from pyiron.table.datamining import PyironTable
+
+
+def create_project(path, n_jobs):
+    project = Project(path)
+    project.import_from_path(path=os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                               '../tests/static/vasp_test_files/full_job_sample'),
+                             recursive=False)
+    job = project.load(project.get_job_ids()[0])
+    for i in range(1, n_jobs):
+        job.copy_to(project=project.open('copy_{}'.format(i // 100)), new_job_name='job_{}'.format(i))
+    return project
+
+
+def get_energy_difference(job):
+    return job['output/generic/energy_tot'][-1] - job['output/generic/energy_pot'][-1]
+
+
+def create_table(table, **kwargs):
+    start = time.time()
+    table.create_table(**kwargs)
+    return time.time() - start
+
+
+def benchmark(n_jobs, workers, project):
+    table = PyironTable(project=project)
+    _ = table.add.get_energy_tot
+    _ = table.add.get_job_name
+    _ = table.add.get_total_number_of_atoms
+    t_serial = create_table(table, enforce_update=True)
+    t_parallel = create_table(table, enforce_update=True, workers=workers)
+    t_cached = create_table(table)
+    table.add['energy_difference'] = get_energy_difference
+    t_column = create_table(table, workers=workers)
+    assert len(table.get_dataframe()) == n_jobs
+    print('{} jobs  serial: {:.2f} s   {} workers: {:.2f} s   cached: {:.2f} s   new column: {:.2f} s'.format(
+        n_jobs, t_serial, workers, t_parallel, t_cached, t_column))
+
+
+if __name__ == '__main__':
+    n_jobs, workers = [int(arg) for arg in sys.argv[1:3]] or [100, 4]
+    project = create_project(os.path.abspath('benchmark_table'), n_jobs)
+    try:
+        benchmark(n_jobs=n_jobs, workers=workers, project=project)
+    finally:
+        project.remove_jobs(recursive=True)
+        project.remove(enable=True)
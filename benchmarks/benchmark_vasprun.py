@@ -0,0 +1,66 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Benchmark the streaming vasprun.xml parser against building the full XML tree, measuring the run time and the peak
+memory. The synthetic vasprun.xml files are created by repeating the ionic step (including the projected DOS) of a test
+vasprun.xml file.
+
+    python benchmarks/benchmark_vasprun.py 10 50 100
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from pyiron.vasp.vasprun import Vasprun
+
+TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'static', 'vasp_test_files',
+                        'vasprun_samples', 'vasprun_2.xml')
+
+
+def create_vasprun(file_name, n_steps, template=TEMPLATE):
+    with open(template, 'r') as f:
+        content = f.read()
+    step_start = content.index('<calculation>')
+    step_stop = content.index('</calculation>') + len('</calculation>\n')
+    with open(file_name, 'w') as f:
+        f.write(content[:step_start])
+        for _ in range(n_steps):
+            f.write(content[step_start:step_stop])
+        f.write(content[step_stop:])
+
+
+def measure(file_name, **kwargs):
+    tracemalloc.start()
+    start = time.time()
+    Vasprun().from_file(filename=file_name, **kwargs)
+    total = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return total, peak / 1e6
+
+
+def benchmark(n_steps, directory):
+    file_name = os.path.join(directory, 'vasprun_{}.xml'.format(n_steps))
+    create_vasprun(file_name=file_name, n_steps=n_steps)
+    print('{:>5d} ionic steps ({:7.1f} MB)'.format(n_steps, os.path.getsize(file_name) / 1e6))
+    for label, kwargs in [('full tree', {'streaming': False}),
+                          ('streaming', {'streaming': True}),
+                          ('streaming, skip pDOS', {'streaming': True, 'skip_sections': ['projected', 'partial']})]:
+        print('    {:<22s} {:8.3f} s  peak memory: {:8.1f} MB'.format(label, *measure(file_name, **kwargs)))
+    os.remove(file_name)
+
+
+if __name__ == '__main__':
+    warnings.simplefilter('ignore')
+    directory = tempfile.mkdtemp()
+    try:
+        for n in [int(arg) for arg in sys.argv[1:]] or [10, 50, 100]:
+            benchmark(n_steps=n, directory=directory)
+    finally:
+        shutil.rmtree(directory)
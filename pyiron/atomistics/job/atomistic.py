@@ -413,19 +413,23 @@ class AtomisticGenericJob(GenericJobCore):
             pyiron.atomistics.job.atomistic.Trajectory: Trajectory instance
 
         """
-        if snapshot_indices is None:
+        # read the output lazily, so only the selected snapshots are read from the HDF5 file
+        lazy, self.project_hdf5.lazy = self.project_hdf5.lazy, True
+        try:
             positions = self.output.positions
             cells = self.output.cells
-        else:
-            positions = self.output.positions[snapshot_indices]
-            cells = self.output.cells[snapshot_indices]
-        if atom_indices is None:
-            return Trajectory(positions[::stride], self.structure.get_parent_basis(),
-                              center_of_mass=center_of_mass, cells=cells[::stride])
-        else:
-            return Trajectory(positions[::stride, atom_indices, :],
-                              self.structure.get_parent_basis()[atom_indices], center_of_mass=center_of_mass,
-                              cells=cells[::stride])
+            if snapshot_indices is not None:
+                positions = positions[snapshot_indices]
+                cells = cells[snapshot_indices]
+            if atom_indices is None:
+                return Trajectory(positions[::stride], self.structure.get_parent_basis(),
+                                  center_of_mass=center_of_mass, cells=cells[::stride])
+            else:
+                return Trajectory(positions[::stride, atom_indices, :],
+                                  self.structure.get_parent_basis()[atom_indices], center_of_mass=center_of_mass,
+                                  cells=cells[::stride])
+        finally:
+            self.project_hdf5.lazy = lazy
 
     def write_traj(self, filename, file_format=None, parallel=True, append=False, stride=1, center_of_mass=False,
                    atom_indices=None, snapshot_indices=None, **kwargs):
@@ -544,6 +548,30 @@ class AtomisticGenericJob(GenericJobCore):
             with self.project_hdf5.open("input") as hdf5_input:
                 self.structure = Atoms().from_hdf(hdf5_input)
 
+    def _get_input_hash_items(self, exclude_nodes=None, decimals=8):
+        """
+        Internal helper function to collect the content of the input hash - the species, positions and cell of the
+        structure are replaced by a canonicalized version, so structures which only differ by numerical noise or by the
+        order of the species list have the same input hash. All other properties of the structure are included as they
+        are stored in the HDF5 file.
+
+        Args:
+            exclude_nodes (list): nodes of the HDF5 input group, which are not included in the input hash
+            decimals (int): number of decimals the positions and the cell are rounded to
+
+        Returns:
+            list: list of bytes
+        """
+        exclude_nodes = list(exclude_nodes or []) + ['structure/species', 'structure/indices', 'structure/positions',
+                                                     'structure/cell/cell']
+        item_lst = super(AtomisticGenericJob, self)._get_input_hash_items(exclude_nodes=exclude_nodes)
+        if self.structure is not None:
+            item_lst.append(' '.join(self.structure.get_chemical_symbols()).encode())
+            for array in [self.structure.positions, self.structure.cell]:
+                if array is not None:
+                    item_lst.append((np.round(np.asarray(array, dtype=float), decimals) + 0.0).tobytes())
+        return item_lst
+
     def _write_chemical_formular_to_database(self):
         if self.structure:
             parent_structure = self.structure.get_parent_basis()
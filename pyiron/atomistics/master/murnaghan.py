@@ -702,20 +702,11 @@ class Murnaghan(AtomisticParallelMaster):
             self._output["volume"] = vol_lst[arg_lst]
             self._output["energy"] = erg_lst[arg_lst]
         else:
-            erg_lst, vol_lst, err_lst, id_lst = [], [], [], []
-            for job_id in self.child_ids:
-                ham = self.project_hdf5.inspect(job_id)
-                print('job_id: ', job_id, ham.status)
-                energy = ham["output/generic/energy_tot"][-1]
-                volume = ham["output/generic/volume"][-1]
-                erg_lst.append(np.mean(energy))
-                err_lst.append(np.var(energy))
-                vol_lst.append(volume)
-                id_lst.append(job_id)
-            vol_lst = np.array(vol_lst)
-            erg_lst = np.array(erg_lst)
-            err_lst = np.array(err_lst)
-            id_lst = np.array(id_lst)
+            (energy, vol_lst), id_lst = self.gather(["output/generic/energy_tot", "output/generic/volume"],
+                                                    workers=self._get_gather_workers(), return_ids=True)
+            energy = energy.reshape(len(energy), -1)
+            erg_lst = np.mean(energy, axis=1)
+            err_lst = np.var(energy, axis=1)
             arg_lst = np.argsort(vol_lst)
 
             self._output["volume"] = vol_lst[arg_lst]
@@ -209,7 +209,7 @@ class PhonopyJob(AtomisticParallelMaster):
         if self.server.run_mode.interactive:
             forces_lst = self.project_hdf5.inspect(self.child_ids[0])["output/generic/forces"]
         else:
-            forces_lst = [self.project_hdf5.inspect(job_id)["output/generic/forces"][-1] for job_id in self.child_ids]
+            forces_lst = self.gather("output/generic/forces", workers=self._get_gather_workers())
         self.phonopy.set_forces(forces_lst)
         self.phonopy.produce_force_constants()
         self.phonopy.set_mesh(mesh=[self.input['dos_mesh']] * 3)
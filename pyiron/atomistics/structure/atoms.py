@@ -1411,78 +1411,48 @@ class Atoms(object):
         xyz = self.get_scaled_positions(wrap=False)
         return xyz[:,0], xyz[:,1], xyz[:,2]
 
-    def __select_slice(self, i_dim, i_flag, dist):
+    def get_boundary_region(self, dist):
         """
+        get all atoms in the boundary around the supercell which have a distance
+        to the supercell boundary of less than dist
         
         Args:
-            i_dim: 
-            i_flag: 
-            dist: 
+            dist (float): width of the boundary region in relative coordinates
 
         Returns:
+            pyiron.atomistics.structure.atoms.Atoms: periodic images of the atoms in the boundary region
 
         """
-        if i_dim + 1 > self.dimension:
-            return True
-        if i_flag == 1:
-            return self.get_scaled_positions(wrap=False)[:, i_dim] < dist
-        elif i_flag == 0:
-            return True
-        elif i_flag == -1:
-            return self.get_scaled_positions(wrap=False)[:, i_dim] > 1. - dist
+        scaled_positions, self._ia_bounds = self._get_boundary_images(dist)
+        return Atoms(indices=self.indices[self._ia_bounds], scaled_positions=scaled_positions, cell=self.cell,
+                     dimension=len(self.cell), species=self.species)
 
-    def get_boundary_region(self, dist):
+    def _get_boundary_images(self, dist):
         """
-        get all atoms in the boundary around the supercell which have a distance
-        to the supercell boundary of less than dist
-        
+        Internal function to get the relative coordinates of all periodic images of the atoms, which have a distance
+        to the supercell boundary of less than dist. The images are ordered by the translation vector and the atom
+        index.
+
         Args:
-            dist: 
+            dist (float): width of the boundary region in relative coordinates
 
         Returns:
-
+            numpy.ndarray, numpy.ndarray: relative coordinates of the images and the indices of the corresponding atoms
         """
         rel_coordinates = self.get_scaled_positions(wrap=False)
-
         dim = self.dimension
-        cell = self.cell.T  # to use same definition as ASE
-        a1 = cell[0]
-        a2, a3 = 0, 0
-        min_i, max_i = -1, 2
-        iyl, iy, izl, iz = 0, 1, 0, 1
-        if dim > 1:
-            a2 = cell[1]
-            iyl, iy = min_i, max_i
-        if dim > 2:
-            a3 = cell[2]
-            izl, iz = min_i, max_i
-
-        index = np.arange(len(self))
-        new_coordinates = np.zeros((1, dim))
-        # pbcVec = np.zeros((1, dim))
-        ia_list = np.zeros((1, 1), dtype=np.int)
-        for i0 in range(min_i, max_i):
-            for i1 in range(iyl, iy):
-                for i2 in range(izl, iz):
-                    # r_vec_abs = i0 * a1 + i1 * a2 + i2 * a3
-                    r_vec = np.array([i0, i1, i2][:dim])
-                    select = self.__select_slice(0, i0, dist) & self.__select_slice(1, i1, dist) & \
-                             self.__select_slice(2, i2, dist)
-                    if np.linalg.norm(r_vec) > 0:
-                        if len(select) > 0:
-                            sel_coordinates = rel_coordinates[select] + r_vec
-                            new_coordinates = np.append(new_coordinates, sel_coordinates, axis=0)
-                            if len(sel_coordinates) > 0:
-                                # rVecs = np.array(len(sel_coordinates) * [r_vec_abs])
-                                # pbcVec = np.append(pbcVec, rVecs, axis=0)
-                                ia_list = np.append(ia_list, index[select])
-                                # print "rVec: ", i0,i1,i2,rVecs[0],index[select],select
-
-        element_list = [self.indices[ia] for ia in ia_list[1:]]
-        self._ia_bounds = ia_list[1:]
-        # self._pbcVec = pbcVec[1:]
-        return Atoms(indices=element_list, scaled_positions=new_coordinates[1:], cell=self.cell,
-                     dimension=len(cell), species=self.species)
+        n_images = max(int(np.ceil(dist)), 1)
+        shifts = np.arange(-n_images, n_images + 1)
+        translations = np.zeros(((2 * n_images + 1) ** dim, rel_coordinates.shape[1]), dtype=int)
+        translations[:, :dim] = np.array(np.meshgrid(*(dim * [shifts]), indexing='ij')).reshape(dim, -1).T
+        translations = translations[np.any(translations != 0, axis=1)]
+        select = np.ones((len(translations), len(self)), dtype=bool)
+        for i_dim in range(dim):
+            shift = translations[:, i_dim:i_dim + 1]
+            coordinate = rel_coordinates[:, i_dim] + shift
+            select &= (shift == 0) | ((coordinate > -dist) & (coordinate < 1. + dist))
+        i_translation, i_atom = np.nonzero(select)
+        return rel_coordinates[i_atom] + translations[i_translation], i_atom
 
     def get_neighbors(self,
                       num_neighbors=12,
@@ -1512,7 +1482,8 @@ class Atoms(object):
         Returns:
 
             pyiron.atomistics.structure.atoms.Neighbors: Neighbors instances with the neighbor indices, distances
-            and vectors
+            and vectors - the attributes are 2D arrays if all atoms have the same number of neighbors and arrays of
+            arrays otherwise.
 
         """
         if cutoff is not None and cutoff_radius is None:
@@ -1525,120 +1496,62 @@ class Atoms(object):
         if exclude_self:
             i_start = 1
 
-        def f_ind(x):
-            return x < len(self)
-
         num_neighbors += 1
         neighbor_obj = Neighbors()
         if not include_boundary:  # periodic boundaries are NOT included
             tree = cKDTree(self.positions)
             if cutoff_radius is None:
-                neighbors = tree.query(self.positions, k=num_neighbors)
+                distances, indices = tree.query(self.positions, k=num_neighbors)
             else:
-                neighbors = tree.query(self.positions, k=num_neighbors, distance_upper_bound=cutoff_radius)
-
-            d_lst, ind_lst, v_lst = [], [], []
-            ic = 0
-            for d_i, ind_i in zip(neighbors[0], neighbors[1]):
-                ff = (ind_i < len(self)) & (ind_i != ic)
-                ind_l = ind_i[ff]
-                ind_lst.append(ind_l)
-                d_lst.append(d_i[ff])
-                v_lst.append(self.positions[ind_l] - self.positions[ic])
-                ic += 1
-            neighbor_obj.indices = ind_lst
-            neighbor_obj.distances = d_lst
-            neighbor_obj.vecs = v_lst
+                distances, indices = tree.query(self.positions, k=num_neighbors, distance_upper_bound=cutoff_radius)
+            select = (indices < len(self)) & (indices != np.arange(len(self))[:, np.newaxis])
+            indices = np.where(select, indices, 0)
+            neighbor_obj.indices = _get_selected_rows(indices, select)
+            neighbor_obj.distances = _get_selected_rows(distances, select)
+            neighbor_obj.vecs = _get_selected_rows(self.positions[indices] - self.positions[:, np.newaxis, :], select)
             return neighbor_obj
 
         # include periodic boundaries
         # translate radius in boundary layer with relative coordinates
         # TODO: introduce more rigoros definition
         radius = 3 * num_neighbors ** (1. / 3.)
+        if cutoff_radius is not None:
+            radius = max(radius, cutoff_radius)
         rel_width = [radius / np.sqrt(np.dot(a_i, a_i)) for a_i in self.cell]
         rel_width_scalar = np.max(rel_width)
 
-        # construct cell with additional atoms bounding original cell
-        boundary_atoms = self.get_boundary_region(rel_width_scalar)
-        extended_cell = self + boundary_atoms
-
-        # build index to map boundary atoms back to original cell
-        map_to_cell = np.append(np.arange(len(self)), self._ia_bounds)
+        # extend the cell by the periodic images of the atoms bounding the original cell and build an index to map the
+        # images back to the original cell
+        boundary_positions, boundary_index = self._get_boundary_images(rel_width_scalar)
+        extended_positions = np.append(self.positions, np.dot(boundary_positions, self.cell), axis=0)
+        map_to_cell = np.append(np.arange(len(self)), boundary_index)
 
-        # transfer relative to absolute coordinates
-        tree = cKDTree(extended_cell.positions)
+        tree = cKDTree(extended_positions)
         if id_list is None:
             positions = self.positions
         else:
-            positions = np.array([self.positions[i] for i in id_list])
-        # print ("len positions: ", len(positions))
+            positions = self.positions[np.array(id_list, dtype=int)]
         if cutoff_radius is None:
-            neighbors = tree.query(positions, k=num_neighbors)
+            distances, indices = tree.query(positions, k=num_neighbors)
+        else:
+            distances, indices = tree.query(positions, k=num_neighbors, distance_upper_bound=cutoff_radius)
+        distances = distances.reshape(len(positions), -1)[:, i_start:]
+        indices = indices.reshape(len(positions), -1)[:, i_start:]
+        select = indices < len(extended_positions)
+        indices = np.where(select, indices, 0)
+
+        # the distances are sorted, so the shell order increases whenever the rounded distance changes
+        shells = np.ones(distances.shape, dtype=int)
+        shells[:, 1:] += np.cumsum(np.diff(np.around(np.where(select, distances, 0), decimals=tolerance), axis=1) != 0,
+                                   axis=1)
+
+        neighbor_obj.distances = _get_selected_rows(distances, select)
+        neighbor_obj.indices = _get_selected_rows(map_to_cell[indices], select)
+        neighbor_obj.shells = _get_selected_rows(shells, select)
+        if t_vec:
+            neighbor_obj.vecs = _get_selected_rows(extended_positions[indices] - positions[:, np.newaxis, :], select)
         else:
-            neighbors = tree.query(positions, k=num_neighbors, distance_upper_bound=cutoff_radius)
-
-        # print ("neighbors: ", neighbors)
-
-        self.neighbor_distance = []  # neighbors[0]
-        self.neighbor_distance_vec = []
-        self.neighbor_index = []
-
-        self.neighbor_shellOrder = []
-
-        # tolerance = 2 # tolerance for round floating point
-
-        def f_ind_ext(x):
-            return x < len(extended_cell)
-
-        neighbor_index = map(lambda x: filter(f_ind_ext, x), neighbors[1])
-        num_neighbors = []
-        for i, index in enumerate(neighbor_index):
-            # print "i, index: ", i, index
-            index = list(index)  # Filter conversion for python 3 compatibility
-            nbrs_distances = neighbors[0][i][i_start:len(index)]
-            # if radius:  # reduce neighborlist based on radius 
-            #     new_index_lst, new_dist_lst = [], []
-            #     for index_red, dis_red in zip(index, nbrs_distances):
-            #         if dis_red < radius: 
-            #             new_index_lst.append(index_red)
-            #             new_dist_lst.append(dis_red)
-            #     index, nbrs_distances= new_index_lst, new_dist_lst
-            self.neighbor_distance.append(nbrs_distances)
-            self.neighbor_index.append(map_to_cell[index][i_start:])
-            u, indices = np.unique(np.around(nbrs_distances, decimals=tolerance), return_inverse=True)
-            self.neighbor_shellOrder.append(indices + 1)  # this gives the shellOrder of neighboring atoms back
-
-            if t_vec:
-                nbr_dist = []
-                if len(index) == 0:
-                    self.neighbor_distance_vec.append(nbr_dist)
-                    continue
-                vec0 = self.positions[index[0]]
-                for i_nbr, ind in enumerate(index[i_start:]):
-                    # ind0 = map_to_cell[ind]
-                    vec_r_ij = extended_cell.positions[ind] - vec0
-
-                    dd0 = neighbors[0][i][i_nbr + i_start]
-                    dd = np.sqrt(np.dot(vec_r_ij, vec_r_ij))
-                    if not (dd - dd0 < 0.001):
-                        raise AssertionError()
-                    # if (dd - dd0 > 0.001):
-                    #     print "wrong: ", vec_r_ij, dd,dd0,i_nbr,ind,ind0,i
-                    #     print self.positions[ind0], extended_cell.positions[ind], vec0
-                    nbr_dist.append(vec_r_ij)
-                self.neighbor_distance_vec.append(nbr_dist)
-            num_neighbors.append(len(index) - i_start)
-
-        min_nbr, max_nbr = min(num_neighbors), max(num_neighbors)
-        if max_nbr == num_neighbors:
-            # print "neighbor distance: ", self.neighbor_distance
-            raise ValueError("Increase max_num_neighbors! " + str(max_nbr) + " " + str(num_neighbors))
-        self.min_nbr_number = min_nbr
-        self.max_nbr_number = max_nbr
-        neighbor_obj.distances = self.neighbor_distance
-        neighbor_obj.vecs = self.neighbor_distance_vec
-        neighbor_obj.indices = self.neighbor_index
-        neighbor_obj.shells = self.neighbor_shellOrder
+            neighbor_obj.vecs = []
         return neighbor_obj
 
     def get_neighborhood(box, position, num_neighbors=12, t_vec=True, include_boundary=True,
@@ -3499,6 +3412,24 @@ class _CrystalStructure(Atoms):
                      pbc=[True, True, True][0:self.dimension])
 
 
+def _get_selected_rows(values, select):
+    """
+    Internal function to select entries of each row of an array of neighbor properties.
+
+    Args:
+        values (numpy.ndarray): array with one row per atom
+        select (numpy.ndarray): boolean array with the shape of the first two dimensions of values
+
+    Returns:
+        numpy.ndarray/list: array if all rows have the same number of selected entries, otherwise list of arrays
+    """
+    n_selected = np.sum(select, axis=1)
+    selected_values = values[select]
+    if len(n_selected) > 0 and np.all(n_selected == n_selected[0]):
+        return selected_values.reshape((len(n_selected), n_selected[0]) + values.shape[2:])
+    return np.split(selected_values, np.cumsum(n_selected)[:-1])
+
+
 class Neighbors:
     """
     Class for storage of the neighbor information for a given atom based on the KDtree algorithm
@@ -3549,7 +3480,7 @@ class Neighbors:
 
     @shells.setter
     def shells(self, new_shells):
-        if isinstance(new_shells, list) or isinstance(new_shells, np.array):
+        if isinstance(new_shells, list) or isinstance(new_shells, np.ndarray):
             self._shells = np.array(new_shells)
         else:
             raise TypeError('Only lists and np.arrays are supported.')
@@ -24,9 +24,12 @@ pandas.options.mode.chained_assignment = None
 
 class ChemicalElement(object):
     """
-    An Object which contains the element specific parameters
+    An Object which contains the element specific parameters. Two elements are equal if their abbreviation, their
+    parent element and their tags are equal, the hash only depends on the abbreviation.
     """
 
+    __slots__ = ('_dataset', 'sub', 'el')
+
     def __init__(self, sub):
         """
         Constructor: assign PSE dictionary to object
@@ -36,22 +39,37 @@ class ChemicalElement(object):
         self.el = None
 
     def __getattr__(self, item):
+        if item.startswith('__') or item in ChemicalElement.__slots__:
+            raise AttributeError(item)
         return self[item]
 
+    def __setattr__(self, key, value):
+        if key in ChemicalElement.__slots__:
+            super(ChemicalElement, self).__setattr__(key, value)
+        else:
+            self.sub[key] = value
+
     def __getitem__(self, item):
         if item in self.sub.index:
             return self.sub[item]
 
+    def _get_key(self):
+        """
+        Internal function to get the properties which identify the element.
+
+        Returns:
+            tuple: abbreviation, parent element and tags
+        """
+        parent = self.sub.get('Parent')
+        if isinstance(parent, float) and np.isnan(parent):
+            parent = None
+        return self.sub.get('Abbreviation'), parent, self.tags
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            conditions = list()
-            conditions.append(self.sub.to_dict() == other.sub.to_dict())
-            return all(conditions)
+            return self.sub is other.sub or self._get_key() == other._get_key()
         elif isinstance(other, (np.ndarray, list)):
-            conditions = list()
-            for sp in other:
-                conditions.append(self.sub.to_dict() == sp.sub.to_dict())
-            return any(conditions)
+            return any([self == sp for sp in other])
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -72,7 +90,7 @@ class ChemicalElement(object):
             return True
 
     def __hash__(self):
-        return hash(repr(self))
+        return hash(self.sub.get('Abbreviation'))
 
     @property
     def tags(self):
@@ -95,6 +113,8 @@ class ChemicalElement(object):
                             more than one tag can be added at once
 
         """
+        if 'tags' not in self.sub.keys() or self.sub['tags'] is None:
+            self.sub['tags'] = dict()
         (self.sub['tags']).update(tag_dic)
 
     def to_hdf(self, hdf):
@@ -125,7 +145,7 @@ class ChemicalElement(object):
                 element_data = hdf_el["elementData"]
                 for key, val in zip(element_data["Parameter"], element_data["Value"]):
                     if key in 'Parent':
-                        self.sub = pse.dataframe.loc[val]
+                        self.sub = pse._dataframe.loc[val]
                         self.sub['Parent'] = val
                     else:
                         self.sub['Parent'] = None
@@ -140,32 +160,79 @@ class ChemicalElement(object):
 
 class PeriodicTable(object):
     """
-    An Object which stores an elementary table which can be modified for the current session
+    An Object which stores an elementary table which can be modified for the current session. The default periodic
+    table is loaded only once per process and shared by all PeriodicTable objects, it is copied before it is modified,
+    so user defined elements are only added to the PeriodicTable object they were added to.
     """
+
+    _shared_dataframe_dict = {}
+
     def __init__(self, file_name=None):  # PSE_dat_file = None):
         """
 
         Args:
             file_name (str): Possibility to choose an source hdf5 file
         """
-        self.dataframe = self._get_periodic_table_df(file_name)
-        if 'Abbreviation' not in self.dataframe.columns.values:
-            self.dataframe['Abbreviation'] = None
-        if not all(self.dataframe['Abbreviation'].values):
-            for item in self.dataframe.index.values:
-                if self.dataframe['Abbreviation'][item] is None:
-                    self.dataframe['Abbreviation'][item] = item
+        if file_name:
+            self._dataframe = self._fill_abbreviation(self._get_periodic_table_df(file_name))
+            self._shared = False
+        else:
+            self._dataframe = self._get_shared_periodic_table_df()
+            self._shared = True
         self._parent_element = None
         self.el = None
 
+    @property
+    def dataframe(self):
+        """
+        Get the periodic table as pandas.DataFrame - the shared default periodic table is copied before it is returned,
+        as it might be modified.
+
+        Returns:
+            pandas.DataFrame: periodic table
+        """
+        self._copy_on_write()
+        return self._dataframe
+
+    @dataframe.setter
+    def dataframe(self, dataframe):
+        """
+        Set the periodic table
+
+        Args:
+            dataframe (pandas.DataFrame): periodic table
+        """
+        self._dataframe = dataframe
+        self._shared = False
+
     def __getattr__(self, item):
+        if item.startswith('_'):
+            raise AttributeError(item)
         return self[item]
 
     def __getitem__(self, item):
-        if item in self.dataframe.columns.values:
-            return self.dataframe[item]
-        if item in self.dataframe.index.values:
-            return self.dataframe.loc[item]
+        """
+        Get a column or an element of the periodic table - reading does not copy the shared default periodic table, so
+        modify the periodic table via the dataframe property or add_element() rather than via the returned object.
+
+        Args:
+            item (str): column name or element abbreviation
+
+        Returns:
+            pandas.Series: column or element data
+        """
+        if item in self._dataframe.columns.values:
+            return self._dataframe[item]
+        if item in self._dataframe.index.values:
+            return self._dataframe.loc[item]
+
+    def _copy_on_write(self):
+        """
+        Internal function to copy the shared default periodic table before it is modified.
+        """
+        if self._shared:
+            self._dataframe = self._dataframe.copy()
+            self._shared = False
 
     def from_hdf(self, hdf):
         """
@@ -180,6 +247,8 @@ class PeriodicTable(object):
 
         """
         elements = hdf.list_groups()  # ["elements"]
+        if len(elements) > 0:
+            self._copy_on_write()
         for el in elements:
             sub = pandas.Series()
             new_element = ChemicalElement(sub)
@@ -222,23 +291,26 @@ class PeriodicTable(object):
         else:
             stringtypes = str
         if isinstance(arg, stringtypes):
-            if arg in self.dataframe.index.values:
+            if arg in self._dataframe.index.values:
                 self.el = arg
             else:
                 raise KeyError(arg)
         elif isinstance(arg, int):
 
-            if arg in list(self.dataframe['AtomicNumber']):
-                index = list(self.dataframe['AtomicNumber']).index(arg)
-                self.el = self.dataframe.iloc[index].name
+            if arg in list(self._dataframe['AtomicNumber']):
+                index = list(self._dataframe['AtomicNumber']).index(arg)
+                self.el = self._dataframe.iloc[index].name
         else:
             raise ValueError("type not defined: " + str(type(arg)))
 
-        if qwargs is not None and 'tags' not in self.dataframe.columns.values:
-            self.dataframe['tags'] = None
+        if len(qwargs) > 0:
+            if 'tags' not in self.dataframe.columns.values:
+                self.dataframe['tags'] = None
             self.dataframe['tags'][self.el] = qwargs
 
-        element = self.dataframe.loc[self.el]
+        element = self._dataframe.loc[self.el]
+        if isinstance(element.get('tags'), dict):
+            element['tags'] = element['tags'].copy()
         # element['CovalentRadius'] /= 100
         return ChemicalElement(element)
 
@@ -251,7 +323,7 @@ class PeriodicTable(object):
         Returns boolean: true for the same element, false otherwise
 
         """
-        return symbol in self.dataframe['Abbreviation']
+        return symbol in self._dataframe['Abbreviation']
 
     def atomic_number_to_abbreviation(self, atom_no):
         """
@@ -265,7 +337,7 @@ class PeriodicTable(object):
         if not isinstance(atom_no, int):
             raise ValueError("type not defined: " + str(type(atom_no)))
 
-        return self.Abbreviation[np.nonzero(self.AtomicNumber.to_numpy() == atom_no)[0][0]]
+        return self._dataframe['Abbreviation'][np.nonzero(self._dataframe['AtomicNumber'].to_numpy() == atom_no)[0][0]]
 
     def add_element(self, parent_element, new_element, use_parent_potential=False, **qwargs):
         """
@@ -288,6 +360,7 @@ class PeriodicTable(object):
         """
 
         pandas.options.mode.chained_assignment = None
+        self._copy_on_write()
         parent_element_data_series = self.dataframe.loc[parent_element]
         parent_element_data_series['Abbreviation'] = new_element
         parent_element_data_series['Parent'] = parent_element
@@ -304,6 +377,39 @@ class PeriodicTable(object):
             self._parent_element = parent_element
         return self.element(new_element)
 
+    @classmethod
+    def _get_shared_periodic_table_df(cls):
+        """
+        Internal function to get the default periodic table, which is loaded only once per process for each set of
+        resource paths. The returned pandas.DataFrame is shared and must not be modified.
+
+        Returns:
+            pandas.DataFrame: default periodic table
+        """
+        resource_paths = tuple(s.resource_paths)
+        if resource_paths not in cls._shared_dataframe_dict:
+            cls._shared_dataframe_dict[resource_paths] = cls._fill_abbreviation(cls._get_periodic_table_df(None))
+        return cls._shared_dataframe_dict[resource_paths]
+
+    @staticmethod
+    def _fill_abbreviation(dataframe):
+        """
+        Internal function to use the index of the periodic table as abbreviation for all elements without abbreviation.
+
+        Args:
+            dataframe (pandas.DataFrame): periodic table
+
+        Returns:
+            pandas.DataFrame: periodic table with abbreviations
+        """
+        if 'Abbreviation' not in dataframe.columns.values:
+            dataframe['Abbreviation'] = None
+        if not all(dataframe['Abbreviation'].values):
+            for item in dataframe.index.values:
+                if dataframe['Abbreviation'][item] is None:
+                    dataframe['Abbreviation'][item] = item
+        return dataframe
+
     @staticmethod
     def _get_periodic_table_df(file_name):
         """
@@ -449,20 +555,22 @@ class ElementColorDictionary(object):
                      'Mt': [109, 235, 0, 38, 255]
                      }
 
+    _lut = None
+
     def to_lut(self):
         """
+        Get the lookup table of the element colors indexed by the atomic number - the table is computed once per
+        process and a copy is returned.
 
         Returns:
-
+            numpy.ndarray: lookup table of the RGBA colors with the shape (256, 4)
         """
-        rv = np.zeros((256, 4), dtype=int)
-        if sys.version_info.major > 2:
-            for k, el in self.elementColors.items():
-                rv[el[0], :] = np.array(el[1:5])
-        else:
-            for k, el in self.elementColors.iteritems():
+        if ElementColorDictionary._lut is None:
+            rv = np.zeros((256, 4), dtype=int)
+            for el in self.elementColors.values():
                 rv[el[0], :] = np.array(el[1:5])
-        return rv
+            ElementColorDictionary._lut = rv
+        return ElementColorDictionary._lut.copy()
 
 
 
@@ -23,6 +23,9 @@ class VolumetricData(object):
 
     http://pymatgen.org/_modules/pymatgen/io/vasp/outputs.html#VolumetricData
 
+    Data loaded with from_hdf() is only read from the HDF5 file when it is accessed, get_average_along_axis() reads it
+    in slabs without loading the full grid.
+
     Attributes:
 
         total_data (numpy.ndarray): A 3D array containing the data
@@ -31,6 +34,8 @@ class VolumetricData(object):
     def __init__(self):
         self._total_data = None
         self._atoms = None
+        self._hdf_group = None
+        self._hdf_nodes = list()
 
     @property
     def atoms(self):
@@ -52,6 +57,8 @@ class VolumetricData(object):
         """
         numpy.ndarray: The Nx x Ny x Nz sized array for the total data
         """
+        if self._total_data is None:
+            self._total_data = self._read_from_hdf("total")
         return self._total_data
 
     @total_data.setter
@@ -64,6 +71,58 @@ class VolumetricData(object):
         if not (len(shape) == 3):
             raise ValueError("Attribute total_data should be a 3D array")
         self._total_data = val
+        self._forget_hdf("total")
+
+    def _read_from_hdf(self, key):
+        """
+        Internal function to read data, which was not yet loaded, from the HDF5 group passed to from_hdf()
+
+        Args:
+            key (str): name of the data in the HDF5 group
+
+        Returns:
+            numpy.ndarray: The data or None if the data is not available
+        """
+        if key in self._hdf_nodes:
+            self._hdf_nodes.remove(key)
+            return self._hdf_group[key]
+
+    def _forget_hdf(self, key):
+        """
+        Internal function to stop reading data from the HDF5 group passed to from_hdf(), as it was set directly
+
+        Args:
+            key (str): name of the data in the HDF5 group
+        """
+        if key in self._hdf_nodes:
+            self._hdf_nodes.remove(key)
+
+    def _get_average_along_axis_from_hdf(self, key, ind, max_slab_size=2 ** 22):
+        """
+        Internal function to compute the lateral average of data, which was not yet loaded, reading the data from the
+        HDF5 file in slabs along the first axis.
+
+        Args:
+            key (str): name of the data in the HDF5 group
+            ind (int): Index of axis (0, 1 and 2 for the x, y, and z axis respectively)
+            max_slab_size (int): maximum number of grid points read at once
+
+        Returns:
+            numpy.ndarray: A 1D vector with the laterally averaged values of the volumetric data
+        """
+        n_x, n_y, n_z = self._hdf_group.get_array_shape(key)
+        slab_size = max(int(max_slab_size // (n_y * n_z)), 1)
+        slab_lst = [np.s_[i:i + slab_size] for i in range(0, n_x, slab_size)]
+        if ind == 0:
+            return np.concatenate([np.average(self._hdf_group.get_array_slice(key, slab), axis=(1, 2))
+                                   for slab in slab_lst])
+        plane_sum = np.zeros((n_y, n_z))
+        for slab in slab_lst:
+            plane_sum += np.sum(self._hdf_group.get_array_slice(key, slab), axis=0)
+        if ind == 1:
+            return np.sum(plane_sum, axis=1) / (n_x * n_z)
+        else:
+            return np.sum(plane_sum, axis=0) / (n_x * n_y)
 
     def get_average_along_axis(self, ind=2):
         """
@@ -78,29 +137,32 @@ class VolumetricData(object):
         Returns:
             numpy.ndarray: A 1D vector with the laterally averaged values of the volumetric data
         """
+        if self._total_data is None and "total" in self._hdf_nodes:
+            return self._get_average_along_axis_from_hdf("total", ind=ind)
         if ind == 0:
-            return np.average(np.average(self._total_data, axis=1), 1)
+            return np.average(np.average(self.total_data, axis=1), 1)
         elif ind == 1:
-            return np.average(np.average(self._total_data, axis=0), 1)
+            return np.average(np.average(self.total_data, axis=0), 1)
         else:
-            return np.average(np.average(self._total_data, axis=0), 0)
+            return np.average(np.average(self.total_data, axis=0), 0)
 
-    def to_hdf(self, hdf5, group_name="volumetric_data"):
+    def to_hdf(self, hdf5, group_name="volumetric_data", compression="gzip"):
         """
-        Writes the data as a group to a HDF5 file
+        Writes the data as a group to a HDF5 file - the grid is stored as chunked dataset
 
         Args:
             hdf5 (pyiron.base.generic.hdfio.ProjectHDFio): The HDF file/path to write the data to
             group_name (str): The name of the group under which the data must be stored as
+            compression (str/None): compression filter of the dataset, e.g. 'gzip' or 'lzf'
 
         """
         with hdf5.open(group_name) as hdf_vd:
             hdf_vd["TYPE"] = str(type(self))
-            hdf_vd["total"] = self.total_data
+            hdf_vd.put_array("total", np.asarray(self.total_data), compression=compression)
 
     def from_hdf(self, hdf5, group_name="volumetric_data"):
         """
-        Recreating the VolumetricData instance by reading data from the HDF5 files
+        Recreating the VolumetricData instance from the HDF5 files - the data is read when it is accessed
 
         Args:
             hdf5 (pyiron.base.generic.hdfio.ProjectHDFio): The HDF file/path to write the data to
@@ -111,7 +173,9 @@ class VolumetricData(object):
 
         """
         with hdf5.open(group_name) as hdf_vd:
-            self._total_data = hdf_vd["total"]
+            self._hdf_group = hdf_vd.copy()
+            self._hdf_nodes = [node for node in ["total"] if node in hdf_vd.list_nodes()]
+            self._total_data = None
 
     def write_cube_file(self, filename="cube_file.cube", cell_scaling=1.0):
         """
@@ -70,6 +70,28 @@ def _job_dict(database, sql_query, user, project_path, recursive, job=None, sub_
               'username': u'test'},.......]
 
     """
+    dict_clause = _get_dict_clause(sql_query=sql_query, user=user, project_path=project_path, recursive=recursive,
+                                   job=job, sub_job_name=sub_job_name, element_lst=element_lst)
+    s.logger.debug('sql_query: %s', str(dict_clause))
+    return database.get_items_dict(dict_clause)
+
+
+def _get_dict_clause(sql_query, user, project_path, recursive, job=None, sub_job_name="%", element_lst=None):
+    """
+    Internal function to convert the project settings to the item_dict syntax used by DatabaseAccess.get_items_dict()
+
+    Args:
+        sql_query (str): SQL query to enter a more specific request
+        user (str): username of the user whoes user space should be searched
+        project_path (str): root_path - this is in contrast to the project_path in GenericPath
+        recursive (bool): search subprojects [True/False]
+        job (str): job_name - by default None
+        sub_job_name (str): path inside the HDF5 file - "%" by default to accept any path
+        element_lst (list): list of elements required in the chemical formular - by default None
+
+    Returns:
+        dict: item_dict for DatabaseAccess.get_items_dict()
+    """
     dict_clause = {}
     # FOR GET_ITEMS_SQL: clause = []
     if user is not None:
@@ -98,8 +120,7 @@ def _job_dict(database, sql_query, user, project_path, recursive, job=None, sub_
     if element_lst is not None:
         dict_clause['element_lst'] = element_lst
 
-    s.logger.debug('sql_query: %s', str(dict_clause))
-    return database.get_items_dict(dict_clause)
+    return dict_clause
 
 
 def get_db_columns(database):
@@ -162,19 +183,16 @@ def job_table(database, sql_query, user, project_path, recursive=True, columns=N
 
     if all_columns:
         columns = all_db
-    job_dict = _job_dict(database=database,
-                         sql_query=sql_query,
-                         user=user,
-                         project_path=project_path,
-                         recursive=recursive,
-                         element_lst=element_lst)
+    dict_clause = _get_dict_clause(sql_query=sql_query, user=user, project_path=project_path, recursive=recursive,
+                                   element_lst=element_lst)
+    s.logger.debug('sql_query: %s', str(dict_clause))
+    df = database.get_items_dataframe(dict_clause, columns=columns)
     pandas.set_option('display.max_colwidth', max_colwidth)
-    df = pandas.DataFrame(job_dict)
-    if len(job_dict) == 0:
+    if len(df) == 0:
         return df
     if sort_by in columns:
-        return df[columns].sort_values(by=sort_by)
-    return df[columns]
+        return df.sort_values(by=sort_by)
+    return df
 
 
 def get_jobs(database, sql_query, user, project_path, recursive=True, columns=None):
@@ -197,17 +215,7 @@ def get_jobs(database, sql_query, user, project_path, recursive=True, columns=No
     if columns is None:
         columns = ["id", "project"]
     df = job_table(database, sql_query, user, project_path, recursive, columns=columns)
-    if len(df) == 0:
-        dictionary = {}
-        for key in columns:
-            dictionary[key] = list()
-        return dictionary
-        # return {key: list() for key in columns}
-    dictionary = {}
-    for key in df.keys():
-        dictionary[key] = df[key].tolist()  # ToDo: Check difference of tolist and to_list
-    return dictionary
-    # return {key: df[key].tolist() for key in df.keys()}
+    return {key: df[key].tolist() for key in columns}
 
 
 def get_job_ids(database, sql_query, user, project_path, recursive=True):
@@ -224,7 +232,7 @@ def get_job_ids(database, sql_query, user, project_path, recursive=True):
     Returns:
         list: a list of job IDs
     """
-    return get_jobs(database, sql_query, user, project_path, recursive=recursive)["id"]
+    return get_jobs(database, sql_query, user, project_path, recursive=recursive, columns=["id"])["id"]
 
 
 def get_child_ids(database, sql_query, user, project_path, job_specifier, status=None):
@@ -303,12 +311,19 @@ def set_job_status(database, sql_query, user, project_path, job_specifier, statu
         sql_query (str): SQL query to enter a more specific request
         user (str): username of the user whoes user space should be searched
         project_path (str): root_path - this is in contrast to the project_path in GenericPath
-        job_specifier (str): name of the job or job ID
+        job_specifier (str, int, list): name of the job or job ID - or a list of job names and job IDs to update the
+                                        status of all of them in a single transaction
         status (str): job status can be one of the following ['initialized', 'appended', 'created', 'submitted',
                      'running', 'aborted', 'collect', 'suspended', 'refresh', 'busy', 'finished']
 
     """
-    database.item_update({'status': str(status)}, get_job_id(database, sql_query, user, project_path, job_specifier))
+    if isinstance(job_specifier, (list, tuple, np.ndarray)):
+        database.update_items({'status': str(status)},
+                              [get_job_id(database, sql_query, user, project_path, specifier)
+                               for specifier in job_specifier])
+    else:
+        database.item_update({'status': str(status)},
+                             get_job_id(database, sql_query, user, project_path, job_specifier))
 
 
 def get_job_status(database, sql_query, user, project_path, job_specifier):
@@ -4,15 +4,20 @@
 
 from __future__ import print_function
 
+import atexit
+from collections import OrderedDict
+from contextlib import contextmanager
 import h5py
+import hashlib
 import os
 import importlib
 import pandas
 import posixpath
 import h5io
 import numpy as np
-from tables.exceptions import NoSuchNodeError
 import sys
+import threading
+from pyiron.base.settings.generic import Settings
 """
 Classes to map the Python objects to HDF5 data structures 
 """
@@ -26,7 +31,594 @@ __email__ = "janssen@mpie.de"
 __status__ = "production"
 __date__ = "Sep 1, 2017"
 
-  
+s = Settings()
+
+
+class HDF5FileCache(object):
+    """
+    Least recently used cache of read-only HDF5 file handles. Reading a single node used to open the HDF5 file several
+    times - to list the nodes, to list the groups, to check the h5io type of each group and finally to read the data.
+    With the cache each file is opened once and the handle is reused as long as the file on disk does not change, which
+    is checked by comparing the inode, the size and the modification time of the file on every access.
+
+    The files are opened through a Python file object rather than by the HDF5 library directly, so the cached handles
+    do not hold an HDF5 file lock and other processes can still write to the files while they are cached.
+
+    The lock of the cache is only held while the cache is looked up or modified, not while the file is read. A handle
+    which is removed from the cache while it is still being read is closed once the last reader is done.
+
+    Args:
+        max_open (int): maximum number of files which are kept open - 0 disables the cache
+    """
+    def __init__(self, max_open=32):
+        self._handles = OrderedDict()
+        self._lock = threading.RLock()
+        self._max_open = 0
+        self.max_open = max_open
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_open(self):
+        """
+        Get the maximum number of files which are kept open
+
+        Returns:
+            int: maximum number of open files
+        """
+        return self._max_open
+
+    @max_open.setter
+    def max_open(self, max_open):
+        """
+        Set the maximum number of files which are kept open, the least recently used files are closed if necessary.
+
+        Args:
+            max_open (int): maximum number of open files - 0 disables the cache
+        """
+        if max_open < 0:
+            raise ValueError('max_open has to be a positive integer or 0 to disable the cache.')
+        with self._lock:
+            self._max_open = int(max_open)
+            self._evict()
+
+    @contextmanager
+    def open(self, file_name):
+        """
+        Open an HDF5 file for reading, if the file was opened before and did not change the cached handle is used.
+
+        Args:
+            file_name (str): absolute path to the HDF5 file
+
+        Returns:
+            h5py.File: read-only file handle or None if the file does not exist
+        """
+        with self._lock:
+            entry = self._get(file_name)
+            if entry is not None:
+                entry.users += 1
+        try:
+            yield entry.h5_file if entry is not None else None
+        finally:
+            if entry is not None:
+                with self._lock:
+                    entry.users -= 1
+                    if self._max_open == 0 or file_name not in self._handles or \
+                            self._handles[file_name] is not entry:
+                        self._close(entry)
+
+    def invalidate(self, file_name):
+        """
+        Close the cached handle of an HDF5 file - has to be called before the file is modified, renamed or removed.
+
+        Args:
+            file_name (str): absolute path to the HDF5 file
+        """
+        with self._lock:
+            entry = self._handles.pop(file_name, None)
+            if entry is not None:
+                self._close(entry)
+
+    def invalidate_directory(self, directory):
+        """
+        Close the cached handles of all HDF5 files in a directory and its subdirectories - has to be called before the
+        directory is moved or removed.
+
+        Args:
+            directory (str): absolute path to the directory
+        """
+        directory = os.path.join(os.path.abspath(directory), '')
+        with self._lock:
+            for file_name in [f for f in self._handles.keys() if os.path.abspath(f).startswith(directory)]:
+                self._close(self._handles.pop(file_name))
+
+    def clear(self):
+        """
+        Close all cached file handles
+        """
+        with self._lock:
+            while len(self._handles) > 0:
+                self._close(self._handles.popitem()[1])
+
+    def detach(self):
+        """
+        Forget all cached file handles without closing them - has to be called in a forked worker process, as the handles
+        and their file descriptors are shared with the parent process.
+        """
+        self._lock = threading.RLock()
+        self._handles = OrderedDict()
+
+    def __len__(self):
+        """
+        Number of currently opened files
+
+        Returns:
+            int: number of open files
+        """
+        return len(self._handles)
+
+    def _get(self, file_name):
+        """
+        Internal function to get the cache entry for an HDF5 file - the file is (re-)opened if necessary.
+
+        Args:
+            file_name (str): absolute path to the HDF5 file
+
+        Returns:
+            _HDF5FileCacheEntry: cache entry or None if the file does not exist
+        """
+        try:
+            stat = os.stat(file_name)
+        except OSError:
+            self.invalidate(file_name)
+            return None
+        file_state = (stat.st_ino, stat.st_size, stat.st_mtime)
+        entry = self._handles.pop(file_name, None)
+        if entry is not None:
+            if entry.file_state == file_state:
+                self.hits += 1
+                self._handles[file_name] = entry
+                return entry
+            self._close(entry)
+        self.misses += 1
+        file_object = open(file_name, 'rb')
+        try:
+            entry = _HDF5FileCacheEntry(file_state, file_object, h5py.File(file_object, mode='r'))
+        except Exception:
+            file_object.close()
+            raise
+        if self._max_open > 0:
+            self._handles[file_name] = entry
+            self._evict()
+        return entry
+
+    def _evict(self):
+        """
+        Internal function to close the least recently used files until at most max_open files are open.
+        """
+        while len(self._handles) > self._max_open:
+            self._close(self._handles.popitem(last=False)[1])
+
+    @staticmethod
+    def _close(entry):
+        """
+        Internal function to close a cache entry which was removed from the cache - if the file is still read, it is
+        closed by the last reader.
+
+        Args:
+            entry (_HDF5FileCacheEntry): cache entry
+        """
+        if entry.users > 0:
+            return
+        try:
+            entry.h5_file.close()
+        finally:
+            entry.file_object.close()
+
+
+class _HDF5FileCacheEntry(object):
+    """
+    Cached HDF5 file handle of the HDF5FileCache.
+
+    Args:
+        file_state (tuple): inode, size and modification time of the file when it was opened
+        file_object (file): Python file object the HDF5 file is read through
+        h5_file (h5py.File): read-only file handle
+    """
+
+    __slots__ = ('file_state', 'file_object', 'h5_file', 'users')
+
+    def __init__(self, file_state, file_object, h5_file):
+        self.file_state = file_state
+        self.file_object = file_object
+        self.h5_file = h5_file
+        self.users = 0
+
+
+hdf5_file_cache = HDF5FileCache(max_open=s.hdf5_max_open_files)
+atexit.register(hdf5_file_cache.clear)
+
+
+def _get_version_tuple(version):
+    """
+    Convert a version string to a tuple of integers which can be compared, the parsing stops at the first part which
+    does not start with a number - for example '0.1.8.dev0' results in (0, 1, 8).
+
+    Args:
+        version (str): version string
+
+    Returns:
+        tuple: version numbers
+    """
+    version_lst = []
+    for part in str(version).split('.'):
+        digits = ''
+        for char in part:
+            if not char.isdigit():
+                break
+            digits += char
+        if not digits:
+            break
+        version_lst.append(int(digits))
+        if len(digits) < len(part):
+            break
+    return tuple(version_lst)
+
+
+# h5io reads from an open h5py.File since version 0.1.8, older versions require the file name
+H5IO_READS_FILE_HANDLES = _get_version_tuple(getattr(h5io, '__version__', '0')) >= (0, 1, 8)
+
+# h5io stores these objects as HDF5 groups, nevertheless they are listed as nodes
+H5IO_GROUP_TYPES = ("dict", "list", "tuple", "pd_dataframe", "pd_series", "multiarray", "json")
+
+
+def _get_title(h5_object):
+    """
+    Get the title of an HDF5 group or dataset, which h5io uses to store the type of the object.
+
+    Args:
+        h5_object (h5py.Group, h5py.Dataset): HDF5 object
+
+    Returns:
+        str: title - an empty string if the object has no title
+    """
+    title = h5_object.attrs.get("TITLE", "")
+    if isinstance(title, bytes):
+        title = title.decode()
+    return str(title)
+
+
+def _list_children(h5_group):
+    """
+    List the children of an HDF5 group, skipping the hidden index nodes PyTables creates for pandas tables.
+
+    Args:
+        h5_group (h5py.Group): HDF5 group
+
+    Returns:
+        dict: {name: h5py.Group or h5py.Dataset}
+    """
+    return {key: value for key, value in h5_group.items() if not key.startswith("_i_")}
+
+
+def _create_extendable_dataset(h5_file, title, data, compression=None):
+    """
+    Create a chunked HDF5 dataset which can be resized along the first axis - the dataset is tagged like an h5io ndarray
+    so it can be read by h5io.
+
+    Args:
+        h5_file (h5py.File): HDF5 file opened for writing
+        title (str): absolute path of the dataset
+        data (numpy.ndarray): initial data
+        compression (str): compression filter, e.g. 'gzip' or 'lzf'
+
+    Returns:
+        h5py.Dataset: new dataset
+    """
+    dataset = h5_file.create_dataset(title, data=data, maxshape=(None,) + data.shape[1:], chunks=True,
+                                     compression=compression)
+    dataset.attrs["TITLE"] = "ndarray"
+    return dataset
+
+
+def _is_lazy_dataset(h5_node):
+    """
+    Check if an HDF5 node is a numerical array stored as plain HDF5 dataset, which can be read in parts.
+
+    Args:
+        h5_node (h5py.Group, h5py.Dataset): HDF5 object
+
+    Returns:
+        bool: [True/False]
+    """
+    return isinstance(h5_node, h5py.Dataset) and h5_node.ndim > 0 and h5_node.dtype.kind in "biufc" \
+        and _get_title(h5_node) == "ndarray"
+
+
+def _get_used_size(h5_object):
+    """
+    Estimate the number of bytes an HDF5 group or dataset occupies in the file - the storage size of the data plus the
+    metadata: the object header and, for groups, the symbol table (B-tree, symbol table nodes and local heap of the
+    link names) and, for chunked datasets, the B-tree of the chunk index. The symbol table nodes are assumed to be half
+    filled, which overestimates the metadata rather than counting it as unused space.
+
+    Args:
+        h5_object (h5py.Group, h5py.Dataset): HDF5 object
+
+    Returns:
+        int: used size in Bytes
+    """
+    used_size = h5py.h5o.get_info(h5_object.id).hdr.space.total
+    if isinstance(h5_object, h5py.Dataset):
+        used_size += h5_object.id.get_storage_size()
+        if h5_object.chunks is not None and h5_object.size > 0:
+            chunk_number = np.prod([-(-length // chunk) for length, chunk in zip(h5_object.shape, h5_object.chunks)])
+            node_size = 24 + 64 * 8 + 65 * (16 + 8 * h5_object.ndim)
+            used_size += node_size * int(-(-chunk_number // 64))
+    else:
+        names = list(h5_object.keys())
+        symbol_nodes = -(-len(names) // 4)
+        used_size += 328 * symbol_nodes + 544 * max(-(-symbol_nodes // 32), 1)
+        used_size += 32 + 2 * sum(8 * (len(name.encode()) // 8 + 1) for name in names + [""])
+        for name in names:
+            used_size += _get_used_size(h5_object[name])
+    return used_size
+
+
+def _split_index(index, shape):
+    """
+    Split a numpy style index into a selection h5py reads as hyperslab and an index which is applied to the data read
+    from the file. h5py only supports slices with positive steps and a single list of increasing indices, so negative
+    steps are reversed after reading and further index arrays are replaced by the smallest slice containing them.
+
+    Args:
+        index (int, slice, list, numpy.ndarray, tuple): numpy style index
+        shape (tuple): shape of the dataset
+
+    Returns:
+        tuple: (selection for h5py, index applied to the selected data or None)
+    """
+    if not isinstance(index, tuple):
+        index = (index,)
+    index = [np.asarray(i, dtype=None if len(i) > 0 else int) if isinstance(i, (list, tuple, np.ndarray)) else i
+             for i in index]
+    n_axes = sum(i.ndim if isinstance(i, np.ndarray) and i.dtype == bool else 0 if i is None or i is Ellipsis else 1
+                 for i in index)
+    if n_axes > len(shape) or sum(i is Ellipsis for i in index) > 1:
+        raise IndexError("too many indices for array")
+    entry_lst, axis = [], 0
+    for i in index:
+        if i is Ellipsis:
+            entry_lst += [Ellipsis] + [slice(None)] * (len(shape) - n_axes)
+            axis += len(shape) - n_axes
+        elif isinstance(i, np.ndarray) and i.dtype == bool:
+            if i.shape != tuple(shape[axis:axis + i.ndim]):
+                raise IndexError("boolean index does not match the shape {}".format(shape))
+            entry_lst += list(np.nonzero(i))
+            axis += i.ndim
+        else:
+            entry_lst.append(i)
+            axis += i is not None
+    entry_lst += [slice(None)] * (len(shape) - axis)
+    fancy = any(isinstance(i, np.ndarray) for i in entry_lst)
+    selection, post, reorder, axis, n_ellipsis = [], [], any(i is None for i in entry_lst), 0, 0
+    for i in entry_lst:
+        if i is None or i is Ellipsis:
+            # the ellipsis is kept, as numpy places the axes of index arrays separated by an ellipsis differently
+            post.append(i)
+            n_ellipsis = len(shape) - n_axes if i is Ellipsis else 0
+            continue
+        length = shape[axis]
+        axis += 1
+        if n_ellipsis > 0:
+            selection.append(slice(None))
+            n_ellipsis -= 1
+        elif isinstance(i, slice):
+            start, stop, step = i.indices(length)
+            if step > 0:
+                selection.append(slice(start, stop, step))
+                post.append(slice(None))
+            else:
+                steps = range(start, stop, step)
+                selection.append(slice(steps[-1], steps[0] + 1, -step) if len(steps) > 0 else slice(0, 0))
+                post.append(slice(None, None, -1))
+                reorder = True
+        elif isinstance(i, np.ndarray):
+            if i.dtype.kind not in "iu":
+                raise IndexError("arrays used as indices must be of integer or boolean type")
+            if np.any(i >= length) or np.any(i < -length):
+                raise IndexError("index out of bounds for axis {} with size {}".format(axis - 1, length))
+            i = np.where(i < 0, i + length, i)
+            reorder = True
+            if i.size == 0:
+                selection.append(slice(0, 0))
+                post.append(i)
+                continue
+            unique, inverse = np.unique(i, return_inverse=True)
+            if unique[-1] - unique[0] < 2 * len(unique) or any(isinstance(s, list) for s in selection):
+                selection.append(slice(int(unique[0]), int(unique[-1]) + 1))
+                post.append(i - unique[0])
+            else:
+                selection.append(unique.tolist())
+                post.append(inverse.reshape(i.shape))
+        else:
+            if not isinstance(i, (int, np.integer)):
+                raise IndexError("only integers, slices, ellipsis, None and integer or boolean arrays are valid indices")
+            i = int(i)
+            if not -length <= i < length:
+                raise IndexError("index {} is out of bounds for axis {} with size {}".format(i, axis - 1, length))
+            i %= length
+            if fancy:
+                selection.append(slice(i, i + 1))
+                post.append(0)
+            else:
+                selection.append(i)
+    return tuple(selection), tuple(post) if reorder else None
+
+
+class HDF5DatasetProxy(object):
+    """
+    Lazy reference to a numerical array stored in an HDF5 file, returned by FileHDFio in lazy mode. Shape and data type
+    are available without reading the data and numpy style indices are translated to HDF5 hyperslab reads, so only the
+    selected part of the array is read from the disk. Numpy functions and np.array() read the complete array.
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+        h5_path (str): absolute path of the dataset inside the HDF5 file
+
+    .. attribute:: shape
+        shape of the array
+    .. attribute:: dtype
+        data type of the array
+    """
+    def __init__(self, file_name, h5_path):
+        self._file_name = file_name
+        self._h5_path = h5_path
+        with hdf5_file_cache.open(file_name) as h5_file:
+            if h5_file is None:
+                raise IOError('file "%s" not found' % file_name)
+            dataset = h5_file[h5_path]
+            self._shape = dataset.shape
+            self._dtype = dataset.dtype
+
+    @property
+    def file_name(self):
+        """
+        Get the file name of the HDF5 file
+
+        Returns:
+            str: absolute path to the HDF5 file
+        """
+        return self._file_name
+
+    @property
+    def h5_path(self):
+        """
+        Get the path of the dataset inside the HDF5 file
+
+        Returns:
+            str: absolute path of the dataset
+        """
+        return self._h5_path
+
+    @property
+    def shape(self):
+        """
+        Get the shape of the array
+
+        Returns:
+            tuple: shape
+        """
+        return self._shape
+
+    @property
+    def dtype(self):
+        """
+        Get the data type of the array
+
+        Returns:
+            numpy.dtype: data type
+        """
+        return self._dtype
+
+    @property
+    def ndim(self):
+        """
+        Get the number of dimensions of the array
+
+        Returns:
+            int: number of dimensions
+        """
+        return len(self._shape)
+
+    @property
+    def size(self):
+        """
+        Get the number of elements of the array
+
+        Returns:
+            int: number of elements
+        """
+        return int(np.prod(self._shape))
+
+    def tolist(self):
+        """
+        Read the complete array as nested list
+
+        Returns:
+            list: array data
+        """
+        return self[()].tolist()
+
+    def __getitem__(self, item):
+        """
+        Read a part of the array
+
+        Args:
+            item (int, slice, list, numpy.ndarray, tuple): numpy style index
+
+        Returns:
+            numpy.ndarray: selected part of the array
+        """
+        selection, post = _split_index(item, self._shape)
+        with hdf5_file_cache.open(self._file_name) as h5_file:
+            if h5_file is None:
+                raise IOError('file "%s" not found' % self._file_name)
+            dataset = h5_file[self._h5_path]
+            if dataset.shape != self._shape:
+                raise ValueError('the dataset "%s" changed on disk' % self._h5_path)
+            data = dataset[selection]
+        if post is not None:
+            return data[post]
+        return data
+
+    def __array__(self, dtype=None):
+        """
+        Read the complete array - called by np.array() and numpy functions
+
+        Args:
+            dtype (numpy.dtype): requested data type
+
+        Returns:
+            numpy.ndarray: array data
+        """
+        data = self[()]
+        if dtype is not None:
+            return data.astype(dtype, copy=False)
+        return data
+
+    def __iter__(self, max_slab_size=2 ** 24):
+        """
+        Iterate over the first axis of the array, the array is read in slabs of at most max_slab_size elements.
+
+        Args:
+            max_slab_size (int): maximum number of elements read at once
+        """
+        slab_size = max(int(max_slab_size // max(self.size // max(len(self), 1), 1)), 1)
+        for i in range(0, len(self), slab_size):
+            for row in self[i:i + slab_size]:
+                yield row
+
+    def __len__(self):
+        """
+        Length of the first axis of the array
+
+        Returns:
+            int: length
+        """
+        return self._shape[0]
+
+    def __repr__(self):
+        """
+        Human readable string representation
+
+        Returns:
+            str: file name, path, shape and data type of the dataset
+        """
+        return "HDF5DatasetProxy({}:{}, shape={}, dtype={})".format(self._file_name, self._h5_path, self._shape,
+                                                                      self._dtype)
+
+
 class HDFStoreIO(pandas.HDFStore):
     """
     dict-like IO interface for storing pandas objects in PyTables either Fixed or Table format.
@@ -100,6 +692,8 @@ class FileHDFio(object):
         boolean if the HDF5 file is currently opened - if an active file handler exists
     .. attribute:: is_empty
         boolean if the HDF5 file is empty
+    .. attribute:: lazy
+        boolean if numerical arrays are returned as HDF5DatasetProxy instead of being read
     """
     def __init__(self, file_name, h5_path="/", mode="a"):
         if not os.path.isabs(file_name):
@@ -109,6 +703,7 @@ class FileHDFio(object):
         self.history = []
         self.h5_path = h5_path
         self._filter = ["groups", "nodes", "objects"]
+        self._lazy = False
 
     @property
     def file_exists(self):
@@ -190,6 +785,27 @@ class FileHDFio(object):
         if self._h5_group[-1] != ".":
             self._h5_group += "."
 
+    @property
+    def lazy(self):
+        """
+        Check if numerical arrays are returned as HDF5DatasetProxy, which only reads the parts of the array which are
+        indexed, rather than being read completely. The setting is inherited by the groups opened from this object.
+
+        Returns:
+            bool: [True/False]
+        """
+        return self._lazy
+
+    @lazy.setter
+    def lazy(self, lazy):
+        """
+        Enable or disable returning numerical arrays as HDF5DatasetProxy
+
+        Args:
+            lazy (bool): [True/False]
+        """
+        self._lazy = bool(lazy)
+
     @property
     def is_root(self):
         """
@@ -221,14 +837,10 @@ class FileHDFio(object):
         Returns:
             bool: [True/False]
         """
-        if self.file_exists:
-            store = HDFStoreIO(self.file_name, mode='r')
-            with store.open(mode='r'):
-                len_nodes = len(eval("store.root._v_children.keys()"))
-                len_groups = len(eval("store.root._v_groups.keys()"))
-                return len_groups + len_nodes == 0
-        else:
-            return True
+        with hdf5_file_cache.open(self.file_name) as h5_file:
+            if h5_file is None:
+                return True
+            return len(_list_children(h5_file)) == 0
 
     @staticmethod
     def file_size(hdf):
@@ -243,6 +855,25 @@ class FileHDFio(object):
         """
         return os.path.getsize(hdf.file_name)
 
+    def get_free_space_fraction(self):
+        """
+        Estimate the fraction of the HDF5 file which is not used - space which was freed by deleting or overwriting
+        data but never reused. HDF5 only tracks freed space within the current session, so the unused space is
+        estimated as the file size minus the superblock, the size of all groups and datasets including their metadata
+        and the blocks HDF5 reserves to aggregate metadata and small datasets, which can not be reclaimed by repacking.
+
+        Returns:
+            float: unused fraction of the file size - between 0 and 1
+        """
+        with hdf5_file_cache.open(self.file_name) as h5_file:
+            if h5_file is None:
+                return 0.0
+            file_size = os.path.getsize(self.file_name)
+            free_space = max(file_size - 96 - 2 * 2048 - _get_used_size(h5_file), h5_file.id.get_freespace())
+        if file_size == 0:
+            return 0.0
+        return min(float(free_space) / file_size, 1.0)
+
     def get_size(self, hdf):  
         """
         Get size of the groups inside the HDF5 file
@@ -266,6 +897,7 @@ class FileHDFio(object):
         """
         new_h5 = FileHDFio(file_name=self.file_name, h5_path=self.h5_path)
         new_h5._filter = self._filter
+        new_h5._lazy = self._lazy
         return new_h5
 
     def copy_to(self, destination, file_name=None, maintain_name=True):
@@ -283,6 +915,7 @@ class FileHDFio(object):
         """
         if file_name is None:
             file_name = destination.file_name
+        hdf5_file_cache.invalidate(file_name)
         if self.file_exists:
             with h5py.File(self.file_name, mode="r", libver='latest', swmr=True) as f_source:
                 with h5py.File(file_name, libver='latest', swmr=True) as f_target:
@@ -327,6 +960,7 @@ class FileHDFio(object):
             FileHDFio: FileHDFio object pointing to the new group
         """
         full_name = posixpath.join(self.h5_path, name)
+        hdf5_file_cache.invalidate(self.file_name)
         with h5py.File(self.file_name, mode='a', libver='latest', swmr=True) as h:
             try:
                 h.create_group(full_name)
@@ -339,6 +973,7 @@ class FileHDFio(object):
         """
         Remove an HDF5 group - if it exists. If the group does not exist no error message is raised.
         """
+        hdf5_file_cache.invalidate(self.file_name)
         try:
             with h5py.File(self.file_name, mode='a', libver='latest', swmr=True) as hdf_file:
                 del hdf_file[self.h5_path]
@@ -391,6 +1026,7 @@ class FileHDFio(object):
         """
         Remove the HDF5 file with all the related content
         """
+        hdf5_file_cache.invalidate(self.file_name)
         if self.file_exists:
             os.remove(self.file_name)
 
@@ -449,6 +1085,165 @@ class FileHDFio(object):
         """
         self.__setitem__(key=key, value=value)
 
+    def extend(self, key, value, compression=None):
+        """
+        Append data along the first axis of an array stored in the HDF5 file. Numerical arrays are stored as chunked and
+        resizable datasets, which are extended in place - so the cost of appending does not depend on the amount of data
+        which is already stored. Other data, like lists of strings or arrays with changing shapes, is read, concatenated
+        and written again.
+
+        Args:
+            key (str): key of the data
+            value (list, numpy.ndarray): data to append
+            compression (str): compression filter used when the dataset is created, e.g. 'gzip' or 'lzf'
+        """
+        if isinstance(value, np.ndarray) and value.ndim > 0 and value.dtype.kind in "biufc":
+            title = posixpath.join(self.h5_path, key)
+            hdf5_file_cache.invalidate(self.file_name)
+            with h5py.File(self.file_name, mode='a', libver='latest') as h5_file:
+                dataset = h5_file.get(title)
+                if dataset is None:
+                    _create_extendable_dataset(h5_file, title, value, compression=compression)
+                    return
+                if isinstance(dataset, h5py.Dataset) and dataset.shape[1:] == value.shape[1:] \
+                        and _get_title(dataset) == "ndarray":
+                    if dataset.maxshape[0] is None and np.result_type(dataset.dtype, value.dtype) == dataset.dtype:
+                        length = dataset.shape[0]
+                        dataset.resize(length + len(value), axis=0)
+                        dataset[length:] = value
+                    else:
+                        data = np.concatenate([dataset[()], value])
+                        compression = dataset.compression if compression is None else compression
+                        del h5_file[title]
+                        _create_extendable_dataset(h5_file, title, data, compression=compression)
+                    return
+        if key in self.list_nodes():
+            data = self[key]
+            if isinstance(data, np.ndarray):
+                data = data.tolist()
+            if isinstance(value, np.ndarray):
+                value = value.tolist()
+            value = np.array(list(data) + list(value))
+        self[key] = value
+
+    def put_array(self, key, value, compression=None, max_slab_size=2 ** 24):
+        """
+        Store a numerical array as chunked HDF5 dataset, which can be read in parts with get_array_slice(). The array is
+        written in slabs along the first axis, so arrays which are not C-contiguous are never copied as a whole.
+
+        Args:
+            key (str): key to store the data
+            value (numpy.ndarray): numerical array
+            compression (str): compression filter, e.g. 'gzip' or 'lzf'
+            max_slab_size (int): maximum number of elements written at once
+        """
+        title = posixpath.join(self.h5_path, key)
+        hdf5_file_cache.invalidate(self.file_name)
+        with h5py.File(self.file_name, mode='a', libver='latest') as h5_file:
+            if title in h5_file:
+                del h5_file[title]
+            dataset = h5_file.create_dataset(title, shape=value.shape, dtype=value.dtype, chunks=True,
+                                             compression=compression)
+            dataset.attrs["TITLE"] = "ndarray"
+            if value.ndim == 0:
+                dataset[()] = value
+                return
+            slab_size = max(int(max_slab_size // max(value[0].size, 1)), 1)
+            for i in range(0, len(value), slab_size):
+                dataset[i:i + slab_size] = value[i:i + slab_size]
+
+    def get_array_shape(self, key):
+        """
+        Get the shape of an array stored in the HDF5 file without reading the array.
+
+        Args:
+            key (str): key of the array
+
+        Returns:
+            tuple: shape of the array
+        """
+        with hdf5_file_cache.open(self.file_name) as h5_file:
+            if h5_file is None:
+                raise IOError('file "%s" not found' % self.file_name)
+            return h5_file[self._get_h5_path(key)].shape
+
+    def get_array_slice(self, key, index):
+        """
+        Read a part of an array stored in the HDF5 file, only the selected part is read from the disk. Objects which
+        h5io does not store as plain HDF5 datasets, like lists, are read completely before the index is applied.
+
+        Args:
+            key (str): key of the array
+            index (slice, tuple, int): numpy style index of the part to read
+
+        Returns:
+            numpy.ndarray: selected part of the array
+        """
+        with hdf5_file_cache.open(self.file_name) as h5_file:
+            if h5_file is None:
+                raise IOError('file "%s" not found' % self.file_name)
+            h5_object = h5_file[self._get_h5_path(key)]
+            if _is_lazy_dataset(h5_object):
+                return h5_object[index]
+        return np.asarray(self[key])[index]
+
+    def get_content_hash(self, exclude_nodes=None):
+        """
+        Get the SHA-1 hash of the content of the current HDF5 group - the paths, h5io types, data types, shapes and values
+        of all nodes. Groups with the same content have the same hash, independent of the file they are stored in.
+
+        Args:
+            exclude_nodes (list): paths relative to the current group which are not included in the hash
+
+        Returns:
+            str: hex digest
+        """
+        exclude_nodes = set(exclude_nodes or [])
+        content_hash = hashlib.sha1()
+        with hdf5_file_cache.open(self.file_name) as h5_file:
+            if h5_file is None:
+                raise IOError('file "%s" not found' % self.file_name)
+            if self.h5_path not in h5_file:
+                return content_hash.hexdigest()
+            h5_group = h5_file[self.h5_path]
+            name_lst = []
+            h5_group.visit(name_lst.append)
+            for name in sorted(name_lst):
+                if name in exclude_nodes:
+                    continue
+                h5_object = h5_group[name]
+                content_hash.update((name + '\0' + _get_title(h5_object) + '\0').encode())
+                if isinstance(h5_object, h5py.Dataset):
+                    if h5_object.shape is None:
+                        content_hash.update(b'empty\0')
+                        continue
+                    data = np.asarray(h5_object[()])
+                    content_hash.update('{}{}\0'.format(data.dtype.str, data.shape).encode())
+                    content_hash.update(repr(data.tolist()).encode() if data.dtype.hasobject else data.tobytes())
+        return content_hash.hexdigest()
+
+    def copy_group_from(self, hdf, name):
+        """
+        Replace a group or node of the current HDF5 group by a copy of the one with the same name in another HDF5 group,
+        which can also be located in the same file. If it does not exist in the other HDF5 group nothing is copied.
+
+        Args:
+            hdf (FileHDFio): HDF5 group the group or node is copied from
+            name (str): name of the group or node
+        """
+        source_path, target_path = hdf._get_h5_path(name), self._get_h5_path(name)
+        hdf5_file_cache.invalidate(self.file_name)
+        with h5py.File(self.file_name, mode='a', libver='latest') as f_target:
+            if target_path in f_target:
+                del f_target[target_path]
+            if os.path.abspath(hdf.file_name) == os.path.abspath(self.file_name):
+                if source_path in f_target:
+                    f_target.copy(source_path, target_path)
+            else:
+                with h5py.File(hdf.file_name, mode='r', libver='latest', swmr=True) as f_source:
+                    if source_path in f_source:
+                        f_source.copy(source_path, f_target, name=target_path)
+
     def list_all(self):
         """
         List all groups and nodes of the HDF5 file - where groups are equivalent to directories and nodes to files.
@@ -456,21 +1251,19 @@ class FileHDFio(object):
         Returns:
             dict: {'groups': [list of groups], 'nodes': [list of nodes]}
         """
-        if self.file_exists:
-            store = HDFStoreIO(self.file_name, mode='r')
-            with store.open(mode="r"):
-                try:
-                    groups = set(eval(self._h5_group + "_v_groups.keys()"))
-                    nodes = set(eval(self._h5_group + "_v_children.keys()"))
-                except NoSuchNodeError:
-                    groups = set()
-                    nodes = set()
-            iopy_nodes = self._filter_io_objects(groups)
-            store.close()
-            return {"groups": sorted(list(groups - iopy_nodes)),
-                    "nodes": sorted(list((nodes - groups).union(iopy_nodes)))}
-        else:
-            return {"groups": [], "nodes": []}
+        with hdf5_file_cache.open(self.file_name) as h5_file:
+            if h5_file is None:
+                return {"groups": [], "nodes": []}
+            h5_group = h5_file.get(self.h5_path)
+            if isinstance(h5_group, h5py.Group):
+                children = _list_children(h5_group)
+            else:
+                children = {}
+            groups = set([key for key, value in children.items() if isinstance(value, h5py.Group)])
+            nodes = set(children.keys())
+            iopy_nodes = set([group for group in groups if _get_title(children[group]) in H5IO_GROUP_TYPES])
+        return {"groups": sorted(list(groups - iopy_nodes)),
+                "nodes": sorted(list((nodes - groups).union(iopy_nodes)))}
 
     def list_nodes(self):
         """
@@ -625,6 +1418,7 @@ class FileHDFio(object):
             print('compression rate from old to new: {}'.format(self.file_size(self) / self.file_size(hdf_new)))
             print('data size vs file size: {}'.format(self.get_size(hdf_new)/self.file_size(hdf_new)))
         self.remove_file()
+        hdf5_file_cache.invalidate(hdf_new.file_name)
         os.rename(hdf_new.file_name, file_name)
 
     def __setitem__(self, key, value):
@@ -635,6 +1429,7 @@ class FileHDFio(object):
             key (str): key to store the data
             value (pandas.DataFrame, pandas.Series, dict, list, float, int): basically any kind of data is supported
         """
+        hdf5_file_cache.invalidate(self.file_name)
         if hasattr(value, "to_hdf") & (not isinstance(value, (pandas.DataFrame, pandas.Series))):
             value.to_hdf(self, key)
         elif isinstance(value, (list, np.ndarray)) and len(value) > 0 and isinstance(value[0], (list, np.ndarray)) \
@@ -664,6 +1459,7 @@ class FileHDFio(object):
         Args:
             key (str): key of the item to delete
         """
+        hdf5_file_cache.invalidate(self.file_name)
         if self.file_exists:
             try:
                 store = HDFStoreIO(self.file_name, mode='a')
@@ -729,10 +1525,10 @@ class FileHDFio(object):
         else:
             item_lst = item.split('/')
             if len(item_lst) == 1 and item_lst[0] != '..':
-                if item in self.list_nodes():
-                    obj = h5io.read_hdf5(self.file_name, title=self._get_h5_path(item))
-                    return obj
-                if item in self.list_groups():
+                list_all_dict = self.list_all()
+                if item in list_all_dict["nodes"]:
+                    return self._read(item)
+                if item in list_all_dict["groups"]:
                     with self.open(item) as hdf_item:
                         obj = hdf_item.copy()
                         return obj
@@ -761,9 +1557,21 @@ class FileHDFio(object):
             item (str): path to the data or key of the data object
 
         Returns:
-            dict, list, float, int: data or data object
-        """
-        return h5io.read_hdf5(self.file_name, title=self._get_h5_path(item))
+            dict, list, float, int, HDF5DatasetProxy: data or data object
+        """
+        title = self._get_h5_path(item)
+        with hdf5_file_cache.open(self.file_name) as h5_file:
+            if h5_file is None:
+                raise IOError('file "%s" not found' % self.file_name)
+            h5_node = h5_file.get(title)
+            if h5_node is None or (isinstance(h5_node, h5py.Group) and "TITLE" not in h5_node.attrs):
+                raise ValueError('no "%s" data found' % title)
+            if self._lazy and _is_lazy_dataset(h5_node):
+                return HDF5DatasetProxy(self.file_name, title)
+            if H5IO_READS_FILE_HANDLES and _get_title(h5_node) not in ("pd_dataframe", "pd_series"):
+                return h5io.read_hdf5(h5_file, title=title)
+        # pandas objects are read by PyTables, which requires the file name rather than the file handle
+        return h5io.read_hdf5(self.file_name, title=title)
 
     # def _open_store(self, mode="r"):
     #     """
@@ -820,9 +1628,8 @@ class FileHDFio(object):
         Returns:
             str: h5io type
         """
-        store = HDFStoreIO(self.file_name, mode='r')
-        with store.open(mode='r'):
-            return str(eval(''.join([self._h5_group, name, "._v_title"])))
+        with hdf5_file_cache.open(self.file_name) as h5_file:
+            return _get_title(h5_file[self._get_h5_path(name)])
 
     def _filter_io_objects(self, groups):
         """
@@ -834,8 +1641,7 @@ class FileHDFio(object):
         Returns:
             set: h5io objects
         """
-        h5io_types = ("dict", "list", "tuple", "pd_dataframe", "pd_series", "multiarray", "json")
-        group_h5io = set([group for group in groups if self._get_h5io_type(group) in h5io_types])
+        group_h5io = set([group for group in groups if self._get_h5io_type(group) in H5IO_GROUP_TYPES])
         return group_h5io
 
     def _walk(self, level=0):
@@ -1121,6 +1927,7 @@ class ProjectHDFio(FileHDFio):
         """
         new_h5 = ProjectHDFio(project=self._project, file_name=self._file_name, h5_path=self._h5_path)
         new_h5._filter = self._filter
+        new_h5._lazy = self._lazy
         return new_h5
 
     def create_hdf(self, path, job_name):
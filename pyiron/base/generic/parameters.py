@@ -89,6 +89,10 @@ class GenericParameters(PyironObject):
         self._replace_char_dict = None
         self._block_dict = None
         self._bool_dict = {True: "True", False: "False"}
+        self._line_index = None
+        self._line_index_source = None
+        self._line_index_length = 0
+        self._value_cache = {}
         self._dataset = OrderedDict()
         self._block_line_dict = {}
         self.end_value_char = end_value_char
@@ -351,13 +355,7 @@ class GenericParameters(PyironObject):
                 num_words = len(multi_word_lst)
                 val = val.split(" ")
                 val = " ".join(val[(num_words - 1):])
-            try:
-                val_v = eval(val)
-            except (TypeError, NameError, SyntaxError):
-                val_v = val
-            if callable(val_v):
-                val_v = val
-            return val_v
+            return self._parse_value(val)
         elif default_value is not None:
             return default_value
         else:
@@ -468,17 +466,16 @@ class GenericParameters(PyironObject):
         Args:
             key_list (list): list of keys to be removed
         """
-        if self.read_only and any([k in self._dataset["Parameter"] for k in key_list]):
+        if self.read_only and any([k in self._get_line_index() for k in key_list]):
             self._read_only_error()
+        line_index = self._get_line_index()
+        i_keys = set()
         for key in key_list:
-            params = np.array(self._dataset["Parameter"])
-            i_keys = np.where(params == key)[0]
-            if len(i_keys) == 0:
-                continue
-            if i_keys[0] == -1:
-                continue
-            for i_key in i_keys[::-1]:
-                self._delete_line(i_key)
+            i_keys.update(line_index.get(key, []))
+        if len(i_keys) > 0:
+            for col, val in self._dataset.items():
+                self._dataset[col] = [v for i, v in enumerate(val) if i not in i_keys]
+            self._line_index = None
 
     def define_blocks(self, block_dict):
         """
@@ -628,7 +625,7 @@ class GenericParameters(PyironObject):
         """
         if isinstance(item, int):
             return self._dataset["Value"][item]
-        elif item in self._dataset["Parameter"]:
+        elif item in self._get_line_index():
             return self.get(item)
 
     def __delitem__(self, key):
@@ -735,10 +732,10 @@ class GenericParameters(PyironObject):
         if self.read_only:
             self._read_only_error()
         for key, val in self._dataset.items():
-            if "numpy" in str(type(val)):
-                val = val.tolist()
+            val = self._to_list(val)
             del val[line_number]
             self._dataset[key] = val
+        self._line_index = None
 
     def _insert(self, line_number, data_dict, shift=0):
         """
@@ -752,27 +749,29 @@ class GenericParameters(PyironObject):
         if self.read_only:
             self._read_only_error()
         for key, val in data_dict.items():
-            lst = self._dataset[key]
-            val = np.array(val).tolist()
-            lst = np.array(lst).tolist()
-            self._dataset[key] = lst[:line_number - shift] + val + lst[line_number:]
+            lst = self._to_list(self._dataset[key])
+            self._dataset[key] = lst[:line_number - shift] + self._to_list(val) + lst[line_number:]
+        self._line_index = None
 
     def _refresh_block_line_hash_table(self):
         """
         Internal helper function to refresh the block dictionary hash table
         """
+        block_lookup = {}
+        for key, val in self._block_dict.items():
+            for par in val:
+                if par not in block_lookup:
+                    block_lookup[par] = key
         self._block_line_dict = {}
-        for i_line, par in enumerate(self._dataset["Parameter"]):
+        for par, i_line_lst in self._get_line_index().items():
             if par.strip() == '':
                 continue
-            for key, val in self._block_dict.items():
-                par_single = par.split()[0]
-                if par_single in val:
-                    if key in self._block_line_dict:
-                        self._block_line_dict[key].append(i_line)
-                    else:
-                        self._block_line_dict[key] = [i_line]
-                    break
+            key = block_lookup.get(par.split()[0])
+            if key is not None:
+                if key in self._block_line_dict:
+                    self._block_line_dict[key] += i_line_lst
+                else:
+                    self._block_line_dict[key] = list(i_line_lst)
         i_line_old = 0
         for key in self._block_dict:
             if key in self._block_line_dict:
@@ -812,7 +811,7 @@ class GenericParameters(PyironObject):
         if self.read_only:
             self._read_only_error()
         for par, val in qwargs.items():
-            if par in self._dataset["Parameter"]:
+            if par in self._get_line_index():
                 raise ValueError("Parameter exists already: " + par)
 
             if self._block_dict is not None:
@@ -821,14 +820,84 @@ class GenericParameters(PyironObject):
                     continue
 
             for col in self._dataset:
-                self._dataset[col] = np.array(self._dataset[col]).tolist()
+                self._dataset[col] = self._to_list(self._dataset[col])
+            line_index = self._get_line_index()
 
             comment = ""
             if isinstance(val, tuple):
                 val, comment = val
             self._dataset["Parameter"].append(par)
-            self._dataset["Value"].append(val)
+            self._dataset["Value"].append(str(val))
             self._dataset["Comment"].append(comment)
+            line_index[par] = [self._line_index_length]
+            self._line_index_length += 1
+
+    def _get_line_index(self):
+        """
+        Internal helper function to get the hash table which maps every parameter to its line numbers. The hash table is
+        rebuilt when the parameter column was replaced or its length changed, so modifications of the _dataset outside
+        of the GenericParameters class are recognised as long as they do not rename parameters in place.
+
+        Returns:
+            OrderedDict: {parameter: [line numbers]}
+        """
+        params = self._dataset.get("Parameter", [])
+        if self._line_index is None or self._line_index_source is not params \
+                or self._line_index_length != len(params):
+            line_index = OrderedDict()
+            for i_line, par in enumerate(params):
+                if par in line_index:
+                    line_index[par].append(i_line)
+                else:
+                    line_index[par] = [i_line]
+            self._line_index = line_index
+            self._line_index_source = params
+            self._line_index_length = len(params)
+        return self._line_index
+
+    def _parse_value(self, val):
+        """
+        Internal helper function to convert a value string to the corresponding python object. The results for
+        immutable types are cached, as the same value strings are parsed every time the input file is written.
+
+        Args:
+            val (str): value string
+
+        Returns:
+            object: python object if the value string can be evaluated otherwise the value string
+        """
+        try:
+            return self._value_cache[val]
+        except (KeyError, TypeError):
+            pass
+        try:
+            val_v = eval(val)
+        except (TypeError, NameError, SyntaxError):
+            val_v = val
+        if callable(val_v):
+            val_v = val
+        if isinstance(val, str) and isinstance(val_v, (bool, int, float, complex, str, type(None))):
+            if len(self._value_cache) >= 1024:
+                self._value_cache = {}
+            self._value_cache[val] = val_v
+        return val_v
+
+    @staticmethod
+    def _to_list(val):
+        """
+        Internal helper function to convert a column of the GenericParameters to a list
+
+        Args:
+            val (list/numpy.ndarray): column
+
+        Returns:
+            list: column as list
+        """
+        if isinstance(val, np.ndarray):
+            return val.tolist()
+        elif isinstance(val, list):
+            return val
+        return list(val)
 
     def _is_multi_word_parameter(self, key):
         """
@@ -925,12 +994,13 @@ class GenericParameters(PyironObject):
             list: [line index, line]
         """
         params = self._dataset["Parameter"]
+        line_index = self._get_line_index()
         multiple_key = key_name.split()
         multi_word_lst = [None]
         if len(multiple_key) > 1:
             key_length = len(multiple_key)
             first = multiple_key[0]
-            i_line_first_lst = np.where(np.array(params) == first)[0]
+            i_line_first_lst = line_index.get(first, [])
             i_line_lst, multi_word_lst = [], []
             for i_sel in i_line_first_lst:
                 values = self._dataset["Value"][i_sel].split()
@@ -947,10 +1017,7 @@ class GenericParameters(PyironObject):
                 multi_word_lst.append([params[i_sel]] + sel_value)
                 i_line_lst.append(i_sel)
         else:
-            if len(params) > 0:
-                i_line_lst = np.where(np.array(params) == key_name)[0]
-            else:
-                i_line_lst = []
+            i_line_lst = line_index.get(key_name, [])
         if len(i_line_lst) == 0:
             return -1, None
         elif len(i_line_lst) == 1:
@@ -9,6 +9,7 @@ import posixpath
 import time
 from pyiron.base.settings.generic import Settings
 from pyiron.base.generic.template import PyironObject
+from pyiron.base.generic.hdfio import hdf5_file_cache
 from tables import NoSuchNodeError
 import tarfile
 import shutil
@@ -161,6 +162,7 @@ class JobCore(PyironObject):
         self.project_hdf5.remove_file()
         self.project_hdf5 = new_location
         if os.path.exists(old_working_directory):
+            hdf5_file_cache.invalidate_directory(old_working_directory)
             shutil.move(old_working_directory, self.working_directory)
             os.rmdir('/'.join(old_working_directory.split('/')[:-1]))
 
@@ -413,6 +415,15 @@ class JobCore(PyironObject):
         internal function to remove command that removes also child jobs.
         Do never use this command, since it will destroy the integrity of your project.
         """
+        self._remove_files()
+        if self.job_id:
+            self.project.db.delete_item(self.job_id)
+
+    def _remove_files(self):
+        """
+        internal function to remove the HDF5 group and the working directory of the job, without removing the database
+        entry - used by remove_child() and Project.remove_jobs() which removes the database entries of many jobs at once.
+        """
         if "server" in self.project_hdf5.list_nodes():
             server_hdf_dict = self.project_hdf5["server"]
             if "qid" in server_hdf_dict.keys() and str(self.status) in ['submitted', 'running', 'collect'] and server_hdf_dict["qid"] is not None:
@@ -420,17 +431,17 @@ class JobCore(PyironObject):
         with self.project_hdf5.open('..') as hdf_parent:
             try:
                 del hdf_parent[self.job_name]
+                hdf5_file_cache.invalidate_directory(str(self.working_directory))
                 shutil.rmtree(str(self.working_directory))
             except (NoSuchNodeError, KeyError, OSError):
                 print('This group does not exist in the HDF5 file {}'.format(self.job_name))
         if self.project_hdf5.is_empty:
             if os.path.isfile(self.project_hdf5.file_name):
+                hdf5_file_cache.invalidate(self.project_hdf5.file_name)
                 os.remove(self.project_hdf5.file_name)
                 dir_name = self.project_hdf5.file_name.split('.h5')[0] + '_hdf5'
                 if os.path.isdir(dir_name):
                     os.rmdir(dir_name)
-        if self.job_id:
-            self.project.db.delete_item(self.job_id)
 
     def to_object(self, object_type=None, **qwargs):
         """
@@ -679,6 +690,7 @@ class JobCore(PyironObject):
             else:
                 self.project_hdf5.remove_group()
         if os.path.exists(old_working_directory):
+            hdf5_file_cache.invalidate_directory(old_working_directory)
             shutil.rmtree(old_working_directory)
             os.rmdir('/'.join(old_working_directory.split('/')[:-1]))
 
@@ -752,7 +764,7 @@ class JobCore(PyironObject):
         """
         name_lst = item.split("/")
         item_obj = name_lst[0]
-        if item_obj in self._list_ext_childs():
+        if item_obj not in self.list_nodes() and item_obj in self.list_childs():
             # ToDo: Murn['strain_0.9'] - sucht im HDF5 file, dort gibt es aber die entsprechenden Gruppen noch nicht.
             child = self._hdf5[self._name + "_hdf5/" + item_obj]
             print("job get: ", self._name + "_jobs", )
@@ -823,6 +835,22 @@ class JobCore(PyironObject):
         except AttributeError:
             pass  # no name check in Python 2.7
 
+    def repack(self, threshold=0.5):
+        """
+        Reclaim the unused space in the HDF5 file of the job by rewriting the file - this is only done when the
+        fraction of unused space exceeds the threshold, as rewriting requires reading and writing the whole file.
+
+        Args:
+            threshold (float): minimal fraction of unused space to rewrite the file - default=0.5
+
+        Returns:
+            bool: True if the file was rewritten
+        """
+        if self.project_hdf5.get_free_space_fraction() <= threshold:
+            return False
+        self.project_hdf5.rewrite_hdf5(job_name=self.job_name, exclude_groups=[])
+        return True
+
     def compress(self, files_to_compress=None):
         """
         Compress the output files of a job object.
@@ -6,6 +6,7 @@ from __future__ import print_function
 # import copy
 import signal
 from datetime import datetime
+import hashlib
 import os
 # import sys
 import posixpath
@@ -150,7 +151,6 @@ class GenericJob(JobCore):
         self._executable = None
         self._import_directory = None
         self._status = JobStatus(db=project.db, job_id=self.job_id)
-        self.refresh_job_status()
         self._restart_file_list = list()
         self._restart_file_dict = dict()
         self._exclude_nodes_hdf = list()
@@ -413,8 +413,11 @@ class GenericJob(JobCore):
         Refresh job status by updating the job status with the status from the database if a job ID is available.
         """
         if self.job_id:
-            self._status = JobStatus(initial_status=self.project.db.get_item_by_id(self.job_id)["status"],
-                                     db=self.project.db, job_id=self.job_id)
+            status = self.__dict__.get('_status')
+            if status is not None and status.job_id == self.job_id and status.database is self.project.db:
+                status.refresh_status()
+            else:
+                self._status = JobStatus(db=self.project.db, job_id=self.job_id)
 
     def clear_job(self):
         """
@@ -656,6 +659,8 @@ class GenericJob(JobCore):
         The run static function is called by run to execute the simulation.
         """
         self._logger.info('{}, status: {}, run job (modal)'.format(self.job_info_str, self.status))
+        if self._run_if_result_exists():
+            return
         if self.executable.executable_path == '':
             self.status.aborted = True
             raise ValueError('No executable set!')
@@ -1013,6 +1018,21 @@ class GenericJob(JobCore):
         """
         return True
 
+    def get_input_hash(self):
+        """
+        Get the hash of everything which determines the result of the calculation - the job type, the job version, the
+        version of the executable and the input stored in the HDF5 file. Jobs with the same input hash are expected to
+        give the same output, so with server.reuse_results enabled the output of a finished job with the same input hash
+        is reused instead of executing the job again. The job has to be saved before the input hash is calculated.
+
+        Returns:
+            str: hex digest
+        """
+        input_hash = hashlib.sha1()
+        for item in self._get_input_hash_items():
+            input_hash.update(item + b'\0')
+        return input_hash.hexdigest()
+
     def db_entry(self):
         """
         Generate the initial database entry for the current GenericJob
@@ -1169,6 +1189,76 @@ class GenericJob(JobCore):
             self.run_if_interactive_non_modal()
         return None
 
+    def _run_if_result_exists(self):
+        """
+        Internal helper function to reuse the output of a finished job with the same input hash instead of executing
+        the job - only if server.reuse_results is enabled. The input hash is stored in the database, so once the job is
+        finished its output can be reused by the following jobs with the same input.
+
+        Returns:
+            bool: [True/False] if the output of a finished job was reused
+        """
+        if not self.server.reuse_results or self.server.run_mode.manual or self.server.run_mode.interactive or \
+                self.server.run_mode.interactive_non_modal or \
+                static_isinstance(self, 'pyiron.base.master.generic.GenericMaster'):
+            return False
+        input_hash = self.get_input_hash()
+        source_id = self.project.db.get_job_id_by_input_hash(input_hash, exclude_id=self.job_id)
+        self.project.db.add_input_hash(self.job_id, input_hash, source_id=source_id)
+        if source_id is None:
+            return False
+        self._logger.info('{}, status: {}, reuse output of job {}'.format(self.job_info_str, self.status, source_id))
+        source_job = self.project.inspect(source_id)
+        self.project_hdf5.copy_group_from(source_job.project_hdf5, 'output')
+        self._copy_working_directory_from(source_job.working_directory)
+        time_now = datetime.now()
+        self.project.db.item_update({'timestart': time_now, 'timestop': time_now, 'totalcputime': 0.0}, self.job_id)
+        self.status.finished = True
+        self.from_hdf()
+        self._calculate_successor()
+        self.send_to_database()
+        self.update_master()
+        return True
+
+    def _copy_working_directory_from(self, source_directory):
+        """
+        Internal helper function to copy the files of the working directory of the job whose output is reused, so the
+        output files and restart files are available in the working directory of this job, too. Files which already
+        exist in the working directory, like the input files written by this job, are kept.
+
+        Args:
+            source_directory (str): working directory of the job whose output is reused
+        """
+        if not os.path.isdir(source_directory):
+            return
+        if not os.path.isdir(self.working_directory):
+            os.makedirs(self.working_directory)
+        for file_name in os.listdir(source_directory):
+            source_path = os.path.join(source_directory, file_name)
+            target_path = os.path.join(self.working_directory, file_name)
+            if os.path.exists(target_path):
+                continue
+            if os.path.isdir(source_path):
+                shutil.copytree(source_path, target_path)
+            else:
+                shutil.copy2(source_path, target_path)
+
+    def _get_input_hash_items(self, exclude_nodes=None):
+        """
+        Internal helper function to collect the content of the input hash - derived classes can extend the list, for
+        example by a canonicalized version of nodes which they exclude from the HDF5 input.
+
+        Args:
+            exclude_nodes (list): nodes of the HDF5 input group, which are not included in the input hash
+
+        Returns:
+            list: list of bytes
+        """
+        with self.project_hdf5.open('input') as hdf_input:
+            input_hash = hdf_input.get_content_hash(exclude_nodes=exclude_nodes)
+        return [str(type(self)).encode(), str(self.version).encode(), str(self.executable.version).encode(),
+                input_hash.encode()]
+
     def _run_if_submitted(self):  # Submitted jobs are handled by the job wrapper!
         """
         Internal helper function the run if submitted function is called when the job status is 'submitted'. It means
@@ -1356,21 +1446,29 @@ class GenericJob(JobCore):
                 self._before_successor_calc(child)
                 child.run()
 
-    def _create_job_structure(self, debug=False):
+    def _create_job_structure(self, debug=False, job_id=None):
         """
         Internal helper function to create the input directories, save the job in the database and write the wrapper.
 
         Args:
             debug (bool): Debug Mode
+            job_id (int): job ID of the database entry, if it was already created together with the entries of other
+                          jobs - then only the HDF5 file and the input files are written and setting the status is left
+                          to the caller
         """
-        self._job_id = self.save()
+        if job_id is None:
+            self._job_id = self.save()
+        else:
+            self.to_hdf()
+            self._job_id = job_id
         print('The job ' + self.job_name + ' was saved and received the ID: ' + str(self._job_id))
         if self._check_if_input_should_be_written():
             self.project_hdf5.create_working_directory()
             self.write_input()
             self._copy_restart_files()
-        self.status.created = True
-        self._calculate_predecessor()
+        if job_id is None:
+            self.status.created = True
+            self._calculate_predecessor()
 
     def _check_if_input_should_be_written(self):
         return not (self.server.run_mode.interactive or self.server.run_mode.interactive_non_modal)
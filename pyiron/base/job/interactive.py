@@ -117,6 +117,8 @@ class InteractiveBase(GenericJob):
         self._interactive_write_input_files = False
         self._interactive_flush_frequency = 1
         self._interactive_write_frequency = 1
+        self._interactive_compression = None
+        self._interactive_repack_threshold = 0.5
         self.interactive_cache = {}
 
     @property
@@ -143,6 +145,40 @@ class InteractiveBase(GenericJob):
             self.interactive_flush_frequency = frequency
         self._interactive_write_frequency = frequency
 
+    @property
+    def interactive_compression(self):
+        """
+        The compression filter of the extendable datasets the interactive cache is written to - None writes the
+        datasets uncompressed. The filter is fixed when a dataset is created, so it only applies to new datasets.
+        """
+        return self._interactive_compression
+
+    @interactive_compression.setter
+    def interactive_compression(self, compression):
+        """
+        Set the compression filter of the extendable datasets the interactive cache is written to.
+
+        Args:
+            compression (str/None): None, 'gzip' or 'lzf'
+        """
+        if compression not in [None, 'gzip', 'lzf']:
+            raise ValueError('interactive_compression must be one of None, \'gzip\' or \'lzf\'')
+        self._interactive_compression = compression
+
+    @property
+    def interactive_repack_threshold(self):
+        """
+        The HDF5 file is rewritten in interactive_close() when the fraction of unused space in the file exceeds the
+        threshold - None defers the repacking to Project.repack_jobs().
+        """
+        return self._interactive_repack_threshold
+
+    @interactive_repack_threshold.setter
+    def interactive_repack_threshold(self, threshold):
+        if threshold is not None and not 0 <= threshold <= 1:
+            raise ValueError('interactive_repack_threshold must be None or between 0 and 1')
+        self._interactive_repack_threshold = threshold
+
     def validate_ready_to_run(self):
         """
         This should work but doesn't...
@@ -178,26 +214,19 @@ class InteractiveBase(GenericJob):
             return True
 
     @staticmethod
-    def _extend_hdf(h5, path, key, data):
+    def _extend_hdf(h5, path, key, data, compression=None):
         """
+        Append data to a dataset in the HDF5 file - numerical arrays are extended in place.
 
         Args:
-            h5:
-            path:
-            key:
-            data:
-
-        Returns:
-
+            h5 (ProjectHDFio): HDF5 group object
+            path (str): HDF5 path relative to h5
+            key (str): key of the dataset
+            data (list, numpy.ndarray): data to append
+            compression (str): compression filter used when the dataset is created
         """
-        if path in h5.list_groups() and key in h5[path].list_nodes():
-            current_hdf = h5[path + "/" + key]
-            if isinstance(data, list):
-                entry = current_hdf.tolist() + data
-            else:
-                entry = current_hdf.tolist() + data.tolist()
-            data = np.array(entry)
-        h5[path + "/" + key] = data
+        with h5.open(path) as h5_path:
+            h5_path.extend(key, data, compression=compression)
 
     @staticmethod
     def _include_last_step(array, step=1, include_last=False):
@@ -251,7 +280,8 @@ class InteractiveBase(GenericJob):
                 elif np.array(data).dtype == np.dtype('O'):
                     self._extend_hdf(h5=h5, path=path, key=key, data=data)
                 else:
-                    self._extend_hdf(h5=h5, path=path, key=key, data=np.array(data))
+                    self._extend_hdf(h5=h5, path=path, key=key, data=np.array(data),
+                                     compression=self._interactive_compression)
                 self.interactive_cache[key] = []
 
     def interactive_open(self):
@@ -271,7 +301,8 @@ class InteractiveBase(GenericJob):
         if len(list(self.interactive_cache.keys())) > 0 and \
                 len(self.interactive_cache[list(self.interactive_cache.keys())[0]]) != 0:
             self.interactive_flush(path="interactive", include_last_step=True)
-        self.project_hdf5.rewrite_hdf5(job_name=self.job_name, exclude_groups=[])
+        if self._interactive_repack_threshold is not None:
+            self.repack(threshold=self._interactive_repack_threshold)
         self.project.db.item_update(self._runtime(), self._job_id)
         self.status.finished = True
         self._interactive_library = None
@@ -3,7 +3,11 @@
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 import six
+import time
+from collections import Counter
 from pyiron.base.database.generic import DatabaseAccess
+from pyiron.base.job.notification import job_notification
+from pyiron.base.settings.generic import Settings
 
 """
 The JobStatus class belongs to the GenericJob object.
@@ -19,6 +23,8 @@ __status__ = "production"
 __date__ = "Sep 1, 2017"
 
 
+s = Settings()
+
 job_status_lst = ['initialized', 'appended', 'created', 'submitted', 'running', 'aborted', 'collect', 'suspended',
                   'refresh', 'busy', 'finished', 'not_converged']
 
@@ -38,10 +44,18 @@ class JobStatus(object):
         busy: The job is refreshing, but during the refresh more related jobs finished so another refresh is necessary.
         finished: The job and all connected sub jobs are finished.
 
+    Reading a status flag like job.status.finished loads the status from the database, unless it was loaded or written
+    less than cache_time seconds ago - in that case the locally cached status is returned. Changing the status writes
+    the new status to the database directly. Use refresh_status() to load the status from the database regardless of
+    the cache. The number of database queries of all JobStatus objects is counted in JobStatus.query_count. Every
+    status change is signalled on the job notification channel, to wake up processes waiting for the job.
+
     Args:
         initial_status (str): If no initial status is provided the status is set to 'initialized'
         db (DatabaseAccess): The database which is responsible for this job.
         job_id (int): job ID
+        cache_time (float/None): time in seconds the cached status is used before it is loaded from the database
+                                 again - by default the JOB_STATUS_CACHE_TIME setting is used.
 
     Attributes:
 
@@ -56,16 +70,50 @@ class JobStatus(object):
         .. attribute:: string
 
             job status as string
+
+        .. attribute:: cache_time
+
+            time in seconds the cached status is used before it is loaded from the database again
     """
 
-    def __init__(self, initial_status='initialized', db=None, job_id=None):
+    query_count = Counter()
+
+    def __init__(self, initial_status='initialized', db=None, job_id=None, cache_time=None):
         super(JobStatus, self).__setattr__('_status_dict', {})
         self._db = None
         self._job_id = None
+        self._cache_time = None
+        self._last_update = None
+        self.cache_time = cache_time
         self.string = initial_status
         self.database = db
         self.job_id = job_id
 
+    @property
+    def cache_time(self):
+        """
+        Get the time in seconds the cached status is used before it is loaded from the database again.
+
+        Returns:
+            float: cache time in seconds
+        """
+        if self._cache_time is None:
+            return s.job_status_cache_time
+        return self._cache_time
+
+    @cache_time.setter
+    def cache_time(self, cache_time):
+        """
+        Set the time in seconds the cached status is used before it is loaded from the database again. Setting it to
+        None uses the JOB_STATUS_CACHE_TIME setting, setting it to 0 loads the status on every access.
+
+        Args:
+            cache_time (float/None): cache time in seconds
+        """
+        if cache_time is not None and cache_time < 0:
+            raise ValueError('The cache time has to be a positive number.')
+        self._cache_time = cache_time
+
     @property
     def database(self):
         """
@@ -167,16 +215,43 @@ class JobStatus(object):
                 status = self.database.get_item_by_id(self.job_id)["status"]
             except IndexError:
                 raise ('The job with the job ID ' + str(self.job_id) + ' is not listed in the database anymore.')
+            JobStatus.query_count['read'] += 1
+            self._last_update = time.time()
             self._reset()
             self._status_dict[status] = True
 
+    def _refresh_if_expired(self):
+        """
+        Private function: Refresh the job status from the database, when the cached status is older than cache_time.
+        """
+        if self._last_update is None or time.time() - self._last_update >= self.cache_time:
+            self.refresh_status()
+
     def _status_write(self):
         """
         Private function: Write the job status to the internal variable _key and store it in the database.
         """
         if self.database and self.job_id:
-            if self.database.get_item_by_id(self.job_id)["status"] != str(self.string):
-                self.database.item_update({'status': str(self.string)}, self.job_id)
+            self.database.item_update({'status': str(self.string)}, self.job_id)
+            JobStatus.query_count['write'] += 1
+            self._last_update = time.time()
+            job_notification.notify(self.job_id, self.string)
+
+    def _cache_status(self, status, job_id):
+        """
+        Private function: Link the job status to a job ID and cache a status which was already written to the database
+        in a bulk update - neither the status is loaded nor written to the database. The status change is signalled on
+        the job notification channel like any other status change.
+
+        Args:
+            status (str): status which was written to the database
+            job_id (int): job ID
+        """
+        self._job_id = job_id
+        self._reset()
+        self._status_dict[status] = True
+        self._last_update = time.time()
+        job_notification.notify(job_id, status)
 
     def _reset(self):
         """
@@ -214,7 +289,7 @@ class JobStatus(object):
 
     def __getattr__(self, name):
         if name in self._status_dict.keys():
-            self.refresh_status()
+            self._refresh_if_expired()
             return self._status_dict[name]
         else:
             super(JobStatus, self).__getattr__(name)
@@ -0,0 +1,196 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import os
+import time
+from pyiron.base.settings.generic import Settings
+
+"""
+File based notification channel, which is used to wake up processes waiting for job status changes.
+"""
+
+__author__ = "Jan Janssen"
+__copyright__ = "Copyright 2019, Max-Planck-Institut für Eisenforschung GmbH - " \
+                "Computational Materials Design (CM) Department"
+__version__ = "1.0"
+__maintainer__ = "Jan Janssen"
+__email__ = "janssen@mpie.de"
+__status__ = "production"
+__date__ = "Sep 1, 2017"
+
+
+s = Settings()
+
+
+class JobNotification(object):
+    """
+    The JobNotification object is a file based notification channel for job status changes. Every status change is
+    written to a small file named after the job ID in the notification directory. The file is replaced by renaming,
+    so each notification changes the modification time of the directory and a waiting process only has to check the
+    modification time of a single directory to detect status changes of any job. The directory is checked every
+    poll_interval seconds at first, the interval is doubled after every check up to max_poll_interval seconds, so short
+    waits react quickly while long waits do not keep the file system busy. The notification only wakes up the
+    waiting process, the job status itself is always read from the database. When the notification directory is not
+    shared between the processes - for example on different nodes of a cluster - the waiting processes fall back to
+    polling the database.
+
+    The file of a job is deleted once the job reaches a final status, which also changes the modification time of the
+    directory. Files left behind by jobs which never reached a final status are deleted after max_age seconds, the
+    directory is cleaned up once per process.
+
+    Args:
+        path (str/None): notification directory - by default the JOB_NOTIFICATION_PATH setting is used.
+        poll_interval (float): initial time in seconds between two checks of the notification directory
+        max_poll_interval (float): maximum time in seconds between two checks of the notification directory
+        max_age (float): time in seconds after which files of jobs without a final status are deleted
+
+    Attributes:
+
+        .. attribute:: path
+
+            notification directory
+
+        .. attribute:: poll_interval
+
+            initial time in seconds between two checks of the notification directory
+
+        .. attribute:: max_poll_interval
+
+            maximum time in seconds between two checks of the notification directory
+
+        .. attribute:: max_age
+
+            time in seconds after which files of jobs without a final status are deleted
+    """
+
+    final_status_lst = ['finished', 'aborted', 'not_converged']
+
+    def __init__(self, path=None, poll_interval=0.05, max_poll_interval=1.0, max_age=86400):
+        self._path = path
+        self._cleaned_path = None
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.max_age = max_age
+
+    @property
+    def path(self):
+        """
+        Get the notification directory.
+
+        Returns:
+            str: path of the notification directory
+        """
+        if self._path is None:
+            return s.job_notification_path
+        return self._path
+
+    @path.setter
+    def path(self, path):
+        """
+        Set the notification directory, setting it to None uses the JOB_NOTIFICATION_PATH setting.
+
+        Args:
+            path (str/None): path of the notification directory
+        """
+        self._path = path
+
+    def notify(self, job_id, status):
+        """
+        Notify all waiting processes that the status of a job changed. Errors during the notification are ignored, as
+        the waiting processes fall back to polling the database.
+
+        Args:
+            job_id (int): job ID
+            status (str): new job status
+        """
+        try:
+            path = self.path
+            file_name = os.path.join(path, str(job_id))
+            tmp_file_name = file_name + '.' + str(os.getpid()) + '.tmp'
+            if not os.path.isdir(path):
+                os.makedirs(path)
+            elif self._cleaned_path != path:
+                self._remove_old_files(path)
+            self._cleaned_path = path
+            with open(tmp_file_name, 'w') as f:
+                f.write(str(status))
+            _replace(tmp_file_name, file_name)
+            if status in self.final_status_lst:
+                os.remove(file_name)
+        except (IOError, OSError, KeyError):
+            pass
+
+    def _remove_old_files(self, path):
+        """
+        Internal function to delete the files which were not modified for more than max_age seconds - the files of jobs
+        which never reached a final status and temporary files of interrupted notifications.
+
+        Args:
+            path (str): notification directory
+        """
+        oldest_time = time.time() - self.max_age
+        for file_name in os.listdir(path):
+            try:
+                file_path = os.path.join(path, file_name)
+                if os.stat(file_path).st_mtime < oldest_time:
+                    os.remove(file_path)
+            except OSError:
+                pass
+
+    def get_state(self):
+        """
+        Get the current state of the notification channel, which is passed to wait() to detect all notifications
+        since this call.
+
+        Returns:
+            float/None: modification time of the notification directory - None if the directory does not exist
+        """
+        try:
+            return os.stat(self.path).st_mtime
+        except (OSError, KeyError):
+            return None
+
+    def wait(self, timeout, state=None):
+        """
+        Block until a job status change is notified or the timeout is reached.
+
+        Args:
+            timeout (float): maximum time to wait in seconds
+            state (float/None): state of the notification channel returned by get_state() - notifications after this
+                                call wake up the waiting process immediately - by default the current state is used.
+
+        Returns:
+            bool: True if a status change was notified, False if the timeout was reached
+        """
+        if state is None:
+            state = self.get_state()
+        end_time = time.time() + timeout
+        poll_interval = self.poll_interval
+        while True:
+            if self.get_state() != state:
+                return True
+            remaining_time = end_time - time.time()
+            if remaining_time <= 0:
+                return False
+            time.sleep(min(poll_interval, remaining_time))
+            poll_interval = min(2 * poll_interval, max(self.max_poll_interval, self.poll_interval))
+
+
+def _replace(source, destination):
+    """
+    Internal function to atomically replace the destination file by the source file.
+
+    Args:
+        source (str): source file
+        destination (str): destination file
+    """
+    if hasattr(os, 'replace'):
+        os.replace(source, destination)
+    else:
+        if os.name == 'nt' and os.path.exists(destination):
+            os.remove(destination)
+        os.rename(source, destination)
+
+
+job_notification = JobNotification()
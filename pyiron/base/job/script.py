@@ -204,6 +204,25 @@ class ScriptJob(GenericJob):
                 if pr_job.db.get_item_by_id(subjob_id)['masterid'] is None:
                     pr_job.db.item_update({'masterid': str(job.job_id)}, subjob_id)
 
+    def _get_input_hash_items(self, exclude_nodes=None):
+        """
+        Internal helper function to collect the content of the input hash - the executable command contains the working
+        directory of the job, so it is replaced by the file name and the content of the script.
+
+        Args:
+            exclude_nodes (list): nodes of the HDF5 input group, which are not included in the input hash
+
+        Returns:
+            list: list of bytes
+        """
+        item_lst = super(ScriptJob, self)._get_input_hash_items(exclude_nodes=exclude_nodes)
+        item_lst.remove(str(self.executable.version).encode())
+        if self._script_path is not None and os.path.isfile(self._script_path):
+            item_lst.append(os.path.basename(self._script_path).encode())
+            with open(self._script_path, 'rb') as f:
+                item_lst.append(f.read())
+        return item_lst
+
     def run_if_lib(self):
         """
         Compatibility function - but library run mode is not available
@@ -144,8 +144,7 @@ class FlexibleMaster(GenericMaster):
             return True
         if len(self._job_name_lst) > 0:
             return False
-        return set([self.project.db.get_item_by_id(child_id)['status']
-                    for child_id in self.child_ids]) < {'finished', 'busy', 'refresh', 'aborted'}
+        return set(self._get_child_status_count().keys()) < {'finished', 'busy', 'refresh', 'aborted'}
 
     def run_static(self):
         """
@@ -233,8 +232,7 @@ class FlexibleMaster(GenericMaster):
                     self._step_function_lst.append(eval(funct_str.split("(")[0][4:]))
 
     def __getitem__(self, item):
-        child_id_lst = self.child_ids
-        child_name_lst = [self.project.db.get_item_by_id(child_id)["job"] for child_id in self.child_ids]
+        child_id_lst, child_name_lst = self._get_child_id_and_name_lst()
         if isinstance(item, int):
             total_lst = child_name_lst + self._job_name_lst
             item = total_lst[item]
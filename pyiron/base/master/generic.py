@@ -4,6 +4,7 @@
 
 import inspect
 import textwrap
+from collections import Counter
 from pyiron.base.job.generic import GenericJob
 
 """
@@ -131,10 +132,7 @@ class GenericMaster(GenericJob):
         Returns:
             dict: {child_id: child job name }
         """
-        child_dict = {}
-        for child_id in self.child_ids:
-            child_dict[child_id] = self.project.db.get_item_by_id(child_id)["job"]
-        return child_dict
+        return dict((item['id'], item['job']) for item in self._get_child_items(columns=['job']))
 
     @property
     def child_ids(self):
@@ -166,7 +164,45 @@ class GenericMaster(GenericJob):
         Returns:
             str: name of the first child job
         """
-        return self.project.db.get_item_by_id(self.child_ids[0])['job']
+        return self._get_child_items(columns=['job'])[0]['job']
+
+    def _get_child_items(self, columns=None):
+        """
+        Get the database items of all child jobs with a single query, if a child ID function is set the items are
+        queried by their IDs.
+
+        Args:
+            columns (list): list of columns to select - by default all columns are selected, the 'id' is always included
+
+        Returns:
+            list: list of dictionaries with one dictionary per child job, in the order of child_ids
+        """
+        if self._child_id_func:
+            return self.project.db.get_items_by_ids(self.child_ids, columns=columns)
+        if self.job_id is None:
+            return []
+        return self.project.db.get_child_items(self.job_id, columns=columns)
+
+    def _get_child_id_and_name_lst(self):
+        """
+        Get the IDs and the job names of all child jobs with a single query
+
+        Returns:
+            list, list: list of child job IDs and list of child job names
+        """
+        child_items = self._get_child_items(columns=['job'])
+        return [item['id'] for item in child_items], [item['job'] for item in child_items]
+
+    def _get_child_status_count(self):
+        """
+        Count the child jobs per job status with a single query
+
+        Returns:
+            dict: {status: number of child jobs}
+        """
+        if self._child_id_func or self.job_id is None:
+            return dict(Counter([item['status'] for item in self._get_child_items(columns=['status'])]))
+        return self.project.db.get_child_status_count(self.job_id)
 
     def validate_ready_to_run(self):
         """
@@ -308,6 +344,18 @@ class GenericMaster(GenericJob):
                     self.project.db.get_items_dict({'masterid': self.job_id})
                     if db_entry['status'] not in ['finished', 'aborted']])
 
+    def get_reuse_statistics(self):
+        """
+        Count how many child jobs reused the output of a finished job with the same input hash (hits) and how many child
+        jobs were executed (misses), only child jobs with server.reuse_results enabled are counted.
+
+        Returns:
+            dict: {'hits': number of child jobs which reused an output, 'misses': number of executed child jobs}
+        """
+        input_hash_dict = self.project.db.get_input_hash_items(self.child_ids)
+        hits = sum([1 for item in input_hash_dict.values() if item['sourceid'] is not None])
+        return {'hits': hits, 'misses': len(input_hash_dict) - hits}
+
     def write_input(self):
         """
         Write the input files for the external executable. This method has to be implemented in the individual
@@ -372,8 +420,7 @@ class GenericMaster(GenericJob):
         Returns:
             dict, list, float, int: data or data object
         """
-        child_id_lst = self.child_ids
-        child_name_lst = [self.project.db.get_item_by_id(child_id)["job"] for child_id in self.child_ids]
+        child_id_lst, child_name_lst = self._get_child_id_and_name_lst()
         if isinstance(item, int):
             item = self._job_name_lst[item]
         return self._get_item_when_str(item=item, child_id_lst=child_id_lst, child_name_lst=child_name_lst)
@@ -218,7 +218,7 @@ class ListMaster(GenericMaster):
         if not self.submission_status.finished:
             return False
         else:
-            status_set = set([self._hdf5.db.get_item_by_id(child_id)['status'] for child_id in self.child_ids])
+            status_set = set(self._get_child_status_count().keys())
             # status_set = set([job.get_status() for job in self.iter_jobs(convert_to_object=False)])
             if "finished" in status_set:
                 return len(status_set) == 1
@@ -322,8 +322,7 @@ class ListMaster(GenericMaster):
         Returns:
             dict, list, float, int: data or data object
         """
-        child_id_lst = self.child_ids
-        child_name_lst = [self.project.db.get_item_by_id(child_id)["job"] for child_id in self.child_ids]
+        child_id_lst, child_name_lst = self._get_child_id_and_name_lst()
         if isinstance(item, int):
             total_lst = child_name_lst + self._job_name_lst
             item = total_lst[item]
@@ -5,15 +5,17 @@
 from __future__ import division, print_function
 from collections import OrderedDict
 from datetime import datetime
+import multiprocessing
 import numpy as np
 import pandas
-import time
 import importlib
+from pyiron.base.generic.hdfio import FileHDFio, hdf5_file_cache
 from pyiron.base.job.generic import GenericJob
 from pyiron.base.master.generic import GenericMaster
 from pyiron.base.master.submissionstatus import SubmissionStatus
 from pyiron.base.generic.parameters import GenericParameters
 from pyiron.base.job.jobstatus import JobStatus
+from pyiron.base.job.notification import job_notification
 
 """
 The parallel master class is a metajob consisting of a list of jobs which are executed in parallel. 
@@ -259,6 +261,55 @@ class ParallelMaster(GenericMaster):
         """
         pass
 
+    def gather(self, path, index=-1, workers=1, return_ids=False):
+        """
+        Read the same dataset from the HDF5 files of all child jobs and stack the results. The HDF5 files of the child
+        jobs are located with a single database query and only the selected part of each dataset is read from the disk.
+
+        Args:
+            path (str/list): path of the dataset in the child jobs - for example 'output/generic/energy_tot' - or a
+                             list of paths to read multiple datasets while opening each HDF5 file only once
+            index (int/slice/tuple/None): numpy style index applied to the dataset of each child job - by default the
+                                          last step is selected, None reads the complete dataset
+            workers (int): number of worker processes to read the HDF5 files concurrently - default=1
+            return_ids (bool): additionally return the IDs of the child jobs, which are received from the same database
+                               query - default=False
+
+        Returns:
+            numpy.ndarray/list: stacked results of all child jobs in the order of the child_ids - a list of stacked
+                                results if a list of paths is given - followed by a numpy.ndarray of the child job IDs
+                                if return_ids is True
+        """
+        path_lst = [path] if isinstance(path, str) else list(path)
+        child_item_lst = self._get_child_items(columns=['projectpath', 'project', 'subjob'])
+        task_lst = [_get_child_hdf_location(db_entry) + (path_lst, index) for db_entry in child_item_lst]
+        if workers is None or workers <= 1 or len(task_lst) <= 1:
+            result_lst = [_gather_child_output(task) for task in task_lst]
+        else:
+            pool = multiprocessing.Pool(processes=min(workers, len(task_lst)), initializer=_init_gather_worker)
+            try:
+                result_lst = pool.map(_gather_child_output, task_lst,
+                                      chunksize=max(1, len(task_lst) // (4 * workers)))
+            finally:
+                pool.close()
+                pool.join()
+        output_lst = [np.array([result[i] for result in result_lst]) for i in range(len(path_lst))]
+        output = output_lst[0] if isinstance(path, str) else output_lst
+        if return_ids:
+            return output, np.array([db_entry['id'] for db_entry in child_item_lst])
+        return output
+
+    def _get_gather_workers(self):
+        """
+        Internal helper function to get the number of worker processes collect_output() uses to gather the output of the
+        child jobs - by default the output is read in the master process, worker processes are only used when
+        job.input['gather_workers'] is set.
+
+        Returns:
+            int: number of worker processes
+        """
+        return int(self.input.get('gather_workers', 1))
+
     def output_to_pandas(self, sort_by=None, h5_path="output"):
         """
         Convert output of all child jobs to a pandas Dataframe object.
@@ -374,10 +425,10 @@ class ParallelMaster(GenericMaster):
         """
         if self.status.finished:
             return True
-        if len(self.child_ids) < len(self._job_generator):
+        status_count = self._get_child_status_count()
+        if sum(status_count.values()) < len(self._job_generator):
             return False
-        return set([self.project.db.get_item_by_id(child_id)['status']
-                    for child_id in self.child_ids]) < {'finished', 'busy', 'refresh', 'aborted', 'not_converged'}
+        return set(status_count.keys()) < {'finished', 'busy', 'refresh', 'aborted', 'not_converged'}
 
     def iter_jobs(self, convert_to_object=True):
         """
@@ -402,8 +453,7 @@ class ParallelMaster(GenericMaster):
         Returns:
             dict, list, float, int: data or data object
         """
-        child_id_lst = self.child_ids
-        child_name_lst = [self.project.db.get_item_by_id(child_id)["job"] for child_id in self.child_ids]
+        child_id_lst, child_name_lst = self._get_child_id_and_name_lst()
         if isinstance(item, int):
             total_lst = self._job_name_lst + child_name_lst
             item = total_lst[item]
@@ -453,6 +503,8 @@ class ParallelMaster(GenericMaster):
         db_dict["timestop"] = datetime.now()
         db_dict["totalcputime"] = (db_dict["timestop"] - start_time).seconds
         self.project.db.item_update(db_dict, job_id)
+        if self.server.reuse_results:
+            self._logger.info("{}, reused results: {}".format(self.job_info_str, self.get_reuse_statistics()))
         self.status.finished = True
         self._logger.info("{}, status: {}, parallel master".format(self.job_info_str, self.status))
         self.update_master()
@@ -494,6 +546,44 @@ class ParallelMaster(GenericMaster):
                 job = None
         return job_to_be_run_lst
 
+    def _save_child_jobs(self, job_lst):
+        """
+        Create the database entries of all new child jobs in a single transaction - rather than one by one when each
+        child job is started. Afterwards each child job writes its HDF5 file and its input files and all child jobs are
+        set to the status 'created' with a single database update, just like a child job created by
+        GenericJob._create_job_structure().
+
+        Args:
+            job_lst (list): list of GenericJob objects
+        """
+        # jobs which customize the way they are saved are created individually when they are started
+        new_job_lst = [job for job in job_lst
+                       if job._job_id is None and job.parent_id is None and job.status.string == 'initialized' and
+                       all([_get_defining_class(type(job), funct) is GenericJob
+                            for funct in ['save', '_run_if_new', '_create_job_structure']])]
+        if len(new_job_lst) < 2:
+            return
+        for job in new_job_lst:
+            job.validate_ready_to_run()
+            if job.server.run_mode.queue:
+                job.check_setup()
+        location_lst = [(job.job_name, str(job.project_hdf5.project_path), str(job.project_hdf5.h5_path))
+                        for job in new_job_lst]
+        existing_lst = [(item['job'], item['project'], item['subjob']) for item in self.project.db.get_items_dict(
+            {'job': sorted(set([location[0] for location in location_lst])),
+             'project': sorted(set([location[1] for location in location_lst])),
+             'subjob': sorted(set([location[2] for location in location_lst]))})]
+        new_job_lst = [job for job, location in zip(new_job_lst, location_lst) if location not in existing_lst]
+        if len(new_job_lst) == 0:
+            return
+        job_id_lst = self.project.db.add_items([job.db_entry() for job in new_job_lst])
+        for job, job_id in zip(new_job_lst, job_id_lst):
+            job._create_job_structure(job_id=job_id)
+        self.project.db.update_items({'status': 'created'}, job_id_lst)
+        JobStatus.query_count['write'] += 1
+        for job, job_id in zip(new_job_lst, job_id_lst):
+            job.status._cache_status('created', job_id)
+
     def _run_if_child_queue(self, job):
         """
         run function which is executed when the child jobs are submitted to the queue. In this case all child jobs are
@@ -502,12 +592,16 @@ class ParallelMaster(GenericMaster):
         Args:
             job (GenericJob): child job to be started
         """
+        job_lst = []
         while job is not None:
-            self._logger.debug('create job: %s %s', job.job_info_str, job.master_id)
-            if not job.status.finished:
-                job.run()
-                self._logger.info('{}: submitted job {}'.format(self.job_name, job.job_name))
+            job_lst.append(job)
             job = next(self._job_generator, None)
+        job_lst = [job for job in job_lst if not job.status.finished]
+        self._save_child_jobs(job_lst)
+        for job in job_lst:
+            self._logger.debug('create job: %s %s', job.job_info_str, job.master_id)
+            job.run()
+            self._logger.info('{}: submitted job {}'.format(self.job_name, job.job_name))
         self.submission_status.submitted_jobs = self.submission_status.total_jobs
         self.status.suspended = True
         if self.is_finished():
@@ -528,6 +622,7 @@ class ParallelMaster(GenericMaster):
         job_to_be_run_lst = self._next_job_series(job)
         if self.project.db.get_item_by_id(self.job_id)['status'] != 'busy':
             self.status.suspended = True
+            self._save_child_jobs(job_to_be_run_lst)
             job_lst = []
             for job in job_to_be_run_lst:
                 job.run()
@@ -548,6 +643,7 @@ class ParallelMaster(GenericMaster):
         job_to_be_run_lst = self._next_job_series(job)
         if self.project.db.get_item_by_id(self.job_id)['status'] != 'busy':
             self.status.suspended = True
+            self._save_child_jobs(job_to_be_run_lst)
             for job in job_to_be_run_lst:
                 job.run()
             if self.master_id:
@@ -588,8 +684,11 @@ class ParallelMaster(GenericMaster):
                 job.run()
                 self._logger.info('{}: finished job {}'.format(self.job_name, job.job_name))
             job = next(self._job_generator, None)
-            while job is None and not self.is_finished():
-                time.sleep(5)
+            while job is None:
+                state = job_notification.get_state()
+                if self.is_finished():
+                    break
+                job_notification.wait(timeout=5, state=state)
                 job = next(self._job_generator, None)
         if self.is_finished():
             self.status.collect = True
@@ -733,6 +832,8 @@ class ParallelMaster(GenericMaster):
         job._name = job_name
         job.master_id = self.get_job_id()
         job.status.initialized = True
+        if self.server.reuse_results:
+            job.server.reuse_results = True
         if self.server.run_mode.non_modal and job.server.run_mode.modal:
             job.server.run_mode.non_modal = True
         elif self.server.run_mode.queue:
@@ -822,3 +923,60 @@ class JobGenerator(object):
         else:
             self._job.refresh_job_status()
             raise StopIteration()
+
+
+def _get_defining_class(cls, name):
+    """
+    Get the class which defines an attribute - the first class in the method resolution order with the attribute in its
+    __dict__. Comparing the defining classes works for functions in Python 2 and 3, while the unbound methods of Python 2
+    are different objects for every access.
+
+    Args:
+        cls (type): class to inspect
+        name (str): attribute name
+
+    Returns:
+        type: defining class - None if no class defines the attribute
+    """
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            return base
+    return None
+
+
+def _get_child_hdf_location(db_entry):
+    """
+    Get the HDF5 file and the HDF5 group of a child job from its database entry.
+
+    Args:
+        db_entry (dict): database entry with the columns projectpath, project and subjob
+
+    Returns:
+        tuple: (absolute path of the HDF5 file, HDF5 group)
+    """
+    project_path = db_entry['projectpath'] if db_entry['projectpath'] is not None else ''
+    file_name = project_path + db_entry['project'] + db_entry['subjob'].split('/')[1] + '.h5'
+    return file_name, db_entry['subjob']
+
+
+def _init_gather_worker():
+    """
+    Initialize a worker process of ParallelMaster.gather() - the HDF5 file handles cached by the parent process can not
+    be used in the forked worker process.
+    """
+    hdf5_file_cache.detach()
+
+
+def _gather_child_output(task):
+    """
+    Read the selected part of multiple datasets from the HDF5 file of a single child job.
+
+    Args:
+        task (tuple): HDF5 file, HDF5 group, list of dataset paths, index
+
+    Returns:
+        list: selected part of each dataset
+    """
+    file_name, h5_path, path_lst, index = task
+    hdf = FileHDFio(file_name=file_name, h5_path=h5_path, mode='r')
+    return [hdf.get_array_slice(path, () if index is None else index) for path in path_lst]
@@ -5,10 +5,10 @@
 from __future__ import print_function
 from collections import OrderedDict
 import inspect
-import time
 import numpy as np
 from pyiron.base.master.generic import GenericMaster, get_function_from_string
 from pyiron.base.generic.parameters import GenericParameters
+from pyiron.base.server.queuestatus import wait_for_jobs
 
 """
 The serial master class is a metajob consisting of a dynamic list of jobs which are executed in serial mode. 
@@ -218,7 +218,7 @@ class SerialMasterBase(GenericMaster):
         Returns:
             str: name of the initial child
         """
-        return self.project.db.get_item_by_id(self.child_ids[0])["job"]
+        return self._get_child_items(columns=['job'])[0]['job']
 
     def create_next(self, job_name=None):
         """
@@ -361,9 +361,7 @@ class SerialMasterBase(GenericMaster):
 
     def _run_if_master_modal_child_non_modal(self, job):
         job.run()
-        while not job.status.finished and not job.status.aborted:
-            job.refresh_job_status()
-            time.sleep(5)
+        wait_for_jobs(job_list=[job], interval_in_s=5)
         self.run_if_refresh()
 
     def run_static(self, **qwargs):
@@ -455,8 +453,7 @@ class SerialMasterBase(GenericMaster):
         Returns:
             dict, list, float, int: data or data object
         """
-        child_id_lst = self.child_ids
-        child_name_lst = [self.project.db.get_item_by_id(child_id)["job"] for child_id in self.child_ids]
+        child_id_lst, child_name_lst = self._get_child_id_and_name_lst()
         if isinstance(item, int):
             total_lst = child_name_lst + self._job_name_lst
             item = total_lst[item]
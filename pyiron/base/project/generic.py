@@ -13,9 +13,9 @@ from pyiron.base.settings.generic import Settings
 from pyiron.base.database.jobtable import get_db_columns, get_job_ids, get_job_id, get_jobs, job_table, \
     get_job_status, set_job_status, get_job_working_directory, get_child_ids
 from pyiron.base.settings.logger import set_logging_level
-from pyiron.base.generic.hdfio import ProjectHDFio
+from pyiron.base.generic.hdfio import ProjectHDFio, hdf5_file_cache
 from pyiron.base.job.jobtype import JobType, JobTypeChoice
-from pyiron.base.server.queuestatus import queue_delete_job, queue_is_empty, queue_table, wait_for_job, \
+from pyiron.base.server.queuestatus import queue_delete_job, queue_is_empty, queue_table, wait_for_job, wait_for_jobs, \
     queue_enable_reservation, queue_check_job_is_waiting_or_running
 
 """
@@ -653,6 +653,7 @@ class Project(ProjectPath):
                 ham = self.load(job_id)
                 ham.move_to(destination)
             for file in self.list_files():
+                hdf5_file_cache.invalidate(os.path.join(self.path, file))
                 shutil.move(os.path.join(self.path, file), destination.path)
         else:
             raise EnvironmentError('move_to: is not available in Viewermode !')
@@ -738,6 +739,7 @@ class Project(ProjectPath):
             file_name (str): name of the file
         """
         if not self.view_mode:
+            hdf5_file_cache.invalidate(posixpath.join(self.path, file_name))
             os.remove(posixpath.join(self.path, file_name))
         else:
             raise EnvironmentError('copy_to: is not available in Viewermode !')
@@ -776,15 +778,29 @@ class Project(ProjectPath):
             recursive (bool): [True/False] delete all jobs in all subprojects - default=False
         """
         if not self.view_mode:
-            for job_id in self.get_job_ids(recursive=recursive):
-                if job_id not in self.get_job_ids(recursive=recursive):
-                    continue
-                else:
-                    try:
-                        self.remove_job(job_specifier=job_id)
-                        s.logger.debug("Remove job with ID {0} ".format(job_id))
-                    except (IndexError, Exception):
-                        s.logger.debug("Could not remove job with ID {0} ".format(job_id))
+            job_id_lst = self.get_job_ids(recursive=recursive)
+            job_id_set = set(job_id_lst)
+            remove_id_lst = []
+            # child jobs are removed before their master jobs, the database entries are removed in one transaction
+            for job_id in sorted(job_id_lst, reverse=True):
+                try:
+                    job = self.load(job_specifier=job_id, convert_to_object=False)
+                    if job is None:
+                        continue
+                    if job.master_id is not None and job.master_id not in job_id_set:
+                        raise ValueError("Child jobs are protected and cannot be deleted!")
+                    if not set(job.child_ids).issubset(job_id_set):
+                        job.remove()
+                    else:
+                        job._remove_files()
+                        remove_id_lst.append(job_id)
+                    s.logger.debug("Remove job with ID {0} ".format(job_id))
+                except IOError:
+                    s.logger.debug('hdf file does not exist. Removal from database will be attempted.')
+                    remove_id_lst.append(job_id)
+                except (IndexError, Exception):
+                    s.logger.debug("Could not remove job with ID {0} ".format(job_id))
+            self.db.delete_items(remove_id_lst)
         else:
             raise EnvironmentError('copy_to: is not available in Viewermode !')
 
@@ -800,6 +816,20 @@ class Project(ProjectPath):
             if job.status == 'finished':
                 job.compress()
 
+    def repack_jobs(self, recursive=False, threshold=0.5):
+        """
+        Reclaim the unused space in the HDF5 files of all finished jobs in the current project and in all subprojects if
+        recursive=True is selected. Only files with a fraction of unused space above the threshold are rewritten.
+
+        Args:
+            recursive (bool): [True/False] repack all jobs in all subprojects - default=False
+            threshold (float): minimal fraction of unused space to rewrite the file - default=0.5
+        """
+        for job_id in self.get_job_ids(recursive=recursive):
+            job = self.inspect(job_id)
+            if job.status == 'finished':
+                job.repack(threshold=threshold)
+
     def delete_output_files_jobs(self, recursive=False):
         """
         Delete the output files of all finished jobs in the current project and in all subprojects if recursive=True is
@@ -834,6 +864,7 @@ class Project(ProjectPath):
                     sub_project = self.open(sub_project_name)
                     sub_project.remove(enable=enable, enforce=enforce)
             self.remove_jobs(recursive=True)
+            hdf5_file_cache.invalidate_directory(self.path)
             for file in self.list_files():
                 os.remove(os.path.join(self.path, file))
             if enforce:
@@ -849,7 +880,7 @@ class Project(ProjectPath):
         Set the status of a particular job
 
         Args:
-            job_specifier (str): name of the job or job ID
+            job_specifier (str, int, list): name of the job or job ID - or a list of job names and job IDs
             status (str): job status can be one of the following ['initialized', 'appended', 'created', 'submitted',
                          'running', 'aborted', 'collect', 'suspended', 'refresh', 'busy', 'finished']
             project (str): project path
@@ -983,6 +1014,22 @@ class Project(ProjectPath):
         """
         wait_for_job(job=job, interval_in_s=interval_in_s, max_iterations=max_iterations)
 
+    @staticmethod
+    def wait_for_jobs(job_list, timeout=None, interval_in_s=5):
+        """
+        Sleep until all jobs in the job list are finished. The waiting process is woken up as soon as the status of
+        any job changes, otherwise the job status is queried from the database every interval_in_s seconds.
+
+        Args:
+            job_list (list): list of jobs (GenericJob) to wait for
+            timeout (float/None): maximum time to wait in seconds - by default there is no limit.
+            interval_in_s (float): maximum interval when the job status is queried from the database - default 5 sec.
+
+        Returns:
+            list: list of the jobs which finished
+        """
+        return wait_for_jobs(job_list=job_list, timeout=timeout, interval_in_s=interval_in_s)
+
     @staticmethod
     def set_logging_level(level, channel=None):
         """
@@ -1106,6 +1153,7 @@ class Project(ProjectPath):
             pattern = posixpath.join(self.path, pattern)
             for f in glob.glob(pattern):
                 s.logger.info('remove file {}'.format(posixpath.basename(f)))
+                hdf5_file_cache.invalidate(f)
                 os.remove(f)
         else:
             raise EnvironmentError('copy_to: is not available in Viewermode !')
@@ -68,6 +68,10 @@ class Server(PyironObject):  # add the option to return the job id and the hold
         .. attribute:: new_hdf
 
             defines whether a subjob should be stored in the same HDF5 file or in a new one.
+
+        .. attribute:: reuse_results
+
+            reuse the output of a finished job with the same input hash instead of executing the job again.
     """
     def __init__(self, host=None, queue=None, cores=1, threads=1, run_mode='modal', new_hdf=True):
         self._cores = cores
@@ -88,6 +92,7 @@ class Server(PyironObject):  # add the option to return the job id and the hold
         self._send_to_db = False
         self._structure_id = None
         self._accept_crash = False
+        self._reuse_results = False
 
     @property
     def send_to_db(self):
@@ -117,6 +122,29 @@ class Server(PyironObject):  # add the option to return the job id and the hold
     def accept_crash(self, accept):
         self._accept_crash = accept
 
+    @property
+    def reuse_results(self):
+        """
+        Get the boolean option to reuse the output of a finished job with the same input hash instead of executing the
+        job again - the output group of the HDF5 file and the files in the working directory of the finished job are
+        copied to the new job.
+
+        Returns:
+            bool: [True/False]
+        """
+        return self._reuse_results
+
+    @reuse_results.setter
+    def reuse_results(self, reuse):
+        """
+        Set the boolean option to reuse the output of a finished job with the same input hash instead of executing the
+        job again
+
+        Args:
+            reuse (bool): [True/False]
+        """
+        self._reuse_results = bool(reuse)
+
     @property
     def structure_id(self):
         """
@@ -399,6 +427,7 @@ class Server(PyironObject):  # add the option to return the job id and the hold
         hdf_dict["run_time"] = self.run_time
         hdf_dict["memory_limit"] = self.memory_limit
         hdf_dict["accept_crash"] = self.accept_crash
+        hdf_dict["reuse_results"] = self.reuse_results
 
         if group_name:
             with hdf.open(group_name) as hdf_group:
@@ -438,6 +467,8 @@ class Server(PyironObject):  # add the option to return the job id and the hold
             self._memory_limit = hdf_dict["memory_limit"]
         if "accept_crash" in hdf_dict.keys():
             self._accept_crash = (hdf_dict["accept_crash"] == 1)
+        if "reuse_results" in hdf_dict.keys():
+            self._reuse_results = (hdf_dict["reuse_results"] == 1)
         if "threads" in hdf_dict.keys():
             self._threads = hdf_dict["threads"]
         self._new_hdf = (hdf_dict["new_h5"] == 1)
@@ -473,6 +504,7 @@ class Server(PyironObject):  # add the option to return the job id and the hold
         del self._send_to_db
         del self._structure_id
         del self._accept_crash
+        del self._reuse_results
 
     @staticmethod
     def _init_host(host):
@@ -6,6 +6,7 @@ import pandas
 import time
 from pyiron.base.settings.generic import Settings
 from pyiron.base.job.jobtype import static_isinstance
+from pyiron.base.job.notification import job_notification
 
 """
 Set of functions to interact with the queuing system directly from within pyiron - optimized for the Sun grid engine.
@@ -24,6 +25,13 @@ QUEUE_SCRIPT_PREFIX = 'pi_'
 
 s = Settings()
 
+
+class JobTimeoutError(ValueError):
+    """
+    Raised when the jobs did not finish before the timeout - derived from ValueError, which was raised before.
+    """
+    pass
+
     
 def queue_table(job_ids=[], project_only=True):
     """
@@ -133,22 +141,59 @@ def queue_enable_reservation(item):
 
 def wait_for_job(job, interval_in_s=5, max_iterations=100):
     """
-    Sleep until the job is finished but maximum interval_in_s * max_iterations seconds.
+    Sleep until the job is finished but maximum interval_in_s * max_iterations seconds. The job status is checked as
+    soon as a status change is signalled on the job notification channel and at the latest every interval_in_s seconds.
 
     Args:
         job (pyiron.base.job.generic.GenericJob): Job to wait for
         interval_in_s (int): interval when the job status is queried from the database - default 5 sec.
         max_iterations (int): maximum number of iterations - default 100
     """
-    finished = False
-    for _ in range(max_iterations):
-        job.refresh_job_status()
-        if job.status.finished or job.status.aborted:
-            finished = True
+    try:
+        wait_for_jobs(job_list=[job], timeout=interval_in_s * max_iterations, interval_in_s=interval_in_s)
+    except JobTimeoutError:
+        raise JobTimeoutError('Maximum iterations reached, but the job was not finished.')
+
+
+def wait_for_jobs(job_list, timeout=None, interval_in_s=5):
+    """
+    Sleep until all jobs in the job list are finished, aborted or not converged. Waiting processes are woken up
+    immediately when the status of any job changes, using the job notification channel. The status of all jobs is
+    then queried from the database with a single query. Without notification the database is polled every
+    interval_in_s seconds.
+
+    Args:
+        job_list (list): list of jobs (pyiron.base.job.generic.GenericJob) to wait for
+        timeout (float/None): maximum time to wait in seconds - by default there is no limit.
+        interval_in_s (float): maximum interval when the job status is queried from the database - default 5 sec.
+
+    Returns:
+        list: list of the jobs which finished, the job status of all jobs is refreshed.
+    """
+    job_list = list(job_list)
+    if len(job_list) == 0:
+        return []
+    database = job_list[0].project.db
+    job_id_lst = [job.job_id for job in job_list]
+    end_time = None if timeout is None else time.time() + timeout
+    while True:
+        state = job_notification.get_state()
+        item_lst = database.get_items_by_ids(job_id_lst, columns=['status'])
+        if len(item_lst) != len(job_id_lst):
+            raise ValueError('Some of the jobs are not listed in the database anymore.')
+        job_id_lst = [item['id'] for item in item_lst if item['status'] not in ['finished', 'aborted', 'not_converged']]
+        if len(job_id_lst) == 0:
             break
-        time.sleep(interval_in_s)
-    if not finished:
-        raise ValueError('Maximum iterations reached, but the job was not finished.')
+        if end_time is None:
+            wait_time = interval_in_s
+        else:
+            wait_time = min(interval_in_s, end_time - time.time())
+            if wait_time <= 0:
+                raise JobTimeoutError('Timeout reached, but ' + str(len(job_id_lst)) + ' jobs were not finished.')
+        job_notification.wait(timeout=wait_time, state=state)
+    for job in job_list:
+        job.refresh_job_status()
+    return [job for job in job_list if job.status.finished]
 
 
 def _validate_que_request(item):
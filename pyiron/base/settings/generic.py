@@ -3,6 +3,7 @@
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 from builtins import input
+import getpass
 import os
 import importlib
 from six import with_metaclass
@@ -72,7 +73,13 @@ class Settings(with_metaclass(Singleton)):
                                'sql_host': None,
                                'sql_type': 'SQLite',
                                'sql_user_key': None,
-                               'sql_database': None}
+                               'sql_database': None,
+                               'sql_pool_size': 0,
+                               'sql_pool_pre_ping': True,
+                               'sql_max_retries': 10,
+                               'hdf5_max_open_files': 32,
+                               'job_status_cache_time': 0.0,
+                               'job_notification_path': None}
         environment_keys = os.environ.keys()
         if 'PYIRONCONFIG' in environment_keys:
             config_file = environment_keys['PYIRONCONFIG']
@@ -200,6 +207,45 @@ class Settings(with_metaclass(Singleton)):
         """
         return self._configuration['resource_paths']
 
+    @property
+    def hdf5_max_open_files(self):
+        """
+        Get the maximum number of HDF5 files which are kept open for reading
+
+        Returns:
+            int: maximum number of open HDF5 files
+        """
+        return self._configuration['hdf5_max_open_files']
+
+    @property
+    def job_status_cache_time(self):
+        """
+        Get the time in seconds a job status is cached before it is loaded from the database again
+
+        Returns:
+            float: cache time in seconds
+        """
+        return self._configuration['job_status_cache_time']
+
+    @property
+    def job_notification_path(self):
+        """
+        Get the directory which is used to notify waiting processes about job status changes - by default a user
+        specific directory in the first resource path is used, which unlike the temporary directory is usually shared
+        between the nodes of a cluster.
+
+        Returns:
+            str: path of the job notification directory
+        """
+        if self._configuration['job_notification_path'] is None:
+            try:
+                user = getpass.getuser()
+            except (KeyError, ImportError, OSError):
+                # no user name is available for the current user id - for example in containers
+                user = str(os.getuid()) if hasattr(os, 'getuid') else 'default'
+            return os.path.join(self._configuration['resource_paths'][0], 'job_notification', user)
+        return self._configuration['job_notification_path']
+
     def __del__(self):
         """
         Close database connection
@@ -213,7 +259,20 @@ class Settings(with_metaclass(Singleton)):
         """
         if self._database is None:
             self._database = DatabaseAccess(self._configuration['sql_connection_string'],
-                                            self._configuration['sql_table_name'])
+                                            self._configuration['sql_table_name'],
+                                            **self._connection_kwargs)
+
+    @property
+    def _connection_kwargs(self):
+        """
+        Connection pool settings for the central database
+
+        Returns:
+            dict: keyword arguments for DatabaseAccess
+        """
+        return {'pool_size': self._configuration['sql_pool_size'],
+                'pool_pre_ping': self._configuration['sql_pool_pre_ping'],
+                'max_retries': self._configuration['sql_max_retries']}
 
     def switch_to_local_database(self, file_name='pyiron.db', cwd=None):
         """
@@ -242,7 +301,8 @@ class Settings(with_metaclass(Singleton)):
         if self._use_local_database:
             self.close_connection()
             self._database = DatabaseAccess(self._configuration['sql_connection_string'],
-                                            self._configuration['sql_table_name'])
+                                            self._configuration['sql_table_name'],
+                                            **self._connection_kwargs)
             self._use_local_database = False
         else:
             print('Database is already in central mode!')
@@ -255,7 +315,8 @@ class Settings(with_metaclass(Singleton)):
             if not self._database.viewer_mode:
                 self.close_connection()
                 self._database = DatabaseAccess(self._configuration['sql_view_connection_string'],
-                                                self._configuration['sql_view_table_name'])
+                                                self._configuration['sql_view_table_name'],
+                                                **self._connection_kwargs)
                 self._database.viewer_mode = True
             else:
                 print('Database is already in viewer mode!')
@@ -270,7 +331,8 @@ class Settings(with_metaclass(Singleton)):
             if self._database.viewer_mode:
                 self.close_connection()
                 self._database = DatabaseAccess(self._configuration['sql_connection_string'],
-                                                self._configuration['sql_table_name'])
+                                                self._configuration['sql_table_name'],
+                                                **self._connection_kwargs)
                 self._database.viewer_mode = True
             else:
                 print('Database is already in user mode!')
@@ -391,6 +453,19 @@ class Settings(with_metaclass(Singleton)):
                 self._configuration['sql_file'] = parser.get(section, "DATABASE_FILE").replace('\\', '/')
         if parser.has_option(section, "JOB_TABLE"):
             self._configuration['sql_table_name'] = parser.get(section, "JOB_TABLE")
+        if parser.has_option(section, "POOL_SIZE"):
+            self._configuration['sql_pool_size'] = parser.getint(section, "POOL_SIZE")
+        if parser.has_option(section, "POOL_PRE_PING"):
+            self._configuration['sql_pool_pre_ping'] = parser.getboolean(section, "POOL_PRE_PING")
+        if parser.has_option(section, "MAX_RETRIES"):
+            self._configuration['sql_max_retries'] = parser.getint(section, "MAX_RETRIES")
+        if parser.has_option(section, "HDF5_MAX_OPEN_FILES"):
+            self._configuration['hdf5_max_open_files'] = parser.getint(section, "HDF5_MAX_OPEN_FILES")
+        if parser.has_option(section, "JOB_STATUS_CACHE_TIME"):
+            self._configuration['job_status_cache_time'] = parser.getfloat(section, "JOB_STATUS_CACHE_TIME")
+        if parser.has_option(section, "JOB_NOTIFICATION_PATH"):
+            self._configuration['job_notification_path'] = \
+                convert_path(parser.get(section, "JOB_NOTIFICATION_PATH"))
 
     @property
     def publication(self):
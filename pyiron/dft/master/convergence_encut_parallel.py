@@ -66,13 +66,12 @@ class ConvEncutParallel(AtomisticParallelMaster):
         self._job_generator = EncutConvergenceJobGenerator(self)
 
     def collect_output(self):
-        eng_lst, encut_lst = [], []
-        for job_id in self.child_ids:  # add iter_jobs (should behave like a project)
-            ham = self.project_hdf5.inspect(job_id)
-            print('job_id: ', job_id, ham.status)
-            eng_lst.append(ham["output/generic/energy_tot"][-1])
-            encut = ham.job_name.split('_')[1:]
+        eng_lst = self.gather("output/generic/energy_tot", workers=self._get_gather_workers())
+        encut_lst = []
+        for job_name in self._get_child_id_and_name_lst()[1]:
+            encut = job_name.split('_')[1:]
             encut_lst.append(float(encut[0] + "." + encut[1]))
+        encut_lst = np.array(encut_lst)
         arg_lst = np.argsort(encut_lst)
         self._output["energy"] = eng_lst[arg_lst]
         self._output["encut"] = encut_lst[arg_lst]
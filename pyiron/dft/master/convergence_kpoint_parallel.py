@@ -70,12 +70,8 @@ class ConvKpointParallel(AtomisticParallelMaster):
         super(ConvKpointParallel, self).write_input()
 
     def collect_output(self):
-        eng_lst, kpoint_lst = [], []
-        for job_id in self.child_ids:  # add iter_jobs (should behave like a project)
-            ham = self.project_hdf5.inspect(job_id)
-            print('job_id: ', job_id, ham.status)
-            eng_lst.append(ham["output/generic/energy_tot"][-1])
-            kpoint_lst.append(int(ham.job_name.split('_')[-1]))
+        eng_lst = self.gather("output/generic/energy_tot", workers=self._get_gather_workers())
+        kpoint_lst = np.array([int(job_name.split('_')[-1]) for job_name in self._get_child_id_and_name_lst()[1]])
         arg_lst = np.argsort(kpoint_lst)
         self._output["energy"] = eng_lst[arg_lst]
         self._output["kpoints"] = kpoint_lst[arg_lst]
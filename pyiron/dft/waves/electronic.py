@@ -26,10 +26,13 @@ class ElectronicStructure(object):
     every k-point has a set of bands associated with it. This is loosely adapted from the `pymatgen electronic_structure
     modules`_. Many of the functions have been substantially modified for pyiron
 
+    Internally the eigenvalues and occupancies are stored as (spin, kpoint, band) arrays, the Kpoint and Band instances
+    are only created when the kpoints attribute is accessed.
+
     .. _pymatgen electronic_structure modules: http://pymatgen.org/pymatgen.electronic_structure.bandstructure.html
     """
     def __init__(self):
-        self.kpoints = list()
+        self._kpoints = None
         self._eigenvalues = list()
         self._occupancies = list()
         self._dos_energies = list()
@@ -39,8 +42,8 @@ class ElectronicStructure(object):
         self._vbm = None
         self._cbm = None
         self._efermi = None
-        self._eigenvalue_matrix = None
-        self._occupancy_matrix = None
+        self._grand_eigenvalue_matrix = None
+        self._grand_occupancy_matrix = None
         self._grand_dos_matrix = None
         self._resolved_densities = None
         self._kpoint_list = list()
@@ -63,6 +66,30 @@ class ElectronicStructure(object):
         kpt_obj.weight = weight
         self.kpoints.append(kpt_obj)
 
+    @property
+    def kpoints(self):
+        """
+        list: List of Kpoint instances of the first spin configuration - they are created from the eigenvalue and
+              occupancy matrices on first access
+        """
+        if self._kpoints is None:
+            self._kpoints = list()
+            if self._grand_eigenvalue_matrix is not None:
+                for i in range(len(self._kpoint_list)):
+                    self.add_kpoint(value=self._kpoint_list[i], weight=self._kpoint_weights[i])
+                    if self._grand_dos_matrix is not None:
+                        resolved_dos_matrices = self._grand_dos_matrix[0, i]
+                    else:
+                        resolved_dos_matrices = None
+                    self._kpoints[-1].set_band_matrices(eigenvalues=self._grand_eigenvalue_matrix[0, i],
+                                                        occupancies=self._grand_occupancy_matrix[0, i],
+                                                        resolved_dos_matrices=resolved_dos_matrices)
+        return self._kpoints
+
+    @kpoints.setter
+    def kpoints(self, val):
+        self._kpoints = val
+
     def get_dos(self, n_bins=100):
         """
         Gives a pyiron.objects.waves.dos.Dos instance
@@ -161,35 +188,68 @@ class ElectronicStructure(object):
     @property
     def eigenvalue_matrix(self):
         """
-        numpy.ndarray: A getter function to return the eigenvalue_matrix. The eigenvalue for a given kpoint index i and band index j
-                       is given by eigenvalue_matrix[i][j]
+        numpy.ndarray: A getter function to return the eigenvalue_matrix of the first spin configuration. The eigenvalue
+                       for a given kpoint index i and band index j is given by eigenvalue_matrix[i][j]
 
         """
-        if self._eigenvalue_matrix is None and len(self.kpoints) > 0:
-            self._eigenvalue_matrix = np.zeros((len(self.kpoints), len(self.kpoints[0].bands)))
-            for i, k in enumerate(self.kpoints):
-                self._eigenvalue_matrix[i, :] = k.eig_occ_matrix[:, 0]
-        return self._eigenvalue_matrix
+        if self.grand_eigenvalue_matrix is None:
+            return None
+        return self.grand_eigenvalue_matrix[0]
 
     @eigenvalue_matrix.setter
     def eigenvalue_matrix(self, val):
-        self._eigenvalue_matrix = val
+        if val is not None:
+            val = np.array([val])
+        self.grand_eigenvalue_matrix = val
 
     @property
     def occupancy_matrix(self):
         """
-        numpy.ndarray: A getter function to return the occupancy_matrix. The occupancy for a given kpoint index i and band index j
-                       is given by occupancy_matrix[i][j]
+        numpy.ndarray: A getter function to return the occupancy_matrix of the first spin configuration. The occupancy
+                       for a given kpoint index i and band index j is given by occupancy_matrix[i][j]
         """
-        if self._occupancy_matrix is None and len(self.kpoints) > 0:
-            self._occupancy_matrix = np.zeros((len(self.kpoints), len(self.kpoints[0].bands)))
-            for i, k in enumerate(self.kpoints):
-                self._occupancy_matrix[i, :] = k.eig_occ_matrix[:, 1]
-        return self._occupancy_matrix
+        if self.grand_occupancy_matrix is None:
+            return None
+        return self.grand_occupancy_matrix[0]
 
     @occupancy_matrix.setter
     def occupancy_matrix(self, val):
-        self._occupancy_matrix = val
+        if val is not None:
+            val = np.array([val])
+        self.grand_occupancy_matrix = val
+
+    @property
+    def grand_eigenvalue_matrix(self):
+        """
+        numpy.ndarray: The eigenvalues of every spin, kpoint and band. The eigenvalue for a given spin index s, kpoint
+                       index k and band index b is given by grand_eigenvalue_matrix[s, k, b]
+        """
+        if self._grand_eigenvalue_matrix is None and self._kpoints is not None and len(self._kpoints) > 0:
+            self._grand_eigenvalue_matrix = np.array([[k.eig_occ_matrix[:, 0] for k in self._kpoints]])
+        return self._grand_eigenvalue_matrix
+
+    @grand_eigenvalue_matrix.setter
+    def grand_eigenvalue_matrix(self, val):
+        if val is not None:
+            val = np.asarray(val)
+            self.n_spins = len(val)
+        self._grand_eigenvalue_matrix = val
+
+    @property
+    def grand_occupancy_matrix(self):
+        """
+        numpy.ndarray: The occupancies of every spin, kpoint and band. The occupancy for a given spin index s, kpoint
+                       index k and band index b is given by grand_occupancy_matrix[s, k, b]
+        """
+        if self._grand_occupancy_matrix is None and self._kpoints is not None and len(self._kpoints) > 0:
+            self._grand_occupancy_matrix = np.array([[k.eig_occ_matrix[:, 1] for k in self._kpoints]])
+        return self._grand_occupancy_matrix
+
+    @grand_occupancy_matrix.setter
+    def grand_occupancy_matrix(self, val):
+        if val is not None:
+            val = np.asarray(val)
+        self._grand_occupancy_matrix = val
 
     @property
     def kpoint_list(self):
@@ -244,26 +304,13 @@ class ElectronicStructure(object):
         Returns:
             dict:
                 "value" (float): Absolute energy value of the VBM (eV)
+                "spin" (int): The spin index of the VBM
                 "kpoint": The Kpoint instance associated with the VBM
                 "band": The Band instance associated with the VBM
         """
-        vbm = None
-        vbm_dict = dict()
-        for kpt in self.kpoints:
-            for band in kpt.bands:
-                if band.occupancy > resolution:
-                    if vbm is None:
-                        vbm = band.eigenvalue
-                        vbm_dict["value"] = vbm
-                        vbm_dict["kpoint"] = kpt
-                        vbm_dict["band"] = band
-                    else:
-                        if band.eigenvalue > vbm:
-                            vbm = band.eigenvalue
-                            vbm_dict["value"] = vbm
-                            vbm_dict["kpoint"] = kpt
-                            vbm_dict["band"] = band
-        return vbm_dict
+        if self.grand_occupancy_matrix is None:
+            return dict()
+        return self._get_band_edge(self.grand_occupancy_matrix > resolution, find_maximum=True)
 
     def get_cbm(self, resolution=1e-6):
         """
@@ -275,26 +322,58 @@ class ElectronicStructure(object):
         Returns:
             dict:
                 "value" (float): Absolute energy value of the CBM (eV)
-                 "kpoint": The Kpoint instance associated with the CBM
-                 "band": The Band instance associated with the CBM
-        """
-        cbm = None
-        cbm_dict = dict()
-        for kpt in self.kpoints:
-            for band in kpt.bands:
-                if band.occupancy <= resolution:
-                    if cbm is None:
-                        cbm = band.eigenvalue
-                        cbm_dict["value"] = cbm
-                        cbm_dict["kpoint"] = kpt
-                        cbm_dict["band"] = band
-                    else:
-                        if band.eigenvalue < cbm:
-                            cbm = band.eigenvalue
-                            cbm_dict["value"] = cbm
-                            cbm_dict["kpoint"] = kpt
-                            cbm_dict["band"] = band
-        return cbm_dict
+                "spin" (int): The spin index of the CBM
+                "kpoint": The Kpoint instance associated with the CBM
+                "band": The Band instance associated with the CBM
+        """
+        if self.grand_occupancy_matrix is None:
+            return dict()
+        return self._get_band_edge(self.grand_occupancy_matrix <= resolution, find_maximum=False)
+
+    def _get_band_edge(self, selection, find_maximum):
+        """
+        Find the highest or lowest eigenvalue of the selected bands of all spin configurations and k-points
+
+        Args:
+            selection (numpy.ndarray): boolean (spin, kpoint, band) array of the bands to consider
+            find_maximum (bool): True to find the highest and False to find the lowest eigenvalue
+
+        Returns:
+            dict: "value", "spin", "kpoint" and "band" of the band edge - empty if no band is selected
+        """
+        if not np.any(selection):
+            return dict()
+        if find_maximum:
+            index = np.argmax(np.where(selection, self.grand_eigenvalue_matrix, -np.inf))
+        else:
+            index = np.argmin(np.where(selection, self.grand_eigenvalue_matrix, np.inf))
+        spin, kpoint, band = np.unravel_index(index, selection.shape)
+        return {"value": self.grand_eigenvalue_matrix[spin, kpoint, band],
+                "spin": spin,
+                "kpoint": self.kpoints[kpoint],
+                "band": self._get_band(spin, kpoint, band)}
+
+    def _get_band(self, spin, kpoint, band):
+        """
+        Get the Band instance for a given spin, kpoint and band index - the Kpoint instances only contain the bands of
+        the first spin configuration, so the bands of the other spin configurations are created from the matrices.
+
+        Args:
+            spin (int): spin index
+            kpoint (int): kpoint index
+            band (int): band index
+
+        Returns:
+            Band: The Band instance
+        """
+        if spin == 0:
+            return self.kpoints[kpoint].bands[band]
+        band_obj = Band()
+        band_obj.eigenvalue = self.grand_eigenvalue_matrix[spin, kpoint, band]
+        band_obj.occupancy = self.grand_occupancy_matrix[spin, kpoint, band]
+        if self._grand_dos_matrix is not None:
+            band_obj.resolved_dos_matrix = self._grand_dos_matrix[spin, kpoint, band]
+        return band_obj
 
     def get_band_gap(self, resolution=1e-6):
         """
@@ -375,13 +454,9 @@ class ElectronicStructure(object):
         """
         if not (self._efermi is not None):
             raise ValueError("e_fermi has to be set before you can determine if the system is metallic or not")
-        fermi_crossed = False
-        _, n_bands = np.shape(self.eigenvalue_matrix)
-        for i in range(n_bands):
-            values = self.eigenvalue_matrix[:, i]
-            if (self.efermi < np.max(values)) and (self.efermi >= np.min(values)):
-                fermi_crossed = True
-        return fermi_crossed
+        eigenvalues = self.grand_eigenvalue_matrix
+        fermi_crossed = (self.efermi < np.max(eigenvalues, axis=1)) & (self.efermi >= np.min(eigenvalues, axis=1))
+        return bool(np.any(fermi_crossed))
 
     @property
     def grand_dos_matrix(self):
@@ -399,7 +474,7 @@ class ElectronicStructure(object):
             numpy.ndarray (5 dimensional)
 
         """
-        if self._grand_dos_matrix is None:
+        if self._grand_dos_matrix is None and self._kpoints is not None and len(self._kpoints) > 0:
             try:
                 n_atoms, n_orbitals = np.shape(self.kpoints[0].bands[0].resolved_dos_matrix)
             except ValueError:
@@ -435,6 +510,9 @@ class ElectronicStructure(object):
             h_es["k_weights"] = self.kpoint_weights
             h_es["eig_matrix"] = self.eigenvalue_matrix
             h_es["occ_matrix"] = self.occupancy_matrix
+            if self.n_spins > 1:
+                h_es["grand_eig_matrix"] = self.grand_eigenvalue_matrix
+                h_es["grand_occ_matrix"] = self.grand_occupancy_matrix
             if self.efermi is not None:
                 h_es["efermi"] = self.efermi
             with h_es.open("dos") as h_dos:
@@ -465,8 +543,12 @@ class ElectronicStructure(object):
                     self.structure.to_hdf(h_es)
                 self.kpoint_list = h_es["k_points"]
                 self.kpoint_weights = h_es["k_weights"]
-                self.eigenvalue_matrix = h_es["eig_matrix"]
-                self.occupancy_matrix = h_es["occ_matrix"]
+                if "grand_eig_matrix" in nodes:
+                    self.grand_eigenvalue_matrix = h_es["grand_eig_matrix"]
+                    self.grand_occupancy_matrix = h_es["grand_occ_matrix"]
+                else:
+                    self.eigenvalue_matrix = h_es["eig_matrix"]
+                    self.occupancy_matrix = h_es["occ_matrix"]
                 if "efermi" in nodes:
                     self.efermi = h_es["efermi"]
                 with h_es.open("dos") as h_dos:
@@ -538,18 +620,11 @@ class ElectronicStructure(object):
 
     def generate_from_matrices(self):
         """
-        Generate the Kpoints and Bands from the kpoint lists and sometimes grand_dos_matrix
+        Generate the Kpoints and Bands from the kpoint lists and sometimes grand_dos_matrix. The Kpoint and Band
+        instances are created on the next access of the kpoints attribute.
 
         """
-        for i in range(len(self.kpoint_list)):
-            self.add_kpoint(self.kpoint_list[i], self.kpoint_weights[i])
-            _, length = np.shape(self.eigenvalue_matrix)
-            for j in range(length):
-                val = self.eigenvalue_matrix[i][j]
-                occ = self.occupancy_matrix[i][j]
-                self.kpoints[-1].add_band(eigenvalue=val, occupancy=occ)
-                if self._grand_dos_matrix is not None:
-                    self.kpoints[-1].bands[-1].resolved_dos_matrix = self.grand_dos_matrix[0, i, j, :, :]
+        self._kpoints = None
 
     def get_spin_resolved_dos(self, spin_indices=0):
         """
@@ -620,15 +695,15 @@ class ElectronicStructure(object):
         return plt
 
     def __del__(self):
-        del self.kpoints
+        del self._kpoints
         del self._eigenvalues
         del self._occupancies
         del self._eg
         del self._vbm
         del self._cbm
         del self._efermi
-        del self._eigenvalue_matrix
-        del self._occupancy_matrix
+        del self._grand_eigenvalue_matrix
+        del self._grand_occupancy_matrix
         del self._grand_dos_matrix
         del self._kpoint_list
         del self._kpoint_weights
@@ -640,8 +715,9 @@ class ElectronicStructure(object):
         output_string.append("----------------------------")
         if self.grand_dos_matrix is not None:
             output_string.append("Spin Configurations: {}".format(len(self.grand_dos_matrix)))
-        output_string.append("Number of k-points: {}".format(len(self.kpoints)))
-        output_string.append("Number of bands: {}".format(len(self.kpoints[0].bands)))
+        n_kpoints, n_bands = np.shape(self.eigenvalue_matrix)
+        output_string.append("Number of k-points: {}".format(n_kpoints))
+        output_string.append("Number of bands: {}".format(n_bands))
 
         try:
             if self.is_metal:
@@ -674,7 +750,8 @@ class Kpoint(object):
     def __init__(self):
         self._value = None
         self._weight = None
-        self.bands = list()
+        self._bands = list()
+        self._band_matrices = None
         self.is_relative = False
 
     @property
@@ -706,8 +783,41 @@ class Kpoint(object):
         band_obj.occupancy = occupancy
         self.bands.append(band_obj)
 
+    @property
+    def bands(self):
+        """
+        list: List of Band instances - if the bands were set by set_band_matrices() they are created on first access
+        """
+        if self._band_matrices is not None:
+            eigenvalues, occupancies, resolved_dos_matrices = self._band_matrices
+            self._band_matrices = None
+            for i in range(len(eigenvalues)):
+                self.add_band(eigenvalue=eigenvalues[i], occupancy=occupancies[i])
+                if resolved_dos_matrices is not None:
+                    self._bands[-1].resolved_dos_matrix = resolved_dos_matrices[i]
+        return self._bands
+
+    @bands.setter
+    def bands(self, val):
+        self._band_matrices = None
+        self._bands = val
+
+    def set_band_matrices(self, eigenvalues, occupancies, resolved_dos_matrices=None):
+        """
+        Set the bands of the k-point from arrays, the Band instances are only created when the bands are accessed.
+
+        Args:
+            eigenvalues (numpy.ndarray): The eigenvalues of the bands
+            occupancies (numpy.ndarray): The occupancies of the bands
+            resolved_dos_matrices (numpy.ndarray/None): The resolved dos matrix of every band
+        """
+        self._bands = list()
+        self._band_matrices = (eigenvalues, occupancies, resolved_dos_matrices)
+
     @property
     def eig_occ_matrix(self):
+        if self._band_matrices is not None:
+            return np.array([self._band_matrices[0], self._band_matrices[1]]).T
         return np.array([[b.eigenvalue, b.occupancy] for b in self.bands])
 
 
@@ -3,6 +3,7 @@
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 from __future__ import print_function, unicode_literals
+import mmap
 import os
 import posixpath
 
@@ -11,6 +12,7 @@ import h5py
 import numpy as np
 import pandas as pd
 import warnings
+from contextlib import closing
 from io import StringIO
 
 from pyiron.lammps.potential import LammpsPotentialFile, PotentialAvailable
@@ -535,49 +537,71 @@ class LammpsBase(AtomisticGenericJob):
         self.input.control.remove_keys(['dimension', 'read_data', 'boundary',
                                         'atom_style', 'velocity'])
 
-    def collect_dump_file(self, file_name="dump.out", cwd=None):
+    def collect_dump_file(self, file_name="dump.out", cwd=None, chunk_size=None):
         """
         general purpose routine to extract static from a lammps dump file
 
-        Args:
-            file_name:
-            cwd:
-
-        Returns:
+        The dump file is memory mapped and the atom blocks are parsed in chunks of snapshots, which are written to the
+        HDF5 file one after another - so the memory consumption is limited by the chunk size rather than the size of
+        the dump file.
 
+        Args:
+            file_name (str): name of the dump file
+            cwd (str): directory of the dump file
+            chunk_size (int/None): number of snapshots parsed at once, by default chunks of about a million atoms
         """
         file_name = self.job_file_name(file_name=file_name, cwd=cwd)
-        output = {}
-        with open(file_name, 'r') as ff:
-            dump = ff.readlines()
         prism = UnfoldingPrism(self.structure.cell, digits=15)
         rotation_lammps2orig = np.linalg.inv(prism.R)
-        time = np.genfromtxt([dump[nn] for nn in np.where([ll.startswith('ITEM: TIMESTEP') for ll in dump])[0]+1], dtype=int)
-        time = np.array([time]).flatten()
-        output['time'] = time
-        natoms = np.genfromtxt([dump[nn] for nn in np.where([ll.startswith('ITEM: NUMBER OF ATOMS') for ll in dump])[0]+1], dtype=int)
-        natoms = np.array([natoms]).flatten()
-        cells = np.genfromtxt(' '.join(([' '.join(dump[nn:nn+3])
-                                         for nn in np.where([ll.startswith('ITEM: BOX BOUNDS')
-                                                             for ll in dump])[0]+1])).split()).reshape(len(natoms), -1)
-        cells = np.array([to_amat(cc) for cc in cells])
-        output['cells'] = cells
-        l_start = np.where([ll.startswith('ITEM: ATOMS') for ll in dump])[0]
-        l_end = l_start+natoms+1
-        content = [pd.read_csv(StringIO('\n'.join(dump[llst:llen]).replace('ITEM: ATOMS ', '')),
-                            delim_whitespace=True) for llst, llen in zip(l_start, l_end)]
-
-        forces = np.array([np.stack((cc['fx'], cc['fy'], cc['fz']), axis=-1) for cc in content])
-        output['forces'] = np.einsum('ijk,kl->ijl', forces, rotation_lammps2orig)
-        unwrapped_positions = np.array([np.stack((cc['xsu'], cc['ysu'], cc['zsu']), axis=-1) for cc in content])
-        positions = unwrapped_positions-np.floor(unwrapped_positions)
-        unwrapped_positions = np.einsum('ikj,ilk->ilj', cells, unwrapped_positions)
-        output['unwrapped_positions'] = np.einsum('ijk,kl->ijl', unwrapped_positions, rotation_lammps2orig)
-        positions = np.einsum('ikj,ilk->ilj', cells, positions)
-        output['positions'] = np.einsum('ijk,kl->ijl', positions, rotation_lammps2orig)
+        if os.path.getsize(file_name) == 0:
+            # an empty file can not be memory mapped
+            self._write_dump_output(dump=b'', rotation_lammps2orig=rotation_lammps2orig, chunk_size=chunk_size)
+        else:
+            with open(file_name, 'rb') as ff, closing(mmap.mmap(ff.fileno(), 0, access=mmap.ACCESS_READ)) as dump:
+                self._write_dump_output(dump=dump, rotation_lammps2orig=rotation_lammps2orig, chunk_size=chunk_size)
+
+    def _write_dump_output(self, dump, rotation_lammps2orig, chunk_size=None):
+        """
+        Parse the content of a LAMMPS dump file chunk by chunk and write it to the HDF5 file - a dump file without
+        snapshots results in empty arrays.
+
+        Args:
+            dump (mmap.mmap/bytes): content of the dump file
+            rotation_lammps2orig (numpy.ndarray): rotation from the LAMMPS cell to the original cell
+            chunk_size (int/None): number of snapshots parsed at once, by default chunks of about a million atoms
+        """
+        headers = _read_dump_headers(dump)
+        if len(set(headers['n_atoms'])) > 1:
+            raise ValueError('Dump files with a changing number of atoms are not supported.')
         with self.project_hdf5.open("output/generic") as hdf_output:
-            for k,v in output.items():
-                hdf_output[k] = v
+            hdf_output['time'] = headers['time']
+            if len(headers['blocks']) == 0:
+                hdf_output['cells'] = np.zeros((0, 3, 3))
+                for k in ['forces', 'unwrapped_positions', 'positions']:
+                    hdf_output[k] = np.zeros((0, len(self.structure), 3))
+                return
+            n_atoms = headers['n_atoms'][0]
+            if chunk_size is None:
+                chunk_size = max(1, 1000000 // max(n_atoms, 1))
+            cells = np.array([to_amat(bounds) for bounds in headers['box_bounds']])
+            hdf_output['cells'] = cells
+            for chunk_start in range(0, len(cells), chunk_size):
+                chunk = slice(chunk_start, chunk_start + chunk_size)
+                content = _parse_dump_atoms(dump, blocks=headers['blocks'][chunk], n_atoms=n_atoms,
+                                            columns=headers['columns'],
+                                            selected_columns=['xsu', 'ysu', 'zsu', 'fx', 'fy', 'fz'])
+                cell_rotation = np.matmul(cells[chunk], rotation_lammps2orig)
+                scaled_positions = content[:, :, :3]
+                output = {'forces': np.matmul(content[:, :, 3:], rotation_lammps2orig),
+                          'unwrapped_positions': np.matmul(scaled_positions, cell_rotation)}
+                del content
+                scaled_positions -= np.floor(scaled_positions)
+                output['positions'] = np.matmul(scaled_positions, cell_rotation)
+                for k, v in output.items():
+                    if chunk_start == 0:
+                        hdf_output[k] = v
+                    else:
+                        hdf_output.extend(k, v)
 
     # Outdated functions:
     def set_potential(self, file_name):
@@ -764,3 +788,64 @@ def to_amat(l_list):
 
     cell = [[xhilo, 0, 0], [xy, yhilo, 0], [xz, yz, zhilo]]
     return cell
+
+
+def _read_dump_headers(dump):
+    """
+    Locate the snapshots of a LAMMPS dump file and parse their headers
+
+    Args:
+        dump (mmap.mmap/bytes): content of the dump file
+
+    Returns:
+        dict: time steps, number of atoms, box bounds and atom block (start, end) offsets for every snapshot as well as
+              the column names of the atom blocks
+    """
+    headers = {'time': [], 'n_atoms': [], 'box_bounds': [], 'blocks': [], 'columns': []}
+    start = dump.find(b'ITEM: TIMESTEP')
+    while start != -1:
+        block_start = dump.find(b'\n', dump.find(b'ITEM: ATOMS', start)) + 1
+        if block_start == 0:
+            block_start = len(dump)
+        lines = dump[start:block_start].decode().splitlines()
+        headers['time'].append(int(lines[1]))
+        headers['n_atoms'].append(int(lines[3]))
+        headers['box_bounds'].append([float(l) for l in ' '.join(lines[5:8]).split()])
+        headers['columns'] = lines[8].split()[2:]
+        start = dump.find(b'ITEM: TIMESTEP', block_start)
+        headers['blocks'].append((block_start, start if start != -1 else len(dump)))
+    headers['time'] = np.array(headers['time'])
+    return headers
+
+
+def _parse_dump_atoms(dump, blocks, n_atoms, columns, selected_columns):
+    """
+    Parse the selected columns of the atom blocks of several snapshots of a LAMMPS dump file into a single array
+
+    All blocks are parsed at once, when every column is numeric - otherwise, for example for dump files including the
+    element names, the blocks are parsed one by one with pandas.
+
+    Args:
+        dump (mmap.mmap/bytes): content of the dump file
+        blocks (list): (start, end) offsets of the atom blocks
+        n_atoms (int): number of atoms per snapshot
+        columns (list): names of the columns of the atom blocks
+        selected_columns (list): names of the columns to return
+
+    Returns:
+        numpy.ndarray: array of the shape (snapshots, atoms, selected columns)
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+        content = np.fromstring(b' '.join([dump[block_start:block_end] for block_start, block_end in blocks]),
+                                dtype=float, sep=' ')
+    if len(content) == len(blocks) * n_atoms * len(columns):
+        indices = [columns.index(c) for c in selected_columns]
+        return content.reshape(len(blocks), n_atoms, len(columns))[:, :, indices]
+    del content
+    content = np.array([pd.read_csv(StringIO(dump[block_start:block_end].decode()), delim_whitespace=True,
+                                    header=None, names=columns, usecols=selected_columns)[selected_columns].values
+                        for block_start, block_end in blocks], dtype=float)
+    if content.shape != (len(blocks), n_atoms, len(selected_columns)):
+        raise ValueError('The atom blocks of the dump file could not be parsed.')
+    return content
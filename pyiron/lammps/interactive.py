@@ -7,11 +7,11 @@ import importlib
 import numpy as np
 import os
 import pandas as pd
-import pickle
 import subprocess
 import warnings
 
 from pyiron.lammps.base import LammpsBase
+from pyiron.lammps.sub.lmpipc import read_message, write_message
 from pyiron.lammps.structure import UnfoldingPrism
 from pyiron.atomistics.job.interactive import GenericInteractive
 
@@ -72,21 +72,31 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
             positions = np.dot(positions, self._interactive_prism.R)
         positions = np.array(positions).flatten()
         if self.server.run_mode.interactive and self.server.cores == 1:
-            self._interactive_library.scatter_atoms("x", 1, 3, (len(positions) * c_double)(*positions))
+            self._interactive_library.scatter_atoms("x", 1, 3, _to_c_array(positions, c_double))
         else:
             self._interactive_library.scatter_atoms("x", 1, 3, positions)
         self._interactive_lib_command('change_box all remap')
 
+    def _interactive_get_thermo(self, key_lst):
+        """
+        Get multiple thermo keywords from the lammps library - with the LammpsLibrary all keywords are requested in a
+        single message.
+
+        Args:
+            key_lst (list): list of thermo keywords
+
+        Returns:
+            numpy.ndarray: values of the thermo keywords
+        """
+        if isinstance(self._interactive_library, LammpsLibrary):
+            return np.array(self._interactive_library.batch([('get_thermo', [key]) for key in key_lst]), dtype=float)
+        return np.array([self._interactive_library.get_thermo(key) for key in key_lst], dtype=float)
+
     def interactive_cells_getter(self):
-        cc = np.array([[self._interactive_library.get_thermo('lx'),
-                        0,
-                        0],
-                       [self._interactive_library.get_thermo('xy'),
-                        self._interactive_library.get_thermo('ly'),
-                        0],
-                       [self._interactive_library.get_thermo('xz'),
-                        self._interactive_library.get_thermo('yz'),
-                        self._interactive_library.get_thermo('lz')]])
+        lx, ly, lz, xy, xz, yz = self._interactive_get_thermo(['lx', 'ly', 'lz', 'xy', 'xz', 'yz'])
+        cc = np.array([[lx, 0, 0],
+                       [xy, ly, 0],
+                       [xz, yz, lz]])
         return self._interactive_prism.unfold_cell(cc)
 
     def interactive_cells_setter(self, cell):
@@ -123,7 +133,7 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
                 el_dict[el] = id_eam + 1
         elem_all = np.array([el_dict[self._structure_current.species[el]] for el in indices])
         if self.server.run_mode.interactive and self.server.cores == 1:
-            self._interactive_library.scatter_atoms('type', 0, 1, (len(elem_all) * c_int)(*elem_all))
+            self._interactive_library.scatter_atoms('type', 0, 1, _to_c_array(elem_all, c_int))
         else:
             self._interactive_library.scatter_atoms('type', 0, 1, elem_all)
 
@@ -307,8 +317,8 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
         positions = positions.flatten()
         elem_all = np.array([el_dict[el] for el in structure.get_chemical_elements()])
         if self.server.run_mode.interactive and self.server.cores == 1:
-            self._interactive_library.scatter_atoms("x", 1, 3, (len(positions) * c_double)(*positions))
-            self._interactive_library.scatter_atoms('type', 0, 1, (len(elem_all) * c_int)(*elem_all))
+            self._interactive_library.scatter_atoms("x", 1, 3, _to_c_array(positions, c_double))
+            self._interactive_library.scatter_atoms('type', 0, 1, _to_c_array(elem_all, c_int))
         else:
             self._interactive_library.scatter_atoms("x", 1, 3, positions)
             self._interactive_library.scatter_atoms('type', 0, 1, elem_all)
@@ -404,24 +414,22 @@ class LammpsInteractive(LammpsBase, GenericInteractive):
             self._interactive_lib_command('compute st all stress/atom NULL')
             self._interactive_lib_command('run 0')
             self.interactive_cache['stress'] = []
-        ss = np.array([self._interactive_library.extract_compute('st', 1, 2)[i][j + (j != k) * (k + 2)]
-                       for i in range(len(self.structure))
-                       for j in range(3)
-                       for k in range(3)]).reshape(len(self.structure), 3, 3)/1.602e6
+        if isinstance(self._interactive_library, LammpsLibrary):
+            st = self._interactive_library.extract_compute('st', 1, 2, len(self.structure), 6)
+        else:
+            st = np.ctypeslib.as_array(self._interactive_library.extract_compute('st', 1, 2)[0],
+                                       shape=(len(self.structure), 6))
+        # columns of stress/atom: xx, yy, zz, xy, xz, yz
+        ss = st[:, [[0, 3, 4], [3, 1, 5], [4, 5, 2]]] / 1.602e6
         if np.matrix.trace(self._interactive_prism.R) != 3:
             ss = np.dot(np.dot(self._interactive_prism.R, ss), self._interactive_prism.R.T)
         return ss
 
     def interactive_pressures_getter(self):
-        pp = np.array([[self._interactive_library.get_thermo('pxx'),
-                        self._interactive_library.get_thermo('pxy'),
-                        self._interactive_library.get_thermo('pxz')],
-                       [self._interactive_library.get_thermo('pxy'),
-                        self._interactive_library.get_thermo('pyy'),
-                        self._interactive_library.get_thermo('pyz')],
-                       [self._interactive_library.get_thermo('pxz'),
-                        self._interactive_library.get_thermo('pyz'),
-                        self._interactive_library.get_thermo('pzz')]])
+        pxx, pyy, pzz, pxy, pxz, pyz = self._interactive_get_thermo(['pxx', 'pyy', 'pzz', 'pxy', 'pxz', 'pyz'])
+        pp = np.array([[pxx, pxy, pxz],
+                       [pxy, pyy, pyz],
+                       [pxz, pyz, pzz]])
         if np.matrix.trace(self._interactive_prism.R) != 3:
             pp = np.dot(np.dot(self._interactive_prism.R, pp), self._interactive_prism.R.T)
         return pp / 10000  # bar -> GPa
@@ -454,9 +462,7 @@ class LammpsLibrary(object):
             command (str): command to be send to the
             data:
         """
-        # print('send: ', {'c': command, 'd': data})
-        pickle.dump({'c': command, 'd': data}, self._process.stdin)
-        self._process.stdin.flush()
+        write_message(self._process.stdin, {'c': command, 'd': data})
 
     def _receive(self):
         """
@@ -465,9 +471,7 @@ class LammpsLibrary(object):
         Returns:
             data
         """
-        output = pickle.load(self._process.stdout)
-        # print(output)
-        return output
+        return read_message(self._process.stdout)
 
     def command(self, command):
         """
@@ -493,12 +497,14 @@ class LammpsLibrary(object):
 
     def scatter_atoms(self, *args):
         """
-        Scatter atoms for the lammps library
+        Scatter atoms for the lammps library - the per atom data is transferred as raw numpy buffer
 
         Args:
             *args:
         """
-        self._send(command='scatter_atoms', data=list(args))
+        args = list(args)
+        args[3] = np.asarray(args[3])
+        self._send(command='scatter_atoms', data=args)
 
     def get_thermo(self, *args):
         """
@@ -515,17 +521,32 @@ class LammpsLibrary(object):
 
     def extract_compute(self, *args):
         """
-        Extract compute from the lammps library
+        Extract compute from the lammps library - for per atom computes the number of atoms and for per atom arrays also
+        the number of columns have to be appended to the arguments.
 
         Args:
-            *args:
+            *args: compute id, style, type, (number of atoms), (number of columns)
 
         Returns:
-
+            numpy.ndarray: compute
         """
         self._send(command='extract_compute', data=list(args))
         return self._receive()
 
+    def batch(self, call_lst):
+        """
+        Execute multiple calls of the lammps library with a single message and a single reply
+
+        Args:
+            call_lst (list): list of (function name, arguments) tuples - for example
+                             [('command', 'run 1'), ('get_thermo', ['pe']), ('gather_atoms', ['x', 1, 3])]
+
+        Returns:
+            list: results of the calls - None for calls without result
+        """
+        self._send(command='batch', data=[{'c': command, 'd': args} for command, args in call_lst])
+        return self._receive()
+
     def close(self):
         self._send(command='close')
         self._process.kill()
@@ -534,3 +555,18 @@ class LammpsLibrary(object):
     def __del__(self):
         if self._process is not None:
             self.close()
+
+
+def _to_c_array(values, c_type):
+    """
+    Convert a numpy array to a ctypes array sharing the memory of a contiguous copy of the numpy array.
+
+    Args:
+        values (numpy.ndarray/list): values
+        c_type (type): ctypes type - c_double or c_int
+
+    Returns:
+        ctypes.Array: ctypes array
+    """
+    values = np.ascontiguousarray(values, dtype=c_type)
+    return (len(values) * c_type).from_buffer(values)
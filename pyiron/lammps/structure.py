@@ -248,6 +248,26 @@ class LammpsStructure(GenericParameters):
         input_str = ''
         self.load_string(input_str)
 
+    def _lines_to_dict(self, lines):
+        """
+        Internal helper function to convert multiple lines to a dictionary - data files without comments are converted
+        directly, as for value only input files without comments every line is stored as stripped value.
+
+        Args:
+            lines (list): list of lines
+
+        Returns:
+            dict: GenericParameters dictionary
+        """
+        if not self.val_only or self.replace_char_dict is not None or \
+                any(self.comment_char in line for line in lines):
+            return super(LammpsStructure, self)._lines_to_dict(lines)
+        lst = OrderedDict()
+        lst["Parameter"] = [''] * len(lines)
+        lst["Value"] = [line.strip() for line in lines]
+        lst["Comment"] = [''] * len(lines)
+        return lst
+
     # def f2s(self, f):
     #     return str(dec.Decimal(repr(f)).quantize(self.car_prec,
     #                                              dec.ROUND_HALF_EVEN))
@@ -338,23 +358,19 @@ class LammpsStructure(GenericParameters):
 
         # atom_style bond
         # format: atom-ID, molecule-ID, atom_type, x, y, z
-        format_str = '{0:d} {1:d} {2:d} {3:f} {4:f} {5:f} '
-        if self._structure.dimension == 3:
-            for id_atom, (x, y, z) in enumerate(coords):
-                id_mol, id_species = 1, el_dict[elements[id_atom]]  # elList[id_atom]
-                # print id_atom + 1, id_mol, id_species + 1, x, y, z
-                atoms += format_str.format(id_atom + 1, id_mol, id_species + 1, x, y, z) + '\n'
-        elif self._structure.dimension == 2:
-            for id_atom, (x, y) in enumerate(coords):
-                id_mol, id_species = 1, el_dict[elements[id_atom]]  # elList[id_atom]
-                # print id_atom + 1, id_mol, id_species + 1, x, y, z
-                atoms += format_str.format(id_atom + 1, id_mol, id_species + 1, x, y, 0.) + '\n'
-        else:
+        if self._structure.dimension not in [2, 3]:
             raise ValueError("dimension 1 not yet implemented")
+        type_lst = self._get_type_lst(el_dict={el.Abbreviation: el_dict[el.Abbreviation] + 1
+                                               for el in self._structure.species})
+        atoms += _format_rows('%d %d %d %f %f %f',
+                              np.arange(1, len(coords) + 1), np.ones(len(coords)), type_lst,
+                              self._pad_coordinates(coords))
 
         bonds_str = 'Bonds \n\n'
-        for i_bond, (i_a, i_b, b_type) in enumerate(bonds):
-            bonds_str += '{0:d} {1:d} {2:d} {3:d}'.format(i_bond + 1, b_type, i_a, i_b) + '\n'
+        if len(bonds) > 0:
+            bonds = np.array(bonds)
+            bonds_str += _format_rows('%d %d %d %d', np.arange(1, len(bonds) + 1), bonds[:, 2], bonds[:, 0],
+                                      bonds[:, 1])
 
         return atomtypes + '\n' + cell_dimesions + '\n' + masses + '\n' + atoms + '\n' + bonds_str + '\n'
 
@@ -436,27 +452,22 @@ class LammpsStructure(GenericParameters):
         atoms = 'Atoms \n\n'
 
         # format: atom-ID, molecule-ID, atom_type, q, x, y, z
-        format_str = '{0:d} {1:d} {2:d} {3:f} {4:f} {5:f} {6:f}'
-        for atom in molecule_lst:
-            id_atom, id_mol, id_species = atom
-            # print id_atom, id_mol, id_species
-            x, y, z = coords[id_atom]
-            el_id = self._structure.species[id_species].Abbreviation
-            atoms += format_str.format(id_atom + 1, id_mol, id_species + 1, q_dict[el_id], x, y, z) + '\n'
+        id_atom, id_mol, id_species = molecule_lst.T
+        q_lst = np.array([q_dict[el.Abbreviation] for el in self._structure.species])
+        atoms += _format_rows('%d %d %d %f %f %f %f', id_atom + 1, id_mol, id_species + 1, q_lst[id_species],
+                              coords[id_atom])
 
         if len(bonds_lst) > 0:
             bonds_str = 'Bonds \n\n'
-            for i_bond, id_vec in enumerate(bonds_lst):
-                bonds_str += '{0:d} {1:d} {2:d} {3:d}'.format(i_bond + 1, 1, id_vec[0], id_vec[1]) + '\n'
+            bonds_str += _format_rows('%d %d %d %d', np.arange(1, len(bonds_lst) + 1), np.ones(len(bonds_lst)),
+                                      np.array(bonds_lst))
         else:
             bonds_str = "\n"
 
         if len(angles_lst) > 0:
             angles_str = 'Angles \n\n'
-            for i_angle, id_vec in enumerate(angles_lst):
-                # print "id: ", i_angle, id_vec
-                angles_str += '{0:d} {1:d} {2:d} {3:d} {4:d}'.format(i_angle + 1, 1, id_vec[0], id_vec[1], id_vec[2]) \
-                              + '\n'
+            angles_str += _format_rows('%d %d %d %d %d', np.arange(1, len(angles_lst) + 1), np.ones(len(angles_lst)),
+                                       np.array(angles_lst))
         else:
             angles_str = "\n"
         return atomtypes + '\n' + cell_dimensions + '\n' + masses + '\n' + atoms + '\n' \
@@ -488,17 +499,12 @@ class LammpsStructure(GenericParameters):
         coords = self.rotate_positions(self._structure)
 
         el_charge_lst = self._structure.charge
-        el_lst = self._structure.get_chemical_symbols()
         el_alphabet_dict = {}
         for ind,el in enumerate(self._structure.get_species_symbols()):
             el_alphabet_dict[el] = ind+1
-        for id_atom, (el, coord) in enumerate(zip(el_lst, coords)):
-            id_el = el_alphabet_dict[el]
-            dim = self._structure.dimension
-            c = np.zeros(3)
-            c[:dim] = coord
-            atoms += '{0:d} {1:d} {2:f} {3:.15f} {4:.15f} {5:.15f}'.format(
-                id_atom + 1, id_el, el_charge_lst[id_atom], c[0], c[1], c[2]) + '\n'
+        atoms += _format_rows('%d %d %f %.15f %.15f %.15f', np.arange(1, len(coords) + 1),
+                              self._get_type_lst(el_dict=el_alphabet_dict), el_charge_lst,
+                              self._pad_coordinates(coords))
         return atomtypes + '\n' + cell_dimesions + '\n' + masses + '\n' + atoms + '\n'
 
  
@@ -527,7 +533,7 @@ class LammpsStructure(GenericParameters):
             if el_eam in el_struct_lst:
                 id_el = list(el_struct_lst).index(el_eam)
                 el = el_obj_lst[id_el]
-                el_dict[el] = id_eam + 1
+                el_dict[el.Abbreviation] = id_eam + 1
                 masses += '{0:3d} {1:f}'.format(id_eam + 1, el.AtomicMass) + '\n'
             else:
                 # element in EAM file but not used in structure, use dummy for atomic mass
@@ -537,13 +543,8 @@ class LammpsStructure(GenericParameters):
 
         coords = self.rotate_positions(self._structure)
 
-        el_lst = self._structure.get_chemical_elements()
-        for id_atom, (el, coord) in enumerate(zip(el_lst, coords)):
-            id_el = el_dict[el]
-            dim = self._structure.dimension
-            c = np.zeros(3)
-            c[:dim] = coord
-            atoms += '{0:d} {1:d} {2:.15f} {3:.15f} {4:.15f}'.format(id_atom + 1, id_el, c[0], c[1], c[2]) + '\n'
+        atoms += _format_rows('%d %d %.15f %.15f %.15f', np.arange(1, len(coords) + 1),
+                              self._get_type_lst(el_dict=el_dict), self._pad_coordinates(coords))
         return atomtypes + '\n' + cell_dimesions + '\n' + masses + '\n' + atoms + '\n'
 
     def rotate_positions(self, structure):
@@ -554,11 +555,54 @@ class LammpsStructure(GenericParameters):
             structure: Atoms-like object. Should has .positions attribute
 
         Returns:
-            (list): List of rotated coordinates
+            numpy.ndarray: rotated coordinates
         """
         prism = UnfoldingPrism(self._structure.cell)
-        coords = [prism.pos_to_lammps(position) for position in structure.positions]
-        return coords
+        return np.dot(structure.positions, prism.R)
+
+    def _get_type_lst(self, el_dict):
+        """
+        Map the species of all atoms to the LAMMPS atom types
+
+        Args:
+            el_dict (dict): dictionary of chemical symbols and atom types
+
+        Returns:
+            numpy.ndarray: atom type of every atom
+        """
+        species_types = np.array([el_dict[el.Abbreviation] for el in self._structure.species], dtype=int)
+        return species_types[np.array(self._structure.indices, dtype=int)]
+
+    def _pad_coordinates(self, coords):
+        """
+        Set the coordinates beyond the dimension of the structure to zero
+
+        Args:
+            coords (numpy.ndarray): rotated coordinates
+
+        Returns:
+            numpy.ndarray: Nx3 array of coordinates
+        """
+        dim = self._structure.dimension
+        padded = np.zeros((len(coords), 3))
+        padded[:, :dim] = np.reshape(coords, (len(coords), -1))[:, :dim]
+        return padded
+
+
+def _format_rows(fmt, *columns):
+    """
+    Format per atom data as lines of a LAMMPS data file - all lines are formatted with a single string operation, which
+    gives the same result as numpy.savetxt() in half the time.
+
+    Args:
+        fmt (str): format of a single line - for example '%d %d %f %f %f'
+        *columns (numpy.ndarray): one or two dimensional arrays with one row per line
+
+    Returns:
+        str: formatted lines
+    """
+    data = np.column_stack(columns)
+    return ((fmt + '\n') * len(data)) % tuple(data.ravel().tolist())
 
 
 def write_lammps_datafile(structure, file_name='lammps.data', cwd=None):
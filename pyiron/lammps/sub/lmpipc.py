@@ -0,0 +1,118 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import numpy as np
+import pickle
+
+"""
+Message format shared by the LammpsLibrary and the lmpmpi.py MPI worker. Every message consists of a pickled header
+followed by the raw data of all numpy arrays contained in the message, so bulk per atom data is not pickled.
+This module is imported by the worker outside of the pyiron package, so it must only depend on numpy.
+"""
+
+__author__ = "Jan Janssen"
+__copyright__ = "Copyright 2019, Max-Planck-Institut für Eisenforschung GmbH - " \
+                "Computational Materials Design (CM) Department"
+__version__ = "1.0"
+__maintainer__ = "Jan Janssen"
+__email__ = "janssen@mpie.de"
+__status__ = "production"
+__date__ = "Sep 1, 2018"
+
+_array_tag = "__ndarray__"
+
+
+def write_message(stream, message):
+    """
+    Write a message to a binary stream - numpy arrays are transferred as raw buffers after the pickled header.
+
+    Args:
+        stream (io.BufferedWriter): binary output stream
+        message (dict/list/tuple/object): message, numpy arrays can be nested in dictionaries, lists and tuples
+    """
+    array_lst = []
+    header = _replace_arrays(message, array_lst)
+    pickle.dump((header, [(a.dtype.str, a.shape) for a in array_lst]), stream, protocol=2)
+    for array in array_lst:
+        if array.size > 0:
+            stream.write(memoryview(array).cast('B'))
+    stream.flush()
+
+
+def read_message(stream):
+    """
+    Read a message written by write_message() from a binary stream.
+
+    Args:
+        stream (io.BufferedReader): binary input stream
+
+    Returns:
+        dict/list/tuple/object: message - numpy arrays are writeable
+    """
+    header, array_info = pickle.load(stream)
+    array_lst = []
+    for dtype, shape in array_info:
+        array = np.empty(shape, dtype=np.dtype(dtype))
+        _read_into(stream, memoryview(array).cast('B'))
+        array_lst.append(array)
+    return _restore_arrays(header, array_lst)
+
+
+def _read_into(stream, buffer):
+    """
+    Fill a buffer from a binary stream.
+
+    Args:
+        stream (io.BufferedReader): binary input stream
+        buffer (memoryview): byte buffer to fill
+    """
+    position = 0
+    while position < len(buffer):
+        n_bytes = stream.readinto(buffer[position:])
+        if not n_bytes:
+            raise EOFError("stream ended before the array data was received")
+        position += n_bytes
+
+
+def _replace_arrays(message, array_lst):
+    """
+    Replace all numpy arrays in the message by references to the list of arrays.
+
+    Args:
+        message (dict/list/tuple/object): message
+        array_lst (list): list the arrays are appended to
+
+    Returns:
+        dict/list/tuple/object: message without numpy arrays
+    """
+    if isinstance(message, np.ndarray) and message.dtype != object:
+        if not message.flags.c_contiguous:
+            message = message.copy()
+        array_lst.append(message)
+        return {_array_tag: len(array_lst) - 1}
+    elif isinstance(message, dict):
+        return {k: _replace_arrays(v, array_lst) for k, v in message.items()}
+    elif isinstance(message, (list, tuple)):
+        return type(message)(_replace_arrays(v, array_lst) for v in message)
+    return message
+
+
+def _restore_arrays(message, array_lst):
+    """
+    Replace the array references created by _replace_arrays() by the received arrays.
+
+    Args:
+        message (dict/list/tuple/object): message without numpy arrays
+        array_lst (list): list of received arrays
+
+    Returns:
+        dict/list/tuple/object: message
+    """
+    if isinstance(message, dict):
+        if len(message) == 1 and _array_tag in message:
+            return array_lst[message[_array_tag]]
+        return {k: _restore_arrays(v, array_lst) for k, v in message.items()}
+    elif isinstance(message, (list, tuple)):
+        return type(message)(_restore_arrays(v, array_lst) for v in message)
+    return message
@@ -1,8 +1,8 @@
 from ctypes import c_double, c_int
 from mpi4py import MPI
 import numpy as np
-import pickle
 import sys
+from lmpipc import read_message, write_message
 
 try:
     from lammps import lammps
@@ -15,8 +15,23 @@ job = lammps(cmdargs=['-screen', 'none'])
 
 
 def extract_compute(funct_args):
+    """
+    Extract a compute - for per atom vectors and arrays the number of atoms and for arrays the number of columns can be
+    appended to the arguments to transfer the data as numpy array.
+
+    Args:
+        funct_args (list): [compute id, style, type, (number of atoms), (number of columns)]
+
+    Returns:
+        numpy.ndarray: compute
+    """
     if MPI.COMM_WORLD.rank == 0:
-        return np.array(job.extract_compute(*funct_args))
+        compute = job.extract_compute(*funct_args[:3])
+        if len(funct_args) == 4:
+            return np.ctypeslib.as_array(compute, shape=(funct_args[3],)).copy()
+        elif len(funct_args) == 5:
+            return np.ctypeslib.as_array(compute[0], shape=(funct_args[3], funct_args[4])).copy()
+        return np.array(compute)
 
 
 def get_thermo(funct_args):
@@ -26,10 +41,12 @@ def get_thermo(funct_args):
 
 def scatter_atoms(funct_args):
     py_vector = funct_args[3]
-    if issubclass(type(py_vector[0]), np.integer):
-        c_vector = (len(py_vector) * c_int)(*py_vector)
+    if np.issubdtype(np.asarray(py_vector).dtype, np.integer):
+        py_vector = np.ascontiguousarray(py_vector, dtype=np.intc)
+        c_vector = (len(py_vector) * c_int).from_buffer(py_vector)
     else:
-        c_vector = (len(py_vector) * c_double)(*py_vector)
+        py_vector = np.ascontiguousarray(py_vector, dtype=np.double)
+        c_vector = (len(py_vector) * c_double).from_buffer(py_vector)
     job.scatter_atoms(funct_args[0], funct_args[1], funct_args[2], c_vector)
 
 
@@ -38,7 +55,22 @@ def command(funct_args):
 
 
 def gather_atoms(funct_args):
-    return np.array(job.gather_atoms(*funct_args))
+    return np.ctypeslib.as_array(job.gather_atoms(*funct_args))
+
+
+def batch(funct_args):
+    """
+    Execute a list of calls and return all their results in a single reply
+
+    Args:
+        funct_args (list): list of {'c': command, 'd': arguments} dictionaries
+
+    Returns:
+        list: results of the calls - None for calls without result
+    """
+    output = [select_cmd(call['c'])(call['d']) for call in funct_args]
+    if MPI.COMM_WORLD.rank == 0:
+        return output
 
 
 def select_cmd(argument):
@@ -46,21 +78,19 @@ def select_cmd(argument):
     Select a lammps command
 
     Args:
-        argument (str): [close, extract_compute, get_thermo, scatter_atoms, command, gather_atoms]
+        argument (str): [close, extract_compute, get_thermo, scatter_atoms, command, gather_atoms, batch]
 
     Returns:
         function: the selected function
     """
-    switcher = {f.__name__: f for f in [extract_compute, get_thermo, scatter_atoms, command, gather_atoms]}
+    switcher = {f.__name__: f for f in [extract_compute, get_thermo, scatter_atoms, command, gather_atoms, batch]}
     return switcher.get(argument)
 
 
 if __name__ == '__main__':
     while True:
         if MPI.COMM_WORLD.rank == 0:
-            input_dict = pickle.load(sys.stdin.buffer)
-            # with open('process.txt', 'a') as file:
-            #     print('Input:', input_dict, file=file)
+            input_dict = read_message(sys.stdin.buffer)
         else:
             input_dict = None
         input_dict = MPI.COMM_WORLD.bcast(input_dict, root=0)
@@ -69,7 +99,4 @@ if __name__ == '__main__':
             break
         output = select_cmd(input_dict['c'])(input_dict['d'])
         if MPI.COMM_WORLD.rank == 0 and output is not None:
-            # with open('process.txt', 'a') as file:
-            #     print('Output:', output, file=file)
-            pickle.dump(output, sys.stdout.buffer)
-            sys.stdout.flush()
+            write_message(sys.stdout.buffer, output)
@@ -6,8 +6,10 @@ import codecs
 from collections import OrderedDict
 from datetime import datetime
 import dill as pickle
+import hashlib
 import inspect
 import json
+import multiprocessing
 import numpy as np
 import os
 import pandas
@@ -17,6 +19,7 @@ import types
 
 from pyiron.base.job.generic import GenericJob
 from pyiron.base.generic.hdfio import FileHDFio
+from pyiron.base.job.path import JobPath
 from pyiron.base.master.generic import get_function_from_string
 from pyiron.table.funct import get_incar, get_sigma, get_total_number_of_atoms, get_elements, \
     get_convergence_check, get_number_of_species, get_number_of_ionic_steps, get_ismear, get_encut, get_n_kpts, \
@@ -49,9 +52,15 @@ class FunctionContainer(object):
 
     @property
     def _function_lst(self):
-        return [funct for funct in self._system_function_lst
-                if funct.__name__ in self._system_function_dict.keys() and self._system_function_dict[funct.__name__]] \
-               + list(self._user_function_dict.values())
+        return list(self._function_dict.values())
+
+    @property
+    def _function_dict(self):
+        function_dict = OrderedDict([(funct.__name__, funct) for funct in self._system_function_lst
+                                     if funct.__name__ in self._system_function_dict.keys() and
+                                     self._system_function_dict[funct.__name__]])
+        function_dict.update(self._user_function_dict)
+        return function_dict
 
     def _to_hdf(self, hdf):
         self._to_pickle(hdf=hdf, key='user_function_dict', value=self._user_function_dict)
@@ -116,6 +125,10 @@ class PyironTable(object):
         self._filter = JobFilters()
         self.add = FunctionContainer()
         self._csv_file = None
+        self._result_cache = {}
+        self._result_hash_dict = {}
+        self._filter_cache = {}
+        self._filter_cache_str = None
         if self._is_file():
             self.load()
 
@@ -170,6 +183,7 @@ class PyironTable(object):
     def save(self, name=None):
         self._name = name
         self.to_hdf()
+        self._cache_to_hdf(FileHDFio(file_name=self._project.path + self.name + '.h5', h5_path='/'))
         self._save_csv()
 
     def load(self, name=None):
@@ -177,52 +191,71 @@ class PyironTable(object):
         self.from_hdf()
         self._load_csv()
 
-    def create_table(self, enforce_update=False, level=3, file=None):
-        skip_table_update = False
-        filter_funct = self.filter_function
-        if self._is_file():
-            if file is None:
-                file = FileHDFio(file_name=self._project.path + self.name + '.h5', h5_path='/')
-            temp_user_function_dict, temp_system_function_dict = self._get_data_from_hdf5(hdf=file)
-            job_stored_ids = self._get_job_ids()
-            job_update_lst = [self._project.inspect(job_id) for job_id in self._project.get_job_ids()
-                              if job_id not in job_stored_ids]
-            job_update_lst = [job for job in job_update_lst if job.status in ['finished'] and filter_funct(job)]
-            keys_update_user_lst = [key for key in self.add._user_function_dict.keys()
-                                    if key not in temp_user_function_dict.keys()]
-            keys_update_system_lst = [k for k, v in self.add._system_function_dict.items()
-                                      if v and not temp_system_function_dict[k]]
-            if len(job_update_lst) == 0 and len(keys_update_user_lst) == 0 and keys_update_system_lst == 0 and \
-                    not enforce_update:
-                skip_table_update = True
-        else:
-            job_update_lst = [self._project.inspect(job_id) for job_id in self._project.get_job_ids()]
-            job_update_lst = [job for job in job_update_lst if job.status in ['finished'] and filter_funct(job)]
-            keys_update_user_lst, keys_update_system_lst = [], []
-        if not skip_table_update and len(job_update_lst) != 0:
-            df_new_ids = self._iterate_over_job_lst(job_lst=job_update_lst,
-                                                    function_lst=self.add._function_lst,
-                                                    level=level)
-        else:
-            df_new_ids = pandas.DataFrame({})
-        if not skip_table_update and (len(keys_update_user_lst) != 0 or len(keys_update_system_lst) != 0):
-            job_update_lst = [self._project.inspect(job_id) for job_id in self._get_job_ids()]
-            job_update_lst = [job for job in job_update_lst
-                              if job is not None and job.status in ['finished'] and filter_funct(job)]
-            function_lst = [v for k, v in self.add._user_function_dict.items() if k in keys_update_system_lst] + \
-                           [funct for funct in self.add._system_function_lst
-                            if funct.__name__ in keys_update_system_lst]
-            df_new_keys = self._iterate_over_job_lst(job_lst=job_update_lst,
-                                                     function_lst=function_lst,
-                                                     level=level)
-        else:
-            df_new_keys = pandas.DataFrame({})
-        if len(self._df) > 0 and len(df_new_keys) > 0:
-            self._df = pandas.concat([self._df, df_new_keys], axis=1, sort=False).reset_index(drop=True)
-        if len(self._df) > 0 and len(df_new_ids) > 0:
-            self._df = pandas.concat([self._df, df_new_ids], sort=False).reset_index(drop=True)
-        elif len(df_new_ids) > 0:
-            self._df = df_new_ids
+    def create_table(self, enforce_update=False, level=3, file=None, workers=1, chunk_size=None):
+        """
+        Create or update the table for all finished jobs of the project. The results of every function for every job
+        are cached, so only new jobs and new functions are evaluated. The cache is stored next to the table - in the
+        HDF5 file of the table or in the HDF5 group file.
+
+        Args:
+            enforce_update (bool): ignore the cached results and evaluate all functions for all jobs
+            level (int): number of project levels which are added as columns col_0, col_1, ...
+            file (FileHDFio/None): HDF5 group to store the result cache - by default the HDF5 file of the table
+            workers (int): number of processes to evaluate the functions in parallel
+            chunk_size (int/None): number of jobs which are send to a process at once - by default every process
+                                   receives four chunks
+        """
+        if file is None and self._is_file():
+            file = FileHDFio(file_name=self._project.path + self.name + '.h5', h5_path='/')
+        if enforce_update:
+            self._result_cache, self._result_hash_dict, self._filter_cache = {}, {}, {}
+        elif file is not None:
+            self._cache_from_hdf(hdf=file)
+        function_dict = self.add._function_dict
+        for key, funct in function_dict.items():
+            function_hash = _get_function_hash(funct)
+            if self._result_hash_dict.get(key) != function_hash:
+                self._result_cache[key], self._result_hash_dict[key] = {}, function_hash
+        filter_str = self._get_filter_str()
+        if filter_str != self._filter_cache_str:
+            self._filter_cache, self._filter_cache_str = {}, filter_str
+        job_entry_lst = self._get_job_entries()
+        task_lst = []
+        for db_entry in job_entry_lst:
+            job_id = db_entry['id']
+            if self._filter_cache.get(job_id, True):
+                key_lst = [key for key in function_dict.keys() if job_id not in self._result_cache.get(key, {})]
+                if job_id not in self._filter_cache or len(key_lst) > 0:
+                    task_lst.append((db_entry, key_lst, job_id not in self._filter_cache))
+        if len(task_lst) > 0:
+            evaluator = _JobEvaluator(function_dict=function_dict,
+                                      filter_function=self.filter_function,
+                                      convert_to_object=self.convert_to_object)
+            for job_id, filter_result, result_dict in self._evaluate_jobs(evaluator=evaluator,
+                                                                          task_lst=task_lst,
+                                                                          workers=workers,
+                                                                          chunk_size=chunk_size):
+                if filter_result is not None:
+                    self._filter_cache[job_id] = filter_result
+                for key, result in result_dict.items():
+                    self._result_cache.setdefault(key, {})[job_id] = result
+            if file is not None:
+                self._cache_to_hdf(hdf=file, key_lst=set([key for _, key_lst, _ in task_lst for key in key_lst]))
+        pr_len = len(self._project.project_path.split('/'))
+        diff_dict_lst = []
+        for db_entry in job_entry_lst:
+            job_id = db_entry['id']
+            if not self._filter_cache[job_id]:
+                continue
+            diff_dict = {}
+            for key in function_dict.keys():
+                diff_dict.update(self._result_cache[key][job_id])
+            pr_lst = self._get_project_list(db_entry['project'], pr_len, level)
+            for ic, col in enumerate(pr_lst):
+                diff_dict['col_{}'.format(ic)] = col
+            diff_dict_lst.append(diff_dict)
+        self.refill_dict(diff_dict_lst)
+        self._df = pandas.DataFrame(diff_dict_lst)
 
     def convert_dict(self, input_dict):
         return {key: self.str_to_value(value) for key, value in input_dict.items()}
@@ -332,40 +365,101 @@ class PyironTable(object):
                 lst[i] = p
         return lst
 
-    def _get_data_from_hdf5(self, hdf):
-        temp_user_function_dict = self.add._from_pickle(hdf=hdf, key='user_function_dict')
-        temp_system_function_dict = self.add._from_pickle(hdf=hdf, key='system_function_dict')
-        return temp_user_function_dict, temp_system_function_dict
-
     def _get_job_ids(self):
         if len(self._df) > 0:
             return self._df.job_id.values
         else:
             return np.array([])
 
-    def _apply_list_of_functions_on_job(self, job, fucntion_lst):
-        diff_dict = {}
-        for funct in fucntion_lst:
-            funct_dict = self._apply_function_on_job(funct, job)
-            for key, value in funct_dict.items():
-                diff_dict[key] = value
-        return diff_dict
+    def _get_job_entries(self):
+        """
+        Get the database entries of all finished jobs of the project with a single database query.
 
-    def _iterate_over_job_lst(self, job_lst, function_lst, level):
-        pr_len = len(self._project.project_path.split('/'))
-        diff_dict_lst = []
-        for job_inspect in tqdm(job_lst):
-            if self.convert_to_object:
-                job = job_inspect.load_object()
-            else:
-                job = job_inspect
-            diff_dict = self._apply_list_of_functions_on_job(job=job, fucntion_lst=function_lst)
-            pr_lst = self._get_project_list(job.project.project_path, pr_len, level)
-            for ic, col in enumerate(pr_lst):
-                diff_dict['col_{}'.format(ic)] = col
-            diff_dict_lst.append(diff_dict)
-        self.refill_dict(diff_dict_lst)
-        return pandas.DataFrame(diff_dict_lst)
+        Returns:
+            list: list of database entries (dict)
+        """
+        job_dict = self._project.get_jobs(recursive=True, columns=['id', 'status', 'hamilton', 'hamversion', 'job',
+                                                                   'subjob', 'projectpath', 'project'])
+        entry_lst = [dict(zip(job_dict.keys(), values)) for values in zip(*job_dict.values())]
+        return [entry for entry in entry_lst if entry['status'] == 'finished']
+
+    def _get_filter_str(self):
+        """
+        Get the hash of the filter function, which is used to identify the cached filter results.
+
+        Returns:
+            str: hash of the filter function
+        """
+        if self._filter_function is None:
+            return ''
+        return _get_function_hash(self._filter_function)
+
+    @staticmethod
+    def _evaluate_jobs(evaluator, task_lst, workers=1, chunk_size=None):
+        """
+        Evaluate the filter and the functions for a list of jobs, either in the current process or in a pool of worker
+        processes.
+
+        Args:
+            evaluator (_JobEvaluator): evaluator for a single job
+            task_lst (list): list of tasks (database entry, function keys, apply filter)
+            workers (int): number of worker processes
+            chunk_size (int/None): number of tasks which are send to a worker process at once
+
+        Returns:
+            list: list of results (job ID, filter result, result dictionary)
+        """
+        if workers is None or workers <= 1 or len(task_lst) == 1:
+            return [evaluator(task) for task in tqdm(task_lst)]
+        if chunk_size is None:
+            chunk_size = max(1, len(task_lst) // (4 * workers))
+        pool = multiprocessing.Pool(processes=workers, initializer=_init_job_evaluator,
+                                    initargs=(pickle.dumps(evaluator),))
+        try:
+            return list(tqdm(pool.imap(_evaluate_job, task_lst, chunksize=chunk_size), total=len(task_lst)))
+        finally:
+            pool.close()
+            pool.join()
+
+    def _cache_to_hdf(self, hdf, key_lst=None):
+        """
+        Store the result cache in an HDF5 group.
+
+        Args:
+            hdf (FileHDFio): HDF5 group
+            key_lst (list/None): keys of the functions to store - by default all functions are stored
+        """
+        if key_lst is None:
+            key_lst = self._result_cache.keys()
+        with hdf.open('cache') as hdf_cache:
+            with hdf_cache.open('functions') as hdf_functions:
+                for key in key_lst:
+                    self.add._to_pickle(hdf=hdf_functions, key=key, value=self._result_cache[key])
+            hdf_cache['function_hash'] = self._result_hash_dict
+            hdf_cache['filter_str'] = self._filter_cache_str
+            self.add._to_pickle(hdf=hdf_cache, key='filter', value=self._filter_cache)
+
+    def _cache_from_hdf(self, hdf):
+        """
+        Load the result cache from an HDF5 group.
+
+        Args:
+            hdf (FileHDFio): HDF5 group
+        """
+        if 'cache' not in hdf.list_groups():
+            return
+        with hdf.open('cache') as hdf_cache:
+            hash_dict = {}
+            if 'function_hash' in hdf_cache.list_nodes():
+                hash_dict = hdf_cache['function_hash']
+            with hdf_cache.open('functions') as hdf_functions:
+                for key in hdf_functions.list_nodes():
+                    if key not in self._result_cache.keys():
+                        self._result_cache[key] = self.add._from_pickle(hdf=hdf_functions, key=key)
+                        self._result_hash_dict[key] = hash_dict.get(key)
+            if self._filter_cache_str is None:
+                self._filter_cache_str = hdf_cache['filter_str']
+                self._filter_cache = self.add._from_pickle(hdf=hdf_cache, key='filter')
 
     def _repr_html_(self):
         """
@@ -377,6 +471,139 @@ class PyironTable(object):
         return self._df._repr_html_()
 
 
+class _JobEvaluator(object):
+    """
+    Load a job from its database entry and evaluate the filter function and the table functions for it. The evaluator
+    is pickled with dill to be sent to the worker processes.
+
+    Args:
+        function_dict (dict): table functions
+        filter_function (function): filter function
+        convert_to_object (bool): apply the functions on the GenericJob object rather than the JobCore object
+    """
+    def __init__(self, function_dict, filter_function, convert_to_object):
+        self.function_dict = function_dict
+        self.filter_function = filter_function
+        self.convert_to_object = convert_to_object
+
+    def __call__(self, task):
+        db_entry, key_lst, apply_filter = task
+        job_inspect = JobPath(db=None, db_entry=db_entry)
+        filter_result = None
+        if apply_filter:
+            filter_result = bool(self.filter_function(job_inspect))
+            if not filter_result:
+                return db_entry['id'], filter_result, {}
+        if self.convert_to_object:
+            job = job_inspect.load_object()
+        else:
+            job = job_inspect
+        result_dict = {key: PyironTable._apply_function_on_job(self.function_dict[key], job) for key in key_lst}
+        return db_entry['id'], filter_result, result_dict
+
+
+def _get_function_hash(funct):
+    """
+    Get a hash of a function, which changes when the function is modified. It includes the byte code, the constants and
+    the names of the function, the immutable content of its closure - like the user function wrapped by
+    FunctionContainer.__setitem__() - and the functions it calls from its global namespace. The hash does not depend on
+    the location of the source code, so it is the same for a function restored with dill or from its source code.
+
+    Args:
+        funct (function): function
+
+    Returns:
+        str: hex digest
+    """
+    function_hash = hashlib.sha1()
+    _update_function_hash(function_hash=function_hash, funct=funct, visited=set())
+    return function_hash.hexdigest()
+
+
+def _update_function_hash(function_hash, funct, visited):
+    """
+    Add a function to a hash, see _get_function_hash().
+
+    Args:
+        function_hash (hashlib.sha1): hash
+        funct (function): function
+        visited (set): ids of the functions which were already added
+    """
+    if id(funct) in visited:
+        return
+    visited.add(id(funct))
+    name_lst = _update_code_hash(function_hash=function_hash, code=funct.__code__)
+    function_hash.update(repr(funct.__defaults__).encode())
+    for cell in funct.__closure__ or ():
+        try:
+            content = cell.cell_contents
+        except ValueError:
+            continue
+        if isinstance(content, types.FunctionType):
+            _update_function_hash(function_hash=function_hash, funct=content, visited=visited)
+        elif isinstance(content, (str, bytes, bool, int, float, complex, tuple, type(None))):
+            function_hash.update(repr(content).encode())
+        else:
+            # mutable objects like lists collecting results change between calls, so only their type is used
+            function_hash.update(type(content).__name__.encode())
+    for name in name_lst:
+        item = funct.__globals__.get(name)
+        if isinstance(item, types.FunctionType):
+            _update_function_hash(function_hash=function_hash, funct=item, visited=visited)
+
+
+def _update_code_hash(function_hash, code):
+    """
+    Add a code object and the code objects nested in it to a hash, see _get_function_hash().
+
+    Args:
+        function_hash (hashlib.sha1): hash
+        code (types.CodeType): code object
+
+    Returns:
+        list: names used by the code objects
+    """
+    function_hash.update(code.co_code)
+    function_hash.update(repr(code.co_names).encode())
+    name_lst = list(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            name_lst += _update_code_hash(function_hash=function_hash, code=const)
+        elif isinstance(const, frozenset):
+            # the order of a frozenset depends on the hash seed of the process
+            function_hash.update(repr(sorted(const, key=repr)).encode())
+        else:
+            function_hash.update(repr(const).encode())
+    return name_lst
+
+
+_job_evaluator = None
+
+
+def _init_job_evaluator(evaluator_dump):
+    """
+    Initialize the job evaluator of a worker process.
+
+    Args:
+        evaluator_dump (bytes): job evaluator pickled with dill
+    """
+    global _job_evaluator
+    _job_evaluator = pickle.loads(evaluator_dump)
+
+
+def _evaluate_job(task):
+    """
+    Evaluate a single job in a worker process.
+
+    Args:
+        task (tuple): database entry, function keys, apply filter
+
+    Returns:
+        tuple: job ID, filter result, result dictionary
+    """
+    return _job_evaluator(task)
+
+
 class TableJob(GenericJob):
     def __init__(self, project, job_name):
         super(TableJob, self).__init__(project, job_name)
@@ -386,6 +613,7 @@ class TableJob(GenericJob):
         self._pyiron_table = PyironTable(project=None)
         self._enforce_update = False
         self._project_level = 0
+        self._workers = 1
         self.analysis_project = project.project
 
     @property
@@ -457,11 +685,29 @@ class TableJob(GenericJob):
         else:
             raise TypeError()
 
+    @property
+    def workers(self):
+        """
+        Get the number of worker processes which evaluate the table functions - by default the functions are evaluated
+        in the process of the TableJob.
+
+        Returns:
+            int: number of worker processes
+        """
+        return self._workers
+
+    @workers.setter
+    def workers(self, workers):
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError('The number of worker processes has to be a positive integer.')
+        self._workers = workers
+
     def to_hdf(self, hdf=None, group_name=None):
         super(TableJob, self).to_hdf(hdf=hdf, group_name=group_name)
         with self.project_hdf5.open("input") as hdf5_input:
             hdf5_input['bool_dict'] = {'enforce_update': self._enforce_update,
                                        'convert_to_object': self._pyiron_table.convert_to_object}
+            hdf5_input['workers'] = self._workers
             self._pyiron_table.add._to_hdf(hdf5_input)
             if self._analysis_project is not None:
                 hdf5_input['project'] = {'path': self._analysis_project.path,
@@ -492,6 +738,8 @@ class TableJob(GenericJob):
             if 'filter' in hdf5_input.list_nodes():
                 self._filter_function_str = hdf5_input['filter']
                 self.pyiron_table.filter_function = get_function_from_string(hdf5_input['filter'])
+            if 'workers' in hdf5_input.list_nodes():
+                self._workers = hdf5_input['workers']
             bool_dict = hdf5_input['bool_dict']
             self._enforce_update = bool_dict['enforce_update']
             self._pyiron_table.convert_to_object = bool_dict['convert_to_object']
@@ -524,7 +772,8 @@ class TableJob(GenericJob):
         with self.project_hdf5.open("input") as hdf5_input:
             self._pyiron_table.create_table(enforce_update=self._enforce_update,
                                             file=hdf5_input,
-                                            level=self._project_level)
+                                            level=self._project_level,
+                                            workers=self._workers)
         self.to_hdf()
         self._pyiron_table._df.to_csv(os.path.join(self.working_directory, 'pyirontable.csv'), index=False)
         with self.project_hdf5.open("output") as hdf5_output:
@@ -35,62 +35,18 @@ class Outcar(object):
 
     def from_file(self, filename="OUTCAR"):
         """
-        Parse and store relevant quantities from the OUTCAR file into parse_dict.
+        Parse and store relevant quantities from the OUTCAR file into parse_dict. The file is read line by line in a
+        single pass, the individual get_*() functions below are equivalent but each of them scans the whole file.
 
         Args:
             filename (str): Filename of the OUTCAR file to parse
 
         """
-        with open(filename, 'r') as f:
-            lines = f.readlines()
-        energies = self.get_total_energies(filename=filename, lines=lines)
-        energies_int = self.get_energy_without_entropy(filename=filename, lines=lines)
-        energies_zero = self.get_energy_sigma_0(filename=filename, lines=lines)
-        scf_energies = self.get_all_total_energies(filename=filename, lines=lines)
-        n_atoms = self.get_number_of_atoms(filename=filename, lines=lines)
-        forces = self.get_forces(filename=filename, lines=lines, n_atoms=n_atoms)
-        positions = self.get_positions(filename=filename, lines=lines, n_atoms=n_atoms)
-        cells = self.get_cells(filename=filename, lines=lines)
-        steps = self.get_steps(filename=filename, lines=lines)
-        temperatures = self.get_temperatures(filename=filename, lines=lines)
-        time = self.get_time(filename=filename, lines=lines)
-        fermi_level = self.get_fermi_level(filename=filename, lines=lines)
-        scf_moments = self.get_dipole_moments(filename=filename, lines=lines)
-        kin_energy_error = self.get_kinetic_energy_error(filename=filename, lines=lines)
-        stresses = self.get_stresses(filename=filename, si_unit=False, lines=lines)
-        n_elect = self.get_nelect(filename=filename, lines=lines)
+        self.parse_dict.update(_OutcarScanner().scan(filename=filename))
         try:
-            irreducible_kpoints = self.get_irreducible_kpoints(filename=filename, lines=lines)
-        except ValueError:
-            print('irreducible kpoints not parsed !')
-            irreducible_kpoints = None
-        magnetization, final_magmom_lst = self.get_magnetization(filename=filename, lines=lines)
-        broyden_mixing = self.get_broyden_mixing_mesh(filename=filename, lines=lines)
-
-        self.parse_dict["energies"] = energies
-        self.parse_dict["energies_int"] = energies_int
-        self.parse_dict["energies_zero"] = energies_zero
-        self.parse_dict["scf_energies"] = scf_energies
-        self.parse_dict["forces"] = forces
-        self.parse_dict["positions"] = positions
-        self.parse_dict["cells"] = cells
-        self.parse_dict["steps"] = steps
-        self.parse_dict["temperatures"] = temperatures
-        self.parse_dict["time"] = time
-        self.parse_dict["fermi_level"] = fermi_level
-        self.parse_dict["scf_dipole_moments"] = scf_moments
-        self.parse_dict["kin_energy_error"] = kin_energy_error
-        self.parse_dict["stresses"] = stresses
-        self.parse_dict["irreducible_kpoints"] = irreducible_kpoints
-        self.parse_dict["magnetization"] = magnetization
-        self.parse_dict["final_magmoms"] = final_magmom_lst
-        self.parse_dict["broyden_mixing"] = broyden_mixing
-        self.parse_dict["n_elect"] = n_elect
-
-        try:
-            self.parse_dict["pressures"] = np.average(stresses[:, 0:3], axis=1) * KBAR_TO_EVA
+            self.parse_dict["pressures"] = np.average(self.parse_dict["stresses"][:, 0:3], axis=1) * KBAR_TO_EVA
         except IndexError:
-            self.parse_dict["pressures"] = np.zeros(len(steps))
+            self.parse_dict["pressures"] = np.zeros(len(self.parse_dict["steps"]))
 
     def to_hdf(self, hdf, group_name="outcar"):
         """
@@ -146,11 +102,9 @@ class Outcar(object):
 
             where N is the number of atoms and M is the number of time steps
         """
-        if n_atoms is None:
-            n_atoms = self.get_number_of_atoms(filename=filename, lines=lines)
-        trigger_indices, lines = _get_trigger(lines=lines, filename=filename, trigger="TOTAL-FORCE (eV/Angst)")
-        return self._get_positions_and_forces_parser(lines=lines, trigger_indices=trigger_indices, n_atoms=n_atoms,
-                                                     pos_flag=True, force_flag=True)
+        scanner = _scan_outcar(filename=filename, lines=lines, n_atoms=n_atoms)
+        scanner.get_number_of_atoms()
+        return np.array(scanner.positions), np.array(scanner.forces)
 
     def get_positions(self, filename="OUTCAR", lines=None, n_atoms=None):
 
@@ -167,11 +121,7 @@ class Outcar(object):
 
             where N is the number of atoms and M is the number of time steps
         """
-        if n_atoms is None:
-            n_atoms = self.get_number_of_atoms(filename=filename, lines=lines)
-        trigger_indices, lines = _get_trigger(lines=lines, filename=filename, trigger="TOTAL-FORCE (eV/Angst)")
-        return self._get_positions_and_forces_parser(lines=lines, trigger_indices=trigger_indices, n_atoms=n_atoms,
-                                                     pos_flag=True, force_flag=False)
+        return self.get_positions_and_forces(filename=filename, lines=lines, n_atoms=n_atoms)[0]
 
     def get_forces(self, filename="OUTCAR", lines=None, n_atoms=None):
         """
@@ -188,11 +138,7 @@ class Outcar(object):
 
             where N is the number of atoms and M is the number of time steps
         """
-        if n_atoms is None:
-            n_atoms = self.get_number_of_atoms(filename=filename, lines=lines)
-        trigger_indices, lines = _get_trigger(lines=lines, filename=filename, trigger="TOTAL-FORCE (eV/Angst)")
-        return self._get_positions_and_forces_parser(lines=lines, trigger_indices=trigger_indices, n_atoms=n_atoms,
-                                                     pos_flag=False, force_flag=True)
+        return self.get_positions_and_forces(filename=filename, lines=lines, n_atoms=n_atoms)[1]
 
     def get_cells(self, filename="OUTCAR", lines=None):
         """
@@ -207,8 +153,7 @@ class Outcar(object):
 
             where M is the number of time steps
         """
-        trigger_indices, lines = _get_trigger(lines=lines, filename=filename, trigger="VOLUME and BASIS-vectors are now :")
-        return self._get_cells_praser(lines=lines, trigger_indices=trigger_indices)
+        return np.array(_scan_outcar(filename=filename, lines=lines).cells)
 
     @staticmethod
     def get_stresses(filename="OUTCAR", lines=None, si_unit=True):
@@ -223,22 +168,10 @@ class Outcar(object):
             numpy.ndarray: An array of stress values
 
         """
-        trigger_indices, lines = _get_trigger(lines=lines,
-                                              filename=filename,
-                                              trigger="FORCE on cell =-STRESS in cart. coord.  units (eV):")
-        pullay_stress_lst = []
-        for j in trigger_indices:
-            try:
-                if si_unit:
-                    pullay_stress_lst.append([float(l) for l in lines[j + 13].split()[1:7]])
-                else:
-                    pullay_stress_lst.append([float(l) for l in lines[j + 14].split()[2:8]])
-            except ValueError:
-                if si_unit:
-                    pullay_stress_lst.append([float('NaN')] * 6)
-                else:
-                    pullay_stress_lst.append([float('NaN')] * 6)
-        return np.array(pullay_stress_lst)
+        scanner = _scan_outcar(filename=filename, lines=lines)
+        if si_unit:
+            return np.array(scanner.stresses_si)
+        return np.array(scanner.stresses)
 
     @staticmethod
     def get_irreducible_kpoints(filename="OUTCAR", reciprocal=True, weight=True, planewaves=True, lines=None):
@@ -255,45 +188,8 @@ class Outcar(object):
         Returns:
             numpy.ndarray: An array of k-points
         """
-        kpoint_lst = []
-        weight_lst = []
-        planewaves_lst = []
-        trigger_number_str = "Subroutine IBZKPT returns following result:"
-        trigger_plane_waves_str = "k-point  1 :"
-        trigger_number = 0
-        trigger_plane_waves = 0
-        lines = _get_lines_from_file(filename=filename, lines=lines)
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if trigger_number_str in line:
-                trigger_number = int(i)
-            elif planewaves:
-                if trigger_plane_waves_str in line:
-                    trigger_plane_waves = int(i)
-        number_irr_kpoints = int(lines[trigger_number + 3].split()[1])
-        if reciprocal:
-            trigger_start = trigger_number + 7
-        else:
-            trigger_start = trigger_number + 10 + number_irr_kpoints
-        for line in lines[trigger_start: trigger_start + number_irr_kpoints]:
-            line = line.strip()
-            line = _clean_line(line)
-            kpoint_lst.append([float(l) for l in line.split()[0:3]])
-            if weight:
-                weight_lst.append(float(line.split()[3]))
-        if planewaves:
-            for line in lines[trigger_plane_waves: trigger_plane_waves + number_irr_kpoints]:
-                line = line.strip()
-                line = _clean_line(line)
-                planewaves_lst.append(float(line.split()[-1]))
-        if weight and planewaves:
-            return np.array(kpoint_lst), np.array(weight_lst), np.array(planewaves_lst)
-        elif weight:
-            return np.array(kpoint_lst), np.array(weight_lst)
-        elif planewaves:
-            return np.array(kpoint_lst), np.array(planewaves_lst)
-        else:
-            return np.array(kpoint_lst)
+        return _scan_outcar(filename=filename, lines=lines).get_irreducible_kpoints(
+            reciprocal=reciprocal, weight=weight, planewaves=planewaves)
 
     @staticmethod
     def get_total_energies(filename="OUTCAR", lines=None):
@@ -309,13 +205,7 @@ class Outcar(object):
 
             where M is the number of time steps
         """
-        def get_total_energies_from_line(line):
-            return float(_clean_line(line.strip()).split()[-2])
-
-        trigger_indices, lines = _get_trigger(lines=lines,
-                                              filename=filename,
-                                              trigger="FREE ENERGIE OF THE ION-ELECTRON SYSTEM (eV)")
-        return np.array([get_total_energies_from_line(lines[j + 2]) for j in trigger_indices])
+        return np.array(_scan_outcar(filename=filename, lines=lines).energies)
 
     @staticmethod
     def get_energy_without_entropy(filename="OUTCAR", lines=None):
@@ -331,13 +221,7 @@ class Outcar(object):
 
             where M is the number of time steps
         """
-        def get_energy_without_entropy_from_line(line):
-            return float(_clean_line(line.strip()).split()[3])
-
-        trigger_indices, lines = _get_trigger(lines=lines,
-                                              filename=filename,
-                                              trigger="FREE ENERGIE OF THE ION-ELECTRON SYSTEM (eV)")
-        return np.array([get_energy_without_entropy_from_line(lines[j + 4]) for j in trigger_indices])
+        return np.array(_scan_outcar(filename=filename, lines=lines).energies_int)
 
     @staticmethod
     def get_energy_sigma_0(filename="OUTCAR", lines=None):
@@ -353,13 +237,7 @@ class Outcar(object):
 
             where M is the number of time steps
         """
-        def get_energy_sigma_0_from_line(line):
-            return float(_clean_line(line.strip()).split()[-1])
-
-        trigger_indices, lines = _get_trigger(lines=lines,
-                                              filename=filename,
-                                              trigger="FREE ENERGIE OF THE ION-ELECTRON SYSTEM (eV)")
-        return np.array([get_energy_sigma_0_from_line(lines[j + 4]) for j in trigger_indices])
+        return np.array(_scan_outcar(filename=filename, lines=lines).energies_zero)
 
     @staticmethod
     def get_all_total_energies(filename="OUTCAR", lines=None):
@@ -373,21 +251,7 @@ class Outcar(object):
         Returns:
             list: A list of energie for every electronic step at every ionic step
         """
-        ionic_trigger = "FREE ENERGIE OF THE ION-ELECTRON SYSTEM (eV)"
-        electronic_trigger = "free energy    TOTEN  ="
-        scf_energies = list()
-        lines = _get_lines_from_file(filename=filename, lines=lines)
-        istep_energies = list()
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if ionic_trigger in line:
-                scf_energies.append(np.array(istep_energies))
-                istep_energies = list()
-            if electronic_trigger in line:
-                line = _clean_line(line)
-                ene = float(line.split()[-2])
-                istep_energies.append(ene)
-        return scf_energies
+        return _scan_outcar(filename=filename, lines=lines).scf_energies
 
     @staticmethod
     def get_magnetization(filename="OUTCAR", lines=None):
@@ -401,65 +265,8 @@ class Outcar(object):
         Returns:
             list: A list with the mgnetization values
         """
-        ionic_trigger = "FREE ENERGIE OF THE ION-ELECTRON SYSTEM (eV)"
-        electronic_trigger = "eigenvalue-minimisations"
-        nion_trigger = "NIONS ="
-        mag_lst = list()
-        local_spin_trigger = False
-        n_atoms = None
-        mag_dict = dict()
-        mag_dict['x'] = list()
-        mag_dict['y'] = list()
-        mag_dict['z'] = list()
-        lines = _get_lines_from_file(filename=filename, lines=lines)
-        istep_energies = list()
-        final_magmom_lst = list()
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if ionic_trigger in line:
-                mag_lst.append(np.array(istep_energies))
-                istep_energies = list()
-            if 'Atomic Wigner-Seitz radii' in line:
-                local_spin_trigger = True
-
-            if electronic_trigger in line:
-                try:
-                    line = lines[i + 2].split('magnetization')[-1]
-                    if line != ' \n':
-                        spin_str_lst = line.split()
-                        spin_str_len = len(spin_str_lst)
-                        if spin_str_len == 1:
-                            ene = float(line)
-                        elif spin_str_len == 3:
-                            ene = [float(spin_str_lst[0]), float(spin_str_lst[1]), float(spin_str_lst[2])]
-                        else:
-                            warnings.warn('Unrecognized spin configuration.')
-                            return mag_lst, final_magmom_lst
-                        istep_energies.append(ene)
-                except ValueError:
-                    warnings.warn("Something went wrong in parsing the magnetization")
-            if n_atoms is None:
-                if nion_trigger in line:
-                    n_atoms = int(line.split(nion_trigger)[-1])
-            if local_spin_trigger:
-                try:
-                    for ind_dir, direc in enumerate(['x', 'y', 'z']):
-                        if 'magnetization ({})'.format(direc) in line:
-                            mag_dict[direc].append([float(lines[i + 4 + atom_index].split()[-1])
-                                                    for atom_index in range(n_atoms)])
-                except ValueError:
-                    warnings.warn("Something went wrong in parsing the magnetic moments")
-        if len(mag_dict['x']) > 0:
-            if len(mag_dict['y']) == 0:
-                final_mag = np.array(mag_dict['x'])
-            else:
-                n_ionic_steps = np.array(mag_dict['x']).shape[0]
-                final_mag = np.abs(np.zeros((n_ionic_steps, n_atoms, 3)))
-                final_mag[:, :, 0] = np.array(mag_dict['x'])
-                final_mag[:, :, 1] = np.array(mag_dict['y'])
-                final_mag[:, :, 2] = np.array(mag_dict['z'])
-            final_magmom_lst = final_mag.tolist()
-        return mag_lst, final_magmom_lst
+        scanner = _scan_outcar(filename=filename, lines=lines)
+        return scanner.magnetization, scanner.get_final_magmoms()
 
     @staticmethod
     def get_broyden_mixing_mesh(filename="OUTCAR", lines=None):
@@ -473,15 +280,7 @@ class Outcar(object):
         Returns:
             int: Mesh size
         """
-        trigger_indices, lines = _get_trigger(lines=lines, filename=filename, trigger="gives a total of ")
-        if len(trigger_indices) > 0:
-            line_ngx = lines[trigger_indices[0]-2]
-        else:
-            warnings.warn("Unable to parse the Broyden mixing mesh. Returning 0 instead")
-            return 0
-        # Exclude all alphabets, and spaces. Then split based on '='
-        str_list = re.sub(r'[a-zA-Z]', r'', line_ngx.replace(" ", "").replace("\n", "")).split("=")
-        return np.prod([int(val) for val in str_list[1:]])
+        return _scan_outcar(filename=filename, lines=lines).get_broyden_mixing_mesh()
 
     @staticmethod
     def get_temperatures(filename="OUTCAR", lines=None):
@@ -495,18 +294,7 @@ class Outcar(object):
         Returns:
             numpy.ndarray: An array of temperatures in Kelvin
         """
-        trigger_indices, lines = _get_trigger(lines=lines, filename=filename, trigger="kin. lattice  EKIN_LAT= ")
-        temperatures = []
-        if len(trigger_indices) > 0:
-            for j in trigger_indices:
-                line = lines[j].strip()
-                line = _clean_line(line)
-                temperatures.append(float(line.split()[-2]))
-        else:
-            temperatures = np.zeros(len(_get_trigger(lines=lines,
-                                                     trigger="FREE ENERGIE OF THE ION-ELECTRON SYSTEM (eV)",
-                                                     return_lines=False)))
-        return np.array(temperatures)
+        return _scan_outcar(filename=filename, lines=lines).get_temperatures()
 
     @staticmethod
     def get_steps(filename="OUTCAR", lines=None):
@@ -519,21 +307,7 @@ class Outcar(object):
         Returns:
             numpy.ndarray: Steps during the simulation
         """
-        nblock_trigger = "NBLOCK ="
-        trigger = "FREE ENERGIE OF THE ION-ELECTRON SYSTEM (eV)"
-        trigger_indices = list()
-        read_nblock = True
-        n_block = 1
-        lines = _get_lines_from_file(filename=filename, lines=lines)
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if trigger in line:
-                trigger_indices.append(i)
-            if read_nblock is None:
-                if nblock_trigger in line:
-                    line = _clean_line(line)
-                    n_block = int(line.split(nblock_trigger)[-1])
-        return n_block * np.linspace(0, len(trigger_indices))
+        return _scan_outcar(filename=filename, lines=lines).get_steps()
 
     def get_time(self, filename="OUTCAR", lines=None):
         """
@@ -547,17 +321,7 @@ class Outcar(object):
             numpy.ndarray: An array of time values in fs
 
         """
-        potim_trigger = "POTIM  ="
-        read_potim = True
-        potim = 1.0
-        lines = _get_lines_from_file(filename=filename, lines=lines)
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if read_potim is None:
-                if potim_trigger in line:
-                    line = _clean_line(line)
-                    potim = float(line.split(potim_trigger)[0])
-        return potim * self.get_steps(filename)
+        return _scan_outcar(filename=filename, lines=lines).get_time()
 
     @staticmethod
     def get_kinetic_energy_error(filename="OUTCAR", lines=None):
@@ -571,21 +335,7 @@ class Outcar(object):
         Returns:
             float: The kinetic energy error in eV
         """
-        trigger = "kinetic energy error for atom="
-        e_kin_err = list()
-        n_species_list = list()
-        nion_trigger = "ions per type ="
-        tot_kin_error = 0.0
-        lines = _get_lines_from_file(filename=filename, lines=lines)
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if trigger in line:
-                e_kin_err.append(float(line.split()[5]))
-            if nion_trigger in line:
-                n_species_list = [float(val) for val in line.split(nion_trigger)[-1].strip().split()]
-        if len(n_species_list) > 0 and len(n_species_list) == len(e_kin_err):
-            tot_kin_error = np.sum(np.array(n_species_list) * np.array(e_kin_err))
-        return tot_kin_error
+        return _scan_outcar(filename=filename, lines=lines).get_kinetic_energy_error()
 
     @staticmethod
     def get_fermi_level(filename="OUTCAR", lines=None):
@@ -599,15 +349,7 @@ class Outcar(object):
         Returns:
             float: The Kohn-Sham Fermi level in eV
         """
-        trigger = "E-fermi :"
-        trigger_indices, lines = _get_trigger(lines=lines, filename=filename, trigger=trigger)
-        if len(trigger_indices) != 0:
-            try:
-                return float(lines[trigger_indices[-1]].split(trigger)[-1].split()[0])
-            except ValueError:
-                return
-        else:
-            return
+        return _scan_outcar(filename=filename, lines=lines).get_fermi_level()
 
     @staticmethod
     def get_dipole_moments(filename="OUTCAR", lines=None):
@@ -622,21 +364,7 @@ class Outcar(object):
             list: A list of dipole moments in (eA) for each electronic step
 
         """
-        moment_trigger = "dipolmoment"
-        istep_trigger = "FREE ENERGIE OF THE ION-ELECTRON SYSTEM (eV)"
-        dip_moms = list()
-        lines = _get_lines_from_file(filename=filename, lines=lines)
-        istep_mom = list()
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if istep_trigger in line:
-                dip_moms.append(np.array(istep_mom))
-                istep_mom = list()
-            if moment_trigger in line:
-                line = _clean_line(line)
-                mom = np.array([float(val) for val in line.split()[1:4]])
-                istep_mom.append(mom)
-        return dip_moms
+        return _scan_outcar(filename=filename, lines=lines).scf_dipole_moments
 
     @staticmethod
     def get_nelect(filename="OUTCAR", lines=None):
@@ -651,12 +379,7 @@ class Outcar(object):
             float: The number of electrons in the simulation
 
         """
-        nelect_trigger = "NELECT"
-        lines = _get_lines_from_file(filename=filename, lines=lines)
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if nelect_trigger in line:
-                return float(line.split()[2])
+        return _scan_outcar(filename=filename, lines=lines).n_elect
 
     @staticmethod
     def get_number_of_atoms(filename="OUTCAR", lines=None):
@@ -671,117 +394,532 @@ class Outcar(object):
             int: The number of ions in the simulation
 
         """
-        ions_trigger = "NIONS ="
-        trigger_indices, lines = _get_trigger(lines=lines, filename=filename, trigger=ions_trigger)
-        if len(trigger_indices) != 0:
-            return int(lines[trigger_indices[0]].split(ions_trigger)[-1])
+        return _scan_outcar(filename=filename, lines=lines).get_number_of_atoms()
+
+
+class _OutcarScanner(object):
+    """
+    Single pass parser for OUTCAR files. Each line is matched against all triggers at once, the lines following a
+    trigger are collected and parsed as soon as they are available - so the file is never kept in memory. Both
+    Outcar.from_file() and the individual Outcar.get_*() functions use this parser.
+    """
+    ionic_trigger = "FREE ENERGIE OF THE ION-ELECTRON SYSTEM (eV)"
+    electronic_energy_trigger = "free energy    TOTEN  ="
+    nion_trigger = "NIONS ="
+    force_trigger = "TOTAL-FORCE (eV/Angst)"
+    cell_trigger = "VOLUME and BASIS-vectors are now :"
+    stress_trigger = "FORCE on cell =-STRESS in cart. coord.  units (eV):"
+    temperature_trigger = "kin. lattice  EKIN_LAT= "
+    fermi_trigger = "E-fermi :"
+    dipole_trigger = "dipolmoment"
+    kin_energy_error_trigger = "kinetic energy error for atom="
+    species_trigger = "ions per type ="
+    nelect_trigger = "NELECT"
+    kpoint_trigger = "Subroutine IBZKPT returns following result:"
+    planewave_trigger = "k-point  1 :"
+    broyden_trigger = "gives a total of "
+    magnetization_trigger = "eigenvalue-minimisations"
+    wigner_seitz_trigger = "Atomic Wigner-Seitz radii"
+    local_magnetization_triggers = ("magnetization (x)", "magnetization (y)", "magnetization (z)")
+
+    def __init__(self):
+        self._handlers = {
+            self.ionic_trigger: self._on_ionic_step,
+            self.electronic_energy_trigger: self._on_electronic_energy,
+            self.nion_trigger: self._on_nions,
+            self.force_trigger: self._on_forces,
+            self.cell_trigger: self._on_cell,
+            self.stress_trigger: self._on_stress,
+            self.temperature_trigger: self._on_temperature,
+            self.fermi_trigger: self._on_fermi_level,
+            self.dipole_trigger: self._on_dipole_moment,
+            self.kin_energy_error_trigger: self._on_kin_energy_error,
+            self.species_trigger: self._on_species,
+            self.nelect_trigger: self._on_nelect,
+            self.kpoint_trigger: self._on_kpoints,
+            self.planewave_trigger: self._on_planewaves,
+            self.broyden_trigger: self._on_broyden_mixing,
+            self.magnetization_trigger: self._on_magnetization,
+            self.wigner_seitz_trigger: self._on_wigner_seitz,
+        }
+        for trigger in self.local_magnetization_triggers:
+            self._handlers[trigger] = self._on_local_magnetization
+        self._trigger_regex = re.compile("|".join([re.escape(trigger) for trigger in self._handlers.keys()]))
+        self._captures = []
+        self._line_index = 0
+        self._previous_lines = [None, None]
+        self.n_atoms = None
+        self.n_ionic_steps = 0
+        self.energies = []
+        self.energies_int = []
+        self.energies_zero = []
+        self.scf_energies = []
+        self._istep_energies = []
+        self.positions = []
+        self.forces = []
+        self.cells = []
+        self.stresses = []
+        self.stresses_si = []
+        self.temperatures = []
+        self._fermi_line = None
+        self.scf_dipole_moments = []
+        self._istep_moments = []
+        self._kin_energy_errors = []
+        self._species_lst = []
+        self.n_elect = None
+        self._kpoint_result = None
+        self._kpoint_cartesian_result = None
+        self._n_irr_kpoints = None
+        self._planewave_lines = None
+        self._planewave_index = -1
+        self._kpoint_index = -1
+        self._broyden_line = None
+        self.magnetization = []
+        self._istep_magnetization = []
+        self._magnetization_stopped = False
+        self._local_spin = False
+        self._local_magnetization = {"x": [], "y": [], "z": []}
+
+    def scan(self, filename):
+        """
+        Parse the OUTCAR file
+
+        Args:
+            filename (str): Filename of the OUTCAR file to parse
+
+        Returns:
+            dict: parse_dict of the Outcar class
+        """
+        with open(filename, "r") as f:
+            self.feed_lines(f)
+        return self._get_parse_dict()
+
+    def feed_lines(self, lines):
+        """
+        Parse the lines of an OUTCAR file - afterwards the parsed quantities are available as attributes and from the
+        get_*() functions.
+
+        Args:
+            lines (iterable): lines of the OUTCAR file including the line breaks
+        """
+        for line in lines:
+            self._feed(line)
+        for capture in self._captures:
+            capture[2](capture[1])
+        self._captures = []
+
+    def _feed(self, line):
+        """
+        Process a single line - pass it to the pending captures and dispatch the triggers it contains.
+
+        Args:
+            line (str): line of the OUTCAR file including the line break
+        """
+        if len(self._captures) > 0:
+            completed = []
+            for capture in self._captures:
+                capture[1].append(line)
+                if len(capture[1]) == capture[0]:
+                    completed.append(capture)
+            for capture in completed:
+                self._captures.remove(capture)
+                capture[2](capture[1])
+        if self._trigger_regex.search(line) is not None:
+            stripped_line = line.strip()
+            for trigger in set(self._trigger_regex.findall(stripped_line)):
+                self._handlers[trigger](line, stripped_line)
+        self._previous_lines = [self._previous_lines[1], line]
+        self._line_index += 1
+
+    def _capture(self, n_lines, callback):
+        """
+        Collect the next lines of the file and call the callback function with the list of lines once they are read.
+
+        Args:
+            n_lines (int): number of lines to collect
+            callback (function): function called with the list of lines
+        """
+        if n_lines <= 0:
+            callback([])
         else:
+            self._captures.append([n_lines, [], callback])
+
+    def _on_ionic_step(self, line, stripped_line):
+        self.n_ionic_steps += 1
+        self.scf_energies.append(np.array(self._istep_energies))
+        self._istep_energies = []
+        self.scf_dipole_moments.append(np.array(self._istep_moments))
+        self._istep_moments = []
+        if not self._magnetization_stopped:
+            self.magnetization.append(np.array(self._istep_magnetization))
+            self._istep_magnetization = []
+        index = len(self.energies)
+        self.energies.append(None)
+        self.energies_int.append(None)
+        self.energies_zero.append(None)
+
+        def parse_energies(lines):
+            self.energies[index] = float(_clean_line(lines[1].strip()).split()[-2])
+            energy_line = _clean_line(lines[3].strip()).split()
+            self.energies_int[index] = float(energy_line[3])
+            self.energies_zero[index] = float(energy_line[-1])
+
+        self._capture(4, parse_energies)
+
+    def _on_electronic_energy(self, line, stripped_line):
+        self._istep_energies.append(float(_clean_line(stripped_line).split()[-2]))
+
+    def _on_nions(self, line, stripped_line):
+        if self.n_atoms is None:
+            self.n_atoms = int(line.split(self.nion_trigger)[-1])
+
+    def _on_forces(self, line, stripped_line):
+        if self.n_atoms is None:
             raise ValueError()
+        index = len(self.positions)
+        self.positions.append(None)
+        self.forces.append(None)
 
-    @staticmethod
-    def _get_positions_and_forces_parser(lines, trigger_indices, n_atoms, pos_flag=True, force_flag=True):
+        def parse_positions_and_forces(lines):
+            lines = lines[1:]
+            try:
+                data = np.array(_clean_line(" ".join(lines)).split(), dtype=float).reshape(self.n_atoms, 6)
+                self.positions[index], self.forces[index] = data[:, :3], data[:, 3:]
+            except ValueError:
+                split_lines = [_clean_line(line.strip()).split() for line in lines]
+                self.positions[index] = [[float(l) for l in line[0:3]] for line in split_lines]
+                self.forces[index] = [[float(l) for l in line[3:]] for line in split_lines]
+
+        self._capture(self.n_atoms + 1, parse_positions_and_forces)
+
+    def _on_cell(self, line, stripped_line):
+        index = len(self.cells)
+        self.cells.append(None)
+
+        def parse_cell(lines):
+            self.cells[index] = [[float(l) for l in _clean_line(line.strip()).split()[0:3]] for line in lines[4:7]]
+
+        self._capture(7, parse_cell)
+
+    def _on_stress(self, line, stripped_line):
+        index = len(self.stresses)
+        self.stresses.append(None)
+        self.stresses_si.append(None)
+
+        def parse_stress(lines):
+            self.stresses[index] = _parse_stress_line(lines[13], start=2)
+            self.stresses_si[index] = _parse_stress_line(lines[12], start=1)
+
+        self._capture(14, parse_stress)
+
+    def _on_temperature(self, line, stripped_line):
+        self.temperatures.append(float(_clean_line(stripped_line).split()[-2]))
+
+    def _on_fermi_level(self, line, stripped_line):
+        self._fermi_line = line
+
+    def _on_dipole_moment(self, line, stripped_line):
+        self._istep_moments.append(np.array([float(val) for val in _clean_line(stripped_line).split()[1:4]]))
+
+    def _on_kin_energy_error(self, line, stripped_line):
+        self._kin_energy_errors.append(float(stripped_line.split()[5]))
+
+    def _on_species(self, line, stripped_line):
+        self._species_lst = [float(val) for val in stripped_line.split(self.species_trigger)[-1].strip().split()]
+
+    def _on_nelect(self, line, stripped_line):
+        if self.n_elect is None:
+            self.n_elect = float(stripped_line.split()[2])
+
+    def _on_kpoints(self, line, stripped_line):
+        self._kpoint_index = self._line_index
+        index = self._line_index
+
+        def parse_number_of_kpoints(lines):
+            try:
+                n_irr_kpoints = int(lines[2].split()[1])
+            except ValueError:
+                if index == self._kpoint_index:
+                    self._kpoint_result = None
+                return
+            if index == self._kpoint_index:
+                self._n_irr_kpoints = n_irr_kpoints
+
+            def parse_kpoints(lines):
+                if index == self._kpoint_index:
+                    self._kpoint_result = lines[3:3 + n_irr_kpoints]
+                    self._kpoint_cartesian_result = lines[6 + n_irr_kpoints:6 + 2 * n_irr_kpoints]
+
+            self._capture(6 + 2 * n_irr_kpoints, parse_kpoints)
+
+        self._kpoint_result = None
+        self._kpoint_cartesian_result = None
+        self._capture(3, parse_number_of_kpoints)
+
+    def _on_planewaves(self, line, stripped_line):
+        if self.kpoint_trigger in stripped_line:
+            return
+        self._planewave_index = self._line_index
+        index = self._line_index
+
+        def parse_planewaves(lines):
+            if index == self._planewave_index:
+                self._planewave_lines = [line] + lines
+
+        self._planewave_lines = None
+        if self._n_irr_kpoints is not None:
+            self._capture(self._n_irr_kpoints - 1, parse_planewaves)
+
+    def _on_broyden_mixing(self, line, stripped_line):
+        if self._broyden_line is None:
+            self._broyden_line = self._previous_lines[0]
+
+    def _on_magnetization(self, line, stripped_line):
+        if self._magnetization_stopped:
+            return
+
+        def parse_magnetization(lines):
+            if self._magnetization_stopped:
+                return
+            try:
+                line = lines[1].split('magnetization')[-1]
+                if line != ' \n':
+                    spin_str_lst = line.split()
+                    spin_str_len = len(spin_str_lst)
+                    if spin_str_len == 1:
+                        ene = float(line)
+                    elif spin_str_len == 3:
+                        ene = [float(spin_str_lst[0]), float(spin_str_lst[1]), float(spin_str_lst[2])]
+                    else:
+                        warnings.warn('Unrecognized spin configuration.')
+                        self._magnetization_stopped = True
+                        return
+                    self._istep_magnetization.append(ene)
+            except ValueError:
+                warnings.warn("Something went wrong in parsing the magnetization")
+
+        self._capture(2, parse_magnetization)
+
+    def _on_wigner_seitz(self, line, stripped_line):
+        self._local_spin = True
+
+    def _on_local_magnetization(self, line, stripped_line):
+        if not self._local_spin or self._magnetization_stopped:
+            return
+        for direction in ["x", "y", "z"]:
+            if 'magnetization ({})'.format(direction) in stripped_line:
+                moments = self._local_magnetization[direction]
+
+                def parse_local_magnetization(lines, moments=moments):
+                    if self._magnetization_stopped:
+                        return
+                    try:
+                        moments.append([float(lines[3 + atom_index].split()[-1])
+                                        for atom_index in range(self.n_atoms)])
+                    except ValueError:
+                        warnings.warn("Something went wrong in parsing the magnetic moments")
+
+                self._capture(3 + self.n_atoms, parse_local_magnetization)
+
+    def get_number_of_atoms(self):
         """
-        Parser to get the forces and or positions for every ionic step from the OUTCAR file
+        Number of ions in the simulation
+
+        Returns:
+            int: The number of ions in the simulation
+        """
+        if self.n_atoms is None:
+            raise ValueError()
+        return self.n_atoms
+
+    def get_irreducible_kpoints(self, reciprocal=True, weight=True, planewaves=True):
+        """
+        Irreducible k-points with their weights and number of plane waves
 
         Args:
-            lines (list): lines read from the file
-            trigger_indices (list): list of line indices where the trigger was found.
-            n_atoms (int): number of atoms
-            pos_flag (bool): parse position
-            force_flag (bool): parse forces
+            reciprocal (bool): Get either the reciprocal or the cartesian coordinates
+            weight (bool): Get the weight assigned to the irreducible kpoints
+            planewaves (bool): Get the planewaves assigned to the irreducible kpoints
 
         Returns:
-            [positions, forces] (sequence)
-            numpy.ndarray: A Nx3xM array of positions in $\AA$
-            numpy.ndarray: A Nx3xM array of forces in $eV / \AA$
+            numpy.ndarray/tuple: k-points and, if selected, weights and number of planewaves - None if the k-points
+                                 could not be parsed
+        """
+        kpoint_lines = self._kpoint_result if reciprocal else self._kpoint_cartesian_result
+        try:
+            if kpoint_lines is None or (planewaves and self._planewave_lines is None):
+                raise ValueError()
+            kpoint_lst = []
+            weight_lst = []
+            for line in kpoint_lines:
+                line = _clean_line(line.strip())
+                kpoint_lst.append([float(l) for l in line.split()[0:3]])
+                if weight:
+                    weight_lst.append(float(line.split()[3]))
+            result = [np.array(kpoint_lst)]
+            if weight:
+                result.append(np.array(weight_lst))
+            if planewaves:
+                result.append(np.array([float(_clean_line(line.strip()).split()[-1])
+                                        for line in self._planewave_lines]))
+        except ValueError:
+            print('irreducible kpoints not parsed !')
+            return None
+        if len(result) == 1:
+            return result[0]
+        return tuple(result)
 
-            where N is the number of atoms and M is the number of time steps
+    def get_final_magmoms(self):
+        """
+        Local magnetic moments of the ions
 
+        Returns:
+            list: local magnetic moments for every ionic step
         """
-        positions = []
-        forces = []
-        for j in trigger_indices:
-            pos = []
-            force = []
-            for line in lines[j + 2: j + n_atoms + 2]:
-                line = line.strip()
-                line = _clean_line(line)
-                if pos_flag:
-                    pos.append([float(l) for l in line.split()[0:3]])
-                if force_flag:
-                    force.append([float(l) for l in line.split()[3:]])
-            forces.append(force)
-            positions.append(pos)
-        if pos_flag and force_flag:
-            return np.array(positions), np.array(forces)
-        elif pos_flag:
-            return np.array(positions)
-        elif force_flag:
-            return np.array(forces)
+        if self._magnetization_stopped or len(self._local_magnetization['x']) == 0:
+            return []
+        if len(self._local_magnetization['y']) == 0:
+            return np.array(self._local_magnetization['x']).tolist()
+        final_mag = np.zeros((np.array(self._local_magnetization['x']).shape[0], self.n_atoms, 3))
+        for ind_dir, direction in enumerate(["x", "y", "z"]):
+            final_mag[:, :, ind_dir] = np.array(self._local_magnetization[direction])
+        return final_mag.tolist()
 
-    @staticmethod
-    def _get_cells_praser(lines, trigger_indices):
+    def get_broyden_mixing_mesh(self):
         """
-        Parser to get the cell size and shape for every ionic step from the OUTCAR file
+        Broyden mixing mesh size
 
-        Args:
-            lines (list): lines read from the file
-            trigger_indices (list): list of line indices where the trigger was found.
-            n_atoms (int): number of atoms
+        Returns:
+            int: Mesh size
+        """
+        if self._broyden_line is None:
+            warnings.warn("Unable to parse the Broyden mixing mesh. Returning 0 instead")
+            return 0
+        # Exclude all alphabets, and spaces. Then split based on '='
+        str_list = re.sub(r'[a-zA-Z]', r'', self._broyden_line.replace(" ", "").replace("\n", "")).split("=")
+        return np.prod([int(val) for val in str_list[1:]])
+
+    def get_fermi_level(self):
+        """
+        Kohn-Sham Fermi level of the last ionic step
 
         Returns:
-            numpy.ndarray: A 3x3xM array of the cell shape in $\AA$
+            float: The Kohn-Sham Fermi level in eV
+        """
+        if self._fermi_line is None:
+            return
+        try:
+            return float(self._fermi_line.split(self.fermi_trigger)[-1].split()[0])
+        except ValueError:
+            return
 
-            where M is the number of time steps
+    def get_temperatures(self):
+        """
+        Temperature at each ionic step - zero for every ionic step if no temperature is printed
 
+        Returns:
+            numpy.ndarray: An array of temperatures in Kelvin
         """
-        cells = []
-        for j in trigger_indices:
-            cell = []
-            for line in lines[j + 5: j + 8]:
-                line = line.strip()
-                line = _clean_line(line)
-                cell.append([float(l) for l in line.split()[0:3]])
-            cells.append(cell)
-        return np.array(cells)
+        if len(self.temperatures) > 0:
+            return np.array(self.temperatures)
+        return np.zeros(self.n_ionic_steps)
 
+    def get_steps(self):
+        """
+        Steps during the simulation
 
-def _clean_line(line):
-    return line.replace("-", " -")
+        Returns:
+            numpy.ndarray: Steps during the simulation
+        """
+        return np.linspace(0, self.n_ionic_steps)
 
+    def get_time(self):
+        """
+        Time after each simulation step - POTIM is not parsed, so a time step of 1 fs is used
 
-def _get_trigger(trigger, filename=None, lines=None, return_lines=True):
+        Returns:
+            numpy.ndarray: An array of time values in fs
+        """
+        return 1.0 * self.get_steps()
+
+    def get_kinetic_energy_error(self):
+        """
+        Kinetic energy error summed over all ions
+
+        Returns:
+            float: The kinetic energy error in eV
+        """
+        if len(self._species_lst) > 0 and len(self._species_lst) == len(self._kin_energy_errors):
+            return np.sum(np.array(self._species_lst) * np.array(self._kin_energy_errors))
+        return 0.0
+
+    def _get_parse_dict(self):
+        """
+        Collect the parsed quantities
+
+        Returns:
+            dict: parse_dict of the Outcar class
+        """
+        self.get_number_of_atoms()
+        return {"energies": np.array(self.energies),
+                "energies_int": np.array(self.energies_int),
+                "energies_zero": np.array(self.energies_zero),
+                "scf_energies": self.scf_energies,
+                "forces": np.array(self.forces),
+                "positions": np.array(self.positions),
+                "cells": np.array(self.cells),
+                "steps": self.get_steps(),
+                "temperatures": self.get_temperatures(),
+                "time": self.get_time(),
+                "fermi_level": self.get_fermi_level(),
+                "scf_dipole_moments": self.scf_dipole_moments,
+                "kin_energy_error": self.get_kinetic_energy_error(),
+                "stresses": np.array(self.stresses),
+                "irreducible_kpoints": self.get_irreducible_kpoints(),
+                "magnetization": self.magnetization,
+                "final_magmoms": self.get_final_magmoms(),
+                "broyden_mixing": self.get_broyden_mixing_mesh(),
+                "n_elect": self.n_elect}
+
+
+def _scan_outcar(filename="OUTCAR", lines=None, n_atoms=None):
     """
-    Find the lines where a specific trigger appears.
+    Parse an OUTCAR file or the lines read from it with the single pass parser.
 
     Args:
-        trigger (str): string pattern to search for
-        lines (list/None): list of lines
-        filename (str/None): file to read lines from
+        filename (str): Filename of the OUTCAR file to parse - only used if no lines are given
+        lines (list/None): lines read from the file
+        n_atoms (int/None): number of ions in OUTCAR - by default it is parsed from the file
 
     Returns:
-        list: indicies of the lines where the trigger string was found and list of lines
+        _OutcarScanner: parser with the parsed quantities
     """
-    lines = _get_lines_from_file(filename=filename, lines=lines)
-    trigger_indicies = [i for i, line in enumerate(lines) if trigger in line.strip()]
-    if return_lines:
-        return trigger_indicies, lines
+    scanner = _OutcarScanner()
+    scanner.n_atoms = n_atoms
+    if lines is None:
+        with open(filename, "r") as f:
+            scanner.feed_lines(f)
     else:
-        return trigger_indicies
+        scanner.feed_lines(lines)
+    return scanner
 
 
-def _get_lines_from_file(filename, lines=None):
+def _parse_stress_line(line, start):
     """
-    If lines is None read the lines from the file with the filename filename.
+    Parse the six stress components from a line of the stress block
 
     Args:
-        filename (str): file to read lines from
-        lines (list/ None): list of lines
+        line (str): line of the stress block
+        start (int): index of the first stress component in the split line
 
     Returns:
-        list: list of lines
+        list: six stress components - NaN if the line can not be parsed
     """
-    if lines is None:
-        with open(filename, 'r') as f:
-            lines = f.readlines()
-    return lines
+    try:
+        return [float(l) for l in line.split()[start:start + 6]]
+    except ValueError:
+        return [float('NaN')] * 6
+
+
+def _clean_line(line):
+    return line.replace("-", " -")
@@ -28,32 +28,136 @@ class Procar(object):
         self.dos_dict = OrderedDict()
 
     def from_file(self, filename):
+        """
+        Parse a PROCAR file. The layout of the k-point and band blocks is detected once per spin channel and the
+        projections of all bands are converted to a single (spin, kpoint, band, atom, orbital) array in one step.
+
+        Args:
+            filename (str): path of the PROCAR file
+
+        Returns:
+            pyiron.dft.waves.electronic.ElectronicStructure: electronic structure with the grand_dos_matrix
+        """
         with open(filename, "r") as f:
-            es_obj = ElectronicStructure()
-            lines = f.readlines()
-            details_trigger = "# of k-points:"
-            details_ready = False
-            kpoint_trigger = "k-point"
-            band_trigger = "band"
-            num_atoms = 0
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if details_trigger in line:
-                    num_kpts, num_bands, num_atoms = self._get_details(line)
-                    details_ready = True
-                if details_ready:
-                    if kpoint_trigger in line.split():
-                        kpt, weight = self._get_kpoint_details(line)
-                        es_obj.add_kpoint(value=kpt, weight=weight)
-
-                    if band_trigger in line.split():
-                        eigenvalue, occupancy = self._get_band_details(line)
-                        es_obj.kpoints[-1].add_band(eigenvalue=eigenvalue, occupancy=occupancy)
-                        band_obj = es_obj.kpoints[-1].bands[-1]
-                        band_obj.resolved_dos_matrix, band_obj.orbital_resolved_dos, band_obj.atom_resolved_dos = \
-                            self._get_dos_matrix(lines[i + 2: i + num_atoms + 4])
+            lines = np.array(f.read().splitlines(), dtype=object)
+        details_trigger = "# of k-points:"
+        start = self._find_line(lines, details_trigger)
+        if start is None:
+            raise ValueError("The file {} is not a PROCAR file".format(filename))
+        num_kpts, num_bands, num_atoms = self._get_details(lines[start])
+        kpoint_index_lst, band_index_lst = list(), list()
+        # In spin polarized calculations all k-point blocks are repeated for the second spin channel
+        while start is not None:
+            kpoint_index, band_index = self._get_block_indices(
+                lines=lines, start=start, num_kpts=num_kpts, num_bands=num_bands
+            )
+            kpoint_index_lst.append(kpoint_index)
+            band_index_lst.append(band_index)
+            start = self._find_line(lines, details_trigger, band_index[-1, -1])
+        band_index = np.array(band_index_lst)
+        header_index = self._find_line(lines, "ion", band_index[0, 0, 0])
+        if header_index is None:
+            raise ValueError("The PROCAR file {} does not contain projections".format(filename))
+        num_orbitals = len(lines[header_index].split()) - 2
+        header_index = band_index + header_index - band_index[0, 0, 0]
+        if not self._check_lines(lines, header_index.flatten(), "ion"):
+            header_index = np.array([self._find_line(lines, "ion", i) for i in band_index.flatten()])
+            header_index = header_index.reshape(band_index.shape)
+        row_index = header_index[..., np.newaxis] + 1 + np.arange(num_atoms)
+        values = np.fromstring("\n".join(lines[row_index.flatten()]), sep=" ")
+        if len(values) != row_index.size * (num_orbitals + 2):
+            raise ValueError("The projections in the PROCAR file {} could not be parsed".format(filename))
+        es_obj = ElectronicStructure()
+        # The first column is the atom index and the last column the sum over all orbitals
+        es_obj.grand_dos_matrix = values.reshape(band_index.shape + (num_atoms, num_orbitals + 2))[..., 1:-1].copy()
+        kpoint_details = [self._get_kpoint_details(line) for line in lines[kpoint_index_lst[0]]]
+        es_obj.kpoint_list = [kpt for kpt, _ in kpoint_details]
+        es_obj.kpoint_weights = [weight for _, weight in kpoint_details]
+        band_details = np.array([self._get_band_details(line) for line in lines[band_index.flatten()]])
+        es_obj.grand_eigenvalue_matrix = band_details[:, 0].reshape(band_index.shape)
+        es_obj.grand_occupancy_matrix = band_details[:, 1].reshape(band_index.shape)
+        es_obj.generate_from_matrices()
         return es_obj
 
+    @staticmethod
+    def _find_line(lines, trigger, start=0):
+        """
+        Find the index of the first line after start, which starts with the trigger.
+
+        Args:
+            lines (numpy.ndarray): lines of the file
+            trigger (str): first word of the line
+            start (int): index of the line to start the search from
+
+        Returns:
+            int/None: index of the line - None if no line was found
+        """
+        for i in range(start, len(lines)):
+            if lines[i].lstrip().startswith(trigger):
+                return i
+        return None
+
+    @staticmethod
+    def _check_lines(lines, index, trigger):
+        """
+        Check if all selected lines start with the trigger.
+
+        Args:
+            lines (numpy.ndarray): lines of the file
+            index (numpy.ndarray): indices of the lines to check
+            trigger (str): first word of the lines
+
+        Returns:
+            bool: True if all lines start with the trigger
+        """
+        if len(index) == 0 or np.max(index) >= len(lines):
+            return False
+        return all(line.lstrip().startswith(trigger) for line in lines[index])
+
+    def _get_block_indices(self, lines, start, num_kpts, num_bands):
+        """
+        Get the line indices of the k-point and band blocks of one spin channel. The layout is detected from the first
+        two k-points and only verified for the remaining blocks, if the layout is irregular all lines are scanned.
+
+        Args:
+            lines (numpy.ndarray): lines of the file
+            start (int): index of the "# of k-points:" line of the spin channel
+            num_kpts (int): number of k-points
+            num_bands (int): number of bands
+
+        Returns:
+            numpy.ndarray, numpy.ndarray: indices of the k-point lines (num_kpts) and of the band lines
+                                          (num_kpts x num_bands)
+        """
+        first_kpoint = self._find_line(lines, "k-point", start)
+        first_band = self._find_line(lines, "band", first_kpoint)
+        if first_kpoint is None or first_band is None:
+            raise ValueError("The PROCAR file does not contain any bands")
+        band_stride = 0
+        if num_bands > 1:
+            band_stride = self._find_line(lines, "band", first_band + 1) - first_band
+        kpoint_stride = 0
+        if num_kpts > 1:
+            kpoint_stride = self._find_line(
+                lines, "k-point", first_band + (num_bands - 1) * band_stride + 1
+            ) - first_kpoint
+        kpoint_index = first_kpoint + np.arange(num_kpts) * kpoint_stride
+        band_index = kpoint_index[:, np.newaxis] + first_band - first_kpoint + np.arange(num_bands) * band_stride
+        if self._check_lines(lines, kpoint_index, "k-point") and self._check_lines(lines, band_index.flatten(), "band"):
+            return kpoint_index, band_index
+        kpoint_lst, band_lst = [], []
+        for i in range(start, len(lines)):
+            line = lines[i].lstrip()
+            if line.startswith("k-point"):
+                if len(kpoint_lst) == num_kpts:
+                    break
+                kpoint_lst.append(i)
+            elif line.startswith("band"):
+                band_lst.append(i)
+        if len(kpoint_lst) != num_kpts or len(band_lst) != num_kpts * num_bands:
+            raise ValueError("The PROCAR file is incomplete")
+        return np.array(kpoint_lst), np.array(band_lst).reshape(num_kpts, num_bands)
+
     @staticmethod
     def _check_if_spin_polarized(line):
         pass
@@ -80,26 +184,3 @@ class Procar(object):
         eigval = float(lst[4])
         occ = float(lst[7])
         return eigval, occ
-
-    @staticmethod
-    def _get_dos_matrix(lines):
-        num_orbitals = len((lines[0].strip()).split()) - 2
-        num_atoms = len(lines) - 2
-        dos_matrix = np.zeros((num_atoms, num_orbitals))
-        orbital_resolved_dos = list()
-        atom_resolved_dos = list()
-        count = 0
-        for i, line in enumerate(lines):
-            line = line.strip()
-            lst = line.split()
-
-            if i not in [0, len(lines) - 1]:
-                dos_matrix[count, :] = np.array([float(val) for val in lst[1: len(lst) - 1]])
-                count += 1
-                atom_resolved_dos.append(float(lst[-1]))
-            if i == len(lines) - 1:
-                orbital_resolved_dos = [float(val) for val in lst[1: len(lst) - 1]]
-
-        atom_resolved_dos = np.array(atom_resolved_dos)
-        orbital_resolved_dos = np.array(orbital_resolved_dos)
-        return dos_matrix, orbital_resolved_dos, atom_resolved_dos
@@ -44,29 +44,83 @@ class Vasprun(object):
     def __init__(self):
         self.vasprun_dict = dict()
         self.root = None
+        self._skip_sections = set()
 
-    def from_file(self, filename="vasprun.xml"):
+    def from_file(self, filename="vasprun.xml", streaming=True, skip_sections=None):
         """
         Parsing vasprun.xml from the working directory
 
+        In the streaming mode the file is read with iterparse() and every top level element (for example an ionic step)
+        is parsed and discarded as soon as it is complete, so the full XML tree is never held in memory. The root
+        element is not stored in this mode.
+
         Args:
             filename (str): Path to the vasprun file
+            streaming (bool): Parse the file incrementally instead of building the full XML tree
+            skip_sections (list/None): Tags of the sections of an ionic step which are not parsed, for example
+                                       ["projected", "partial"] to skip the projected DOS or ["eigenvalues"]
         """
         if not (os.path.isfile(filename)):
             raise AssertionError()
+        self._skip_sections = set(skip_sections) if skip_sections is not None else set()
         try:
-            self.root = ETree.parse(filename).getroot()
+            if streaming:
+                self.root = None
+                self._parse_streaming(filename)
+            else:
+                self.root = ETree.parse(filename).getroot()
+                self.parse_root_to_dict()
         except ParseError:
             raise VasprunError("The vasprun.xml file is either corrupted or the simulation has failed")
 
-        self.parse_root_to_dict()
+    def _parse_streaming(self, filename):
+        """
+        Parses the vasprun.xml file element by element. Every child of the root element is parsed as soon as its end
+        tag is read and is removed from the tree afterwards. The content of skipped sections is removed while it is
+        read.
+
+        Args:
+            filename (str): Path to the vasprun file
+        """
+        d = self.vasprun_dict
+        self._init_dict(d)
+        stack = list()
+        skip_depth = None
+        for event, elem in ETree.iterparse(filename, events=("start", "end")):
+            if event == "start":
+                if skip_depth is None and elem.tag in self._skip_sections and len(stack) > 1 \
+                        and stack[1].tag == "calculation":
+                    skip_depth = len(stack)
+                stack.append(elem)
+            else:
+                stack.pop()
+                if skip_depth is not None and len(stack) >= skip_depth:
+                    stack[-1].remove(elem)
+                    if len(stack) == skip_depth:
+                        skip_depth = None
+                elif len(stack) == 1:
+                    self._parse_root_leaf(elem, d)
+                    stack[0].remove(elem)
+        self._finalize_dict(d)
 
     def parse_root_to_dict(self):
         """
         Parses from the main xml root.
         """
-        node = self.root
         d = self.vasprun_dict
+        self._init_dict(d)
+        for leaf in self.root:
+            self._parse_root_leaf(leaf, d)
+        self._finalize_dict(d)
+
+    @staticmethod
+    def _init_dict(d):
+        """
+        Initializes the lists which are filled for every ionic step
+
+        Args:
+            d (dict): The dictionary to which data is to be parsed
+        """
         d["scf_energies"] = list()
         d["scf_fr_energies"] = list()
         d["scf_0_energies"] = list()
@@ -78,28 +132,44 @@ class Vasprun(object):
         d["total_fr_energies"] = list()
         d["total_0_energies"] = list()
         d["stress_tensors"] = list()
-        for leaf in node:
-            if leaf.tag in ["generator", "incar"]:
-                d[leaf.tag] = dict()
-                for items in leaf:
-                    d[leaf.tag] = self.parse_item_to_dict(items, d[leaf.tag])
-            if leaf.tag in ["kpoints"]:
-                d[leaf.tag] = dict()
-                self.parse_kpoints_to_dict(leaf, d[leaf.tag])
-            if leaf.tag in ["atominfo"]:
-                d[leaf.tag] = dict()
-                self.parse_atom_information_to_dict(leaf, d[leaf.tag])
-            if leaf.tag in ["structure"] and leaf.attrib["name"] == "initialpos":
-                d["init_structure"] = dict()
-                self.parse_structure_to_dict(leaf, d["init_structure"])
-            if leaf.tag in ["structure"] and leaf.attrib["name"] == "finalpos":
-                d["final_structure"] = dict()
-                self.parse_structure_to_dict(leaf, d["final_structure"])
-            if leaf.tag in ["calculation"]:
-                self.parse_calc_to_dict(leaf, d)
-            if leaf.tag in ["parameters"]:
-                pass
-                self.parse_parameters(leaf, d)
+
+    def _parse_root_leaf(self, leaf, d):
+        """
+        Parses a child of the main xml root to a dictionary
+
+        Args:
+            leaf (xml.etree.Element instance): The node to parse
+            d (dict): The dictionary to which data is to be parsed
+        """
+        if leaf.tag in ["generator", "incar"]:
+            d[leaf.tag] = dict()
+            for items in leaf:
+                d[leaf.tag] = self.parse_item_to_dict(items, d[leaf.tag])
+        if leaf.tag in ["kpoints"]:
+            d[leaf.tag] = dict()
+            self.parse_kpoints_to_dict(leaf, d[leaf.tag])
+        if leaf.tag in ["atominfo"]:
+            d[leaf.tag] = dict()
+            self.parse_atom_information_to_dict(leaf, d[leaf.tag])
+        if leaf.tag in ["structure"] and leaf.attrib["name"] == "initialpos":
+            d["init_structure"] = dict()
+            self.parse_structure_to_dict(leaf, d["init_structure"])
+        if leaf.tag in ["structure"] and leaf.attrib["name"] == "finalpos":
+            d["final_structure"] = dict()
+            self.parse_structure_to_dict(leaf, d["final_structure"])
+        if leaf.tag in ["calculation"]:
+            self.parse_calc_to_dict(leaf, d)
+        if leaf.tag in ["parameters"]:
+            self.parse_parameters(leaf, d)
+
+    @staticmethod
+    def _finalize_dict(d):
+        """
+        Converts the per ionic step lists to arrays
+
+        Args:
+            d (dict): The dictionary to which data was parsed
+        """
         d["cells"] = np.array(d["cells"])
         d["positions"] = np.array(d["positions"])
         # Check if the parsed coordinates are in absolute/relative coordinates. If absolute, convert to relative
@@ -112,11 +182,6 @@ class Vasprun(object):
         d["total_energies"] = np.array(d["total_energies"])
         d["total_fr_energies"] = np.array(d["total_fr_energies"])
         d["total_0_energies"] = np.array(d["total_0_energies"])
-        d["scf_energies"] = d["scf_energies"]
-        d["scf_dipole_moments"] = d["scf_dipole_moments"]
-        d["scf_fr_energies"] = d["scf_fr_energies"]
-        d["scf_0_energies"] = d["scf_0_energies"]
-        d["stress_tensors"] = d["stress_tensors"]
 
     def parse_kpoints_to_dict(self, node, d):
         """
@@ -182,14 +247,16 @@ class Vasprun(object):
                         if item.tag == "set":
                             for sp in item:
                                 elements = sp
-                                if elements[1].text in species_dict.keys():
+                                species_name_lst = [key if isinstance(key, str) else key.Abbreviation
+                                                    for key in species_dict.keys()]
+                                if elements[1].text in species_name_lst:
                                     pse = PeriodicTable()
                                     count = 1
                                     not_unique = True
                                     species_key = None
                                     while not_unique:
                                         species_key = "_".join([elements[1].text, str(count)])
-                                        if species_key not in species_dict.keys():
+                                        if species_key not in species_name_lst:
                                             not_unique = False
                                         else:
                                             count += 1
@@ -287,15 +354,9 @@ class Vasprun(object):
                                         values = self._parse_2d_matrix(sp, vec_type=float)
                                         spin_resolved_dos.append(values[:, 1:])
                             atom_resolved_dos.append(spin_resolved_dos)
-                        atom_resolved_dos = np.array(atom_resolved_dos)
-                        n_atoms, n_spin, n_densities, n_orbitals = np.shape(atom_resolved_dos)
-                        new_grand_dos_matrix = np.zeros((n_spin, n_atoms, n_orbitals, n_densities))
-                        for i_spin in range(n_spin):
-                            for i_atom in range(n_atoms):
-                                for i_orbitals in range(n_orbitals):
-                                    new_grand_dos_matrix[i_spin, i_atom, i_orbitals, :] = \
-                                        atom_resolved_dos[i_atom, i_spin, :, i_orbitals]
-                        d["resolved_dos_matrix"] = new_grand_dos_matrix
+                        atom_resolved_dos = np.array(atom_resolved_dos, dtype=float)
+                        # (n_atoms, n_spin, n_densities, n_orbitals) -> (n_spin, n_atoms, n_orbitals, n_densities)
+                        d["resolved_dos_matrix"] = np.ascontiguousarray(atom_resolved_dos.transpose(1, 0, 3, 2))
 
     def parse_projected_dos_to_dict(self, node, d):
         """
@@ -316,19 +377,8 @@ class Vasprun(object):
                         orbital_dict[ii.text] = orbital_index
                         orbital_index += 1
                     if ii.tag == "set":
-                        spin_dos_mat = list()
-                        for sp in ii:
-                            if sp.tag == "set" and "spin" in sp.attrib["comment"]:
-                                kpt_dos_mat = list()
-                                for kpt in sp:
-                                    band_dos_mat = list()
-                                    for band in kpt:
-                                        dos_matrix = self._parse_2d_matrix(band, vec_type=float)
-                                        band_dos_mat.append(dos_matrix)
-                                    kpt_dos_mat.append(band_dos_mat)
-                                spin_dos_mat.append(kpt_dos_mat)
-                        grand_dos_matrix = np.array(spin_dos_mat)
-                        d["grand_dos_matrix"] = grand_dos_matrix
+                        spin_sets = [sp for sp in ii if sp.tag == "set" and "spin" in sp.attrib["comment"]]
+                        d["grand_dos_matrix"] = self._parse_sets_to_array(spin_sets, n_levels=2, vec_type=float)
                         d["orbital_dict"] = orbital_dict
 
     def parse_scf(self, node):
@@ -372,6 +422,8 @@ class Vasprun(object):
         scf_0_energies = list()
         scf_moments = list()
         for item in node:
+            if item.tag in self._skip_sections:
+                continue
             if item.tag in ["scstep"]:
                 scf_dict = self.parse_scf(item)
                 scf_energies.append(scf_dict["scf_energy"])
@@ -405,6 +457,8 @@ class Vasprun(object):
                 self.parse_fermi_level_to_dict(item, d)
                 d["efermi"] = float(d["efermi"])
                 for i in item:
+                    if i.tag in self._skip_sections:
+                        continue
                     if i.tag == "total":
                         try:
                             self.parse_total_dos_to_dict(i, d)
@@ -440,22 +494,14 @@ class Vasprun(object):
             if item.tag == "array":
                 for ii in item:
                     if ii.tag == "set":
-                        spin_occ_mat = list()
-                        spin_eig_mat = list()
-                        for sp in ii:
-                            if sp.tag == "set" and "spin" in sp.attrib["comment"]:
-                                kpt_eig_mat = list()
-                                kpt_occ_mat = list()
-                                for kpt in sp:
-                                    values = self._parse_2d_matrix(kpt, vec_type=float)
-                                    eig_vec = values[:, 0].flatten()
-                                    occ_vec = values[:, 1].flatten()
-                                    kpt_eig_mat.append(eig_vec)
-                                    kpt_occ_mat.append(occ_vec)
-                                spin_eig_mat.append(kpt_eig_mat)
-                                spin_occ_mat.append(kpt_occ_mat)
-                        grand_eigenvalue_matrix = np.array(spin_eig_mat)
-                        grand_occupancy_matrix = np.array(spin_occ_mat)
+                        spin_sets = [sp for sp in ii if sp.tag == "set" and "spin" in sp.attrib["comment"]]
+                        values = self._parse_sets_to_array(spin_sets, n_levels=1, vec_type=float)
+                        if len(spin_sets) > 0:
+                            grand_eigenvalue_matrix = np.ascontiguousarray(values[..., 0])
+                            grand_occupancy_matrix = np.ascontiguousarray(values[..., 1])
+                        else:
+                            grand_eigenvalue_matrix = values
+                            grand_occupancy_matrix = values
         d["grand_eigenvalue_matrix"] = grand_eigenvalue_matrix
         d["grand_occupancy_matrix"] = grand_occupancy_matrix
 
@@ -556,11 +602,46 @@ class Vasprun(object):
         Returns:
             numpy.ndarray: The required 2D array/vector
         """
+        if vec_type in [float, int] and len(node) > 0 \
+                and all(item.text is not None and item.attrib.get("type") != "logical" for item in node):
+            n_columns = len(node[0].text.split())
+            arr = np.fromstring(" ".join([item.text for item in node]), dtype=vec_type, sep=" ")
+            if len(arr) == len(node) * n_columns:
+                return arr.reshape(len(node), n_columns)
         arr = list()
         for item in node:
             arr.append(self._parse_vector(item, vec_type=vec_type))
         return np.array(arr)
 
+    def _parse_sets_to_array(self, sets, n_levels, vec_type=float):
+        """
+        Parses a list of equally shaped nested sets into a single preallocated array
+
+        Args:
+            sets (list): The outermost set nodes (xml.etree.Element instances)
+            n_levels (int): Number of nested set levels inside the outermost sets, the nodes at the innermost level are
+                            parsed as 2D matrices
+            vec_type (type): The type of the vector to be parsed
+
+        Returns:
+            numpy.ndarray: Array with the shape (len(sets), ..., n_rows, n_columns)
+        """
+        if len(sets) == 0:
+            return np.array([])
+        shape = [len(sets)]
+        node = sets[0]
+        for _ in range(n_levels):
+            shape.append(len(node))
+            node = node[0]
+        first_matrix = self._parse_2d_matrix(node, vec_type=vec_type)
+        arr = np.empty(shape + list(first_matrix.shape), dtype=first_matrix.dtype)
+        for index in np.ndindex(*shape):
+            node = sets[index[0]]
+            for i in index[1:]:
+                node = node[i]
+            arr[index] = self._parse_2d_matrix(node, vec_type=vec_type)
+        return arr
+
     @staticmethod
     def _parse_vector(node, vec_type=float):
         """
@@ -641,8 +722,8 @@ class Vasprun(object):
         es_obj = ElectronicStructure()
         es_obj.kpoint_list = self.vasprun_dict["kpoints"]["kpoint_list"]
         es_obj.kpoint_weights = self.vasprun_dict["kpoints"]["kpoint_weights"]
-        es_obj.eigenvalue_matrix = self.vasprun_dict["grand_eigenvalue_matrix"][0, :, :]
-        es_obj.occupancy_matrix = self.vasprun_dict["grand_occupancy_matrix"][0, :, :]
+        es_obj.grand_eigenvalue_matrix = self.vasprun_dict["grand_eigenvalue_matrix"]
+        es_obj.grand_occupancy_matrix = self.vasprun_dict["grand_occupancy_matrix"]
         if "grand_dos_matrix" in self.vasprun_dict.keys():
             es_obj.grand_dos_matrix = self.vasprun_dict["grand_dos_matrix"]
         if "efermi" in self.vasprun_dict.keys():
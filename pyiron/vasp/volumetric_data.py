@@ -2,6 +2,7 @@
 # Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
+from itertools import islice
 import math
 
 import numpy as np
@@ -35,22 +36,26 @@ class VaspVolumetricData(VolumetricData):
         self._diff_data = None
         self._total_data = None
 
-    def from_file(self, filename, normalize=True):
+    def from_file(self, filename, normalize=True, dtype=np.float64):
         """
         Parsing the contents of from a file
 
         Args:
             filename (str): Path of file to parse
             normalize (boolean): Flag to normalize by the volume of the cell
+            dtype (type): Data type of the volumetric data, use numpy.float32 to halve the memory
         """
         try:
-            self.atoms, vol_data_list = self._read_vol_data(filename=filename, normalize=normalize)
+            self.atoms, vol_data_list = self._read_vol_data(filename=filename, normalize=normalize, dtype=dtype)
         except (ValueError, IndexError, TypeError):
             try:
                 self.atoms, vol_data_list = self._read_vol_data_old(filename=filename, normalize=normalize)
             except (ValueError, IndexError, TypeError):
                 raise ValueError("Unable to parse file: {}".format(filename))
+            if vol_data_list is not None:
+                vol_data_list = [data.astype(dtype, copy=False) for data in vol_data_list]
         if self.atoms is not None:
+            self._hdf_nodes = list()
             self._total_data = vol_data_list[0]
             if len(vol_data_list) > 1:
                 self._diff_data = vol_data_list[1]
@@ -139,14 +144,16 @@ class VaspVolumetricData(VolumetricData):
                 data = {"total": all_dataset[0] / volume}
                 return atoms, [data["total"]]
 
-    def _read_vol_data(self, filename, normalize=True):
+    def _read_vol_data(self, filename, normalize=True, dtype=np.float64):
         """
         Parses the VASP volumetric type files (CHGCAR, LOCPOT, PARCHG etc). Rather than looping over individual values,
-        this function utilizes numpy indexing resulting in a parsing efficiency of at least 10%.
+        the grid is parsed in blocks of lines directly into a preallocated array, which is returned in Fortran order
+        as VASP writes x as the fastest index.
 
         Args:
             filename (str): File to be parsed
             normalize (bool): Normalize the data with respect to the volume (Recommended for CHGCAR files)
+            dtype (type): Data type of the volumetric data
 
         Returns:
             pyiron.atomistics.structure.atoms.Atoms: The structure of the volumetric snapshot
@@ -160,11 +167,8 @@ class VaspVolumetricData(VolumetricData):
         with open(filename, "r") as f:
             struct_lines = list()
             get_grid = False
-            n_x = 0
-            n_y = 0
-            n_z = 0
-            n_grid = 0
-            n_grid_str = None
+            grid = None
+            grid_str = None
             total_data_list = list()
             atoms = None
             for line in f:
@@ -173,16 +177,10 @@ class VaspVolumetricData(VolumetricData):
                     if strip_line == "":
                         get_grid = True
                     struct_lines.append(strip_line)
-                elif n_grid_str is None:
-                    n_x, n_y, n_z = [int(val) for val in strip_line.split()]
-                    n_grid = n_x * n_y * n_z
-                    n_grid_str = " ".join([str(val) for val in [n_x, n_y, n_z]])
-                    load_txt = np.genfromtxt(f, max_rows=int(n_grid / 5))
-                    load_txt = np.hstack(load_txt)
-                    if n_grid % 5 != 0:
-                        add_line = np.genfromtxt(f, max_rows=1)
-                        load_txt = np.append(load_txt, np.hstack(add_line))
-                    total_data = self._fastest_index_reshape(load_txt, [n_x, n_y, n_z])
+                elif grid_str is None:
+                    grid = [int(val) for val in strip_line.split()]
+                    grid_str = strip_line.replace(" ", "")
+                    total_data = self._read_grid(f, grid, dtype=dtype)
                     try:
                         atoms = atoms_from_string(struct_lines)
                     except ValueError:
@@ -195,14 +193,8 @@ class VaspVolumetricData(VolumetricData):
                         total_data /= atoms.get_volume()
                     total_data_list.append(total_data)
                 elif atoms is not None:
-                    grid_str = n_grid_str.replace(" ", "")
                     if grid_str == strip_line.replace(" ", ""):
-                        load_txt = np.genfromtxt(f, max_rows=int(n_grid / 5))
-                        load_txt = np.hstack(load_txt)
-                        if n_grid % 5 != 0:
-                            add_line = np.genfromtxt(f, max_rows=1)
-                            load_txt = np.hstack(np.append(load_txt, np.hstack(add_line)))
-                        total_data = self._fastest_index_reshape(load_txt, [n_x, n_y, n_z])
+                        total_data = self._read_grid(f, grid, dtype=dtype)
                         if normalize:
                             total_data /= atoms.get_volume()
                         total_data_list.append(total_data)
@@ -212,10 +204,48 @@ class VaspVolumetricData(VolumetricData):
                 return None, None
             return atoms, total_data_list
 
+    @staticmethod
+    def _read_grid(f, grid, dtype=np.float64, max_lines=100000):
+        """
+        Helper function to parse the volumetric data following the grid line. The lines are read in blocks and parsed
+        into a preallocated array, only the lines belonging to the grid are read from the file.
+
+        Args:
+            f (file): File object positioned after the grid line
+            grid (list/turple/numpy.ndarray): Sequence of the integer grid points [Nx, Ny, Nz]
+            dtype (type): Data type of the volumetric data
+            max_lines (int): Maximum number of lines parsed at once
+
+        Returns:
+            numpy.ndarray: A Nx $\times$ Ny $\times$ Nz numpy array in Fortran order
+
+        """
+        n_grid = int(np.prod(grid))
+        raw_data = np.empty(n_grid, dtype=dtype)
+        n_read = 0
+        values_per_line = None
+        while n_read < n_grid:
+            if values_per_line is None:
+                n_lines = 1
+            else:
+                n_lines = min(max_lines, -(-(n_grid - n_read) // values_per_line))
+            values = np.fromstring("".join(islice(f, n_lines)), sep=" ")
+            if values_per_line is None:
+                values_per_line = len(values)
+                n_expected = min(values_per_line, n_grid)
+            else:
+                n_expected = min(n_lines * values_per_line, n_grid - n_read)
+            if n_expected == 0 or len(values) != n_expected:
+                raise ValueError("The volumetric data could not be parsed.")
+            raw_data[n_read:n_read + n_expected] = values
+            n_read += n_expected
+        return VaspVolumetricData._fastest_index_reshape(raw_data, grid)
+
     @staticmethod
     def _fastest_index_reshape(raw_data, grid):
         """
-        Helper function to parse volumetric data with x-axis as the fastest index into a 3D numpy array
+        Helper function to parse volumetric data with x-axis as the fastest index into a 3D numpy array - the data is
+        not copied, the array is returned in Fortran order.
 
         Args:
             raw_data (numpy.ndarray): Raw unprocessed volumetric data which is flattened
@@ -226,57 +256,55 @@ class VaspVolumetricData(VolumetricData):
 
         """
         n_x, n_y, n_z = grid
-        total_data = np.zeros((n_x, n_y, n_z))
-        all_data = raw_data[0:np.prod(grid)]
-        all_indices = np.arange(len(all_data), dtype=int)
-        x_indices = all_indices % n_x
-        y_indices = all_indices / n_x % n_y
-        y_indices = np.array(y_indices, dtype=int)
-        z_indices = all_indices / (n_x * n_y)
-        z_indices = np.array(z_indices, dtype=int)
-        total_data[x_indices, y_indices, z_indices] = all_data
-        return total_data
+        return np.reshape(raw_data[0:n_x * n_y * n_z], (n_z, n_y, n_x)).T
 
     @property
     def total_data(self):
         """
         numpy.ndarray: Total volumtric data (3D)
         """
+        if self._total_data is None:
+            self._total_data = self._read_from_hdf("total")
         return self._total_data
 
     @total_data.setter
     def total_data(self, val):
         self._total_data = val
+        self._forget_hdf("total")
 
     @property
     def diff_data(self):
         """
         numpy.ndarray: Volumtric difference data (3D)
         """
+        if self._diff_data is None:
+            self._diff_data = self._read_from_hdf("diff")
         return self._diff_data
 
     @diff_data.setter
     def diff_data(self, val):
         self._diff_data = val
+        self._forget_hdf("diff")
 
-    def to_hdf(self, hdf5, group_name="volumetric_data"):
+    def to_hdf(self, hdf5, group_name="volumetric_data", compression="gzip"):
         """
-        Writes the data as a group to a HDF5 file
+        Writes the data as a group to a HDF5 file - the grids are stored as chunked datasets
 
         Args:
             hdf5 (pyiron.base.generic.hdfio.ProjectHDFio): The HDF file/path to write the data to
             group_name (str): The name of the group under which the data must be stored as
+            compression (str/None): compression filter of the datasets, e.g. 'gzip' or 'lzf'
 
         """
         with hdf5.open(group_name) as hdf_vd:
             hdf_vd["TYPE"] = str(type(self))
-            hdf_vd["total"] = self.total_data
+            hdf_vd.put_array("total", np.asarray(self.total_data), compression=compression)
             if self.diff_data is not None:
-                hdf_vd["diff"] = self.diff_data
+                hdf_vd.put_array("diff", np.asarray(self.diff_data), compression=compression)
 
     def from_hdf(self, hdf5, group_name="volumetric_data"):
         """
-        Recreating the VolumetricData instance by reading data from the HDF5 files
+        Recreating the VolumetricData instance from the HDF5 files - the data is read when it is accessed
 
         Args:
             hdf5 (pyiron.base.generic.hdfio.ProjectHDFio): The HDF file/path to write the data to
@@ -287,6 +315,7 @@ class VaspVolumetricData(VolumetricData):
 
         """
         with hdf5.open(group_name) as hdf_vd:
-            self._total_data = hdf_vd["total"]
-            if "diff" in hdf_vd.list_nodes():
-                self._diff_data = hdf_vd["diff"]
+            self._hdf_group = hdf_vd.copy()
+            self._hdf_nodes = [node for node in ["total", "diff"] if node in hdf_vd.list_nodes()]
+            self._total_data = None
+            self._diff_data = None
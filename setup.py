@@ -34,7 +34,7 @@ setup(
                       'dill',
                       'future',
                       'h5io>=0.1.1',
-                      'h5py',
+                      'h5py>=2.9',
                       'matplotlib',
                       'numpy',
                       'pandas',
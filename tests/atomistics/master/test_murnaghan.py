@@ -1,6 +1,8 @@
+import numpy as np
 import os
 import unittest
 from pyiron.atomistics.structure.atoms import CrystalStructure
+from pyiron.base.job.jobstatus import JobStatus
 from pyiron.base.project.generic import Project
 
 
@@ -48,6 +50,86 @@ class TestMurnaghan(unittest.TestCase):
         murn.remove()
         job_ser.remove()
 
+    def test_gather(self):
+        murn = self.project.create_job("Murnaghan", "murnaghan_gather")
+        murn.save()
+        forces = np.random.random((3, 4, 2, 3))
+        for i, f in enumerate(forces):
+            job = self.project.create_job(self.project.job_type.ScriptJob, "gather_child_" + str(i))
+            job.master_id = murn.job_id
+            job.save()
+            with job.project_hdf5.open("output/generic") as h5:
+                h5["forces"] = f
+                h5["volume"] = np.arange(4.) + i
+                h5["steps"] = [0, 1, 2, i]
+        self.assertTrue(np.array_equal(murn.gather("output/generic/forces"), forces[:, -1]))
+        forces_all, volume = murn.gather(["output/generic/forces", "output/generic/volume"], index=None, workers=2)
+        self.assertTrue(np.array_equal(forces_all, forces))
+        self.assertTrue(np.array_equal(volume[:, 0], np.arange(3)))
+        self.assertTrue(np.array_equal(murn.gather("output/generic/forces", index=(0, 1), workers=2),
+                                       forces[:, 0, 1]))
+        self.assertTrue(np.array_equal(murn.gather("output/generic/steps"), [0, 1, 2]))
+        steps, id_lst = murn.gather("output/generic/steps", return_ids=True)
+        self.assertTrue(np.array_equal(steps, [0, 1, 2]))
+        self.assertEqual(list(id_lst), murn.child_ids)
+        self.assertEqual(murn._get_gather_workers(), 1)
+        murn.input["gather_workers"] = 2
+        self.assertEqual(murn._get_gather_workers(), 2)
+        murn.remove()
+
+    def test_save_child_jobs(self):
+        murn = self.project.create_job("Murnaghan", "murnaghan_save_children")
+        murn.save()
+        job_lst = []
+        for i in range(3):
+            job = self.project.create_job(self.project.job_type.AtomisticExampleJob, "save_child_" + str(i))
+            job.structure = self.basis
+            job.master_id = murn.job_id
+            job_lst.append(job)
+        job_lst[2].save()
+        job_lst.append(self.project.create_job(self.project.job_type.AtomisticExampleJob, "save_child_2"))
+        job_lst[3].structure = self.basis
+        JobStatus.query_count.clear()
+        murn._save_child_jobs(job_lst)
+        self.assertEqual(JobStatus.query_count['read'], 0)
+        self.assertEqual(JobStatus.query_count['write'], 1)
+        self.assertEqual([job.status.string for job in job_lst], ['created', 'created', 'initialized', 'initialized'])
+        self.assertEqual(len(self.project.db.get_items_dict({'job': 'save_child_2'})), 1)
+        for job in job_lst[:2]:
+            self.assertEqual(self.project.db.get_item_by_id(job.job_id)['status'], 'created')
+            self.assertEqual(self.project.db.get_item_by_id(job.job_id)['job'], job.job_name)
+            self.assertTrue(os.path.exists(job.project_hdf5.file_name))
+        murn.remove()
+
+    def test_reuse_statistics(self):
+        murn = self.project.create_job("Murnaghan", "murnaghan_reuse")
+        murn.save()
+        job_lst = []
+        for i in range(3):
+            job = self.project.create_job(self.project.job_type.ScriptJob, "reuse_child_" + str(i))
+            job.master_id = murn.job_id
+            job.save()
+            job_lst.append(job)
+        self.assertEqual(murn.get_reuse_statistics(), {'hits': 0, 'misses': 0})
+        self.project.db.add_input_hash(job_lst[0].job_id, "hash_0")
+        self.project.db.add_input_hash(job_lst[1].job_id, "hash_0", source_id=job_lst[0].job_id)
+        self.project.db.add_input_hash(job_lst[2].job_id, "hash_2")
+        self.assertEqual(murn.get_reuse_statistics(), {'hits': 1, 'misses': 2})
+        murn.remove()
+
+    def test_input_hash(self):
+        job_lst = []
+        for i, noise in enumerate([0.0, 1e-12, 0.1]):
+            job = self.project.create_job(self.project.job_type.AtomisticExampleJob, "job_hash_" + str(i))
+            job.structure = self.basis.copy()
+            job.structure.positions[0, 0] += noise
+            job.save()
+            job_lst.append(job)
+        self.assertEqual(job_lst[0].get_input_hash(), job_lst[1].get_input_hash())
+        self.assertNotEqual(job_lst[0].get_input_hash(), job_lst[2].get_input_hash())
+        for job in job_lst:
+            job.remove()
+
 
 if __name__ == '__main__':
     unittest.main()
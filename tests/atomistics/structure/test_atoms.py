@@ -512,6 +512,24 @@ class TestAtoms(unittest.TestCase):
         # print nbr_dict.distances
         # print [set(s) for s in nbr_dict.shells]
 
+    def test_get_neighbors_periodic(self):
+        basis = CrystalStructure('Fe', bravais_basis='bcc', lattice_constants=[2.83]).repeat([3, 3, 3])
+        neigh = basis.get_neighbors(num_neighbors=14)
+        self.assertEqual(neigh.distances.shape, (len(basis), 14))
+        self.assertEqual(neigh.vecs.shape, (len(basis), 14, 3))
+        self.assertTrue(np.allclose(np.linalg.norm(neigh.vecs, axis=-1), neigh.distances))
+        self.assertTrue(np.array_equal(neigh.shells[0], 8 * [1] + 6 * [2]))
+        self.assertTrue(np.allclose(neigh.distances[:, :8], 2.83 * np.sqrt(3) / 2))
+        neigh_cutoff = basis.get_neighbors(cutoff_radius=2.6, num_neighbors=20)
+        self.assertEqual(neigh_cutoff.indices.shape, (len(basis), 8))
+        self.assertTrue(np.array_equal(np.sort(neigh_cutoff.indices, axis=1), np.sort(neigh.indices[:, :8], axis=1)))
+        neigh_id = basis.get_neighbors(num_neighbors=14, id_list=[3, 4])
+        self.assertTrue(np.allclose(neigh_id.distances, neigh.distances[[3, 4]]))
+        basis.positions[0] += [0.1, 0, 0]
+        neigh_cutoff = basis.get_neighbors(cutoff_radius=2.6, num_neighbors=20)
+        self.assertEqual(len(neigh_cutoff.indices[0]), 8)
+        self.assertTrue(all([len(ind) in [7, 8] for ind in neigh_cutoff.indices]))
+
     def test_center_coordinates(self):
         cell = 2.2 * np.identity(3)
         NaCl = Atoms('NaCl', scaled_positions=[(0, 0, 0), (0.5, 0.5, 0.5)], cell=cell)
@@ -1,5 +1,6 @@
 import unittest
 import os
+from copy import copy, deepcopy
 from pyiron.atomistics.structure.atoms import CrystalStructure
 from pyiron.atomistics.structure.periodic_table import PeriodicTable
 from pyiron.base.project.generic import Project
@@ -136,6 +137,39 @@ class TestPeriodicTable(unittest.TestCase):
         self.assertTrue(o_1 <= o_2)
         self.assertTrue(o_1 >= o_2)
 
+    def test_shared_periodic_table(self):
+        pse_1 = PeriodicTable()
+        pse_2 = PeriodicTable()
+        self.assertIs(pse_1._dataframe, pse_2._dataframe)
+        self.assertEqual(pse_1["Fe"].AtomicNumber, 26)
+        self.assertEqual(pse_1.AtomicNumber["Fe"], 26)
+        pse_1.element("Fe").MeltingPoint = 1900
+        self.assertIs(pse_1._dataframe, pse_2._dataframe)
+        self.assertEqual(int(pse_2.element("Fe").MeltingPoint), 1811)
+        pse_1.add_element("Fe", "Fe_shared", spin="up")
+        self.assertIsNot(pse_1._dataframe, pse_2._dataframe)
+        self.assertTrue(pse_1.is_element("Fe_shared"))
+        self.assertFalse(pse_2.is_element("Fe_shared"))
+        self.assertFalse(PeriodicTable().is_element("Fe_shared"))
+        fe = pse_2.element("Fe")
+        fe.add_tags({'spin': 'down'})
+        self.assertEqual(PeriodicTable().element("Fe").tags, {})
+
+    def test_hash(self):
+        pse = PeriodicTable()
+        pse.add_element("O", "O_up", spin="up")
+        o_1 = pse.element("O")
+        o_2 = PeriodicTable().element("O")
+        self.assertEqual(hash(o_1), hash(o_2))
+        self.assertEqual(len({o_1, o_2, pse.element("O_up"), pse.element("H")}), 3)
+
+    def test_copy_element(self):
+        o_1 = self.pse.element("O")
+        self.assertEqual(copy(o_1), o_1)
+        self.assertEqual(deepcopy(o_1), o_1)
+        self.assertEqual(deepcopy(o_1).AtomicNumber, 8)
+        self.assertIsNone(o_1.NotAProperty)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -8,10 +8,16 @@ Murat Han Celik
 """
 import unittest
 import os
+import time
 from datetime import datetime
 from random import choice
 from string import ascii_uppercase
+from sqlalchemy import inspect
+from sqlalchemy.exc import OperationalError
 from pyiron.base.settings.generic import DatabaseAccess
+from pyiron.base.database.generic import INDEXED_COLUMNS, REGEXP_CACHE_SIZE, AutorestoredConnection, \
+    ConnectionStatistics, _compile_regexp, _regexp_cache
+from pyiron.base.database.jobtable import set_job_status
 
 
 class TestDatabaseAccess(unittest.TestCase):
@@ -111,6 +117,16 @@ class TestDatabaseAccess(unittest.TestCase):
         # Murat: 'Just ignore the line!'
         self.assertEqual([], self.database.get_items_sql(r"chemicalformula like 'B\d[a-z]'"))
 
+    def test_regexp_cache_size(self):
+        """
+        Tests that the cache of compiled LIKE patterns does not grow beyond REGEXP_CACHE_SIZE
+        Returns:
+        """
+        for i in range(REGEXP_CACHE_SIZE + 10):
+            self.assertTrue(_compile_regexp('H' + str(i) + '%').match('H' + str(i) + 'Ni'))
+        self.assertLessEqual(len(_regexp_cache), REGEXP_CACHE_SIZE)
+        self.assertIs(_compile_regexp('H5%'), _compile_regexp('H5%'))
+
     def test_add_item_dict(self):
         """
         Tests add_item_dict function
@@ -152,6 +168,89 @@ class TestDatabaseAccess(unittest.TestCase):
         self.assertRaises(Exception, self.database.delete_item, [key])  # use only str or int
         # self.assertRaises(Exception, self.database.get_item_by_id, key)  # ensure item does not exist anymore
 
+    def test_bulk_items(self):
+        """
+        Tests add_items, update_items and delete_items
+        Returns:
+        """
+        par_dict = self.add_items('BO')
+        del par_dict['id']
+        id_lst = self.database.add_items([dict(par_dict, job='bulk_' + str(i)) for i in range(5)])
+        self.assertEqual(5, len(id_lst))
+        self.assertEqual(['bulk_' + str(i) for i in range(5)],
+                         [self.database.get_item_by_id(item_id)['job'] for item_id in id_lst])
+        self.database.update_items({'status': 'finished'}, id_lst[:3])
+        self.assertEqual(['finished'] * 3 + ['KAAAA'] * 2,
+                         [self.database.get_item_by_id(item_id)['status'] for item_id in id_lst])
+        self.database.update_items([{'status': 'aborted'}, {'status': 'running', 'job': 'renamed'}], id_lst[3:])
+        self.assertEqual('aborted', self.database.get_item_by_id(id_lst[3])['status'])
+        self.assertEqual('running', self.database.get_item_by_id(id_lst[4])['status'])
+        self.assertEqual('renamed', self.database.get_item_by_id(id_lst[4])['job'])
+        self.assertRaises(ValueError, self.database.update_items, [{'status': 'aborted'}], id_lst)
+        set_job_status(database=self.database, sql_query=None, user=None, project_path='database.testing/',
+                       job_specifier=id_lst[:2], status='collect')
+        self.assertEqual(['collect', 'collect', 'finished'],
+                         [self.database.get_item_by_id(item_id)['status'] for item_id in id_lst[:3]])
+        mixed_lst = [dict(par_dict, job='bulk_mixed', subjob='/b'), dict(par_dict, job='bulk_mixed', subjob='/a'),
+                     dict(par_dict, job='bulk_mixed', subjob='/c', masterid=id_lst[0])]
+        mixed_id_lst = self.database.add_items(mixed_lst)
+        self.assertEqual(['/b', '/a', '/c'],
+                         [self.database.get_item_by_id(item_id)['subjob'] for item_id in mixed_id_lst])
+        self.assertEqual(id_lst[0], self.database.get_item_by_id(mixed_id_lst[2])['masterid'])
+        self.database.delete_items(mixed_id_lst)
+        self.database.delete_items(id_lst[1:])
+        self.assertEqual([id_lst[0]], [item['id'] for item in self.database.get_items_dict({'job': 'bulk_%'})])
+
+    def test_child_items(self):
+        """
+        Tests get_items_by_ids, get_child_items and get_child_status_count
+        Returns:
+        """
+        par_dict = self.add_items('BO')
+        master_id = par_dict['id']
+        del par_dict['id']
+        id_lst = self.database.add_items([dict(par_dict, job='child_' + str(i), masterid=master_id,
+                                               status='finished' if i < 3 else 'running') for i in range(5)])
+        child_items = self.database.get_child_items(master_id, columns=['job'])
+        self.assertEqual(id_lst, [item['id'] for item in child_items])
+        self.assertEqual(['child_' + str(i) for i in range(5)], [item['job'] for item in child_items])
+        self.assertEqual({'finished': 3, 'running': 2}, self.database.get_child_status_count(master_id))
+        items = self.database.get_items_by_ids([id_lst[4], id_lst[1], 10 ** 9])
+        self.assertEqual(['child_4', 'child_1'], [item['job'] for item in items])
+        self.assertEqual(self.database.get_item_by_id(id_lst[4]), items[0])
+        self.assertRaises(ValueError, self.database.get_child_items, master_id, ['no_column'])
+        self.database.delete_items(id_lst)
+        self.assertEqual({}, self.database.get_child_status_count(master_id))
+
+    def test_input_hash(self):
+        """
+        Tests add_input_hash, get_job_id_by_input_hash and get_input_hash_items
+        Returns:
+        """
+        # the table is created when the database is opened, so deleting items does not inspect the database
+        self.assertIsNotNone(self.database._input_hash_table)
+        par_dict = self.add_items('BO')
+        del par_dict['id']
+        id_lst = self.database.add_items([dict(par_dict, job='hash_' + str(i), status='finished' if i < 2 else 'running')
+                                          for i in range(4)])
+        self.assertIsNone(self.database.get_job_id_by_input_hash('a'))
+        self.assertEqual({}, self.database.get_input_hash_items(id_lst))
+        for item_id in id_lst:
+            self.database.add_input_hash(item_id, 'a' if item_id != id_lst[1] else 'b')
+        self.database.add_input_hash(id_lst[3], 'a', source_id=id_lst[0])
+        self.assertEqual(id_lst[0], self.database.get_job_id_by_input_hash('a'))
+        self.assertIsNone(self.database.get_job_id_by_input_hash('a', exclude_id=id_lst[0]))
+        self.assertEqual(id_lst[1], self.database.get_job_id_by_input_hash('b'))
+        self.assertEqual({id_lst[2]: {'inputhash': 'a', 'sourceid': None},
+                          id_lst[3]: {'inputhash': 'a', 'sourceid': id_lst[0]}},
+                         self.database.get_input_hash_items(id_lst[2:] + [10 ** 9]))
+        self.database.delete_item(id_lst[0])
+        self.database.update_items({'status': 'finished'}, [id_lst[2]])
+        self.assertEqual(id_lst[2], self.database.get_job_id_by_input_hash('a'))
+        self.database.delete_items(id_lst[1:])
+        self.assertIsNone(self.database.get_job_id_by_input_hash('b'))
+        self.assertEqual({}, self.database.get_input_hash_items(id_lst))
+
     def test_get_item_by_id(self):
         """
         Tests get_item_by_id function
@@ -205,6 +304,48 @@ class TestDatabaseAccess(unittest.TestCase):
         third_dict['id'] = self.database.add_item_dict(third_dict)
         self.assertEqual([par_dict, second_dict], self.database.get_items_dict({'project': 'Projecta/%'}))
 
+    def test_get_items_dict_project_prefix(self):
+        """
+        Tests that prefix queries are resolved as range queries while other patterns still use the regex
+        Returns:
+        """
+        self.assertTrue(self.database._is_prefix_pattern('Projecta/b_c.d/%'))
+        self.assertFalse(self.database._is_prefix_pattern('Projecta/%/c/%'))
+        self.assertFalse(self.database._is_prefix_pattern('H([0-9]*)%'))
+        self.assertFalse(self.database._is_prefix_pattern('Projecta/'))
+        first = self.add_items('H2')
+        second = self.add_items('H2', project='database.testing/sub_project/')
+        third = self.add_items('H2', project='database.testing0')
+        self.assertEqual([first, second], self.database.get_items_dict({'project': 'database.testing/%'}))
+        self.assertEqual([second], self.database.get_items_dict({'project': 'database.testing/sub_project/%'}))
+        self.assertEqual([first, second, third], self.database.get_items_dict({'project': 'database.%'}))
+        self.assertEqual([second], self.database.get_items_dict({'project': '%sub%'}))
+
+    def test_get_items_dataframe(self):
+        """
+        Tests that get_items_dataframe returns the same items as get_items_dict
+        Returns:
+        """
+        self.add_items('H2')
+        self.add_items('H2', project='database.testing/sub_project/')
+        item_dict = {'project': 'database.testing/%'}
+        df = self.database.get_items_dataframe(item_dict)
+        self.assertEqual(self.database.get_items_dict(item_dict), df.to_dict(orient='records'))
+        df = self.database.get_items_dataframe(item_dict, columns=['id', 'timestop'])
+        self.assertEqual(['id', 'timestop'], list(df.columns))
+        self.assertEqual(datetime(2016, 5, 2, 11, 31, 4, 371165), df['timestop'].iloc[0])
+        self.assertEqual(0, len(self.database.get_items_dataframe({'project': 'none/%'}, columns=['id'])))
+        self.assertRaises(ValueError, self.database.get_items_dataframe, item_dict, ['nocolumn'])
+
+    def test_indexes(self):
+        """
+        Tests that the secondary indexes are created
+        Returns:
+        """
+        index_lst = [index['column_names'] for index in inspect(self.database._engine).get_indexes('simulation')]
+        for column in INDEXED_COLUMNS:
+            self.assertIn([column], index_lst)
+
     def test_get_items_dict_or(self):
         """
         Tests 'or' functionality of get_items_dict function
@@ -267,11 +408,12 @@ class TestDatabaseAccess(unittest.TestCase):
         self.assertRaises(Exception, self.database.add_column, ['mycolumn'], 10)  # cannot use int as params
 
     # NOT A TEST #
-    def add_items(self, formula):
+    def add_items(self, formula, project='database.testing/'):
         """
         Simple generic helper function to add items to DB
         Args:
             formula: string for chemicalformula
+            project: string for project
 
         Returns:
         """
@@ -281,7 +423,7 @@ class TestDatabaseAccess(unittest.TestCase):
                     'hamversion': '1.1',
                     'job': 'testing',
                     'parentid': 0,
-                    'project': 'database.testing/',
+                    'project': project,
                     'projectpath': '/TESTING',
                     'status': 'KAAAA',
                     'timestart': datetime(2016, 5, 2, 11, 31, 4, 253377),
@@ -294,5 +436,80 @@ class TestDatabaseAccess(unittest.TestCase):
         return par_dict
 
 
+class TestDatabaseAccessPool(unittest.TestCase):
+    """
+    Test the pooled connection mode, SQLite in WAL mode is used as stand-in for the central database
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.database = DatabaseAccess('sqlite:///test_database_pool.db', 'simulation', pool_size=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.database.conn.close()
+        cls.database._engine.dispose()
+        for file_name in ['test_database_pool.db', 'test_database_pool.db-wal', 'test_database_pool.db-shm']:
+            if os.path.exists(file_name):
+                os.remove(file_name)
+
+    def test_shared_engine(self):
+        second_database = DatabaseAccess('sqlite:///test_database_pool.db', 'simulation', pool_size=2)
+        self.assertIs(self.database._engine, second_database._engine)
+        self.assertIs(self.database.statistics, second_database.statistics)
+
+    def test_connection_reuse(self):
+        self.database.statistics.reset()
+        for i in range(20):
+            item_id = self.database.add_item_dict({'job': 'job_' + str(i), 'project': 'pool/', 'status': 'created'})
+            self.database.item_update({'status': 'finished'}, item_id)
+            self.assertEqual(self.database.get_item_by_id(item_id)['status'], 'finished')
+        statistics = self.database.statistics.to_dict()
+        self.assertLessEqual(statistics['connects'], 2)
+        self.assertGreaterEqual(statistics['queries'], 60)
+        self.assertEqual(statistics['retries'], 0)
+        self.assertEqual(len(self.database.get_items_dict({'project': 'pool/%'})), 20)
+
+    def test_bounded_retries(self):
+        class UnreachableEngine(object):
+            @staticmethod
+            def connect():
+                raise OperationalError('select 1', {}, Exception('server not reachable'))
+
+        statistics = ConnectionStatistics()
+        conn = AutorestoredConnection(UnreachableEngine(), max_retries=3, retry_delay=0.001, statistics=statistics)
+        self.assertRaises(OperationalError, conn.execute, 'select 1')
+        self.assertEqual(statistics.retries, 3)
+
+    def test_no_retry_on_query_errors(self):
+        statistics = ConnectionStatistics()
+        conn = AutorestoredConnection(self.database._engine, max_retries=3, retry_delay=10, statistics=statistics)
+        start_time = time.time()
+        self.assertRaises(OperationalError, conn.execute, 'select no_such_column from ' + self.database.table_name)
+        self.assertLess(time.time() - start_time, 5)
+        self.assertEqual(statistics.retries, 0)
+        conn.close()
+
+    def test_retry_on_disconnect(self):
+        class DisconnectingConnection(object):
+            closed = False
+
+            def execute(self, *args, **kwargs):
+                raise OperationalError('select 1', {}, Exception('server closed the connection unexpectedly'),
+                                       connection_invalidated=True)
+
+            def invalidate(self):
+                pass
+
+        class DisconnectingEngine(object):
+            @staticmethod
+            def connect():
+                return DisconnectingConnection()
+
+        statistics = ConnectionStatistics()
+        conn = AutorestoredConnection(DisconnectingEngine(), max_retries=2, retry_delay=0.001, statistics=statistics)
+        self.assertRaises(OperationalError, conn.execute, 'select 1')
+        self.assertEqual(statistics.retries, 2)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,9 @@
 import os
+import h5py
 import numpy as np
-from pyiron.base.generic.hdfio import FileHDFio
+from pyiron.base.generic.hdfio import FileHDFio, HDF5DatasetProxy, HDF5FileCache, hdf5_file_cache, \
+    _get_version_tuple
+import threading
 import unittest
 
 
@@ -108,6 +111,164 @@ class TestFileHDFio(unittest.TestCase):
     def test_copy(self):
         self.assertIsInstance(self.es_hdf5.copy(), FileHDFio)
 
+    def test_extend(self):
+        hdf = FileHDFio(file_name=self.current_dir + '/filehdfio_extend.h5')
+        with hdf.open('interactive') as hdf_interactive:
+            hdf_interactive.extend('positions', np.zeros((2, 3, 3)))
+            hdf_interactive.extend('positions', np.ones((3, 3, 3)))
+            hdf_interactive.extend('steps', np.array([0, 1]), compression='gzip')
+            hdf_interactive.extend('steps', np.array([2.5]))
+        self.assertEqual(hdf['interactive/positions'].shape, (5, 3, 3))
+        self.assertEqual(hdf['interactive/positions'][2:].sum(), 27)
+        self.assertTrue(np.array_equal(hdf['interactive/steps'], np.array([0, 1, 2.5])))
+        with h5py.File(hdf.file_name, mode='r') as h5_file:
+            self.assertEqual(h5_file['interactive/positions'].maxshape, (None, 3, 3))
+            self.assertEqual(h5_file['interactive/steps'].compression, 'gzip')
+        hdf['energy'] = np.array([1.0, 2.0])
+        hdf.extend('energy', np.array([3.0]))
+        hdf.extend('energy', np.array([4.0]))
+        self.assertTrue(np.array_equal(hdf['energy'], np.array([1.0, 2.0, 3.0, 4.0])))
+        hdf.remove_file()
+
+    def test_get_free_space_fraction(self):
+        hdf = FileHDFio(file_name=self.current_dir + '/filehdfio_free_space.h5')
+        self.assertEqual(hdf.get_free_space_fraction(), 0.0)
+        hdf['data'] = np.random.rand(100000)
+        hdf['removed'] = np.random.rand(100000)
+        self.assertLess(hdf.get_free_space_fraction(), 0.1)
+        with h5py.File(hdf.file_name, mode='a') as h5_file:
+            del h5_file['removed']
+        self.assertGreater(hdf.get_free_space_fraction(), 0.4)
+        hdf.remove_file()
+
+    def test_get_free_space_fraction_small_nodes(self):
+        hdf = FileHDFio(file_name=self.current_dir + '/filehdfio_small_nodes.h5')
+        with h5py.File(hdf.file_name, mode='a') as h5_file:
+            for i in range(200):
+                h5_file['group_' + str(i // 20) + '/node_' + str(i)] = i
+        self.assertLess(hdf.get_free_space_fraction(), 0.1)
+        hdf.remove_file()
+
+    def test_file_cache(self):
+        hdf = FileHDFio(file_name=self.current_dir + '/filehdfio_cache.h5')
+        hdf['value'] = 1
+        hdf5_file_cache.invalidate(hdf.file_name)
+        misses = hdf5_file_cache.misses
+        self.assertEqual(hdf['value'], 1)
+        self.assertEqual(hdf['value'], 1)
+        self.assertEqual(hdf5_file_cache.misses, misses + 1)
+        hdf['value'] = 2
+        self.assertEqual(hdf['value'], 2)
+        self.assertEqual(hdf5_file_cache.misses, misses + 2)
+        hdf.remove_file()
+        self.assertEqual(hdf.list_all(), {"groups": [], "nodes": []})
+
+    def test_file_cache_limit(self):
+        cache = HDF5FileCache(max_open=1)
+        with cache.open(self.full_hdf5.file_name) as h5_file:
+            self.assertIn('content', h5_file)
+        with cache.open(self.es_hdf5.file_name) as h5_file:
+            self.assertIsNotNone(h5_file)
+        self.assertEqual(len(cache), 1)
+        with cache.open(self.es_hdf5.file_name):
+            pass
+        self.assertEqual(cache.hits, 1)
+        with cache.open(self.current_dir + '/filehdfio_missing.h5') as h5_file:
+            self.assertIsNone(h5_file)
+        cache.max_open = 0
+        self.assertEqual(len(cache), 0)
+        with cache.open(self.full_hdf5.file_name):
+            pass
+        self.assertEqual(len(cache), 0)
+        self.assertRaises(ValueError, setattr, cache, 'max_open', -1)
+
+    def test_file_cache_readers(self):
+        cache = HDF5FileCache(max_open=2)
+        def read_other_file():
+            with cache.open(self.es_hdf5.file_name) as h5_other:
+                result_lst.append(h5_other is not None)
+
+        result_lst = []
+        with cache.open(self.full_hdf5.file_name) as h5_file:
+            thread = threading.Thread(target=read_other_file)
+            thread.start()
+            thread.join(timeout=10)
+            self.assertEqual(result_lst, [True])
+            cache.invalidate(self.full_hdf5.file_name)
+            self.assertEqual(len(cache), 1)
+            self.assertIn('content', h5_file)
+        self.assertFalse(h5_file.id.valid)
+        with cache.open(self.full_hdf5.file_name) as h5_file:
+            pass
+        self.assertEqual(len(cache), 2)
+        cache.invalidate_directory(self.current_dir)
+        self.assertEqual(len(cache), 1)
+        self.assertFalse(h5_file.id.valid)
+        cache.clear()
+
+    def test_content_hash(self):
+        hdf = FileHDFio(file_name=self.current_dir + '/filehdfio_hash.h5')
+        hdf_other = FileHDFio(file_name=self.current_dir + '/filehdfio_hash_other.h5')
+        for h, name in [(hdf, 'first'), (hdf, 'second'), (hdf_other, 'first')]:
+            with h.open(name) as hdf_group:
+                hdf_group['array'] = np.arange(6)
+                hdf_group['dict'] = {'key': 'value'}
+                hdf_group['float'] = 1.0
+        content_hash = hdf['first'].get_content_hash()
+        self.assertEqual(content_hash, hdf['second'].get_content_hash())
+        self.assertEqual(content_hash, hdf_other['first'].get_content_hash())
+        hdf['second/float'] = 2.0
+        self.assertNotEqual(content_hash, hdf['second'].get_content_hash())
+        self.assertEqual(content_hash, hdf['first'].get_content_hash(exclude_nodes=[]))
+        self.assertEqual(hdf['first'].get_content_hash(exclude_nodes=['float']),
+                         hdf['second'].get_content_hash(exclude_nodes=['float']))
+        hdf['second'].copy_group_from(hdf['first'], 'dict')
+        self.assertEqual(hdf['second/dict'], {'key': 'value'})
+        hdf_other['first'].copy_group_from(hdf['second'], 'float')
+        self.assertEqual(hdf_other['first/float'], 2.0)
+        hdf['second'].copy_group_from(hdf['first'], 'missing')
+        self.assertEqual(sorted(hdf['second'].list_nodes()), ['array', 'dict', 'float'])
+        hdf.remove_file()
+        hdf_other.remove_file()
+
+    def test_lazy(self):
+        hdf = FileHDFio(file_name=self.current_dir + '/filehdfio_lazy.h5')
+        positions = np.random.random((10, 4, 3))
+        hdf['positions'] = positions
+        hdf['steps'] = [0, 1, 2]
+        hdf['energy'] = 1.0
+        self.assertFalse(hdf.lazy)
+        self.assertIsInstance(hdf['positions'], np.ndarray)
+        hdf.lazy = True
+        with hdf.open('..') as hdf_copy:
+            self.assertTrue(hdf_copy.lazy)
+        proxy = hdf['positions']
+        self.assertIsInstance(proxy, HDF5DatasetProxy)
+        self.assertEqual(proxy.shape, (10, 4, 3))
+        self.assertEqual(proxy.dtype, positions.dtype)
+        self.assertEqual(len(proxy), 10)
+        for index in [-1, (slice(None, None, 3), 1), slice(None, None, -2), [7, 2, 7], (Ellipsis, [2, 0]),
+                      ([1, 3], slice(None), [0, 2]), (slice(2, 8, 2), [3, 1]), (None, 0, Ellipsis),
+                      positions[:, 0, 0] > 0.5, []]:
+            self.assertTrue(np.array_equal(proxy[index], positions[index]))
+            self.assertEqual(proxy[index].shape, positions[index].shape)
+        self.assertRaises(IndexError, proxy.__getitem__, 10)
+        self.assertRaises(IndexError, proxy.__getitem__, (0, 0, 0, 0))
+        self.assertTrue(np.array_equal(np.array(proxy), positions))
+        self.assertTrue(np.array_equal(list(proxy), list(positions)))
+        self.assertEqual(proxy.tolist(), positions.tolist())
+        self.assertEqual(hdf['steps'], [0, 1, 2])
+        self.assertEqual(hdf['energy'], 1.0)
+        hdf.remove_file()
+
+
+    def test_get_version_tuple(self):
+        self.assertEqual(_get_version_tuple('0.1.10'), (0, 1, 10))
+        self.assertEqual(_get_version_tuple('0.1.8.dev0'), (0, 1, 8))
+        self.assertEqual(_get_version_tuple('1.2rc1'), (1, 2))
+        self.assertEqual(_get_version_tuple('0'), (0,))
+        self.assertTrue(_get_version_tuple('0.1.10') > (0, 1, 8))
+        self.assertTrue(_get_version_tuple('0.1.7') < (0, 1, 8))
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from copy import deepcopy
 import pandas
 import os
@@ -83,5 +84,50 @@ class TestGenericParameters(unittest.TestCase):
         self.assertEqual(str(self.generic_parameters_str.get_pandas()), str(data_frame_all_entries.get_pandas()))
 
 
+    def test_line_index(self):
+        gp = GenericParameters(table_name='index')
+        gp.load_string("a 1\nb 2\n# comment\nfix ensemble nvt\nfix other npt\nc 3")
+        self.assertEqual(gp._find_line("c"), (5, None))
+        self.assertEqual(gp.get("fix ensemble"), "nvt")
+        self.assertEqual(gp.get("fix other"), "npt")
+        with self.assertRaises(ValueError):
+            gp.get("fix")
+        gp.remove_keys(["b"])
+        self.assertEqual(gp._find_line("c"), (4, None))
+        self.assertIsNone(gp["b"])
+        gp.set(b=4, d=(5, "comment"))
+        self.assertEqual(gp.get("b"), 4)
+        self.assertEqual(gp._find_line("d"), (6, None))
+        self.assertEqual(gp._dataset["Comment"][6], "comment")
+        with self.assertRaises(ValueError):
+            gp._append(a=2)
+        gp._dataset["Parameter"].append("e")
+        gp._dataset["Value"].append("6")
+        gp._dataset["Comment"].append("")
+        self.assertEqual(gp.get("e"), 6)
+        gp.load_string("x 1")
+        self.assertEqual(gp.get("x"), 1)
+        self.assertEqual(gp.get("a", default_value=0), 0)
+
+    def test_block_insert(self):
+        gp = GenericParameters(table_name='block')
+        gp.load_string("a 1\nb 2\nc 3")
+        gp.define_blocks(OrderedDict([("first", ["a", "b"]), ("second", ["c"])]))
+        gp.set(b___x=5)
+        self.assertEqual(gp._dataset["Parameter"], ["a", "b", "b___x", "c"])
+        self.assertEqual(gp.get("b___x"), 5)
+        self.assertEqual(gp.get("c"), 3)
+
+    def test_value_cache(self):
+        gp = GenericParameters(table_name='cache')
+        gp.load_string("a 1\nb [1, 2]")
+        self.assertEqual(gp.get("a"), 1)
+        gp.modify(a=2)
+        self.assertEqual(gp.get("a"), 2)
+        lst = gp.get("b")
+        lst.append(3)
+        self.assertEqual(gp.get("b"), [1, 2])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,5 +1,7 @@
 import unittest
 import os
+import h5py
+import numpy as np
 from pyiron.base.project.generic import Project
 
 
@@ -26,6 +28,61 @@ class TestGenericJob(unittest.TestCase):
         ham.save()
         ham.remove()
 
+    def test_reuse_results(self):
+        script_path = os.path.join(self.file_location, 'test_genericjob_reuse.py')
+        with open(script_path, 'w') as f:
+            f.write('print(1)')
+        ham_first = self.project.create_job('ScriptJob', "job_reuse_first")
+        ham_first.script_path = script_path
+        ham_first.save()
+        ham_first.project_hdf5['output/energy'] = np.array([1.0, 2.0])
+        ham_first.status.finished = True
+        ham_first.project_hdf5.create_working_directory()
+        with open(os.path.join(ham_first.working_directory, 'output.log'), 'w') as f:
+            f.write('energy 1.0')
+        self.project.db.add_input_hash(ham_first.job_id, ham_first.get_input_hash())
+        ham_second = self.project.create_job('ScriptJob', "job_reuse_second")
+        ham_second.script_path = script_path
+        ham_second.server.reuse_results = True
+        ham_second.run()
+        self.assertTrue(ham_second.status.finished)
+        self.assertTrue(np.array_equal(ham_second['output/energy'], [1.0, 2.0]))
+        with open(os.path.join(ham_second.working_directory, 'output.log')) as f:
+            self.assertEqual(f.read(), 'energy 1.0')
+        self.assertEqual(ham_first.get_input_hash(), ham_second.get_input_hash())
+        self.assertEqual({ham_second.job_id: {'inputhash': ham_first.get_input_hash(), 'sourceid': ham_first.job_id}},
+                         self.project.db.get_input_hash_items([ham_second.job_id]))
+        self.assertTrue(self.project.load(ham_second.job_id).server.reuse_results)
+        input_hash = ham_first.get_input_hash()
+        with open(script_path, 'w') as f:
+            f.write('print(2)')
+        self.assertNotEqual(input_hash, ham_first.get_input_hash())
+        ham_first.remove()
+        ham_second.remove()
+        os.remove(script_path)
+
+    def test_repack(self):
+        ham = self.project.create_job('ScriptJob', "job_repack")
+        ham.save()
+        ham.project_hdf5['removed'] = np.random.rand(100000)
+        self.assertFalse(ham.repack(threshold=0.5))
+        with h5py.File(ham.project_hdf5.file_name, mode='a') as h5_file:
+            del h5_file[ham.project_hdf5.h5_path + '/removed']
+        file_size = os.path.getsize(ham.project_hdf5.file_name)
+        self.assertTrue(ham.repack(threshold=0.5))
+        self.assertLess(os.path.getsize(ham.project_hdf5.file_name), file_size / 2)
+        self.assertIn('custom_dict', ham['input'].list_groups())
+        ham.remove()
+
+    def test_repack_small_nodes(self):
+        ham = self.project.create_job('ScriptJob', "job_repack_small_nodes")
+        ham.save()
+        with h5py.File(ham.project_hdf5.file_name, mode='a') as h5_file:
+            for i in range(200):
+                h5_file[ham.project_hdf5.h5_path + '/output/node_' + str(i)] = i
+        self.assertFalse(ham.repack(threshold=0.5))
+        ham.remove()
+
     def test_id(self):
         pass
 
@@ -266,6 +266,28 @@ class TestJobStatus(unittest.TestCase):
         self.assertNotEqual(new_status, str(self.jobstatus_database))
         self.assertEqual(finished_status, str(self.jobstatus_database))
 
+    def test_cache_time(self):
+        job_status = JobStatus(db=self.database, job_id=self.job_id, cache_time=0)
+        JobStatus.query_count.clear()
+        _ = job_status.finished
+        _ = job_status.aborted
+        self.assertEqual(JobStatus.query_count['read'], 2)
+        job_status.cache_time = 3600
+        job_status.running = True
+        self.assertEqual(JobStatus.query_count['write'], 1)
+        self.assertTrue(job_status.running)
+        self.assertFalse(job_status.finished)
+        self.assertEqual(JobStatus.query_count['read'], 2)
+        self.database.item_update({'status': 'finished'}, self.job_id)
+        self.assertTrue(job_status.running)
+        job_status.refresh_status()
+        self.assertTrue(job_status.finished)
+        self.assertEqual(JobStatus.query_count['read'], 3)
+        self.assertRaises(ValueError, setattr, job_status, 'cache_time', -1)
+        job_status.cache_time = None
+        self.assertEqual(job_status.cache_time, 0)
+        job_status.initialized = True
+
 
 class JobStatusIntegration(unittest.TestCase):
     @classmethod
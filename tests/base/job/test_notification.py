@@ -0,0 +1,81 @@
+import os
+import shutil
+import threading
+import time
+import unittest
+from pyiron.base.job.notification import JobNotification
+
+
+class _CountingNotification(JobNotification):
+    check_count = 0
+
+    def get_state(self):
+        self.check_count += 1
+        return super(_CountingNotification, self).get_state()
+
+
+class TestJobNotification(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'job_notification')
+        cls.notification = JobNotification(path=cls.path, poll_interval=0.01)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.path, ignore_errors=True)
+
+    def test_notify(self):
+        self.notification.notify(1, 'running')
+        with open(os.path.join(self.path, '1')) as f:
+            self.assertEqual(f.read(), 'running')
+        self.notification.notify(1, 'collect')
+        with open(os.path.join(self.path, '1')) as f:
+            self.assertEqual(f.read(), 'collect')
+        self.assertIn('1', os.listdir(self.path))
+        self.assertFalse(any([f.endswith('.tmp') for f in os.listdir(self.path)]))
+        state = self.notification.get_state()
+        time.sleep(0.01)
+        self.notification.notify(1, 'finished')
+        self.assertNotIn('1', os.listdir(self.path))
+        self.assertTrue(self.notification.wait(timeout=0.05, state=state))
+
+    def test_remove_old_files(self):
+        path = os.path.join(self.path, 'old_files')
+        notification = JobNotification(path=path, max_age=3600)
+        notification.notify(4, 'running')
+        notification.notify(5, 'running')
+        old_time = time.time() - 7200
+        os.utime(os.path.join(path, '4'), (old_time, old_time))
+        JobNotification(path=path, max_age=3600).notify(6, 'running')
+        self.assertEqual(sorted(os.listdir(path)), ['5', '6'])
+
+    def test_wait(self):
+        self.notification.notify(2, 'running')
+        state = self.notification.get_state()
+        self.assertFalse(self.notification.wait(timeout=0.05, state=state))
+        time.sleep(0.01)
+        self.notification.notify(2, 'finished')
+        self.assertTrue(self.notification.wait(timeout=0.05, state=state))
+
+    def test_wait_thread(self):
+        thread = threading.Timer(0.1, self.notification.notify, args=(3, 'finished'))
+        start_time = time.time()
+        thread.start()
+        self.assertTrue(self.notification.wait(timeout=10))
+        self.assertLess(time.time() - start_time, 5)
+        thread.join()
+
+    def test_poll_interval(self):
+        notification = _CountingNotification(path=os.path.join(self.path, 'poll'), poll_interval=0.01,
+                                             max_poll_interval=0.04)
+        self.assertFalse(notification.wait(timeout=0.4))
+        self.assertLess(notification.check_count, 20)
+
+    def test_missing_directory(self):
+        notification = JobNotification(path=os.path.join(self.path, 'missing'))
+        self.assertIsNone(notification.get_state())
+        self.assertFalse(notification.wait(timeout=0.01))
+
+
+if __name__ == '__main__':
+    unittest.main()
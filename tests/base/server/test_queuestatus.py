@@ -0,0 +1,40 @@
+import os
+import unittest
+from pyiron.base.project.generic import Project
+from pyiron.base.server.queuestatus import JobTimeoutError, wait_for_job, wait_for_jobs
+
+
+class TestQueueStatus(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.file_location = os.path.dirname(os.path.abspath(__file__))
+        cls.project = Project(os.path.join(cls.file_location, 'test_queuestatus'))
+
+    @classmethod
+    def tearDownClass(cls):
+        file_location = os.path.dirname(os.path.abspath(__file__))
+        project = Project(os.path.join(file_location, 'test_queuestatus'))
+        project.remove(enable=True)
+
+    def test_wait_for_job_timeout(self):
+        job = self.project.create_job('ScriptJob', 'job_timeout')
+        job.save()
+        with self.assertRaises(JobTimeoutError):
+            wait_for_job(job, interval_in_s=0.01, max_iterations=2)
+        self.assertTrue(issubclass(JobTimeoutError, ValueError))
+        job.status.finished = True
+        self.assertEqual(wait_for_jobs([job], timeout=1, interval_in_s=0.01), [job])
+        job.remove()
+
+    def test_wait_for_job_removed(self):
+        job = self.project.create_job('ScriptJob', 'job_removed')
+        job.save()
+        self.project.db.delete_item(job.job_id)
+        with self.assertRaises(ValueError) as context:
+            wait_for_job(job, interval_in_s=0.01, max_iterations=2)
+        self.assertNotIsInstance(context.exception, JobTimeoutError)
+        self.assertIn('not listed in the database', str(context.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,7 @@ import numpy as np
 
 from pyiron.atomistics.structure.atoms import Atoms
 from pyiron.vasp.vasprun import Vasprun
+from pyiron.vasp.procar import Procar
 from pyiron.dft.waves.dos import Dos
 from pyiron.dft.waves.electronic import ElectronicStructure
 from pyiron.base.generic.hdfio import FileHDFio
@@ -100,3 +101,79 @@ class TestElectronicStructure(unittest.TestCase):
 
     def test_is_metal(self):
         self.assertTrue(self.es_list[1].is_metal)
+        es_obj = ElectronicStructure()
+        es_obj.kpoint_list = [[0, 0, 0], [0.5, 0, 0]]
+        es_obj.kpoint_weights = [0.5, 0.5]
+        es_obj.eigenvalue_matrix = [[-2., 1.], [-1.5, 2.]]
+        es_obj.occupancy_matrix = [[1., 0.], [1., 0.]]
+        es_obj.efermi = 0.
+        self.assertFalse(es_obj.is_metal)
+        es_obj.efermi = -1.8
+        self.assertTrue(es_obj.is_metal)
+
+    def test_band_edges(self):
+        for es in self.es_list:
+            for resolution in [1e-6, 0.5]:
+                eigenvalues = es.eigenvalue_matrix.flatten()
+                occupancies = es.occupancy_matrix.flatten()
+                vbm_dict = es.get_vbm(resolution=resolution)
+                cbm_dict = es.get_cbm(resolution=resolution)
+                self.assertEqual(vbm_dict["value"], np.max(eigenvalues[occupancies > resolution]))
+                self.assertEqual(cbm_dict["value"], np.min(eigenvalues[occupancies <= resolution]))
+                self.assertEqual(vbm_dict["band"].eigenvalue, vbm_dict["value"])
+                self.assertIn(vbm_dict["band"], vbm_dict["kpoint"].bands)
+                self.assertIn(cbm_dict["band"], cbm_dict["kpoint"].bands)
+                self.assertEqual(es.get_band_gap(resolution=resolution)["band_gap"],
+                                 max(0., cbm_dict["value"] - vbm_dict["value"]))
+
+    def test_lazy_kpoints(self):
+        es_obj = ElectronicStructure()
+        es_obj.kpoint_list = [[0, 0, 0], [0.5, 0, 0]]
+        es_obj.kpoint_weights = [0.5, 0.5]
+        es_obj.eigenvalue_matrix = np.array([[-2., 1., 3.], [-1.5, 2., 4.]])
+        es_obj.occupancy_matrix = np.array([[1., 0., 0.], [1., 0., 0.]])
+        es_obj.generate_from_matrices()
+        self.assertIsNone(es_obj._kpoints)
+        self.assertEqual(len(es_obj.kpoints), 2)
+        self.assertIsNotNone(es_obj.kpoints[0]._band_matrices)
+        self.assertEqual(es_obj.vbm, -1.5)
+        self.assertEqual(es_obj.cbm, 1.)
+        self.assertEqual(es_obj.eg, 2.5)
+        self.assertTrue(np.array_equal(es_obj.kpoints[1].eig_occ_matrix, [[-1.5, 1.], [2., 0.], [4., 0.]]))
+        self.assertEqual(es_obj.kpoints[1].bands[2].eigenvalue, 4.)
+        self.assertIsNone(es_obj.kpoints[1]._band_matrices)
+        es_obj = ElectronicStructure()
+        es_obj.add_kpoint(value=[0, 0, 0], weight=1.)
+        es_obj.kpoints[0].add_band(eigenvalue=-1., occupancy=1.)
+        es_obj.kpoints[0].add_band(eigenvalue=1., occupancy=0.)
+        self.assertTrue(np.array_equal(es_obj.grand_eigenvalue_matrix, [[[-1., 1.]]]))
+        self.assertTrue(np.array_equal(es_obj.occupancy_matrix, [[1., 0.]]))
+        self.assertEqual(es_obj.eg, 2.)
+
+    def test_spin_polarized(self):
+        filename = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "../../static/vasp_test_files/procar_samples/PROCAR_spin")
+        es_obj = Procar().from_file(filename=filename)
+        es_obj.grand_occupancy_matrix[1] = [0.75, 0, 0, 0]
+        es_obj.grand_eigenvalue_matrix[1, 1, 3] = -12.
+        self.assertEqual(es_obj.n_spins, 2)
+        self.assertEqual(es_obj.grand_eigenvalue_matrix.shape, (2, 3, 4))
+        vbm_dict = es_obj.get_vbm()
+        self.assertEqual(vbm_dict["value"], -9.7)
+        self.assertEqual(vbm_dict["spin"], 0)
+        cbm_dict = es_obj.get_cbm()
+        self.assertEqual(cbm_dict["value"], -12.)
+        self.assertEqual(cbm_dict["spin"], 1)
+        self.assertIs(cbm_dict["kpoint"], es_obj.kpoints[1])
+        self.assertEqual(cbm_dict["band"].eigenvalue, -12.)
+        self.assertTrue(np.array_equal(cbm_dict["band"].resolved_dos_matrix, es_obj.grand_dos_matrix[1, 1, 3]))
+        filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../static/dft/test_es_hdf.h5")
+        hdf_obj = FileHDFio(os.path.abspath(filename))
+        es_obj.to_hdf(hdf_obj, group_name="written_es_spin")
+        es_obj_new = ElectronicStructure()
+        es_obj_new.from_hdf(hdf=hdf_obj, group_name="written_es_spin")
+        self.assertEqual(es_obj_new.n_spins, 2)
+        self.assertTrue(np.array_equal(es_obj_new.grand_eigenvalue_matrix, es_obj.grand_eigenvalue_matrix))
+        self.assertTrue(np.array_equal(es_obj_new.grand_occupancy_matrix, es_obj.grand_occupancy_matrix))
+        self.assertTrue(np.array_equal(es_obj_new.grand_dos_matrix, es_obj.grand_dos_matrix))
+        self.assertEqual(es_obj_new.cbm, -12.)
@@ -75,6 +75,19 @@ class TestLammps(unittest.TestCase):
                                                            '1 1 0.000000000000000 0.000000000000000 0.000000000000000',
                                                            ''])
 
+    def test_structure_atomic_species(self):
+        atoms = Atoms('FeNiFe', positions=[[0, 0, 0], [0.5, 0, 0], [0, 0.5, 0.5]], cell=np.eye(3))
+        atoms.cell = np.array([[1, 0, 0], [0.5, 1, 0], [0, 0, 1]])
+        lmp_structure = LammpsStructure()
+        lmp_structure._el_eam_lst = ['Al', 'Ni', 'Fe']
+        lmp_structure.structure = atoms
+        lines = lmp_structure._dataset['Value']
+        atom_lines = lines[lines.index('Atoms') + 2:-1]
+        self.assertEqual([line.split()[:2] for line in atom_lines], [['1', '3'], ['2', '2'], ['3', '3']])
+        self.assertTrue(np.allclose(np.array([line.split()[2:] for line in atom_lines], dtype=float),
+                                    lmp_structure.rotate_positions(atoms)))
+        self.assertEqual(lines[lines.index('Masses') + 2], '1 1.000000')
+
     def test_structure_charge(self):
         atoms = Atoms('Fe1', positions=np.zeros((1, 3)), cell=np.eye(3))
         atoms.add_tag(charge=2.0)
@@ -187,6 +200,53 @@ class TestLammps(unittest.TestCase):
         self.assertTrue(np.array_equal(self.job_dump['output/generic/positions'].shape, (1, 2, 3)))
         self.assertTrue(np.array_equal(self.job_dump['output/generic/cells'].shape, (1, 3, 3)))
 
+    def test_dump_parser_chunks(self):
+        structure = Atoms(elements=2*['Fe'], cell=2.78*np.eye(3), positions=2.78*np.outer(np.arange(2), np.ones(3))*0.5)
+        job_chunks = Lammps(project=ProjectHDFio(project=self.project, file_name='lammps_dump_chunks'),
+                            job_name='lammps_dump_chunks')
+        job_chunks.structure = structure
+        file_directory = os.path.join(self.execution_path, "..", "static", "lammps_test_files")
+        job_chunks.collect_dump_file(cwd=file_directory, file_name='dump.out')
+        output = {key: job_chunks['output/generic/' + key]
+                  for key in ['time', 'cells', 'positions', 'unwrapped_positions', 'forces']}
+        self.assertEqual(output['positions'].shape, (6, 81, 3))
+        job_chunks.collect_dump_file(cwd=file_directory, file_name='dump.out', chunk_size=4)
+        for key, value in output.items():
+            self.assertTrue(np.array_equal(job_chunks['output/generic/' + key], value))
+        self.assertTrue(np.array_equal(output['time'], np.arange(0, 1001, 200)))
+
+    def test_dump_parser_empty(self):
+        structure = Atoms(elements=2*['Fe'], cell=2.78*np.eye(3), positions=2.78*np.outer(np.arange(2), np.ones(3))*0.5)
+        job_empty = Lammps(project=ProjectHDFio(project=self.project, file_name='lammps_dump_empty'),
+                           job_name='lammps_dump_empty')
+        job_empty.structure = structure
+        os.makedirs(job_empty.working_directory, exist_ok=True)
+        open(os.path.join(job_empty.working_directory, 'dump.out'), 'w').close()
+        job_empty.collect_dump_file(cwd=job_empty.working_directory, file_name='dump.out')
+        self.assertEqual(len(job_empty['output/generic/time']), 0)
+        self.assertEqual(job_empty['output/generic/cells'].shape, (0, 3, 3))
+        self.assertEqual(job_empty['output/generic/positions'].shape, (0, 2, 3))
+        self.assertEqual(job_empty['output/generic/forces'].shape, (0, 2, 3))
+
+    def test_dump_parser_element_column(self):
+        structure = Atoms(elements=2*['Fe'], cell=2.78*np.eye(3), positions=2.78*np.outer(np.arange(2), np.ones(3))*0.5)
+        job_element = Lammps(project=ProjectHDFio(project=self.project, file_name='lammps_dump_element'),
+                             job_name='lammps_dump_element')
+        job_element.structure = structure
+        file_directory = os.path.join(self.execution_path, "..", "static", "lammps_test_files")
+        job_element.collect_dump_file(cwd=file_directory, file_name='dump_static.out')
+        output = {key: job_element['output/generic/' + key] for key in ['positions', 'forces']}
+        with open(os.path.join(file_directory, 'dump_static.out')) as f:
+            lines = f.readlines()
+        lines[8] = lines[8].replace('type', 'type element')
+        lines[9:] = [line.replace(' 1 ', ' 1 Fe ', 1) for line in lines[9:]]
+        os.makedirs(job_element.working_directory, exist_ok=True)
+        with open(os.path.join(job_element.working_directory, 'dump.out'), 'w') as f:
+            f.writelines(lines)
+        job_element.collect_dump_file(cwd=job_element.working_directory, file_name='dump.out')
+        for key, value in output.items():
+            self.assertTrue(np.allclose(job_element['output/generic/' + key], value))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -16,6 +16,10 @@ class InteractiveLibrary(object):
     def scatter_atoms(self, *args):
         self._command.append(' '.join([str(arg) for arg in args]))
 
+    def get_thermo(self, key):
+        return {'pxx': 1.0, 'pyy': 2.0, 'pzz': 3.0, 'pxy': 4.0, 'pxz': 5.0, 'pyz': 6.0,
+                'lx': 1.0, 'ly': 2.0, 'lz': 3.0, 'xy': 0.0, 'xz': 0.0, 'yz': 0.0}[key]
+
 
 
 class TestLammpsInteractive(unittest.TestCase):
@@ -47,6 +51,15 @@ class TestLammpsInteractive(unittest.TestCase):
         self.assertTrue(self.job._interactive_library._command[0].startswith('x 1 3'))
         self.assertEqual(self.job._interactive_library._command[1], 'change_box all remap')
 
+    def test_interactive_pressures_getter(self):
+        self.job.interactive_cells_setter(np.eye(3))
+        self.assertTrue(np.allclose(self.job.interactive_pressures_getter(),
+                                    np.array([[1, 4, 5], [4, 2, 6], [5, 6, 3]]) / 10000))
+
+    def test_interactive_cells_getter(self):
+        self.job.interactive_cells_setter(np.eye(3))
+        self.assertTrue(np.allclose(self.job.interactive_cells_getter(), np.diag([1, 2, 3])))
+
     def test_interactive_execute(self):
         self.job._interactive_lammps_input()
         self.assertEqual(self.job._interactive_library._command,
@@ -0,0 +1,38 @@
+import io
+import numpy as np
+import unittest
+from pyiron.lammps.sub.lmpipc import read_message, write_message
+
+
+class TestLmpIpc(unittest.TestCase):
+    def test_round_trip(self):
+        positions = np.arange(12.).reshape(4, 3)
+        message = {'c': 'batch',
+                   'd': [{'c': 'command', 'd': 'run 1'},
+                         {'c': 'scatter_atoms', 'd': ['x', 1, 3, positions[:, ::2]]},
+                         {'c': 'scatter_atoms', 'd': ['type', 0, 1, np.array([1, 2], dtype=np.intc)]},
+                         (np.array(2.5), np.zeros(0), None)]}
+        stream = io.BytesIO()
+        write_message(stream, message)
+        write_message(stream, 'close')
+        stream.seek(0)
+        reply = read_message(stream)
+        self.assertEqual(reply['d'][0], {'c': 'command', 'd': 'run 1'})
+        self.assertTrue(np.array_equal(reply['d'][1]['d'][3], positions[:, ::2]))
+        self.assertTrue(reply['d'][1]['d'][3].flags.writeable)
+        self.assertEqual(reply['d'][2]['d'][3].dtype, np.intc)
+        self.assertEqual(reply['d'][3][0].shape, ())
+        self.assertEqual(reply['d'][3][0], 2.5)
+        self.assertEqual(len(reply['d'][3][1]), 0)
+        self.assertIsNone(reply['d'][3][2])
+        self.assertEqual(read_message(stream), 'close')
+
+    def test_incomplete_message(self):
+        stream = io.BytesIO()
+        write_message(stream, np.arange(10.))
+        stream = io.BytesIO(stream.getvalue()[:-8])
+        self.assertRaises(EOFError, read_message, stream)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 import os
 from pyiron.project import Project
+from pyiron.table.datamining import PyironTable
 from pyiron.table.funct import _get_majority
 
 
@@ -16,6 +17,9 @@ class TestDatamining(unittest.TestCase):
         project = Project(os.path.join(cls.execution_path, 'table'))
         project.remove_jobs(recursive=True)
         project.remove(enable=True)
+        project = Project(os.path.join(cls.execution_path, 'table_cache'))
+        project.remove_jobs(recursive=True)
+        project.remove(enable=True)
 
     def test_get_majority(self):
         lst = [1, 1, 2]
@@ -56,7 +60,10 @@ class TestDatamining(unittest.TestCase):
         _ = table.add.get_equilibrium_parameters
         _ = table.add.get_magnetic_structure
         table.add['alat'] = get_alat
+        self.assertEqual(table.workers, 1)
+        self.assertRaises(ValueError, setattr, table, 'workers', 0)
         table.run()
+        self.assertEqual(self.project.load(table.job_id).workers, 1)
         df = table.get_dataframe()
         self.assertEqual(df['Number_of_atoms'].values[0], 2)
         self.assertEqual(df['Fe'].values[0], 2)
@@ -74,6 +81,79 @@ class TestDatamining(unittest.TestCase):
         self.assertEqual(df['alat'].values[0], 0.0)
         self.assertEqual(df['magnetic_structure'].values[0], 'ferro-magnetic')
 
+    def test_create_table_cache(self):
+        project = Project(os.path.join(self.execution_path, 'table_cache'))
+        for sub_project in ['first', 'second']:
+            project.open(sub_project).import_from_path(
+                path=os.path.join(self.execution_path, '../static/vasp_test_files/full_job_sample'),
+                recursive=False
+            )
+        evaluated_job_ids = []
+
+        def get_evaluated_job_id(job):
+            evaluated_job_ids.append(job.job_id)
+            return job.job_id
+
+        table = PyironTable(project=project)
+        _ = table.add.get_job_name
+        table.add['evaluated_job_id'] = get_evaluated_job_id
+        table.create_table(level=1)
+        df = table.get_dataframe()
+        self.assertEqual(sorted(evaluated_job_ids), sorted(project.get_job_ids()))
+        self.assertEqual(list(df['job_id']), sorted(project.get_job_ids()))
+        self.assertEqual(list(df['evaluated_job_id']), list(df['job_id']))
+        self.assertEqual(list(df['col_0']), ['first', 'second'])
+        self.assertEqual(list(df['job_name']), ['full_job_sample'] * 2)
+        table.create_table(level=1)
+        self.assertEqual(len(evaluated_job_ids), 2)
+        _ = table.add.get_energy_tot
+        table.create_table(level=1)
+        self.assertEqual(len(evaluated_job_ids), 2)
+        self.assertEqual(list(table.get_dataframe()['energy_tot']), [-17.7331698] * 2)
+        table.filter_function = lambda job: 'second' in job.project.project_path
+        table.create_table(level=1)
+        self.assertEqual(len(evaluated_job_ids), 2)
+        self.assertEqual(list(table.get_dataframe()['col_0']), ['second'])
+        table.create_table(level=1, enforce_update=True)
+        self.assertEqual(len(evaluated_job_ids), 3)
+        table.filter_function = lambda job: 'first' in job.project.project_path
+        table.create_table(level=1)
+        self.assertEqual(list(table.get_dataframe()['col_0']), ['first'])
+        self.assertEqual(len(evaluated_job_ids), 4)
+
+        def get_evaluated_job_id(job):
+            evaluated_job_ids.append(job.job_id)
+            return -job.job_id
+
+        table.add['evaluated_job_id'] = get_evaluated_job_id
+        table.create_table(level=1)
+        self.assertEqual(len(evaluated_job_ids), 5)
+        self.assertEqual(list(table.get_dataframe()['evaluated_job_id']), [-min(project.get_job_ids())])
+        table.filter_function = lambda job: True
+        table.create_table(level=1, enforce_update=True, workers=2, chunk_size=1)
+        self.assertEqual(len(evaluated_job_ids), 5)
+        self.assertTrue(table.get_dataframe()['evaluated_job_id'].equals(-df['job_id']))
+
+    def test_cache_hdf(self):
+        project = Project(os.path.join(self.execution_path, 'table_cache'))
+        if len(project.get_job_ids()) == 0:
+            project.open('first').import_from_path(
+                path=os.path.join(self.execution_path, '../static/vasp_test_files/full_job_sample'),
+                recursive=False
+            )
+        hdf = project.open('hdf').create_hdf(path=project.open('hdf').path, job_name='cache')
+        table = PyironTable(project=project)
+        _ = table.add.get_job_name
+        table.create_table(file=hdf)
+        self.assertIn('cache', hdf.list_groups())
+        table_reload = PyironTable(project=project)
+        _ = table_reload.add.get_job_name
+        table_reload._cache_from_hdf(hdf=hdf)
+        self.assertEqual(table_reload._result_cache, table._result_cache)
+        self.assertEqual(table_reload._filter_cache, table._filter_cache)
+        table_reload.create_table(file=hdf)
+        self.assertTrue(table_reload.get_dataframe().equals(table.get_dataframe()))
+
 
 if __name__ == '__main__':
     unittest.main()
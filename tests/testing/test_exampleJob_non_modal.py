@@ -61,6 +61,20 @@ class TestExampleJob(unittest.TestCase):
 
         ham_non_modal.remove()
 
+    def test_wait_for_jobs(self):
+        job_lst = []
+        for job_name in ['job_wait_0', 'job_wait_1']:
+            job = self.project.create_job(self.project.job_type.ExampleJob, job_name)
+            job.input['count'] = self.count
+            job.server.run_mode.non_modal = True
+            job.run()
+            job_lst.append(job)
+        finished_lst = self.project.wait_for_jobs(job_lst, timeout=250, interval_in_s=60)
+        self.assertEqual(len(finished_lst), 2)
+        self.assertTrue(all([job.status.finished for job in job_lst]))
+        for job in job_lst:
+            job.remove()
+
 
 if __name__ == '__main__':
     unittest.main()
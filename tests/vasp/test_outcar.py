@@ -52,6 +52,22 @@ class TestOutcar(unittest.TestCase):
                         print(key, self.outcar_parser.parse_dict[key])
                         raise AssertionError("{} has the wrong type".format(key))
 
+    def test_from_file_matches_getters(self):
+        for filename in self.file_list:
+            parser = Outcar()
+            parser.from_file(filename=filename)
+            positions, forces = parser.get_positions_and_forces(filename)
+            self.assertTrue(np.array_equal(parser.parse_dict["positions"], positions))
+            self.assertTrue(np.array_equal(parser.parse_dict["forces"], forces))
+            self.assertTrue(np.array_equal(parser.parse_dict["cells"], parser.get_cells(filename)))
+            self.assertTrue(np.array_equal(parser.parse_dict["energies"], parser.get_total_energies(filename)))
+            self.assertTrue(np.array_equal(parser.parse_dict["stresses"],
+                                           parser.get_stresses(filename, si_unit=False)))
+            with open(filename) as f:
+                lines = f.readlines()
+            self.assertTrue(np.array_equal(parser.parse_dict["energies"], parser.get_total_energies(lines=lines)))
+            self.assertEqual(parser.parse_dict["n_elect"], parser.get_nelect(lines=lines))
+
     def test_get_positions_and_forces(self):
         for filename in self.file_list:
             output = self.outcar_parser.get_positions_and_forces(filename)
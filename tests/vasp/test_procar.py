@@ -0,0 +1,84 @@
+import unittest
+import os
+import numpy as np
+from pyiron.vasp.procar import Procar
+
+
+class TestProcar(unittest.TestCase):
+
+    """
+    Testing routines in the vasp/procar module.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.file_location = os.path.dirname(os.path.abspath(__file__))
+        cls.procar_directory = os.path.join(cls.file_location, "../static/vasp_test_files/procar_samples")
+
+    @staticmethod
+    def _read_tot_columns(filename):
+        atom_dos, orbital_dos = list(), list()
+        with open(filename, "r") as f:
+            for line in f:
+                lst = line.split()
+                if len(lst) > 0 and lst[0].isdigit():
+                    atom_dos.append(float(lst[-1]))
+                elif len(lst) > 0 and lst[0] == "tot":
+                    orbital_dos.append([float(val) for val in lst[1:-1]])
+        return np.array(atom_dos), np.array(orbital_dos)
+
+    def test_from_file(self):
+        for filename, n_spins in [("PROCAR_no_spin", 1), ("PROCAR_spin", 2)]:
+            filename = os.path.join(self.procar_directory, filename)
+            es_obj = Procar().from_file(filename=filename)
+            self.assertEqual(es_obj.n_spins, n_spins)
+            self.assertEqual(es_obj.grand_dos_matrix.shape, (n_spins, 3, 4, 2, 9))
+            atom_dos, orbital_dos = self._read_tot_columns(filename)
+            self.assertTrue(np.allclose(np.sum(es_obj.grand_dos_matrix, axis=-1).flatten(), atom_dos, atol=5e-3))
+            self.assertTrue(np.allclose(np.sum(es_obj.grand_dos_matrix, axis=-2).reshape(-1, 9), orbital_dos,
+                                        atol=5e-3))
+            with open(filename, "r") as f:
+                first_row = f.readlines()[8].split()
+            self.assertEqual(es_obj.grand_dos_matrix[0, 0, 0, 0, 0], float(first_row[1]))
+            self.assertEqual(es_obj.grand_dos_matrix[0, 0, 0, 0, -1], float(first_row[-2]))
+            self.assertTrue(np.allclose(es_obj.kpoint_list, [[0, -0.05, 0], [0.1, 0, 0], [0.2, 0.05, 0]]))
+            self.assertTrue(np.allclose(es_obj.kpoint_weights, [1 / 3] * 3))
+            self.assertTrue(np.allclose(es_obj.eigenvalue_matrix, [[-10, -9.9, -9.8, -9.7]] * 3))
+            self.assertTrue(np.allclose(es_obj.occupancy_matrix, [[1, 0.75, 0.5, 0.25]] * 3))
+            self.assertEqual(len(es_obj.kpoints), 3)
+            self.assertEqual(len(es_obj.kpoints[0].bands), 4)
+            self.assertTrue(np.array_equal(es_obj.kpoints[2].bands[1].resolved_dos_matrix,
+                                           es_obj.grand_dos_matrix[0, 2, 1]))
+
+    def test_irregular_layout(self):
+        with open(os.path.join(self.procar_directory, "PROCAR_no_spin"), "r") as f:
+            lines = f.readlines()
+        # The blank lines of the second k-point are missing
+        start = lines.index(" k-point    2 :     0.10000000 0.00000000 0.00000000     weight = 0.33333333\n")
+        lines = lines[:start] + [line for line in lines[start: start + 30] if line.strip() != ""] + \
+            lines[start + 30:]
+        filename = os.path.join(self.procar_directory, "PROCAR_irregular")
+        try:
+            with open(filename, "w") as f:
+                f.writelines(lines)
+            es_obj = Procar().from_file(filename=filename)
+            es_obj_regular = Procar().from_file(filename=os.path.join(self.procar_directory, "PROCAR_no_spin"))
+            self.assertTrue(np.array_equal(es_obj.grand_dos_matrix, es_obj_regular.grand_dos_matrix))
+            self.assertTrue(np.array_equal(es_obj.eigenvalue_matrix, es_obj_regular.eigenvalue_matrix))
+        finally:
+            os.remove(filename)
+
+    def test_incomplete_file(self):
+        with open(os.path.join(self.procar_directory, "PROCAR_no_spin"), "r") as f:
+            lines = f.readlines()
+        filename = os.path.join(self.procar_directory, "PROCAR_incomplete")
+        try:
+            with open(filename, "w") as f:
+                f.writelines(lines[:-10])
+            self.assertRaises(ValueError, Procar().from_file, filename=filename)
+        finally:
+            os.remove(filename)
+
+
+if __name__ == "__main__":
+    unittest.main()
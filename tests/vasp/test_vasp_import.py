@@ -27,6 +27,18 @@ class TestVaspImport(unittest.TestCase):
         self.assertEqual(ham.get_nelect(), 16)
         self.assertTrue(np.array_equal(ham.structure.get_initial_magnetic_moments(), [-1, -1]))
 
+    def test_trajectory(self):
+        self.project.import_from_path(path=os.path.join(self.file_location,
+                                                        '../static/vasp_test_files/full_job_sample'),
+                                      recursive=False)
+        ham = self.project.load('full_job_sample')
+        positions = ham.output.positions
+        traj = ham.trajectory(snapshot_indices=[-1, 0], atom_indices=[1])
+        self.assertEqual(len(traj), 2)
+        self.assertTrue(np.allclose(traj[0].positions, positions[-1, [1]]))
+        self.assertTrue(np.allclose(ham.trajectory()[-1].positions, positions[-1]))
+        self.assertFalse(ham.project_hdf5.lazy)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -22,7 +22,7 @@ class TestVasprun(unittest.TestCase):
         cls.direc = os.path.join(cls.file_location, "../static/vasp_test_files/vasprun_samples")
         file_list = sorted(os.listdir(cls.direc))
         del file_list[file_list.index("vasprun_spoilt.xml")]
-        cls.num_species = [3, 1, 2, 2, 3, 4, 2]
+        cls.num_species = [3, 1, 2, 2, 3, 2]
 
         for f in file_list:
             vp = Vasprun()
@@ -35,6 +35,26 @@ class TestVasprun(unittest.TestCase):
         filename = posixpath.join(self.direc, "vasprun_spoilt.xml")
         self.assertRaises(VasprunError, vp.from_file, filename)
 
+    def test_from_file_streaming(self):
+        filename = posixpath.join(self.direc, "vasprun_2.xml")
+        vp_tree = Vasprun()
+        vp_tree.from_file(filename, streaming=False)
+        vp_stream = Vasprun()
+        vp_stream.from_file(filename, streaming=True)
+        self.assertIsNotNone(vp_tree.root)
+        self.assertIsNone(vp_stream.root)
+        self.assertEqual(sorted(vp_tree.vasprun_dict.keys()), sorted(vp_stream.vasprun_dict.keys()))
+        for key in ["positions", "cells", "forces", "total_energies", "grand_eigenvalue_matrix",
+                    "grand_occupancy_matrix", "grand_dos_matrix", "resolved_dos_matrix", "spin_dos_density"]:
+            self.assertTrue(np.array_equal(vp_tree.vasprun_dict[key], vp_stream.vasprun_dict[key]))
+        vp_skip = Vasprun()
+        vp_skip.from_file(filename, skip_sections=["projected", "partial", "eigenvalues"])
+        for key in ["grand_dos_matrix", "resolved_dos_matrix", "grand_eigenvalue_matrix"]:
+            self.assertNotIn(key, vp_skip.vasprun_dict.keys())
+        self.assertTrue(np.array_equal(vp_tree.vasprun_dict["spin_dos_density"],
+                                       vp_skip.vasprun_dict["spin_dos_density"]))
+        self.assertTrue(np.array_equal(vp_tree.vasprun_dict["forces"], vp_skip.vasprun_dict["forces"]))
+
     def test_parse_generator(self):
         for vp in self.vp_list:
             self.assertIsInstance(vp.vasprun_dict["generator"], dict)
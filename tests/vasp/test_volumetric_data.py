@@ -2,6 +2,7 @@ import unittest
 import os
 import posixpath
 import numpy as np
+from pyiron.base.generic.hdfio import FileHDFio
 from pyiron.vasp.volumetric_data import VaspVolumetricData
 
 
@@ -48,3 +49,35 @@ class TestVaspVolumetricData(unittest.TestCase):
                 atoms, total_data = self.vd_obj._read_vol_data(chgcar_file, normalize=True)
                 self.assertIsNone(atoms)
                 self.assertIsNone(total_data)
+
+    def test_read_vol_data_float32(self):
+        file_name = posixpath.join(self.file_location, "../static/vasp_test_files/chgcar_samples/CHGCAR_spin")
+        vd_obj = VaspVolumetricData()
+        vd_obj.from_file(file_name, dtype=np.float32)
+        self.assertEqual(vd_obj.total_data.dtype, np.float32)
+        self.assertEqual(vd_obj.diff_data.dtype, np.float32)
+        _, [total_data, diff_data] = self.vd_obj._read_vol_data_old(file_name, normalize=True)
+        self.assertTrue(np.allclose(vd_obj.total_data, total_data, rtol=1e-6))
+        self.assertTrue(np.allclose(vd_obj.diff_data, diff_data, rtol=1e-6))
+
+    def test_to_and_from_hdf(self):
+        file_name = posixpath.join(self.file_location, "../static/vasp_test_files/chgcar_samples/CHGCAR_spin")
+        hdf_name = os.path.join(self.file_location, "volumetric_data.h5")
+        vd_obj = VaspVolumetricData()
+        vd_obj.from_file(file_name)
+        try:
+            hdf = FileHDFio(file_name=hdf_name)
+            vd_obj.to_hdf(hdf, group_name="charge_density")
+            vd_hdf = VaspVolumetricData()
+            vd_hdf.from_hdf(hdf, group_name="charge_density")
+            self.assertIsNone(vd_hdf._total_data)
+            for ind in range(3):
+                self.assertTrue(np.allclose(vd_hdf.get_average_along_axis(ind=ind),
+                                            vd_obj.get_average_along_axis(ind=ind)))
+            self.assertIsNone(vd_hdf._total_data)
+            self.assertTrue(np.array_equal(vd_hdf.total_data, vd_obj.total_data))
+            self.assertTrue(np.array_equal(vd_hdf.diff_data, vd_obj.diff_data))
+            self.assertTrue(np.array_equal(hdf.get_array_slice("charge_density/total", np.s_[2:4, 1]),
+                                           vd_obj.total_data[2:4, 1]))
+        finally:
+            os.remove(hdf_name)